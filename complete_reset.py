@@ -97,7 +97,15 @@ def clear_trading_data_files():
     files_to_clear = [
         "trading_data/trades/all_trades.json",
         "trading_data/trades/all_trades.csv",
+        "trading_data/trades/all_trades.jsonl",  # append journal replayed over the snapshot on load
+        "trading_data/trades/all_trades.json.tmp",
+        "trading_data/trades/all_trades.csv.tmp",
         "trading_data/trade_database.json",
+        "trading_data/trade_database.json.migrated",
+        "trading_data/trade_database.db",  # SQLite trade store and its WAL side files
+        "trading_data/trade_database.db-wal",
+        "trading_data/trade_database.db-shm",
+        "trading_data/trades/trade_events.jsonl",  # undelivered events would be replayed on start
         "trading_data/balance.json"
     ]
     
@@ -119,6 +127,15 @@ def clear_trading_data_files():
     except Exception as e:
         print(f"⚠️ Error clearing reports directory: {e}")
 
+    # Clear Parquet trade history (ML training data)
+    try:
+        history_dir = Path("trading_data/trades/history")
+        if history_dir.exists():
+            shutil.rmtree(history_dir)
+            print("✅ Cleared trade history directory")
+    except Exception as e:
+        print(f"⚠️ Error clearing trade history directory: {e}")
+
 def reset_environment_config():
     """Reset environment configuration to default"""
     print("\n⚙️ RESETTING ENVIRONMENT CONFIG")
@@ -166,6 +183,7 @@ def verify_clean_slate():
         from src.execution_engine.trade_database import TradeDatabase
         trade_db = TradeDatabase()
         db_count = len(trade_db.trades)
+        trade_db.close()
         print(f"📊 Trade Database: {db_count} trades")
     except Exception as e:
         print(f"📊 Trade Database: Error checking - {e}")
@@ -181,7 +199,12 @@ def verify_clean_slate():
     # Check files
     files_to_check = [
         "trading_data/trade_database.json",
-        "trading_data/trades/all_trades.json"
+        "trading_data/trade_database.json.migrated",
+        "trading_data/trades/all_trades.json",
+        "trading_data/trades/all_trades.jsonl",
+        "trading_data/trades/trade_events.jsonl",
+        "trading_data/trades/history",
+        "trading_data/trades/all_trades.csv"
     ]
     
     for file_path in files_to_check:
@@ -7,7 +7,6 @@ import signal
 import sys
 import threading
 import time
-from src.bot_manager import BotManager
 from src.utils.logger import setup_logger
 
 # Global bot manager
@@ -108,7 +107,9 @@ async def main():
         # Give web dashboard time to start
         await asyncio.sleep(2)
 
-        # Initialize bot manager but don't start it automatically
+        # Initialize bot manager but don't start it automatically (imported here - the trading
+        # stack is not needed to bring the dashboard up)
+        from src.bot_manager import BotManager
         bot_manager = BotManager()
 
         # Make bot manager available to web dashboard
@@ -5,17 +5,22 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Any, Optional
 from pathlib import Path
 import json
+import importlib.util
 
-# ML libraries (install when needed)
-try:
+# ML libraries (install when needed) - scikit-learn takes seconds to import, so it is only
+# loaded when a dataset is prepared or models are trained
+ML_AVAILABLE = importlib.util.find_spec('sklearn') is not None
+
+
+def _load_sklearn():
+    """Import the scikit-learn names used below (no-op after the first call)"""
+    global RandomForestClassifier, RandomForestRegressor, train_test_split, cross_val_score
+    global accuracy_score, classification_report, StandardScaler, LabelEncoder, SelectKBest, f_classif
     from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
     from sklearn.model_selection import train_test_split, cross_val_score
     from sklearn.metrics import accuracy_score, classification_report
     from sklearn.preprocessing import StandardScaler, LabelEncoder
     from sklearn.feature_selection import SelectKBest, f_classif
-    ML_AVAILABLE = True
-except ImportError:
-    ML_AVAILABLE = False
 
 from src.analytics.trade_logger import trade_logger
 
@@ -37,8 +42,7 @@ class MLTradeAnalyzer:
         self.market_regime_model = None          # Market condition classifier
         self.risk_adjustment_model = None        # Dynamic risk management
 
-        # Feature scalers
-        self.scaler = StandardScaler()
+        # Feature encoders
         self.label_encoders = {}
 
         # Feature importance tracking
@@ -66,17 +70,15 @@ class MLTradeAnalyzer:
         if not ML_AVAILABLE:
             self.logger.error("❌ ML libraries not installed. Run: pip install scikit-learn")
             return None
+        _load_sklearn()
 
         try:
-            # Export current data for ML
-            ml_file = trade_logger.export_for_ml()
-            if not ml_file:
+            # Typed closed-trade history (columnar, no CSV round trip)
+            df = trade_logger.get_ml_dataframe()
+            if df is None:
                 self.logger.warning("⚠️ No trade data available for ML analysis")
                 return None
 
-            # Load the dataset
-            df = pd.read_csv(ml_file)
-
             if len(df) < 3:  # Reduced from 10 to work with smaller datasets
                 self.logger.warning("⚠️ Insufficient data for ML analysis (need at least 3 trades)")
                 return None
@@ -146,6 +148,7 @@ class MLTradeAnalyzer:
         """Train ML models on historical trade data"""
         if not ML_AVAILABLE:
             return {"error": "ML libraries not available - run: pip install scikit-learn"}
+        _load_sklearn()
 
         try:
             # Prepare dataset
@@ -0,0 +1,228 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+# Columnar storage (optional - pip install pyarrow)
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+class TradeHistoryStore:
+    """Closed-trade history as typed Parquet, partitioned by month
+
+    Layout: trading_data/trades/history/month=YYYY-MM/part-<ms>.parquet.
+    Each writer flush adds a small part file; once a month has more than
+    compact_after_parts files they are merged into one. Reads are memory
+    mapped and only load the requested columns and months. A trade that is
+    written again (e.g. an exit corrected after close) supersedes its older
+    rows: reads keep the last row per trade_id.
+    """
+
+    # Column types of a closed TradeRecord
+    COLUMNS = {
+        'trade_id': 'string',
+        'timestamp': 'timestamp',
+        'strategy_name': 'string',
+        'symbol': 'string',
+        'side': 'string',
+        'entry_price': 'float',
+        'exit_price': 'float',
+        'quantity': 'float',
+        'margin_used': 'float',
+        'leverage': 'int',
+        'position_value_usdt': 'float',
+        'rsi_at_entry': 'float',
+        'macd_at_entry': 'float',
+        'sma_20_at_entry': 'float',
+        'sma_50_at_entry': 'float',
+        'volume_at_entry': 'float',
+        'pnl_usdt': 'float',
+        'pnl_percentage': 'float',
+        'exit_reason': 'string',
+        'duration_minutes': 'int',
+        'market_trend': 'string',
+        'volatility_score': 'float',
+        'risk_reward_ratio': 'float',
+        'max_drawdown': 'float',
+        'entry_signal_strength': 'float',
+        'market_phase': 'string',
+        'trade_status': 'string'
+    }
+
+    BACKFILL_MARKER = "_backfilled"  # leading underscore: not picked up as a data file
+
+    def __init__(self, history_dir: str = "trading_data/trades/history", compact_after_parts: int = 20):
+        self.logger = logging.getLogger(__name__)
+        self.history_dir = Path(history_dir)
+        self.compact_after_parts = compact_after_parts
+        self._lock = threading.Lock()
+        self.schema = self._build_schema() if PARQUET_AVAILABLE else None
+
+    @staticmethod
+    def is_available() -> bool:
+        return PARQUET_AVAILABLE
+
+    def _build_schema(self):
+        arrow_types = {
+            'string': pa.string(),
+            'timestamp': pa.timestamp('us'),
+            'float': pa.float64(),
+            'int': pa.int64()
+        }
+        return pa.schema([(name, arrow_types[kind]) for name, kind in self.COLUMNS.items()])
+
+    def has_data(self) -> bool:
+        return self.history_dir.exists() and any(self.history_dir.glob("month=*/*.parquet"))
+
+    def _to_table(self, records: List[Dict[str, Any]]):
+        """Typed Arrow table from trade dicts (missing fields become nulls)"""
+        columns = {}
+        for name, kind in self.COLUMNS.items():
+            values = [record.get(name) for record in records]
+            if kind == 'timestamp':
+                values = [datetime.fromisoformat(v) if isinstance(v, str) else v for v in values]
+            elif kind == 'int':
+                values = [int(v) if v is not None else None for v in values]
+            elif kind == 'float':
+                values = [float(v) if v is not None else None for v in values]
+            columns[name] = values
+        return pa.Table.from_pydict(columns, schema=self.schema)
+
+    def append(self, records: List[Dict[str, Any]]) -> int:
+        """Write closed trades (TradeRecord.to_dict() format) into their month partitions"""
+        if not PARQUET_AVAILABLE or not records:
+            return 0
+
+        try:
+            by_month: Dict[str, List[Dict[str, Any]]] = {}
+            for record in records:
+                timestamp = record.get('timestamp')
+                if isinstance(timestamp, str):
+                    timestamp = datetime.fromisoformat(timestamp)
+                by_month.setdefault(timestamp.strftime('%Y-%m'), []).append(record)
+
+            with self._lock:
+                for month, month_records in by_month.items():
+                    month_dir = self.history_dir / f"month={month}"
+                    month_dir.mkdir(parents=True, exist_ok=True)
+                    part_file = month_dir / f"part-{int(time.time() * 1000)}.parquet"
+                    while part_file.exists():
+                        part_file = month_dir / f"part-{int(time.time() * 1000) + 1}.parquet"
+                    pq.write_table(self._to_table(month_records), part_file)
+
+                    if len(list(month_dir.glob("*.parquet"))) > self.compact_after_parts:
+                        self._compact_month(month_dir)
+
+            return len(records)
+
+        except Exception as e:
+            self.logger.error(f"❌ Error writing trade history: {e}")
+            return 0
+
+    def _compact_month(self, month_dir: Path):
+        """Merge a month's part files into one, keeping the last row per trade"""
+        parts = sorted(month_dir.glob("*.parquet"))
+        table = ds.dataset([str(p) for p in parts], schema=self.schema, format="parquet").to_table()
+        frame = table.to_pandas().drop_duplicates('trade_id', keep='last')
+
+        stamp = int(time.time() * 1000)
+        while (month_dir / f"part-{stamp}.parquet").exists():
+            stamp += 1
+        merged_file = month_dir / f"part-{stamp}.parquet"
+        tmp_file = month_dir / f"part-{stamp}.parquet.tmp"
+        pq.write_table(pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False), tmp_file)
+
+        # Merged file goes live first; a crash before the parts are removed only leaves duplicates reads drop
+        tmp_file.rename(merged_file)
+        for part in parts:
+            part.unlink()
+        self.logger.debug(f"🗜️ Trade history compacted: {month_dir.name} ({len(parts)} parts → 1)")
+
+    def read(self, columns: Optional[List[str]] = None, start: Optional[datetime] = None,
+             end: Optional[datetime] = None) -> Optional[pd.DataFrame]:
+        """Closed trades with only the requested columns, optionally limited to [start, end)
+
+        Returns None if Parquet support is unavailable or nothing has been written yet.
+        """
+        if not PARQUET_AVAILABLE or not self.has_data():
+            return None
+
+        try:
+            wanted = list(columns) if columns else list(self.COLUMNS)
+            load = wanted + ([] if 'trade_id' in wanted else ['trade_id'])
+            if (start or end) and 'timestamp' not in load:
+                load.append('timestamp')
+
+            # Month partitions are pruned from the directory names before any file is opened
+            row_filter = None
+            if start is not None:
+                row_filter = (ds.field('month') >= start.strftime('%Y-%m')) & \
+                             (ds.field('timestamp') >= pa.scalar(start, pa.timestamp('us')))
+            if end is not None:
+                end_filter = (ds.field('month') <= end.strftime('%Y-%m')) & \
+                             (ds.field('timestamp') < pa.scalar(end, pa.timestamp('us')))
+                row_filter = end_filter if row_filter is None else row_filter & end_filter
+
+            with self._lock:
+                table = self._dataset().to_table(columns=load, filter=row_filter)
+
+            frame = table.to_pandas().drop_duplicates('trade_id', keep='last')
+            return frame[wanted].reset_index(drop=True)
+
+        except Exception as e:
+            self.logger.error(f"❌ Error reading trade history: {e}")
+            return None
+
+    def _dataset(self):
+        """Hive-partitioned dataset over the history directory, read through memory maps"""
+        partition_schema = pa.schema([('month', pa.string())])
+        return ds.dataset(
+            str(self.history_dir.resolve()),
+            schema=pa.unify_schemas([self.schema, partition_schema]),
+            format="parquet",
+            filesystem=pafs.LocalFileSystem(use_mmap=True),
+            partitioning=ds.partitioning(partition_schema, flavor="hive"),
+            exclude_invalid_files=True
+        )
+
+    def is_backfilled(self) -> bool:
+        return (self.history_dir / self.BACKFILL_MARKER).exists()
+
+    def backfill(self, records: List[Dict[str, Any]]) -> int:
+        """One-shot import of closed trades that predate the history store
+
+        Runs until its marker file exists, independent of what the writer has
+        appended since; trades already in the history are skipped.
+        """
+        if not PARQUET_AVAILABLE or self.is_backfilled():
+            return 0
+
+        existing = self.read(columns=['trade_id'])
+        if existing is not None:
+            known = set(existing['trade_id'])
+            records = [record for record in records if record.get('trade_id') not in known]
+
+        written = self.append(records)
+        if records and not written:
+            return 0  # write failed - try again next time
+
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        (self.history_dir / self.BACKFILL_MARKER).touch()
+        if written:
+            self.logger.info(f"📦 Trade history backfilled with {written} closed trades")
+        return written
+
+
+# Global trade history store
+trade_history = TradeHistoryStore()
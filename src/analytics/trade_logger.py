@@ -1,11 +1,17 @@
+import atexit
 import json
 import csv
 import logging
+import os
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import pandas as pd
+from src.config.global_config import global_config
+from src.analytics.trade_history import trade_history
 
 @dataclass
 class TradeRecord:
@@ -56,7 +62,15 @@ class TradeRecord:
         return data
 
 class TradeLogger:
-    """Comprehensive trade logging for ML analysis"""
+    """Comprehensive trade logging for ML analysis
+
+    Entries, exits and updates only mark a trade dirty. A background writer
+    coalesces changes within TRADE_LOG_FLUSH_INTERVAL and appends them to
+    all_trades.jsonl (one full record per line, last line wins) and
+    all_trades.csv. all_trades.json is the compacted snapshot: rewritten
+    from memory every TRADE_LOG_COMPACT_INTERVAL seconds or
+    TRADE_LOG_COMPACT_EVERY journal lines, and on flush() at shutdown.
+    """
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -74,27 +88,107 @@ class TradeLogger:
         # File paths
         self.trades_json_file = self.trades_dir / "all_trades.json"
         self.trades_csv_file = self.trades_dir / "all_trades.csv"
+        self.trades_journal_file = self.trades_dir / "all_trades.jsonl"
+
+        # Background persistence
+        self._write_lock = threading.Lock()  # serializes file writes (writer thread vs. flush/_save_trades)
+        self._pending_lock = threading.Lock()
+        self._pending: Dict[str, None] = {}  # dirty trade_ids in order (dict as ordered set)
+        self._pending_event = threading.Event()
+        self._writer_thread = None
+        self._journal_lines = 0
+        self._last_compaction = time.time()
+        self.write_stats = {'queued': 0, 'coalesced': 0, 'appended': 0, 'compactions': 0}
 
         # Load existing trades
         self.trades: List[TradeRecord] = []
+        self._trade_index: Dict[str, int] = {}  # trade_id -> position in self.trades
+        self._indexed_list = self.trades
+        self._indexed_len = 0
         self.load_existing_trades()
+        atexit.register(self.flush)
 
     def load_existing_trades(self):
-        """Load existing trades from JSON file"""
+        """Load the compacted JSON snapshot, then replay the append journal on top"""
         try:
+            trades_data = []
             if self.trades_json_file.exists():
                 with open(self.trades_json_file, 'r') as f:
                     trades_data = json.load(f)
 
-                for trade_data in trades_data:
-                    # Convert timestamp back to datetime
-                    trade_data['timestamp'] = datetime.fromisoformat(trade_data['timestamp'])
-                    self.trades.append(TradeRecord(**trade_data))
+            records = {}
+            for trade_data in trades_data:
+                records.setdefault(trade_data['trade_id'], trade_data)
+
+            if self.trades_journal_file.exists():
+                with open(self.trades_journal_file, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            self.logger.warning("⚠️ Skipping truncated trade journal line")
+                            continue
+                        self._journal_lines += 1
+                        if entry.get('_removed'):
+                            records.pop(entry['trade_id'], None)
+                        else:
+                            records[entry['trade_id']] = entry
+
+            for trade_data in records.values():
+                # Convert timestamp back to datetime
+                trade_data['timestamp'] = datetime.fromisoformat(trade_data['timestamp'])
+                self._append_trade(TradeRecord(**{k: v for k, v in trade_data.items()
+                                                  if k in TradeRecord.__dataclass_fields__}))
 
+            if self.trades:
                 self.logger.info(f"📊 Loaded {len(self.trades)} existing trade records")
         except Exception as e:
             self.logger.error(f"❌ Error loading existing trades: {e}")
 
+    def _append_trade(self, trade_record: TradeRecord):
+        """Append a record and index its position"""
+        if self._indexed_list is not self.trades or self._indexed_len != len(self.trades):
+            self._rebuild_trade_index()
+        self._trade_index.setdefault(trade_record.trade_id, len(self.trades))
+        self.trades.append(trade_record)
+        self._indexed_len += 1
+
+    def _rebuild_trade_index(self):
+        """Index first occurrence of each trade_id (matches the old linear scan)"""
+        self._trade_index = {}
+        for position, trade in enumerate(self.trades):
+            self._trade_index.setdefault(trade.trade_id, position)
+        self._indexed_list = self.trades
+        self._indexed_len = len(self.trades)
+
+    def get_trade(self, trade_id: str) -> Optional[TradeRecord]:
+        """Trade record by ID via the index; re-indexes if self.trades was replaced or resized elsewhere"""
+        if self._indexed_list is not self.trades or self._indexed_len != len(self.trades):
+            self._rebuild_trade_index()
+
+        position = self._trade_index.get(trade_id)
+        if position is None:
+            return None
+        if self.trades[position].trade_id != trade_id:
+            # Reordered in place - rebuild once
+            self._rebuild_trade_index()
+            position = self._trade_index.get(trade_id)
+            if position is None:
+                return None
+        return self.trades[position]
+
+    def remove_trade(self, trade_id: str) -> bool:
+        """Remove a trade record (positions after it shift, so the index is rebuilt)"""
+        if self.get_trade(trade_id) is None:
+            return False
+        self.trades = [t for t in self.trades if t.trade_id != trade_id]
+        self._rebuild_trade_index()
+        self.queue_save(trade_id)
+        return True
+
     def log_trade_entry(self, strategy_name: str, symbol: str, side: str, 
                        entry_price: float, quantity: float, margin_used: float, 
                        leverage: int, technical_indicators: Dict[str, float] = None,
@@ -146,10 +240,10 @@ class TradeLogger:
             return None
 
         # Add to trades list
-        self.trades.append(trade_record)
+        self._append_trade(trade_record)
 
-        # Save to files
-        self._save_trades()
+        # Persist in the background
+        self.queue_save(trade_id)
 
         self.logger.info(f"📝 TRADE ENTRY LOGGED | {trade_id} | {symbol} | {side} | ${entry_price:.4f}")
         self.logger.debug(f"📝 TRADE DETAILS: {trade_record.to_dict()}")
@@ -165,11 +259,7 @@ class TradeLogger:
         """Log trade exit and calculate final metrics"""
 
         # Find the trade record
-        trade_record = None
-        for trade in self.trades:
-            if trade.trade_id == trade_id:
-                trade_record = trade
-                break
+        trade_record = self.get_trade(trade_id)
 
         if not trade_record:
             self.logger.error(f"❌ Trade record not found for ID: {trade_id}")
@@ -214,40 +304,32 @@ class TradeLogger:
         if risk > 0:
             trade_record.risk_reward_ratio = reward / risk
 
-        # Save updated trades
-        self._save_trades()
+        # Persist in the background
+        self.queue_save(trade_id)
 
         # Sync updated trade to database
         self._sync_to_database(trade_id, trade_record)
 
         self.logger.info(f"📝 TRADE EXIT LOGGED | {trade_id} | PnL: ${pnl_usdt:.2f} ({pnl_percentage:+.2f}%) | Duration: {trade_record.duration_minutes}min")
 
-    def _save_trades(self):
-        """Save trades to both JSON and CSV files"""
-        try:
-            # Save to JSON
-            trades_data = [trade.to_dict() for trade in self.trades]
-            with open(self.trades_json_file, 'w') as f:
-                json.dump(trades_data, f, indent=2, default=str)
-
-            # Save to CSV
-            if trades_data:
-                df = pd.DataFrame(trades_data)
-                df.to_csv(self.trades_csv_file, index=False)
-
-        except Exception as e:
-            self.logger.error(f"❌ Error saving trades: {e}")
-
     def get_daily_summary(self, date: datetime) -> Dict[str, Any]:
         """Generate daily trading summary"""
         start_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_date = start_date + timedelta(days=1)
 
-        # Filter trades for the day
-        daily_trades = [
-            trade for trade in self.trades
-            if start_date <= trade.timestamp < end_date
-        ]
+        # Closed trades come column-projected from the history; open ones through the open-trade index
+        closed_history = self.read_closed_history(self.DAILY_REPORT_COLUMNS, start_date, end_date)
+        if closed_history is not None:
+            daily_trades = [TradeRecord(**{**row, 'timestamp': row['timestamp'].to_pydatetime()})
+                            for row in closed_history.to_dict('records')]
+            daily_trades += [trade for trade in self._open_trades()
+                             if start_date <= trade.timestamp < end_date]
+            daily_trades.sort(key=lambda trade: trade.timestamp)
+        else:
+            daily_trades = [
+                trade for trade in self.trades
+                if start_date <= trade.timestamp < end_date
+            ]
 
         if not daily_trades:
             return {
@@ -301,59 +383,129 @@ class TradeLogger:
             'trades': [trade.to_dict() for trade in daily_trades]
         }
 
+    # TradeRecord columns the daily report needs from closed trades
+    DAILY_REPORT_COLUMNS = [
+        'trade_id', 'timestamp', 'strategy_name', 'symbol', 'side', 'entry_price', 'exit_price',
+        'quantity', 'margin_used', 'leverage', 'position_value_usdt', 'pnl_usdt', 'pnl_percentage',
+        'duration_minutes', 'exit_reason', 'trade_status'
+    ]
+
+    def _open_trades(self) -> List[TradeRecord]:
+        """Open trades via the database's open-trade index instead of a scan over self.trades"""
+        try:
+            from src.execution_engine.trade_database import get_trade_database
+            open_ids = list(get_trade_database().get_open_trades())
+        except Exception as e:
+            self.logger.warning(f"⚠️ Open-trade index unavailable, scanning trade log: {e}")
+            return [trade for trade in self.trades if trade.trade_status == "OPEN"]
+        trades = [self.get_trade(trade_id) for trade_id in open_ids]
+        return [trade for trade in trades if trade is not None and trade.trade_status == "OPEN"]
+
+    def _ensure_history_backfilled(self):
+        """Import closed trades that predate the Parquet history (no-op once its marker exists)"""
+        if not trade_history.is_backfilled():
+            trade_history.backfill([trade.to_dict() for trade in self.trades
+                                    if trade.trade_status == "CLOSED" and trade.pnl_usdt is not None])
+
+    def read_closed_history(self, columns: List[str], start: Optional[datetime] = None,
+                            end: Optional[datetime] = None) -> Optional[pd.DataFrame]:
+        """Closed trades from the Parquet history, only the given columns, nulls as None
+
+        The history is backfilled from this log on first use. Returns None if
+        Parquet support is unavailable or the read failed, so callers can fall
+        back to the in-memory records.
+        """
+        if not trade_history.is_available():
+            return None
+        self._ensure_history_backfilled()
+        if not trade_history.has_data():
+            return pd.DataFrame(columns=columns)  # nothing closed yet
+        frame = trade_history.read(columns=columns, start=start, end=end)
+        if frame is None:
+            return None
+        return frame.astype(object).where(frame.notna(), None)
+
+    # TradeRecord columns the ML dataset is derived from
+    ML_SOURCE_COLUMNS = [
+        'strategy_name', 'symbol', 'side', 'leverage', 'position_value_usdt',
+        'rsi_at_entry', 'macd_at_entry', 'sma_20_at_entry', 'sma_50_at_entry', 'volume_at_entry',
+        'entry_signal_strength', 'market_trend', 'volatility_score', 'market_phase', 'timestamp',
+        'pnl_usdt', 'pnl_percentage', 'duration_minutes', 'risk_reward_ratio', 'max_drawdown', 'exit_reason'
+    ]
+
+    def get_ml_dataframe(self) -> Optional[pd.DataFrame]:
+        """ML-ready closed trades; read column-projected from the Parquet history when available"""
+        try:
+            source = None
+            if trade_history.is_available():
+                self._ensure_history_backfilled()
+                source = trade_history.read(columns=self.ML_SOURCE_COLUMNS)
+
+            if source is None:
+                source = pd.DataFrame(
+                    [{column: getattr(trade, column) for column in self.ML_SOURCE_COLUMNS}
+                     for trade in self.trades if trade.trade_status == "CLOSED" and trade.pnl_usdt is not None],
+                    columns=self.ML_SOURCE_COLUMNS)
+                for column in self.ML_SOURCE_COLUMNS:
+                    if trade_history.COLUMNS[column] in ('float', 'int'):
+                        source[column] = pd.to_numeric(source[column])
+
+            if source.empty:
+                return None
+
+            timestamps = pd.to_datetime(source['timestamp'])
+            return pd.DataFrame({
+                # Basic trade info
+                'strategy': source['strategy_name'],
+                'symbol': source['symbol'],
+                'side': source['side'],
+                'leverage': source['leverage'],
+                'position_size_usdt': source['position_value_usdt'],
+
+                # Technical indicators
+                'rsi_entry': source['rsi_at_entry'].fillna(0),
+                'macd_entry': source['macd_at_entry'].fillna(0),
+                'sma_20_entry': source['sma_20_at_entry'].fillna(0),
+                'sma_50_entry': source['sma_50_at_entry'].fillna(0),
+                'volume_entry': source['volume_at_entry'].fillna(0),
+                'signal_strength': source['entry_signal_strength'].fillna(0),
+
+                # Market conditions
+                'market_trend': source['market_trend'].fillna('UNKNOWN'),
+                'volatility_score': source['volatility_score'].fillna(0),
+                'market_phase': source['market_phase'].fillna('UNKNOWN'),
+
+                # Time features
+                'hour_of_day': timestamps.dt.hour,
+                'day_of_week': timestamps.dt.weekday,
+                'month': timestamps.dt.month,
+
+                # Trade outcome (target variables)
+                'pnl_usdt': source['pnl_usdt'],
+                'pnl_percentage': source['pnl_percentage'],
+                'duration_minutes': source['duration_minutes'].fillna(0),
+                'was_profitable': (source['pnl_usdt'] > 0).astype(int),
+                'risk_reward_ratio': source['risk_reward_ratio'].fillna(0),
+                'max_drawdown': source['max_drawdown'].fillna(0),
+                'exit_reason': source['exit_reason'].fillna('UNKNOWN')
+            })
+
+        except Exception as e:
+            self.logger.error(f"❌ Error building ML dataset: {e}")
+            return None
+
     def export_for_ml(self, output_file: str = None) -> str:
         """Export trades data for machine learning analysis"""
         if not output_file:
             output_file = self.trades_dir / f"ml_dataset_{datetime.now().strftime('%Y%m%d')}.csv"
 
         try:
-            # Create ML-friendly dataset
-            ml_data = []
-
-            for trade in self.trades:
-                if trade.trade_status == "CLOSED" and trade.pnl_usdt is not None:
-                    ml_record = {
-                        # Basic trade info
-                        'strategy': trade.strategy_name,
-                        'symbol': trade.symbol,
-                        'side': trade.side,
-                        'leverage': trade.leverage,
-                        'position_size_usdt': trade.position_value_usdt,
-
-                        # Technical indicators
-                        'rsi_entry': trade.rsi_at_entry or 0,
-                        'macd_entry': trade.macd_at_entry or 0,
-                        'sma_20_entry': trade.sma_20_at_entry or 0,
-                        'sma_50_entry': trade.sma_50_at_entry or 0,
-                        'volume_entry': trade.volume_at_entry or 0,
-                        'signal_strength': trade.entry_signal_strength or 0,
-
-                        # Market conditions
-                        'market_trend': trade.market_trend or 'UNKNOWN',
-                        'volatility_score': trade.volatility_score or 0,
-                        'market_phase': trade.market_phase or 'UNKNOWN',
-
-                        # Time features
-                        'hour_of_day': trade.timestamp.hour,
-                        'day_of_week': trade.timestamp.weekday(),
-                        'month': trade.timestamp.month,
-
-                        # Trade outcome (target variables)
-                        'pnl_usdt': trade.pnl_usdt,
-                        'pnl_percentage': trade.pnl_percentage,
-                        'duration_minutes': trade.duration_minutes or 0,
-                        'was_profitable': 1 if trade.pnl_usdt > 0 else 0,
-                        'risk_reward_ratio': trade.risk_reward_ratio or 0,
-                        'max_drawdown': trade.max_drawdown or 0,
-                        'exit_reason': trade.exit_reason or 'UNKNOWN'
-                    }
-                    ml_data.append(ml_record)
+            df = self.get_ml_dataframe()
 
             # Save to CSV
-            if ml_data:
-                df = pd.DataFrame(ml_data)
+            if df is not None:
                 df.to_csv(output_file, index=False)
-                self.logger.info(f"📊 ML dataset exported: {output_file} ({len(ml_data)} records)")
+                self.logger.info(f"📊 ML dataset exported: {output_file} ({len(df)} records)")
                 return str(output_file)
             else:
                 self.logger.warning("⚠️ No closed trades available for ML export")
@@ -374,11 +526,10 @@ class TradeLogger:
 
             # Fetch current market data for indicators
             try:
-                from src.binance_client.client import BinanceClientWrapper
-                binance_client = BinanceClientWrapper()
+                from src.binance_client.client import get_shared_client
 
-                # Get recent klines for indicator calculation
-                klines = binance_client.client.futures_klines(
+                # Get recent klines for indicator calculation (shared client: pooled, rate limited)
+                klines = get_shared_client().get_klines(
                     symbol=symbol,
                     interval='1h',  # 1-hour timeframe
                     limit=100  # Get enough data for indicators
@@ -513,10 +664,9 @@ class TradeLogger:
                 return False
 
             # Check for duplicates first
-            for existing_trade in self.trades:
-                if existing_trade.trade_id == trade_id:
-                    self.logger.warning(f"⚠️ Trade {trade_id} already exists in logger - skipping duplicate")
-                    return True  # Return success since trade is already logged
+            if self.get_trade(trade_id) is not None:
+                self.logger.warning(f"⚠️ Trade {trade_id} already exists in logger - skipping duplicate")
+                return True  # Return success since trade is already logged
 
             # Clean up any old field names that might cause issues
             if 'position_size_usdt' in trade_dict:
@@ -555,9 +705,9 @@ class TradeLogger:
             trade_record = TradeRecord(**{k: v for k, v in trade_dict.items() 
                                         if k in TradeRecord.__dataclass_fields__})
 
-            # Add to trades list and save
-            self.trades.append(trade_record)
-            self._save_trades()
+            # Add to trades list and persist in the background
+            self._append_trade(trade_record)
+            self.queue_save(trade_record.trade_id)
 
             self.logger.info(f"📝 TRADE LOGGED FROM DATABASE | {trade_record.trade_id} | {trade_record.symbol} | {trade_record.side} | ${trade_record.entry_price:.4f}")
             self.logger.debug(f"📝 TRADE DETAILS: {trade_record.to_dict()}")
@@ -568,19 +718,122 @@ class TradeLogger:
             self.logger.error(f"❌ Error logging trade: {e}")
             return False
 
-    def _save_trades(self):
-        """Save trades to both JSON and CSV files"""
-        try:
-            # Save to JSON
-            trades_data = [trade.to_dict() for trade in self.trades]
-            with open(self.trades_json_file, 'w') as f:
-                json.dump(trades_data, f, indent=2, default=str)
+    def queue_save(self, trade_id: str):
+        """Mark a trade dirty; the background writer appends it within TRADE_LOG_FLUSH_INTERVAL"""
+        with self._pending_lock:
+            if trade_id in self._pending:
+                self.write_stats['coalesced'] += 1
+            else:
+                self._pending[trade_id] = None
+                self.write_stats['queued'] += 1
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                self._writer_thread = threading.Thread(target=self._run_writer, daemon=True, name="trade-log-writer")
+                self._writer_thread.start()
+        self._pending_event.set()
+
+    def _run_writer(self):
+        """Writer thread: wait for dirty trades, let the window fill, then append them"""
+        while True:
+            self._pending_event.wait()
+            time.sleep(global_config.TRADE_LOG_FLUSH_INTERVAL)  # coalesce bursts (entry + DB sync + update)
+            self._pending_event.clear()
+            self._write_pending()
+
+    def _take_pending(self) -> List[str]:
+        with self._pending_lock:
+            trade_ids = list(self._pending)
+            self._pending.clear()
+        return trade_ids
+
+    def _write_pending(self):
+        """Append dirty trades to the JSONL journal and CSV; compact when due"""
+        with self._write_lock:
+            trade_ids = self._take_pending()
+            try:
+                if trade_ids:
+                    journal_lines = []
+                    csv_rows = []
+                    for trade_id in trade_ids:
+                        trade = self.get_trade(trade_id)
+                        if trade is None:
+                            journal_lines.append(json.dumps({'trade_id': trade_id, '_removed': True}))
+                            continue
+                        trade_dict = trade.to_dict()
+                        journal_lines.append(json.dumps(trade_dict, default=str))
+                        csv_rows.append(trade_dict)
+
+                    with open(self.trades_journal_file, 'a') as f:
+                        f.write('\n'.join(journal_lines) + '\n')
+                    if csv_rows:
+                        self._append_csv_rows(csv_rows)
+                        trade_history.append([row for row in csv_rows
+                                              if row['trade_status'] == "CLOSED" and row['pnl_usdt'] is not None])
+
+                    self._journal_lines += len(journal_lines)
+                    self.write_stats['appended'] += len(journal_lines)
+
+                if self._journal_lines and (
+                        self._journal_lines >= global_config.TRADE_LOG_COMPACT_EVERY
+                        or time.time() - self._last_compaction >= global_config.TRADE_LOG_COMPACT_INTERVAL):
+                    self._compact()
 
-            # Save to CSV
-            if trades_data:
-                df = pd.DataFrame(trades_data)
-                df.to_csv(self.trades_csv_file, index=False)
+            except Exception as e:
+                # Put them back so the next pass retries
+                with self._pending_lock:
+                    for trade_id in trade_ids:
+                        self._pending.setdefault(trade_id, None)
+                self.logger.error(f"❌ Error writing trade log: {e}")
+
+    def _append_csv_rows(self, rows: List[Dict[str, Any]]):
+        """Append rows to the CSV (header only when the file is new); compaction drops superseded rows"""
+        fieldnames = list(TradeRecord.__dataclass_fields__)
+        write_header = not self.trades_csv_file.exists() or self.trades_csv_file.stat().st_size == 0
+        with open(self.trades_csv_file, 'a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            if write_header:
+                writer.writeheader()
+            writer.writerows(rows)
+
+    def _compact(self):
+        """Rewrite the JSON snapshot and CSV from memory, then truncate the journal (caller holds _write_lock)"""
+        trades_data = [trade.to_dict() for trade in list(self.trades)]
+
+        json_tmp = self.trades_json_file.with_suffix('.json.tmp')
+        with open(json_tmp, 'w') as f:
+            json.dump(trades_data, f, indent=2, default=str)
+        os.replace(json_tmp, self.trades_json_file)
+
+        csv_tmp = self.trades_csv_file.with_suffix('.csv.tmp')
+        with open(csv_tmp, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(TradeRecord.__dataclass_fields__), extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(trades_data)
+        os.replace(csv_tmp, self.trades_csv_file)
+
+        # Snapshot is durable - journal entries up to now are redundant
+        with open(self.trades_journal_file, 'w'):
+            pass
+        self._journal_lines = 0
+        self._last_compaction = time.time()
+        self.write_stats['compactions'] += 1
+        self.logger.debug(f"🗜️ Trade log compacted | {len(trades_data)} trades")
+
+    def flush(self):
+        """Write everything pending and compact (shutdown hook; also registered with atexit)"""
+        try:
+            self._write_pending()
+            with self._write_lock:
+                if self._journal_lines:
+                    self._compact()
+        except Exception as e:
+            self.logger.error(f"❌ Error flushing trade log: {e}")
 
+    def _save_trades(self):
+        """Synchronously write every trade (for callers that edit self.trades directly)"""
+        try:
+            with self._write_lock:
+                self._take_pending()
+                self._compact()
         except Exception as e:
             self.logger.error(f"❌ Error saving trades: {e}")
 
@@ -609,8 +862,8 @@ class TradeLogger:
         try:
             self.logger.info(f"🔍 DEBUG: Starting sync for trade {trade_id}")
 
-            from src.execution_engine.trade_database import TradeDatabase
-            trade_db = TradeDatabase()
+            from src.execution_engine.trade_database import get_trade_database
+            trade_db = get_trade_database()
 
             self.logger.info(f"🔍 DEBUG: Database loaded with {len(trade_db.trades)} existing trades")
 
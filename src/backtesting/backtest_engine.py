@@ -0,0 +1,443 @@
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.execution_engine.position_sizing import fallback_symbol_info, quantity_for_margin
+from src.strategy_processor.signal_processor import SignalProcessor, SignalType
+
+# Strategy modules whose per-signal info logs are muted while replaying history
+STRATEGY_LOGGERS = (
+    'src.strategy_processor.signal_processor',
+    'src.execution_engine.strategies.macd_divergence_strategy',
+    'src.execution_engine.strategies.engulfing_pattern_strategy',
+    'src.execution_engine.strategies.smart_money_config',
+)
+
+
+def calculate_base_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized copy of PriceFetcher.calculate_indicators (RSI, MACD, SMA, Bollinger, engulfing)
+
+    Kept here so a backtest does not need the exchange client that price_fetcher imports.
+    """
+    df = df.copy()
+    close = df['close']
+
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    rs = gain / loss.replace(0, 0.000001)
+    df['rsi'] = 100 - (100 / (1 + rs))
+
+    exp1 = close.ewm(span=12, adjust=False).mean()
+    exp2 = close.ewm(span=26, adjust=False).mean()
+    df['macd'] = exp1 - exp2
+    df['macd_signal'] = df['macd'].ewm(span=9, adjust=False).mean()
+    df['macd_histogram'] = df['macd'] - df['macd_signal']
+
+    df['sma_20'] = close.rolling(window=20).mean()
+    df['sma_50'] = close.rolling(window=50).mean()
+
+    std20 = close.rolling(window=20).std()
+    df['bb_upper'] = df['sma_20'] + (std20 * 2)
+    df['bb_lower'] = df['sma_20'] - (std20 * 2)
+    df['bb_middle'] = df['sma_20']
+
+    prev_open = df['open'].shift(1)
+    prev_close = close.shift(1)
+    df['bullish_engulfing'] = (prev_close < prev_open) & (close > df['open']) & \
+                              (df['open'] < prev_close) & (close > prev_open)
+    df['bearish_engulfing'] = (prev_close > prev_open) & (close < df['open']) & \
+                              (df['open'] > prev_close) & (close < prev_open)
+    return df
+
+
+def candles_to_frame(candles: np.ndarray) -> pd.DataFrame:
+    """OHLCV archive records -> DataFrame shaped like PriceFetcher.fetch_market_data output"""
+    df = pd.DataFrame({
+        'open': candles['open'], 'high': candles['high'], 'low': candles['low'],
+        'close': candles['close'], 'volume': candles['volume'], 'close_time': candles['close_time']
+    }, index=pd.to_datetime(candles['timestamp'], unit='ms'))
+    df.index.name = 'timestamp'
+    return df
+
+
+@dataclass
+class BacktestTrade:
+    strategy_name: str
+    symbol: str
+    side: str
+    entry_time: datetime
+    entry_price: float
+    quantity: float
+    margin_used: float
+    leverage: int
+    stop_loss: float
+    take_profit: float
+    exit_time: Optional[datetime] = None
+    exit_price: Optional[float] = None
+    exit_reason: str = ""
+    pnl_usdt: float = 0.0
+    pnl_percentage: float = 0.0
+    partial_tp_amount: float = 0.0
+    duration_minutes: int = 0
+
+
+@dataclass
+class BacktestResult:
+    strategy_name: str
+    symbol: str
+    timeframe: str
+    candles: int
+    trades: List[BacktestTrade] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        pnl = np.array([trade.pnl_usdt for trade in self.trades], dtype=float)
+        equity = np.cumsum(pnl)
+        drawdown = np.maximum.accumulate(np.concatenate([[0.0], equity]))[1:] - equity if len(pnl) else pnl
+        gross_profit = pnl[pnl > 0].sum()
+        gross_loss = -pnl[pnl < 0].sum()
+
+        return {
+            'strategy': self.strategy_name,
+            'symbol': self.symbol,
+            'timeframe': self.timeframe,
+            'candles': self.candles,
+            'total_trades': len(pnl),
+            'winning_trades': int((pnl > 0).sum()),
+            'win_rate': round(float((pnl > 0).mean() * 100), 1) if len(pnl) else 0.0,
+            'total_pnl': round(float(pnl.sum()), 2),
+            'avg_pnl': round(float(pnl.mean()), 2) if len(pnl) else 0.0,
+            'max_drawdown': round(float(drawdown.max()), 2) if len(pnl) else 0.0,
+            'profit_factor': round(float(gross_profit / gross_loss), 2) if gross_loss > 0 else None,
+            'sharpe_ratio': self.sharpe_ratio(),
+            'elapsed_seconds': round(self.elapsed_seconds, 2)
+        }
+
+    def sharpe_ratio(self) -> Optional[float]:
+        """Annualized Sharpe of daily PnL as a return on the margin committed (markets trade 365 days)"""
+        if len(self.trades) < 2:
+            return None
+        daily_pnl = pd.Series(
+            [trade.pnl_usdt for trade in self.trades],
+            index=pd.DatetimeIndex([trade.exit_time for trade in self.trades])
+        ).resample('1D').sum()
+        returns = daily_pnl / np.mean([trade.margin_used for trade in self.trades])
+        std = returns.std()
+        if not std or np.isnan(std):
+            return None
+        return round(float(returns.mean() / std * np.sqrt(365)), 2)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame([asdict(trade) for trade in self.trades])
+
+
+class BacktestEngine:
+    """Replays candles through the live entry/exit logic
+
+    Indicators are calculated once over the whole history (vectorized), and a
+    vectorized pre-filter marks the candles where a strategy's conditions
+    could possibly hold. Only those candles are handed to the real
+    SignalProcessor / strategy code, on the same trailing window the bot
+    uses, so signals are exactly what the live code would produce. The
+    per-candle loop only tracks position state: intrabar SL/TP from the
+    candle's high/low (stop loss first when both are touched), the partial
+    take profit from OrderManager.check_partial_take_profit, strategy exits
+    at candle close, the bot's signal cooldown, and OrderManager's
+    margin/leverage position sizing.
+    """
+
+    def __init__(self, symbol_info: Optional[Dict[str, Dict]] = None, signal_cooldown_minutes: int = 15):
+        self.logger = logging.getLogger(__name__)
+        self.signal_processor = SignalProcessor()
+        self.symbol_info = symbol_info or {}  # symbol -> {'min_qty', 'step_size', 'precision'}
+        self.signal_cooldown_minutes = signal_cooldown_minutes
+
+    @staticmethod
+    def _window_size(timeframe: str) -> int:
+        """Candles per evaluation (same as BotManager._get_data_limit)"""
+        if timeframe in ['1m', '3m', '5m']:
+            return 300
+        elif timeframe in ['15m', '30m', '1h']:
+            return 200
+        return 150
+
+    def _get_symbol_info(self, symbol: str) -> Dict:
+        return self.symbol_info.get(symbol) or fallback_symbol_info(symbol)
+
+    @contextmanager
+    def _quiet_strategy_logs(self):
+        loggers = [logging.getLogger(name) for name in STRATEGY_LOGGERS]
+        levels = [logger.level for logger in loggers]
+        for logger in loggers:
+            logger.setLevel(logging.WARNING)
+        try:
+            yield
+        finally:
+            for logger, level in zip(loggers, levels):
+                logger.setLevel(level)
+
+    def load_candles(self, symbol: str, timeframe: str, start: Optional[datetime] = None,
+                     end: Optional[datetime] = None) -> Optional[pd.DataFrame]:
+        """Archived candles for symbol/timeframe (None if the archive is disabled or empty)"""
+        from src.data_fetcher.ohlcv_archive import ohlcv_archive
+
+        if ohlcv_archive is None:
+            self.logger.warning("⚠️ OHLCV archive disabled - pass candles to run() directly")
+            return None
+
+        candles = ohlcv_archive.read(
+            symbol, timeframe,
+            start_time=int(start.timestamp() * 1000) if start else None,
+            end_time=int(end.timestamp() * 1000) if end else None
+        )
+        if candles is None or not len(candles):
+            return None
+        return candles_to_frame(candles)
+
+    def _prepare(self, config: Dict, candles: pd.DataFrame):
+        """Indicator frame plus vectorized entry/exit candidate masks (supersets of the real conditions)
+
+        Returns (frame, entry_mask, exit_long_mask, exit_short_mask, smart_money_strategy).
+        """
+        name = config['name'].lower()
+        frame = calculate_base_indicators(candles)
+        everywhere = np.ones(len(frame), dtype=bool)
+        nowhere = np.zeros(len(frame), dtype=bool)
+
+        if 'rsi' in name and 'engulfing' not in name:
+            rsi = frame['rsi'].to_numpy()
+            entry = (rsi <= config.get('rsi_long_entry', 40)) | (rsi >= config.get('rsi_short_entry', 60))
+            return (frame, entry, rsi >= config.get('rsi_long_exit', 70),
+                    rsi <= config.get('rsi_short_exit', 30), None)
+
+        if 'macd' in name:
+            from src.execution_engine.strategies.macd_divergence_strategy import MACDDivergenceStrategy
+
+            strategy = MACDDivergenceStrategy(config)
+            frame = strategy.calculate_indicators(frame)
+            histogram = frame['macd_histogram']
+            momentum = histogram.diff()
+            trend = histogram - histogram.shift(2)
+            above = frame['macd'] > frame['macd_signal']
+            below = frame['macd'] < frame['macd_signal']
+            entry = ((below & (momentum > 0) & (trend > 0)) | (above & (momentum < 0) & (trend < 0))) & \
+                    (momentum.abs() >= strategy.min_histogram_threshold)
+            # Momentum peak/bottom before the crossover (evaluate_exit_signal)
+            strong = momentum.abs() >= strategy.exit_threshold
+            exit_long = (histogram > 0) & (histogram.shift(1) > histogram.shift(2)) & \
+                        (momentum < momentum.shift(1)) & strong
+            exit_short = (histogram < 0) & (histogram.shift(1) < histogram.shift(2)) & \
+                         (momentum > momentum.shift(1)) & strong
+            return frame, entry.to_numpy(), exit_long.to_numpy(), exit_short.to_numpy(), None
+
+        if 'engulfing' in name:
+            from src.execution_engine.strategies.engulfing_pattern_strategy import EngulfingPatternStrategy
+
+            strategy = EngulfingPatternStrategy(config['name'], config)
+            frame = strategy.calculate_indicators(frame)
+            rsi = frame['rsi']
+            close_ago = frame[f'close_{strategy.price_lookback_bars}_ago']
+            long_setup = frame['bullish_engulfing'] & (rsi < strategy.rsi_threshold) & (frame['close'] < close_ago)
+            short_setup = frame['bearish_engulfing'] & (rsi > strategy.rsi_threshold) & (frame['close'] > close_ago)
+            entry = ((long_setup | short_setup) & frame['stable_candle']).to_numpy()
+            rsi = rsi.to_numpy()
+            return frame, entry, rsi >= strategy.rsi_long_exit, rsi <= strategy.rsi_short_exit, None
+
+        if 'smart' in name and 'money' in name:
+            from src.execution_engine.strategies.smart_money_config import SmartMoneyStrategy
+
+            strategy = SmartMoneyStrategy(config)
+            volume = frame['volume']
+            avg_volume = volume.shift(1).rolling(19).mean()
+            entry = (volume >= avg_volume * strategy.volume_spike_multiplier * (1 - 1e-9)).to_numpy()
+
+            # Session filter evaluated once per UTC hour with the strategy's own session rules
+            session_open = np.zeros(24, dtype=bool)
+            for hour in range(24):
+                strategy.clock = lambda hour=hour: datetime(2000, 1, 1, hour, tzinfo=timezone.utc)
+                session_open[hour] = strategy._is_trading_session_active()
+            entry = entry & session_open[frame.index.hour.to_numpy()]
+            # should_exit_position defers to SL/TP, so there are no strategy exits to evaluate
+            return frame, entry, nowhere, nowhere, strategy
+
+        self.logger.warning(f"⚠️ BACKTEST | Unknown strategy type: {config['name']} - no signals")
+        return frame, nowhere, everywhere, everywhere, None
+
+    def run(self, strategy_name: str, strategy_config: Dict, candles: pd.DataFrame) -> BacktestResult:
+        """Simulate one strategy over candles (DataFrame indexed by open time with OHLCV columns)"""
+        started = time.perf_counter()
+        config = {**strategy_config, 'name': strategy_name}
+        symbol = config.get('symbol', '')
+        timeframe = config.get('timeframe', '')
+        result = BacktestResult(strategy_name, symbol, timeframe, len(candles))
+        window = self._window_size(timeframe)
+        if len(candles) < window:
+            self.logger.warning(f"⚠️ BACKTEST | {strategy_name} | Need at least {window} candles, got {len(candles)}")
+            return result
+
+        with self._quiet_strategy_logs():
+            frame, entry_mask, exit_long, exit_short, smart_money = self._prepare(config, candles)
+            frame = frame.copy()  # consolidate column blocks - makes the per-window slices cheaper
+
+            margin = config.get('margin', 50.0)
+            leverage = config.get('leverage', 5)
+            info = self._get_symbol_info(symbol)
+            precision = config.get('decimals', info['precision'])
+            partial_threshold = config.get('partial_tp_pnl_threshold', 0.0)
+            partial_percentage = config.get('partial_tp_position_percentage', 0.0)
+            partial_enabled = partial_threshold > 0 and partial_percentage > 0
+            cooldown_ns = self.signal_cooldown_minutes * 60 * 1_000_000_000
+
+            times = frame.index
+            time_ns = times.as_unit('ns').asi8
+            opens, highs = frame['open'].to_numpy(), frame['high'].to_numpy()
+            lows, closes = frame['low'].to_numpy(), frame['close'].to_numpy()
+            raw_klines = np.column_stack([time_ns // 1_000_000, opens, highs, lows, closes,
+                                          frame['volume'].to_numpy()]) if smart_money else None
+
+            last_signal_ns: Dict[str, int] = {}
+            trade: Optional[BacktestTrade] = None
+            position: Dict[str, Any] = {}
+
+            def close_trade(i: int, price: float, reason: str):
+                nonlocal trade
+                direction = 1 if trade.side == 'BUY' else -1
+                remaining_pnl = (price - trade.entry_price) * position['quantity'] * direction
+                trade.exit_time = times[i].to_pydatetime()
+                trade.exit_price = float(price)
+                trade.exit_reason = reason
+                trade.pnl_usdt = float(remaining_pnl + trade.partial_tp_amount)
+                trade.pnl_percentage = trade.pnl_usdt / trade.margin_used * 100
+                trade.duration_minutes = int((time_ns[i] - position['entry_ns']) // 60_000_000_000)
+                result.trades.append(trade)
+                trade = None
+
+            for i in range(window - 1, len(frame)):
+                if trade is not None:
+                    is_long = trade.side == 'BUY'
+                    stop_loss, take_profit = trade.stop_loss, trade.take_profit
+
+                    # Stop loss first when a candle touches both levels (conservative); gaps fill at the open
+                    if (is_long and lows[i] <= stop_loss) or (not is_long and highs[i] >= stop_loss):
+                        fill = min(opens[i], stop_loss) if is_long else max(opens[i], stop_loss)
+                        close_trade(i, fill, 'STOP_LOSS')
+                    else:
+                        if partial_enabled and not position['partial_taken']:
+                            # Price at which PnL on the margin reaches the threshold
+                            move = partial_threshold / 100 * trade.margin_used / position['quantity']
+                            level = trade.entry_price + move if is_long else trade.entry_price - move
+                            if (is_long and highs[i] >= level) or (not is_long and lows[i] <= level):
+                                fill = max(opens[i], level) if is_long else min(opens[i], level)
+                                close_quantity = round(position['original_quantity'] * partial_percentage / 100.0, precision)
+                                close_quantity = min(max(close_quantity, info['min_qty']), position['quantity'])
+                                trade.partial_tp_amount = float((fill - trade.entry_price) * close_quantity * (1 if is_long else -1))
+                                position['quantity'] -= close_quantity
+                                position['partial_taken'] = True
+
+                        if (is_long and highs[i] >= take_profit) or (not is_long and lows[i] <= take_profit):
+                            fill = max(opens[i], take_profit) if is_long else min(opens[i], take_profit)
+                            close_trade(i, fill, 'TAKE_PROFIT')
+                        elif position['quantity'] <= 0:
+                            close_trade(i, closes[i], 'PARTIAL_TP')
+                        elif (exit_long if is_long else exit_short)[i]:
+                            exit_reason = self.signal_processor.evaluate_exit_conditions(
+                                frame.iloc[i - window + 1:i + 1], position, config)
+                            if exit_reason:
+                                close_trade(i, closes[i], exit_reason)
+
+                if trade is not None or not entry_mask[i]:
+                    continue
+                if all(time_ns[i] - last_signal_ns.get(side, -cooldown_ns) < cooldown_ns for side in ('BUY', 'SELL')):
+                    continue  # any signal would be dropped by the cooldown
+
+                if smart_money is not None:
+                    candle_time = times[i].to_pydatetime().replace(tzinfo=timezone.utc)
+                    smart_money.clock = lambda: candle_time
+                    signal = smart_money.analyze_market(raw_klines[i - window + 1:i + 1].tolist(), closes[i])
+                else:
+                    signal = self.signal_processor.evaluate_entry_conditions(
+                        frame.iloc[i - window + 1:i + 1], config, indicators_ready=True)
+                if not signal:
+                    continue
+
+                # Same per strategy/symbol/side cooldown as the bot
+                side_key = signal.signal_type.value
+                if time_ns[i] - last_signal_ns.get(side_key, -cooldown_ns) < cooldown_ns:
+                    continue
+                last_signal_ns[side_key] = time_ns[i]
+
+                quantity, margin_used, _ = quantity_for_margin(
+                    signal.entry_price, margin, leverage, info['min_qty'], info['step_size'], precision)
+                side = 'BUY' if signal.signal_type == SignalType.BUY else 'SELL'
+                trade = BacktestTrade(
+                    strategy_name=strategy_name, symbol=symbol, side=side,
+                    entry_time=times[i].to_pydatetime(), entry_price=float(signal.entry_price),
+                    quantity=float(quantity), margin_used=float(margin_used), leverage=leverage,
+                    stop_loss=float(signal.stop_loss), take_profit=float(signal.take_profit)
+                )
+                position = {
+                    'side': side, 'entry_price': signal.entry_price, 'stop_loss': signal.stop_loss,
+                    'take_profit': signal.take_profit, 'quantity': quantity, 'original_quantity': quantity,
+                    'partial_taken': False, 'entry_ns': time_ns[i]
+                }
+
+            if trade is not None:
+                close_trade(len(frame) - 1, closes[-1], 'END_OF_DATA')
+
+        result.elapsed_seconds = time.perf_counter() - started
+        summary = result.summary()
+        self.logger.info(f"📊 BACKTEST | {strategy_name} | {symbol} {timeframe} | {len(candles)} candles | "
+                         f"Trades: {summary['total_trades']} | Win rate: {summary['win_rate']}% | "
+                         f"PnL: ${summary['total_pnl']:.2f} | Max DD: ${summary['max_drawdown']:.2f} | "
+                         f"{result.elapsed_seconds:.2f}s")
+        return result
+
+    def run_all(self, strategies: Optional[Dict[str, Dict]] = None, start: Optional[datetime] = None,
+                end: Optional[datetime] = None) -> Dict[str, BacktestResult]:
+        """Backtest every configured strategy on its archived symbol/timeframe candles"""
+        if strategies is None:
+            from src.config.trading_config import trading_config_manager
+            strategies = trading_config_manager.get_all_strategies()
+
+        results = {}
+        candles_by_stream: Dict[tuple, Optional[pd.DataFrame]] = {}
+        for strategy_name, config in strategies.items():
+            stream = (config.get('symbol', ''), config.get('timeframe', ''))
+            if stream not in candles_by_stream:
+                candles_by_stream[stream] = self.load_candles(stream[0], stream[1], start, end)
+
+            candles = candles_by_stream[stream]
+            if candles is None:
+                self.logger.warning(f"⚠️ BACKTEST | {strategy_name} | No archived candles for {stream[0]} {stream[1]}")
+                continue
+            results[strategy_name] = self.run(strategy_name, config, candles)
+        return results
+
+
+def main():
+    """python -m src.backtesting.backtest_engine [strategy ...]"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    from src.config.trading_config import trading_config_manager
+
+    strategies = trading_config_manager.get_all_strategies()
+    wanted = sys.argv[1:]
+    if wanted:
+        strategies = {name: config for name, config in strategies.items() if name in wanted}
+
+    results = BacktestEngine().run_all(strategies)
+    if not results:
+        print("No archived candles to backtest")
+        return
+    print(pd.DataFrame([result.summary() for result in results.values()]).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
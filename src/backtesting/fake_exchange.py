@@ -0,0 +1,311 @@
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.backtesting.market_replay import ReplayMarket
+from src.execution_engine.position_sizing import fallback_symbol_info
+
+MAINTENANCE_MARGIN_RATE = 0.004
+
+
+class FakeExchangeError(Exception):
+    """Rejected request (same code/message attributes as the exchange client's API errors)"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"APIError(code={code}): {message}")
+        self.code = code
+        self.message = message
+
+
+class FakeExchangeClient:
+    """In-process stand-in for the exchange client used by BinanceClientWrapper
+
+    Implements the subset of the client the bot calls (ping, tickers,
+    klines, account, positions, market orders, leverage/margin type,
+    exchange info, listen keys), priced from a ReplayMarket. MARKET orders
+    fill immediately at the replay price; positions are tracked per
+    (symbol, positionSide) in hedge mode or net under 'BOTH'. Balances are
+    a single USDT wallet with cross margin. latency_ms adds a fixed delay to
+    every call to stand in for the network round trip.
+    """
+
+    API_URL = FUTURES_URL = "replay://fake-exchange"
+    session = None  # no HTTP session to pool
+
+    def __init__(self, market: ReplayMarket, balance: float = 10000.0, fee_rate: float = 0.0004,
+                 latency_ms: float = 0.0):
+        self.logger = logging.getLogger(__name__)
+        self.market = market
+        self.wallet_balance = float(balance)
+        self.fee_rate = fee_rate
+        self.latency_ms = latency_ms
+
+        self.positions: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self.leverage: Dict[str, int] = {}
+        self.orders: List[Dict[str, Any]] = []
+        self._order_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'orders': 0, 'realized_pnl': 0.0, 'fees': 0.0}
+
+    def _request(self):
+        self.stats['requests'] += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+    def _price(self, symbol: str) -> float:
+        price = self.market.price(symbol)
+        if price is None:
+            raise FakeExchangeError(-1121, "Invalid symbol.")
+        return price
+
+    # Connectivity
+
+    def ping(self) -> Dict:
+        self._request()
+        return {}
+
+    futures_ping = ping
+
+    # Market data
+
+    def futures_symbol_ticker(self, symbol: Optional[str] = None, **params):
+        self._request()
+        if symbol is None:
+            return [{'symbol': s, 'price': f"{self._price(s):.8f}"} for s in self.market.symbols()]
+        return {'symbol': symbol.upper(), 'price': f"{self._price(symbol):.8f}", 'time': self.market.now_ms()}
+
+    get_symbol_ticker = futures_symbol_ticker
+
+    def futures_klines(self, symbol: str, interval: str, limit: int = 500, startTime: Optional[int] = None,
+                       endTime: Optional[int] = None, **params) -> List[List[Any]]:
+        self._request()
+        return self.market.klines(symbol, interval, limit=min(int(limit), 1500), start_time=startTime, end_time=endTime)
+
+    get_klines = futures_klines
+
+    def get_historical_klines(self, symbol: str, interval: str, start_str=None, end_str=None,
+                              limit: int = 1000, **params) -> List[List[Any]]:
+        return self.futures_klines(symbol, interval, limit=limit)
+
+    def futures_exchange_info(self, **params) -> Dict[str, Any]:
+        self._request()
+        symbols = []
+        for symbol in self.market.symbols():
+            info = fallback_symbol_info(symbol)
+            symbols.append({
+                'symbol': symbol,
+                'status': 'TRADING',
+                'quantityPrecision': info['precision'],
+                'pricePrecision': 2,
+                'filters': [
+                    {'filterType': 'PRICE_FILTER', 'tickSize': '0.01'},
+                    {'filterType': 'LOT_SIZE', 'minQty': str(info['min_qty']), 'stepSize': str(info['step_size']),
+                     'maxQty': '1000000'},
+                    {'filterType': 'MARKET_LOT_SIZE', 'minQty': str(info['min_qty']),
+                     'stepSize': str(info['step_size']), 'maxQty': '1000000'},
+                    {'filterType': 'MIN_NOTIONAL', 'notional': '5'}
+                ]
+            })
+        return {'timezone': 'UTC', 'serverTime': self.market.now_ms(), 'symbols': symbols}
+
+    get_exchange_info = futures_exchange_info
+
+    # Account
+
+    def _position_rows(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        rows = []
+        for (pos_symbol, position_side), position in sorted(self.positions.items()):
+            if symbol and pos_symbol != symbol.upper():
+                continue
+            amount, entry = position['amount'], position['entry']
+            mark = self._price(pos_symbol)
+            leverage = self.leverage.get(pos_symbol, 20)
+            notional = amount * mark
+            rows.append({
+                'symbol': pos_symbol,
+                'positionSide': position_side,
+                'positionAmt': f"{amount:.8f}",
+                'entryPrice': f"{entry:.8f}",
+                'markPrice': f"{mark:.8f}",
+                'unRealizedProfit': f"{amount * (mark - entry):.8f}",
+                'unrealizedProfit': f"{amount * (mark - entry):.8f}",
+                'notional': f"{notional:.8f}",
+                'initialMargin': f"{abs(notional) / leverage:.8f}",
+                'maintMargin': f"{abs(notional) * MAINTENANCE_MARGIN_RATE:.8f}",
+                'leverage': str(leverage),
+                'marginType': 'cross',
+                'isolatedMargin': '0',
+                'updateTime': self.market.now_ms()
+            })
+        return rows
+
+    def futures_position_information(self, symbol: Optional[str] = None, **params) -> List[Dict[str, Any]]:
+        self._request()
+        with self._lock:
+            return self._position_rows(symbol)
+
+    def futures_account(self, **params) -> Dict[str, Any]:
+        self._request()
+        with self._lock:
+            positions = self._position_rows()
+            unrealized = sum(float(p['unRealizedProfit']) for p in positions)
+            initial_margin = sum(float(p['initialMargin']) for p in positions)
+            maint_margin = sum(float(p['maintMargin']) for p in positions)
+            margin_balance = self.wallet_balance + unrealized
+            available = max(0.0, margin_balance - initial_margin)
+
+            return {
+                'canTrade': True,
+                'totalWalletBalance': f"{self.wallet_balance:.8f}",
+                'totalUnrealizedProfit': f"{unrealized:.8f}",
+                'totalMarginBalance': f"{margin_balance:.8f}",
+                'totalInitialMargin': f"{initial_margin:.8f}",
+                'totalMaintMargin': f"{maint_margin:.8f}",
+                'availableBalance': f"{available:.8f}",
+                'maxWithdrawAmount': f"{available:.8f}",
+                'assets': [{
+                    'asset': 'USDT',
+                    'walletBalance': f"{self.wallet_balance:.8f}",
+                    'unrealizedProfit': f"{unrealized:.8f}",
+                    'marginBalance': f"{margin_balance:.8f}",
+                    'crossWalletBalance': f"{self.wallet_balance:.8f}",
+                    'availableBalance': f"{available:.8f}",
+                    'initialMargin': f"{initial_margin:.8f}",
+                    'maintMargin': f"{maint_margin:.8f}"
+                }],
+                'positions': positions
+            }
+
+    def get_account(self, **params) -> Dict[str, Any]:
+        account = self.futures_account()
+        return {
+            'canTrade': True,
+            'balances': [{'asset': 'USDT', 'free': account['availableBalance'],
+                          'locked': account['totalInitialMargin']}]
+        }
+
+    # Trading
+
+    def futures_change_leverage(self, symbol: str, leverage: int, **params) -> Dict[str, Any]:
+        self._request()
+        if not 1 <= int(leverage) <= 125:
+            raise FakeExchangeError(-4028, "Leverage is not valid")
+        self.leverage[symbol.upper()] = int(leverage)
+        return {'symbol': symbol.upper(), 'leverage': int(leverage), 'maxNotionalValue': '1000000'}
+
+    def futures_change_margin_type(self, symbol: str, marginType: str = "CROSSED", **params) -> Dict[str, Any]:
+        self._request()
+        return {'code': 200, 'msg': 'success'}
+
+    def futures_create_order(self, symbol: str, side: str, type: str = "MARKET", quantity: float = 0,
+                             positionSide: str = "BOTH", reduceOnly: Any = False, **params) -> Dict[str, Any]:
+        self._request()
+        if type.upper() != "MARKET":
+            raise FakeExchangeError(-1116, f"Order type {type} is not supported by the replay exchange.")
+
+        symbol, side, position_side = symbol.upper(), side.upper(), positionSide.upper()
+        quantity = float(quantity)
+        if quantity <= 0:
+            raise FakeExchangeError(-4003, "Quantity less than or equal to zero.")
+        if position_side != "BOTH" and str(reduceOnly).lower() == "true":
+            raise FakeExchangeError(-1106, "Parameter 'reduceonly' sent when not required.")
+
+        with self._lock:
+            price = self._price(symbol)
+            position = self.positions.setdefault((symbol, position_side), {'amount': 0.0, 'entry': 0.0})
+            delta = quantity if side == "BUY" else -quantity
+
+            if (position_side == "LONG" and side == "SELL") or (position_side == "SHORT" and side == "BUY"):
+                if quantity > abs(position['amount']) + 1e-12:
+                    raise FakeExchangeError(-2022, "ReduceOnly Order is rejected.")
+            elif str(reduceOnly).lower() == "true" and (position['amount'] * delta >= 0 or
+                                                         quantity > abs(position['amount']) + 1e-12):
+                raise FakeExchangeError(-2022, "ReduceOnly Order is rejected.")
+
+            realized = self._apply_fill(position, delta, price)
+            fee = price * quantity * self.fee_rate
+            self.wallet_balance += realized - fee
+            self.stats['realized_pnl'] += realized
+            self.stats['fees'] += fee
+            self.stats['orders'] += 1
+            if abs(position['amount']) < 1e-12:
+                del self.positions[(symbol, position_side)]
+
+            order = {
+                'orderId': next(self._order_ids),
+                'clientOrderId': f"replay_{self.stats['orders']}",
+                'symbol': symbol,
+                'side': side,
+                'positionSide': position_side,
+                'type': 'MARKET',
+                'status': 'FILLED',
+                'reduceOnly': str(reduceOnly).lower() == "true",
+                'origQty': f"{quantity}",
+                'executedQty': f"{quantity}",
+                'price': '0',
+                'avgPrice': f"{price:.8f}",
+                'cumQuote': f"{price * quantity:.8f}",
+                'updateTime': self.market.now_ms()
+            }
+            self.orders.append(order)
+
+        self.logger.debug(f"🧪 FAKE FILL | {symbol} | {side} {quantity} {position_side} @ {price:.4f} | "
+                          f"Realized: {realized:+.4f}")
+        return order
+
+    create_order = futures_create_order
+
+    @staticmethod
+    def _apply_fill(position: Dict[str, float], delta: float, price: float) -> float:
+        """Apply a signed fill to a position; returns realized PnL"""
+        amount, entry = position['amount'], position['entry']
+        if amount == 0 or amount * delta > 0:
+            new_amount = amount + delta
+            position['entry'] = (amount * entry + delta * price) / new_amount
+            position['amount'] = new_amount
+            return 0.0
+
+        closed = min(abs(delta), abs(amount))
+        realized = closed * (price - entry) * (1 if amount > 0 else -1)
+        new_amount = amount + delta
+        if amount * new_amount < 0:
+            position['entry'] = price  # flipped through zero (one-way mode)
+        position['amount'] = new_amount
+        return realized
+
+    def futures_get_open_orders(self, symbol: Optional[str] = None, **params) -> List[Dict[str, Any]]:
+        self._request()
+        return []  # market orders fill immediately
+
+    get_open_orders = futures_get_open_orders
+
+    def futures_cancel_order(self, symbol: str, orderId: Optional[int] = None, **params):
+        self._request()
+        raise FakeExchangeError(-2011, "Unknown order sent.")
+
+    cancel_order = futures_cancel_order
+
+    # User data stream (not simulated; the harness runs with USER_DATA_STREAM=false)
+
+    def futures_stream_get_listen_key(self) -> str:
+        self._request()
+        return "replay-listen-key"
+
+    def futures_stream_keepalive(self, listenKey: str) -> Dict:
+        self._request()
+        return {}
+
+    def futures_stream_close(self, listenKey: str) -> Dict:
+        self._request()
+        return {}
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            open_positions = len(self.positions)
+        return {**self.stats, 'wallet_balance': self.wallet_balance, 'open_positions': open_positions}
+
+
+# Fake exchange the client wrapper connects to when EXCHANGE_REPLAY is set (installed by the replay harness)
+active_exchange: Optional[FakeExchangeClient] = None
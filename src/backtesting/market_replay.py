@@ -0,0 +1,348 @@
+import asyncio
+import base64
+import hashlib
+import heapq
+import json
+import logging
+import struct
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.data_fetcher.ohlcv_archive import INTERVAL_MS
+
+MIN_SPEED = 1.0
+MAX_SPEED = 1000.0
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class ReplayMarket:
+    """Recorded candles on a replay clock, shared by the fake exchange and the stream server
+
+    candles maps (symbol, interval) to CANDLE_DTYPE records. The first warmup
+    candles of every stream are history (served over REST when the bot
+    bootstraps); everything after is replayed. Candle times are shifted by a
+    whole number of the longest interval so the replay starts within one
+    candle of the wall clock, keeping the bot's own clock checks meaningful.
+
+    Inside a candle the price walks open -> low -> high -> close (bullish) or
+    open -> high -> low -> close (bearish), so ticks, REST klines and fills
+    all agree on the price at any replay instant.
+    """
+
+    def __init__(self, candles: Dict[Tuple[str, str], np.ndarray], speed: float = 1.0,
+                 warmup: int = 500, ticks_per_candle: int = 4):
+        if not MIN_SPEED <= speed <= MAX_SPEED:
+            raise ValueError(f"Replay speed must be between {MIN_SPEED:g}x and {MAX_SPEED:g}x")
+        if not candles:
+            raise ValueError("No candles to replay")
+        for (symbol, interval), records in candles.items():
+            if interval not in INTERVAL_MS:
+                raise ValueError(f"Unsupported replay interval: {interval}")
+            if len(records) <= warmup:
+                raise ValueError(f"{symbol} {interval}: need more than {warmup} candles, got {len(records)}")
+
+        self.logger = logging.getLogger(__name__)
+        self.speed = float(speed)
+        self.ticks_per_candle = max(1, int(ticks_per_candle))
+
+        longest = max(INTERVAL_MS[interval] for _, interval in candles)
+        replay_start = max(int(records['timestamp'][warmup]) for records in candles.values())
+        now_ms = int(time.time() * 1000)
+        self.time_shift = (now_ms - replay_start) // longest * longest
+
+        self.streams: Dict[Tuple[str, str], np.ndarray] = {}
+        for (symbol, interval), records in candles.items():
+            shifted = np.array(records, copy=True)
+            shifted['timestamp'] += self.time_shift
+            shifted['close_time'] = shifted['timestamp'] + INTERVAL_MS[interval] - 1
+            self.streams[(symbol.upper(), interval)] = shifted
+
+        self.start_ms = replay_start + self.time_shift
+        self.end_ms = max(int(records['close_time'][-1]) + 1 for records in self.streams.values())
+        self._wall_start: Optional[float] = None
+
+    # Clock
+
+    def start(self):
+        if self._wall_start is None:
+            self._wall_start = time.monotonic()
+            self.logger.info(f"▶️ REPLAY STARTED | {len(self.streams)} streams | {self.speed:g}x | "
+                             f"{(self.end_ms - self.start_ms) / 60000:.0f} market minutes")
+
+    @property
+    def started(self) -> bool:
+        return self._wall_start is not None
+
+    def now_ms(self) -> int:
+        """Current replay time (stays at the replay start until start() is called)"""
+        if self._wall_start is None:
+            return self.start_ms
+        elapsed = (time.monotonic() - self._wall_start) * self.speed * 1000
+        return min(self.start_ms + int(elapsed), self.end_ms)
+
+    def wall_time_until(self, market_ms: int) -> float:
+        """Seconds of wall clock before the replay reaches market_ms"""
+        return max(0.0, (market_ms - self.now_ms()) / (self.speed * 1000))
+
+    @property
+    def finished(self) -> bool:
+        return self.now_ms() >= self.end_ms
+
+    # Prices
+
+    @staticmethod
+    def _partial(candle, fraction: float) -> Tuple[float, float, float, float, float]:
+        """(open, high, low, close, volume) of a candle `fraction` of the way through its interval"""
+        o, h, l, c = float(candle['open']), float(candle['high']), float(candle['low']), float(candle['close'])
+        path = (o, l, h, c) if c >= o else (o, h, l, c)
+        fraction = min(max(fraction, 0.0), 1.0)
+        position = fraction * 3
+        segment = min(int(position), 2)
+        start, end = path[segment], path[segment + 1]
+        price = start + (end - start) * (position - segment)
+
+        visited = path[:segment + 1] + (price,)
+        return o, max(visited), min(visited), price, float(candle['volume']) * fraction
+
+    def _current_index(self, records: np.ndarray, now_ms: int) -> int:
+        """Index of the candle open at now_ms (-1 if none has opened yet)"""
+        return int(np.searchsorted(records['timestamp'], now_ms, side='right')) - 1
+
+    def symbols(self) -> List[str]:
+        return sorted({symbol for symbol, _ in self.streams})
+
+    def price(self, symbol: str) -> Optional[float]:
+        """Last traded price of symbol (from its shortest-interval stream)"""
+        symbol = symbol.upper()
+        keys = [key for key in self.streams if key[0] == symbol]
+        if not keys:
+            return None
+        key = min(keys, key=lambda k: INTERVAL_MS[k[1]])
+        records, step = self.streams[key], INTERVAL_MS[key[1]]
+        now_ms = self.now_ms()
+        index = self._current_index(records, now_ms)
+        if index < 0:
+            return float(records['open'][0])
+        candle = records[index]
+        return self._partial(candle, (now_ms - int(candle['timestamp'])) / step)[3]
+
+    def klines(self, symbol: str, interval: str, limit: int = 500, start_time: Optional[int] = None,
+               end_time: Optional[int] = None) -> List[List[Any]]:
+        """REST-style kline rows up to the replay time; the last one is still forming"""
+        key = (symbol.upper(), interval)
+        if key not in self.streams:
+            return []
+        records, step = self.streams[key], INTERVAL_MS[interval]
+        now_ms = self.now_ms()
+
+        hi = self._current_index(records, now_ms) + 1
+        if end_time is not None:
+            hi = min(hi, int(np.searchsorted(records['timestamp'], end_time, side='right')))
+        lo = 0 if start_time is None else int(np.searchsorted(records['timestamp'], start_time, side='left'))
+        if start_time is not None:
+            hi = min(hi, lo + limit)
+        else:
+            lo = max(lo, hi - limit)
+
+        rows = []
+        for candle in records[lo:hi]:
+            o, h, l, c, v = self._partial(candle, (now_ms - int(candle['timestamp'])) / step)
+            rows.append(self._kline_row(candle, o, h, l, c, v))
+        return rows
+
+    @staticmethod
+    def _kline_row(candle, o, h, l, c, v) -> List[Any]:
+        return [int(candle['timestamp']), f"{o:.8f}", f"{h:.8f}", f"{l:.8f}", f"{c:.8f}", f"{v:.8f}",
+                int(candle['close_time']), f"{v * c:.8f}", 0, "0", "0", "0"]
+
+    # Stream events
+
+    def events(self) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """(market_ms, stream_name, kline) for every replayed tick, in time order
+
+        Each candle emits ticks_per_candle updates; the last one is the close
+        (x=True). Ties are broken by stream name, so the order is deterministic.
+        """
+        def stream_events(symbol, interval, records):
+            step = INTERVAL_MS[interval]
+            name = f"{symbol.lower()}@kline_{interval}"
+            first = int(np.searchsorted(records['timestamp'], self.start_ms, side='left'))
+            for candle in records[first:]:
+                opened = int(candle['timestamp'])
+                for tick in range(1, self.ticks_per_candle + 1):
+                    fraction = tick / self.ticks_per_candle
+                    o, h, l, c, v = self._partial(candle, fraction)
+                    closed = tick == self.ticks_per_candle
+                    event_ms = int(candle['close_time']) if closed else opened + int(step * fraction)
+                    yield event_ms, name, {
+                        't': opened, 'T': int(candle['close_time']), 's': symbol, 'i': interval,
+                        'o': f"{o:.8f}", 'h': f"{h:.8f}", 'l': f"{l:.8f}", 'c': f"{c:.8f}",
+                        'v': f"{v:.8f}", 'x': closed
+                    }
+
+        return heapq.merge(*(stream_events(symbol, interval, records)
+                             for (symbol, interval), records in sorted(self.streams.items())),
+                           key=lambda event: (event[0], event[1]))
+
+
+class KlineReplayServer:
+    """Local WebSocket server that streams ReplayMarket ticks in the exchange kline format
+
+    Clients connect to ws://host:port/ws/<stream>[/<stream>...] (the URL the
+    WebSocket manager builds from EXCHANGE_WS_URL) and receive
+    {"e": "kline", "E": <send time ms>, "s": ..., "k": {...}} messages for
+    their streams. The replay clock starts with the first connection.
+    Minimal RFC 6455: text frames out, ping/close handled, no extensions.
+    """
+
+    def __init__(self, market: ReplayMarket, host: str = "127.0.0.1", port: int = 0):
+        self.logger = logging.getLogger(__name__)
+        self.market = market
+        self.host = host
+        self.port = port
+        self.clients: Dict[asyncio.StreamWriter, set] = {}
+        self.done = threading.Event()
+        self.stats = {'connections': 0, 'messages_sent': 0, 'ticks_replayed': 0}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._first_client = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/ws/"
+
+    def start(self, timeout: float = 10.0) -> str:
+        """Start serving in a background thread; returns the base URL"""
+        self._thread = threading.Thread(target=self._run, name="kline-replay-server", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise RuntimeError("Kline replay server did not start")
+        return self.url
+
+    def stop(self):
+        if self._loop and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._first_client = asyncio.Event()
+        server = self._loop.run_until_complete(asyncio.start_server(self._handle_client, self.host, self.port))
+        self.port = server.sockets[0].getsockname()[1]
+        self._loop.create_task(self._broadcast())
+        self._ready.set()
+        self.logger.info(f"📡 Kline replay server listening on {self.url}")
+        try:
+            self._loop.run_forever()
+        finally:
+            server.close()
+            self._loop.close()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+            lines = request.decode('latin-1').split("\r\n")
+            path = lines[0].split(" ")[1]
+            headers = {k.strip().lower(): v.strip() for k, v in
+                       (line.split(":", 1) for line in lines[1:] if ":" in line)}
+            key = headers.get('sec-websocket-key')
+            if not key or not path.startswith("/ws/"):
+                writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+                writer.close()
+                return
+
+            accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+            writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                          f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+            await writer.drain()
+
+            streams = {s.lower() for s in path[len("/ws/"):].split("/") if s}
+            self.clients[writer] = streams
+            self.stats['connections'] += 1
+            self.logger.info(f"🔌 Replay client connected: {sorted(streams)}")
+            self.market.start()
+            self._first_client.set()
+
+            await self._read_frames(reader, writer)
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            self.logger.error(f"Replay client error: {e}")
+        finally:
+            self.clients.pop(writer, None)
+            writer.close()
+
+    async def _read_frames(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Consume client frames: answer pings, stop on close"""
+        while True:
+            first, second = await reader.readexactly(2)
+            opcode, length = first & 0x0F, second & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", await reader.readexactly(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", await reader.readexactly(8))[0]
+            mask = await reader.readexactly(4) if second & 0x80 else b"\x00\x00\x00\x00"
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(await reader.readexactly(length)))
+
+            if opcode == 0x8:
+                writer.write(self._frame(payload[:2], opcode=0x8))
+                await writer.drain()
+                return
+            if opcode == 0x9:
+                writer.write(self._frame(payload, opcode=0xA))
+                await writer.drain()
+
+    @staticmethod
+    def _frame(payload: bytes, opcode: int = 0x1) -> bytes:
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 65536:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        return header + payload
+
+    async def _broadcast(self):
+        """Send every replayed tick to the clients subscribed to its stream, on the replay clock"""
+        await self._first_client.wait()
+        try:
+            for event_ms, stream, kline in self.market.events():
+                delay = self.market.wall_time_until(event_ms)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                self.stats['ticks_replayed'] += 1
+                subscribers = [writer for writer, streams in self.clients.items() if stream in streams]
+                if not subscribers:
+                    continue
+
+                message = json.dumps({'e': 'kline', 'E': int(time.time() * 1000), 's': kline['s'], 'k': kline})
+                frame = self._frame(message.encode())
+                for writer in subscribers:
+                    try:
+                        writer.write(frame)
+                        await writer.drain()
+                        self.stats['messages_sent'] += 1
+                    except ConnectionError:
+                        self.clients.pop(writer, None)
+
+            self.logger.info(f"⏹️ REPLAY COMPLETE | {self.stats['ticks_replayed']} ticks | "
+                             f"{self.stats['messages_sent']} messages sent")
+        except Exception as e:
+            self.logger.error(f"❌ Replay broadcast failed: {e}")
+        finally:
+            self.done.set()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return self.stats.copy()
@@ -0,0 +1,202 @@
+import itertools
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.backtesting.backtest_engine import BacktestEngine, candles_to_frame
+from src.config.global_config import global_config
+from src.data_fetcher.ohlcv_archive import CANDLE_DTYPE
+
+# Parameters a sweep may vary (anything else in the config stays as configured)
+SWEEPABLE_PARAMETERS = (
+    'rsi_long_entry', 'rsi_short_entry', 'rsi_long_exit', 'rsi_short_exit',
+    'macd_fast', 'macd_slow', 'macd_signal', 'min_histogram_threshold', 'macd_exit_threshold',
+    'price_lookback_bars', 'rsi_threshold', 'stable_candle_ratio',
+    'leverage', 'margin', 'max_loss_pct', 'partial_tp_pnl_threshold', 'partial_tp_position_percentage'
+)
+
+# Per-process state of sweep workers (set by _init_worker)
+_worker_frame: Optional[pd.DataFrame] = None
+_worker_engine: Optional[BacktestEngine] = None
+
+
+def build_grid(ranges: Dict[str, Iterable]) -> List[Dict[str, Any]]:
+    """Every combination of the parameter ranges, minus MACD combos with fast >= slow"""
+    unknown = set(ranges) - set(SWEEPABLE_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unsupported sweep parameters: {sorted(unknown)}")
+
+    names = list(ranges)
+    grid = []
+    for values in itertools.product(*(list(ranges[name]) for name in names)):
+        overrides = {name: value.item() if isinstance(value, np.generic) else value
+                     for name, value in zip(names, values)}
+        if overrides.get('macd_fast', 0) >= overrides.get('macd_slow', float('inf')):
+            continue
+        grid.append(overrides)
+    return grid
+
+
+def _init_worker(shm_name: str, count: int, symbol_info: Dict[str, Dict]):
+    """Attach to the shared candle block and build this process's indicator-ready frame once"""
+    global _worker_frame, _worker_engine
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    candles = np.ndarray((count,), dtype=CANDLE_DTYPE, buffer=shm.buf)
+    _worker_frame = candles_to_frame(candles)  # copies into pandas, so the block can be closed
+    del candles
+    shm.close()
+
+    logging.getLogger('src.backtesting.backtest_engine').setLevel(logging.WARNING)
+    _worker_engine = BacktestEngine(symbol_info)
+
+
+def _run_config(task: Tuple[int, str, Dict[str, Any]]) -> Tuple[int, Optional[Dict[str, Any]]]:
+    index, strategy_name, config = task
+    try:
+        result = _worker_engine.run(strategy_name, config, _worker_frame)
+        # The next task carries a different config; don't keep this one's instance around
+        _worker_engine.signal_processor.clear_strategy_cache()
+        return index, result.summary()
+    except Exception as e:
+        logging.getLogger(__name__).error(f"❌ Sweep config {index} failed: {e}")
+        return index, None
+
+
+class ParameterSweep:
+    """Grid search over a strategy config, backtested across a process pool
+
+    The candles are copied once into a shared memory block; each worker
+    attaches to it when the pool starts, so tasks only carry the parameter
+    overrides. Results are ranked on total PnL, max drawdown and Sharpe
+    ratio (score = mean of the three ranks, lower is better).
+    """
+
+    def __init__(self, strategy_name: str, base_config: Dict[str, Any], workers: Optional[int] = None,
+                 symbol_info: Optional[Dict[str, Dict]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.strategy_name = strategy_name
+        self.base_config = dict(base_config)
+        self.workers = workers or global_config.BACKTEST_WORKERS or os.cpu_count() or 1
+        self.symbol_info = symbol_info or {}
+
+    @staticmethod
+    def _to_records(candles: pd.DataFrame) -> np.ndarray:
+        records = np.zeros(len(candles), dtype=CANDLE_DTYPE)
+        records['timestamp'] = candles.index.as_unit('ms').asi8
+        for column in ('open', 'high', 'low', 'close', 'volume'):
+            records[column] = candles[column].to_numpy(dtype=float)
+        if 'close_time' in candles.columns:
+            records['close_time'] = candles['close_time'].to_numpy(dtype=np.int64)
+        return records
+
+    def run(self, ranges: Dict[str, Iterable], candles: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Backtest every combination in ranges; returns one row per config, best first"""
+        grid = build_grid(ranges)
+        if not grid:
+            return pd.DataFrame()
+
+        if candles is None:
+            candles = BacktestEngine(self.symbol_info).load_candles(
+                self.base_config.get('symbol', ''), self.base_config.get('timeframe', ''))
+            if candles is None:
+                self.logger.error(f"❌ No archived candles for {self.strategy_name}")
+                return pd.DataFrame()
+
+        started = time.perf_counter()
+        records = self._to_records(candles)
+        tasks = [(index, self.strategy_name, {**self.base_config, **overrides})
+                 for index, overrides in enumerate(grid)]
+        self.logger.info(f"🔬 SWEEP | {self.strategy_name} | {len(grid)} configs | {len(records)} candles | "
+                         f"{self.workers} workers")
+
+        shm = shared_memory.SharedMemory(create=True, size=max(records.nbytes, 1))
+        try:
+            shared = np.ndarray(records.shape, dtype=CANDLE_DTYPE, buffer=shm.buf)
+            shared[:] = records
+            del shared
+            initargs = (shm.name, len(records), self.symbol_info)
+
+            if self.workers <= 1:
+                _init_worker(*initargs)
+                summaries = list(map(_run_config, tasks))
+            else:
+                chunksize = max(1, len(tasks) // (self.workers * 4))
+                with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                         initargs=initargs) as pool:
+                    summaries = list(pool.map(_run_config, tasks, chunksize=chunksize))
+        finally:
+            shm.close()
+            shm.unlink()
+
+        rows = []
+        for index, summary in summaries:
+            if summary is not None:
+                rows.append({**grid[index], **summary})
+        results = self.rank(pd.DataFrame(rows))
+
+        self.logger.info(f"✅ SWEEP COMPLETE | {self.strategy_name} | {len(rows)}/{len(grid)} configs | "
+                         f"{time.perf_counter() - started:.1f}s")
+        return results
+
+    @staticmethod
+    def rank(results: pd.DataFrame) -> pd.DataFrame:
+        """Order by the mean of the PnL, drawdown and Sharpe ranks"""
+        if results.empty:
+            return results
+        ranks = pd.concat([
+            results['total_pnl'].rank(ascending=False),
+            results['max_drawdown'].rank(ascending=True),
+            results['sharpe_ratio'].astype(float).rank(ascending=False, na_option='bottom')
+        ], axis=1)
+        results = results.assign(score=ranks.mean(axis=1))
+        return results.sort_values(['score', 'total_pnl'], ascending=[True, False]).reset_index(drop=True)
+
+    def best_config(self, results: pd.DataFrame) -> Dict[str, Any]:
+        """Base config with the top-ranked parameters applied"""
+        if results.empty:
+            return dict(self.base_config)
+        best = results.iloc[0]
+        overrides = {name: best[name].item() if isinstance(best[name], np.generic) else best[name]
+                     for name in SWEEPABLE_PARAMETERS if name in results.columns}
+        return {**self.base_config, **overrides}
+
+
+def main():
+    """python -m src.backtesting.parameter_sweep <strategy> name=v1,v2,... [name=...]"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    from src.config.trading_config import trading_config_manager
+
+    if len(sys.argv) < 3:
+        print(main.__doc__)
+        return
+
+    strategy_name = sys.argv[1]
+    base_config = trading_config_manager.get_all_strategies().get(strategy_name)
+    if base_config is None:
+        print(f"Unknown strategy: {strategy_name}")
+        return
+
+    ranges = {}
+    for argument in sys.argv[2:]:
+        name, values = argument.split('=', 1)
+        ranges[name] = [float(value) if '.' in value else int(value) for value in values.split(',')]
+
+    sweep = ParameterSweep(strategy_name, base_config)
+    results = sweep.run(ranges)
+    if results.empty:
+        print("No results")
+        return
+    print(results.head(20).to_string(index=False))
+    print(f"\nBest config: {sweep.best_config(results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import argparse
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Settings the harness forces before any bot module reads the environment
+REPLAY_ENVIRONMENT = {
+    'EXCHANGE_REPLAY': 'true',
+    'USER_DATA_STREAM': 'false',  # the fake exchange has no user-data stream
+    'OHLCV_ARCHIVE': 'false',     # replayed candles must not land in the real archive
+    'TELEGRAM_BOT_TOKEN': '',
+    'TELEGRAM_CHAT_ID': ''
+}
+
+
+def load_replay_candles(streams: List[Tuple[str, str]], archive_dir: str,
+                        limit: Optional[int] = None) -> Dict[Tuple[str, str], np.ndarray]:
+    """Archived candles per (symbol, interval) stream, newest limit of each"""
+    from src.data_fetcher.ohlcv_archive import OHLCVArchive
+
+    archive = OHLCVArchive(archive_dir)
+    candles = {}
+    for symbol, interval in streams:
+        records = archive.read(symbol, interval, limit=limit)
+        if records is None or not len(records):
+            logging.getLogger(__name__).warning(f"⚠️ No archived candles for {symbol} {interval} - not replayed")
+            continue
+        candles[(symbol.upper(), interval)] = np.array(records)
+    return candles
+
+
+async def run_bot(bot, server, max_seconds: Optional[float], grace_seconds: float):
+    """Run the bot until the replay finishes (plus a grace period) or max_seconds elapse"""
+    bot_task = asyncio.create_task(bot.start())
+    started = time.monotonic()
+    try:
+        while not server.done.is_set() and not bot_task.done():
+            if max_seconds and time.monotonic() - started >= max_seconds:
+                break
+            await asyncio.sleep(0.5)
+        await asyncio.sleep(grace_seconds)  # let the last candle's evaluation finish
+    finally:
+        await bot.stop("Replay complete")
+        try:
+            await asyncio.wait_for(bot_task, timeout=30)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            bot_task.cancel()
+
+
+def main():
+    """Replay archived klines through an unmodified BotManager against the fake exchange
+
+    python -m src.backtesting.replay_harness [--speed 100] [--candles 2000] [--latency-ms 20]
+    """
+    parser = argparse.ArgumentParser(description="Deterministic market replay for end-to-end latency benchmarks")
+    parser.add_argument('--speed', type=float, default=100.0, help="replay speed (1x - 1000x)")
+    parser.add_argument('--candles', type=int, default=2000, help="newest candles replayed per stream (incl. warmup)")
+    parser.add_argument('--warmup', type=int, default=500, help="candles served as history before the replay starts")
+    parser.add_argument('--ticks', type=int, default=4, help="kline updates per candle (the last one closes it)")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="simulated REST round trip per call")
+    parser.add_argument('--balance', type=float, default=10000.0, help="starting USDT wallet")
+    parser.add_argument('--max-seconds', type=float, default=None, help="stop after this much wall clock")
+    parser.add_argument('--archive-dir', default="trading_data/ohlcv", help="recorded candles to replay")
+    parser.add_argument('--workdir', default=None, help="bot working directory (default: a temp directory)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(message)s')
+    logger = logging.getLogger(__name__)
+
+    # The bot writes its databases and logs under ./trading_data - keep the replay's apart from live data
+    archive_dir = str(Path(args.archive_dir).resolve())
+    dashboard_configs = Path("trading_data/web_dashboard_configs.json").resolve()
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="replay_"))
+    (workdir / "trading_data").mkdir(parents=True, exist_ok=True)
+    if dashboard_configs.exists():
+        shutil.copy(dashboard_configs, workdir / "trading_data" / dashboard_configs.name)
+    os.chdir(workdir)
+
+    os.environ.update(REPLAY_ENVIRONMENT)
+    for key in ('BINANCE_API_KEY', 'BINANCE_SECRET_KEY', 'BITGET_API_KEY', 'BITGET_SECRET_KEY'):
+        os.environ.setdefault(key, 'replay')
+
+    from src.backtesting import fake_exchange
+    from src.backtesting.market_replay import KlineReplayServer, ReplayMarket
+    from src.config.global_config import global_config
+    from src.config.trading_config import trading_config_manager
+    from src.utils.latency import latency_tracker
+
+    strategies = trading_config_manager.get_all_strategies()
+    streams = sorted({(config['symbol'].upper(), config['timeframe']) for config in strategies.values()
+                      if config.get('symbol') and config.get('timeframe')})
+    candles = load_replay_candles(streams, archive_dir, args.candles)
+    if not candles:
+        logger.error(f"❌ Nothing to replay - no archived candles for {streams} in {archive_dir}")
+        return
+
+    market = ReplayMarket(candles, speed=args.speed, warmup=args.warmup, ticks_per_candle=args.ticks)
+    fake_exchange.active_exchange = fake_exchange.FakeExchangeClient(
+        market, balance=args.balance, latency_ms=args.latency_ms)
+    server = KlineReplayServer(market)
+    global_config.EXCHANGE_WS_URL = server.start()
+
+    logger.info(f"🧪 REPLAY HARNESS | {len(candles)} streams | {args.speed:g}x | workdir: {workdir}")
+
+    from src.bot_manager import BotManager
+    bot = BotManager()
+    latency_tracker.reset()
+    asyncio.run(run_bot(bot, server, args.max_seconds, grace_seconds=max(2.0, 2 * args.latency_ms / 1000)))
+    server.stop()
+
+    print("\n" + latency_tracker.format_report())
+    print(f"\nReplay: {server.get_statistics()}")
+    print(f"Exchange: {fake_exchange.active_exchange.get_statistics()}")
+
+
+if __name__ == "__main__":
+    main()
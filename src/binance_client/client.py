@@ -1,10 +1,12 @@
 
 import logging
+import threading
 import time
 import requests
 from typing import Dict, Any, Optional, List
 from pybitget import Client
 from pybitget.exceptions import BitgetAPIException
+from src.binance_client.rate_limiter import rate_limiter
 
 class BinanceClientWrapper:
     """Wrapper for Binance client with error handling (supports both Spot and Futures)"""
@@ -18,17 +20,21 @@ class BinanceClientWrapper:
         self.global_config = global_config
         
         self.is_futures = self.global_config.BINANCE_FUTURES
-        self._last_request_time = 0
-        self._min_request_interval = 1.0  # Minimum 1000ms between requests (aggressive)
-        self._request_count = 0
-        self._request_window_start = time.time()
-        self._max_requests_per_minute = 500  # Conservative limit (Binance allows 1200)
+        self.rate_limiter = rate_limiter  # process-wide weight/order budget
         self._initialize_client()
+        self._configure_session()
 
     def _initialize_client(self):
         """Initialize Binance client for Spot or Futures"""
         try:
-            if self.global_config.BINANCE_TESTNET:
+            if self.global_config.EXCHANGE_REPLAY:
+                # Replay harness: same client surface, served by the in-process fake exchange
+                from src.backtesting import fake_exchange
+                if fake_exchange.active_exchange is None:
+                    raise RuntimeError("EXCHANGE_REPLAY is set but no fake exchange is running")
+                self.client = fake_exchange.active_exchange
+                self.logger.info(f"🧪 Using fake exchange for market replay: {self.client.FUTURES_URL}")
+            elif self.global_config.BINANCE_TESTNET:
                 if self.is_futures:
                     # Use futures testnet
                     self.client = Client(
@@ -64,36 +70,28 @@ class BinanceClientWrapper:
             self.logger.error(f"Failed to initialize Binance client: {e}")
             raise
 
-    def _rate_limit(self):
-        """Enhanced rate limiting with sliding window to prevent IP bans"""
-        current_time = time.time()
-        
-        # Reset request count every minute
-        if current_time - self._request_window_start > 60:
-            self._request_count = 0
-            self._request_window_start = current_time
-        
-        # Check if we're approaching rate limits
-        if self._request_count >= self._max_requests_per_minute:
-            sleep_time = 60 - (current_time - self._request_window_start)
-            if sleep_time > 0:
-                self.logger.warning(f"Rate limit protection: sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
-                self._request_count = 0
-                self._request_window_start = time.time()
-        
-        # Minimum interval between requests
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self._min_request_interval:
-            time.sleep(self._min_request_interval - time_since_last)
-        
-        self._last_request_time = time.time()
-        self._request_count += 1
+    def _configure_session(self):
+        """Pooled keep-alive adapters, default timeout and used-weight header tracking"""
+        from src.utils.http_session import mount_pool
+
+        session = getattr(self.client, 'session', None)
+        if session is None:
+            return
+
+        mount_pool(session)
+        if hasattr(self.client, '_requests_params') and not self.client._requests_params:
+            self.client._requests_params = {'timeout': self.global_config.HTTP_TIMEOUT}
+        if rate_limiter.record_response not in session.hooks['response']:
+            session.hooks['response'].append(rate_limiter.record_response)
+
+    def _rate_limit(self, endpoint: str = 'default', **params):
+        """Wait for this call's request weight (and order count) in the shared token buckets"""
+        self.rate_limiter.acquire(endpoint, **params)
 
     async def test_connection(self) -> bool:
         """Test API connection with improved error handling"""
         try:
-            self._rate_limit()
+            self._rate_limit('ping')
             if self.is_futures:
                 # Test futures connection
                 self.client.futures_ping()
@@ -143,7 +141,7 @@ class BinanceClientWrapper:
         }
 
         try:
-            self._rate_limit()
+            self._rate_limit('ping')
             if self.is_futures:
                 # Test futures permissions
                 self.client.futures_ping()
@@ -151,12 +149,14 @@ class BinanceClientWrapper:
                 self.logger.info("✅ API PING SUCCESSFUL")
 
                 # Test futures market data
+                self._rate_limit('ticker')
                 ticker = self.client.futures_symbol_ticker(symbol='BTCUSDT')
                 if ticker:
                     permissions['market_data'] = True
                     self.logger.info("✅ MARKET DATA ACCESS GRANTED")
 
                 # Test futures account access
+                self._rate_limit('account')
                 account = self.client.futures_account()
                 if account:
                     permissions['account_access'] = True
@@ -208,7 +208,7 @@ class BinanceClientWrapper:
 
         for attempt in range(max_retries):
             try:
-                self._rate_limit()
+                self._rate_limit('account')
                 if self.is_futures:
                     result = self.client.futures_account()
                 else:
@@ -269,6 +269,7 @@ class BinanceClientWrapper:
     def get_symbol_ticker(self, symbol: str) -> Optional[Dict]:
         """Get ticker information for a symbol"""
         try:
+            self._rate_limit('ticker')
             if self.is_futures:
                 return self.client.futures_symbol_ticker(symbol=symbol)
             else:
@@ -277,13 +278,20 @@ class BinanceClientWrapper:
             self.logger.error(f"Error getting ticker for {symbol}: {e}")
             return None
 
-    def get_klines(self, symbol: str, interval: str, limit: int = 500) -> Optional[List]:
-        """Get kline/candlestick data for a symbol"""
+    def get_klines(self, symbol: str, interval: str, limit: int = 500,
+                   start_time: Optional[int] = None, end_time: Optional[int] = None) -> Optional[List]:
+        """Get kline/candlestick data for a symbol, optionally within [start_time, end_time] (ms)"""
         try:
+            self._rate_limit('klines', limit=limit)
+            params = {'symbol': symbol, 'interval': interval, 'limit': limit}
+            if start_time is not None:
+                params['startTime'] = int(start_time)
+            if end_time is not None:
+                params['endTime'] = int(end_time)
             if self.is_futures:
-                return self.client.futures_klines(symbol=symbol, interval=interval, limit=limit)
+                return self.client.futures_klines(**params)
             else:
-                return self.client.get_klines(symbol=symbol, interval=interval, limit=limit)
+                return self.client.get_klines(**params)
         except Exception as e:
             self.logger.error(f"Error getting klines for {symbol}: {e}")
             return None
@@ -291,7 +299,7 @@ class BinanceClientWrapper:
     def get_historical_klines(self, symbol: str, interval: str, limit: int = 100) -> Optional[list]:
         """Get historical klines with rate limiting"""
         try:
-            self._rate_limit()
+            self._rate_limit('klines', limit=limit)
             if self.is_futures:
                 return self.client.futures_klines(symbol=symbol, interval=interval, limit=limit)
             else:
@@ -306,7 +314,7 @@ class BinanceClientWrapper:
     def create_order(self, **kwargs) -> Optional[Dict[str, Any]]:
         """Create an order with rate limiting"""
         try:
-            self._rate_limit()
+            self._rate_limit('order')
             if self.is_futures:
                 return self.client.futures_create_order(**kwargs)
             else:
@@ -321,7 +329,7 @@ class BinanceClientWrapper:
     def get_open_orders(self, symbol: str = None) -> Optional[list]:
         """Get open orders with rate limiting"""
         try:
-            self._rate_limit()
+            self._rate_limit('open_orders', symbol=symbol)
             if self.is_futures:
                 return self.client.futures_get_open_orders(symbol=symbol)
             else:
@@ -336,7 +344,7 @@ class BinanceClientWrapper:
     def cancel_order(self, symbol: str, order_id: int) -> Optional[Dict[str, Any]]:
         """Cancel an order with rate limiting"""
         try:
-            self._rate_limit()
+            self._rate_limit('cancel_order')
             if self.is_futures:
                 return self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
             else:
@@ -351,7 +359,7 @@ class BinanceClientWrapper:
     def set_leverage(self, symbol: str, leverage: int) -> Optional[Dict[str, Any]]:
         """Set leverage for futures trading with rate limiting"""
         try:
-            self._rate_limit()
+            self._rate_limit('leverage')
             if self.is_futures:
                 return self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
             else:
@@ -367,7 +375,7 @@ class BinanceClientWrapper:
     def set_margin_type(self, symbol: str, margin_type: str = "CROSSED") -> Optional[Dict[str, Any]]:
         """Set margin type for futures trading with rate limiting"""
         try:
-            self._rate_limit()
+            self._rate_limit('margin_type')
             if self.is_futures:
                 return self.client.futures_change_margin_type(symbol=symbol, marginType=margin_type)
             else:
@@ -384,3 +392,55 @@ class BinanceClientWrapper:
         except Exception as e:
             self.logger.error(f"Unexpected error setting margin type for {symbol}: {e}")
             return None
+
+    def get_listen_key(self) -> Optional[str]:
+        """Create a user-data stream listen key (futures only)"""
+        try:
+            self._rate_limit('listen_key')
+            if self.is_futures:
+                return self.client.futures_stream_get_listen_key()
+            else:
+                self.logger.warning("User-data stream only supported for futures trading")
+                return None
+        except (BitgetAPIException, requests.exceptions.RequestException) as e:
+            self.logger.error(f"Error creating listen key: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Unexpected error creating listen key: {e}")
+            return None
+
+    def keepalive_listen_key(self, listen_key: str) -> bool:
+        """Extend a user-data stream listen key by another 60 minutes"""
+        try:
+            self._rate_limit('listen_key')
+            self.client.futures_stream_keepalive(listenKey=listen_key)
+            return True
+        except (BitgetAPIException, requests.exceptions.RequestException) as e:
+            self.logger.error(f"Error keeping listen key alive: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Unexpected error keeping listen key alive: {e}")
+            return False
+
+    def close_listen_key(self, listen_key: str) -> bool:
+        """Close a user-data stream listen key"""
+        try:
+            self.client.futures_stream_close(listenKey=listen_key)
+            return True
+        except Exception as e:
+            self.logger.debug(f"Error closing listen key: {e}")
+            return False
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> BinanceClientWrapper:
+    """Process-wide client (one pooled session) for consumers that don't own one"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = BinanceClientWrapper()
+    return _shared_client
@@ -0,0 +1,176 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+from src.config.global_config import global_config
+
+
+class TokenBucket:
+    """Thread-unsafe token bucket; WeightedRateLimiter serializes access"""
+
+    def __init__(self, capacity: float, window_seconds: float):
+        self.capacity = float(capacity)
+        self.refill_rate = self.capacity / window_seconds  # tokens per second
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount tokens are available (amount is capped at capacity)"""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.refill_rate)
+
+    def consume(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+    def sync_used(self, used: float):
+        """Align with server-reported usage; only ever lowers the tokens we think we have"""
+        self.tokens = min(self.tokens, self.capacity - used)
+
+
+class WeightedRateLimiter:
+    """Process-wide REST limiter: request weight per minute plus order counts per 10s/minute
+
+    Each endpoint has a request weight (USDⓈ-M futures values; spot calls are
+    accounted with the same table). Cheap calls spend a few tokens and can
+    burst, expensive ones wait until the bucket has refilled. The buckets are
+    corrected from the X-MBX-USED-WEIGHT / X-MBX-ORDER-COUNT response headers
+    so requests made outside this process's accounting are still respected,
+    and a 429/418 response pauses all callers for the Retry-After period.
+    """
+
+    ENDPOINT_WEIGHTS = {
+        'ping': 1,
+        'ticker': 1,
+        'account': 5,
+        'position_information': 5,
+        'order': 1,
+        'cancel_order': 1,
+        'leverage': 1,
+        'margin_type': 1,
+        'listen_key': 1,
+        'exchange_info': 1,
+        'default': 1
+    }
+    ORDER_ENDPOINTS = {'order'}
+
+    def __init__(self, weight_per_minute: int = 2000, orders_per_10s: int = 250, orders_per_minute: int = 1000):
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.weight_bucket = TokenBucket(weight_per_minute, 60)
+        self.order_buckets = {
+            '10s': TokenBucket(orders_per_10s, 10),
+            '1m': TokenBucket(orders_per_minute, 60)
+        }
+        self.paused_until = 0.0
+
+        self.stats = {
+            'requests': 0,
+            'weight_used': 0,
+            'orders': 0,
+            'throttled': 0,
+            'throttled_seconds': 0.0,
+            'server_used_weight': None,
+            'backoffs': 0
+        }
+
+    def weight_for(self, endpoint: str, **params) -> int:
+        """Request weight of an endpoint call"""
+        if endpoint == 'klines':
+            limit = params.get('limit') or 500
+            if limit < 100:
+                return 1
+            if limit < 500:
+                return 2
+            if limit <= 1000:
+                return 5
+            return 10
+        if endpoint == 'open_orders':
+            return 1 if params.get('symbol') else 40
+        return self.ENDPOINT_WEIGHTS.get(endpoint, self.ENDPOINT_WEIGHTS['default'])
+
+    def acquire(self, endpoint: str = 'default', **params) -> float:
+        """Block until the call fits the weight and order budgets; returns seconds waited"""
+        weight = self.weight_for(endpoint, **params)
+        orders = 1 if endpoint in self.ORDER_ENDPOINTS else 0
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = max(self.paused_until - now, self.weight_bucket.wait_time(weight, now))
+                if orders:
+                    for bucket in self.order_buckets.values():
+                        wait = max(wait, bucket.wait_time(orders, now))
+
+                if wait <= 0:
+                    self.weight_bucket.consume(weight)
+                    if orders:
+                        for bucket in self.order_buckets.values():
+                            bucket.consume(orders)
+                    self.stats['requests'] += 1
+                    self.stats['weight_used'] += weight
+                    self.stats['orders'] += orders
+                    if waited:
+                        self.stats['throttled'] += 1
+                        self.stats['throttled_seconds'] += waited
+                    return waited
+
+            # Sleep outside the lock so other threads can take cheaper calls meanwhile
+            wait = min(wait, 1.0)
+            if waited == 0:
+                self.logger.debug(f"⏳ Rate limit: {endpoint} (weight {weight}) waiting {wait:.2f}s")
+            time.sleep(wait)
+            waited += wait
+
+    def record_response(self, response, *args, **kwargs):
+        """requests response hook: sync buckets from usage headers, back off on 429/418"""
+        try:
+            headers = response.headers
+            used_weight = headers.get('X-MBX-USED-WEIGHT-1M')
+            order_count_10s = headers.get('X-MBX-ORDER-COUNT-10S')
+            order_count_1m = headers.get('X-MBX-ORDER-COUNT-1M')
+
+            with self._lock:
+                now = time.monotonic()
+                if used_weight is not None:
+                    self.weight_bucket.wait_time(0, now)  # refill before syncing
+                    self.weight_bucket.sync_used(float(used_weight))
+                    self.stats['server_used_weight'] = int(used_weight)
+                for key, value in (('10s', order_count_10s), ('1m', order_count_1m)):
+                    if value is not None:
+                        self.order_buckets[key].wait_time(0, now)
+                        self.order_buckets[key].sync_used(float(value))
+
+            if response.status_code in (418, 429):
+                self.backoff(float(headers.get('Retry-After', 60)), response.status_code)
+
+        except Exception as e:
+            self.logger.debug(f"Could not read rate limit headers: {e}")
+        return response
+
+    def backoff(self, seconds: float, status_code: Optional[int] = None):
+        """Pause every caller (exchange asked us to back off)"""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.stats['backoffs'] += 1
+        self.logger.warning(f"⚠️ Rate limit hit ({status_code}) - pausing REST requests for {seconds:.0f}s")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            stats = self.stats.copy()
+            self.weight_bucket.wait_time(0, now)
+            stats['available_weight'] = round(self.weight_bucket.tokens, 1)
+            stats['paused_seconds'] = max(0.0, self.paused_until - now)
+            return stats
+
+
+# Global limiter - one budget per IP, shared by every client instance in the process
+rate_limiter = WeightedRateLimiter(global_config.REST_WEIGHT_LIMIT,
+                                   global_config.REST_ORDER_LIMIT_10S,
+                                   global_config.REST_ORDER_LIMIT_1M)
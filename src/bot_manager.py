@@ -4,11 +4,15 @@ import pandas as pd
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from src.config.global_config import global_config
-from src.binance_client.client import BitgetClientWrapper
+from src.binance_client.client import BitgetClientWrapper, get_shared_client
 from src.data_fetcher.price_fetcher import PriceFetcher
 from src.data_fetcher.balance_fetcher import BalanceFetcher
+from src.data_fetcher.account_snapshot import AccountSnapshotService
+from src.data_fetcher.user_data_stream import UserDataStreamManager
+from src.data_fetcher.symbol_metadata import SymbolMetadataService
 from src.strategy_processor.signal_processor import SignalProcessor
 from src.execution_engine.order_manager import OrderManager
+from src.execution_engine.trade_events import trade_event_bus
 from src.execution_engine.strategies.rsi_oversold_config import RSIOversoldConfig
 from src.execution_engine.strategies.macd_divergence_config import MACDDivergenceConfig
 from src.reporting.telegram_reporter import TelegramReporter
@@ -16,12 +20,18 @@ from src.config.trading_config import trading_config_manager
 from src.execution_engine.trade_monitor import TradeMonitor
 from src.execution_engine.anomaly_detector import AnomalyDetector
 from src.data_fetcher.websocket_manager import websocket_manager
-import schedule
+from src.strategy_processor.strategy_scheduler import StrategyScheduler
+from src.utils.latency import latency_tracker, StageTimer
+from src.utils.logger import log_event, EVENT_SCAN, EVENT_POSITION, EVENT_UNTRACKED_POSITION
 import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import logging
 
 
+STARTUP_RECOVERY_RETRIES = 3  # position recovery attempts after the first before startup is aborted
+
 # WebLogHandler moved to src/utils/logger.py to prevent circular imports
 
 class BotManager:
@@ -38,42 +48,24 @@ class BotManager:
         if not global_config.is_live_trading_ready():
             raise ValueError("Configuration not ready for live trading.")
 
-        # Initialize components
-        self.binance_client = BinanceClientWrapper()
-
-        # Test connection early to validate everything works
-        self.logger.info("🔍 TESTING BINANCE CONNECTION...")
-
-        try:
-            connection_success = self.binance_client.test_connection()
-            if not connection_success:
-                self.logger.warning("⚠️ BINANCE CONNECTION FAILED - Continuing with limited functionality")
-                self.logger.warning("💡 Bot will start but may have issues with live trading")
-            else:
-                self.logger.info("✅ BINANCE CONNECTION SUCCESSFUL")
-        except Exception as conn_error:
-            self.logger.error(f"❌ Connection test error: {conn_error}")
-            self.logger.warning("🔄 Continuing bot startup despite connection issues...")
-
-        # Validate API permissions
-        self.logger.info("🔍 VALIDATING API PERMISSIONS...")
-        try:
-            permissions = self.binance_client.validate_api_permissions()
-
-            if not permissions['market_data']:
-                self.logger.warning("⚠️ Market data access limited - continuing anyway")
-
-            if not permissions['account_access'] and not global_config.BINANCE_TESTNET:
-                self.logger.warning("⚠️ Account access limited - continuing anyway")
-
-            self.logger.info("✅ API VALIDATION COMPLETE")
-        except Exception as e:
-            self.logger.warning(f"⚠️ API VALIDATION ERROR: {e} - continuing anyway")
+        # Initialize components (no network calls here - connection checks run in start())
+        self.binance_client = get_shared_client()
 
         self.price_fetcher = PriceFetcher(self.binance_client)
         self.balance_fetcher = BalanceFetcher(self.binance_client)
         self.signal_processor = SignalProcessor()
 
+        # One shared positions/balances snapshot instead of a REST call per consumer
+        self.account_snapshot = AccountSnapshotService(self.binance_client)
+        self.balance_fetcher.account_snapshot = self.account_snapshot
+
+        # Pushed fills/positions/balances keep the snapshot current between REST resyncs
+        self.user_data_stream = UserDataStreamManager(self.binance_client, self.account_snapshot)
+        self.user_data_stream.add_update_callback(self._on_user_data_event)
+
+        # Lot size / tick size rules, served from disk and refreshed in the background
+        self.symbol_metadata = SymbolMetadataService(self.binance_client)
+
         # Import trade_logger
         from src.analytics.trade_logger import trade_logger
 
@@ -99,6 +91,18 @@ class BotManager:
         # Strategy assessment timers
         self.strategy_last_assessment = {}
 
+        # Event-driven scheduling: evaluate strategies when their candle closes
+        self.event_driven = global_config.EVENT_DRIVEN_SCHEDULER
+        self.strategy_scheduler = StrategyScheduler()
+        self.last_housekeeping = None
+        self.last_exit_check = None
+
+        # Concurrent evaluation: blocking REST/pandas work runs in a bounded thread pool
+        self.concurrent_strategies = global_config.CONCURRENT_STRATEGIES
+        self.strategy_executor = None  # created on first use, released on stop()
+        self._symbol_locks = {}  # symbol -> asyncio.Lock (strategies on one symbol stay sequential)
+        self._execution_lock = None  # asyncio.Lock serializing order placement/recording
+
         # Signal cooldown tracking to prevent duplicate signals
         self.last_signal_time = {}
         self.signal_cooldown_minutes = 15  # 15 minute cooldown between same signals
@@ -120,6 +124,9 @@ class BotManager:
 
         # Set anomaly detector reference in order manager
         self.order_manager.set_anomaly_detector(self.anomaly_detector)
+        self.order_manager.set_account_snapshot(self.account_snapshot)
+        self.order_manager.set_symbol_metadata(self.symbol_metadata)
+        self.anomaly_detector.set_account_snapshot(self.account_snapshot)
         self.logger.info("🔍 Anomaly detector initialized and connected to order manager")
 
         # Register all loaded strategies with anomaly detector
@@ -131,9 +138,12 @@ class BotManager:
             else:
                 self.logger.warning(f"⚠️ Strategy {strategy_name} has no symbol configured")
 
-        # Daily reporter
-        from src.analytics.daily_reporter import DailyReporter
-        self.daily_reporter = DailyReporter(self.telegram_reporter)
+        # Daily reporter (created after the first scan - not needed to start trading)
+        self.daily_reporter = None
+
+        # Startup stage timings
+        self.startup_timer = None
+        self.first_scan_completed = False
 
         # Track if startup notification was sent
         self.startup_notification_sent = False
@@ -152,25 +162,15 @@ class BotManager:
         """Initialize web logging handler safely after basic setup"""
         try:
             # Import WebLogHandler from utils.logger to prevent circular dependencies
-            from src.utils.logger import WebLogHandler
+            from src.utils.logger import WebLogHandler, add_log_handler
 
             self.log_handler = WebLogHandler()
             self.log_handler.setFormatter(logging.Formatter('%(message)s'))  # Simplified format for web
             self.log_handler.setLevel(logging.DEBUG)  # Ensure DEBUG level messages are captured
 
-            # Add to root logger to capture all logs
-            root_logger = logging.getLogger()
-
-            # Remove any existing web log handlers to prevent duplicates
-            existing_handlers = [h for h in root_logger.handlers if isinstance(h, WebLogHandler)]
-            for handler in existing_handlers:
-                root_logger.removeHandler(handler)
-
-            # Add the new handler
-            root_logger.addHandler(self.log_handler)
-
-            # Also add to bot manager's own logger
-            self.logger.addHandler(self.log_handler)
+            # Replaces the setup_logger web handler (on the background log listener when queued);
+            # bot manager records reach it through the root logger
+            add_log_handler(self.log_handler)
 
             self.logger.debug("🔍 Web log handler successfully initialized")
 
@@ -181,9 +181,79 @@ class BotManager:
             self.log_handler = WebLogHandler()  # Use imported class as fallback
             self.logger.warning("🔄 Using fallback log handler for web dashboard")
 
+    def _verify_exchange_access(self) -> bool:
+        """Check connectivity, market data and account permissions (blocking REST)"""
+        self.logger.info("🔍 VALIDATING BINANCE CONNECTION AND API PERMISSIONS...")
+        try:
+            permissions = self.binance_client.validate_api_permissions()
+
+            if not permissions['ping']:
+                self.logger.warning("⚠️ BINANCE CONNECTION FAILED - Continuing with limited functionality")
+                self.logger.warning("💡 Bot will start but may have issues with live trading")
+                return False
+
+            if not permissions['market_data']:
+                self.logger.warning("⚠️ Market data access limited - continuing anyway")
+
+            if not permissions['account_access'] and not global_config.BINANCE_TESTNET:
+                self.logger.warning("⚠️ Account access limited - continuing anyway")
+
+            self.logger.info("✅ API VALIDATION COMPLETE")
+            return True
+        except Exception as e:
+            self.logger.warning(f"⚠️ API VALIDATION ERROR: {e} - continuing anyway")
+            return False
+
+    async def _startup_stage(self, name: str, awaitable):
+        """Await one startup step, recording its timing"""
+        with self.startup_timer.stage(name):
+            return await awaitable
+
+    async def _restore_trade_state(self) -> bool:
+        """Finish delivering last run's trade events, then recover open positions from them"""
+        # Finish recording trade events a previous run published but never delivered
+        trade_event_bus.replay_pending()
+        await asyncio.to_thread(trade_event_bus.flush)
+
+        self.logger.info(f"🔍 CHECKING FOR EXISTING POSITIONS...")
+        return await self._recover_active_positions()
+
+    async def _retry_position_recovery(self) -> bool:
+        """Retry a failed position recovery with backoff (trading without it could open duplicates)"""
+        for attempt in range(1, STARTUP_RECOVERY_RETRIES + 1):
+            wait = 2 ** attempt
+            self.logger.warning(f"🔄 POSITION RECOVERY FAILED - retrying in {wait}s ({attempt}/{STARTUP_RECOVERY_RETRIES})")
+            await asyncio.sleep(wait)
+            try:
+                if await self._recover_active_positions():
+                    return True
+            except Exception as e:
+                self.logger.error(f"❌ POSITION RECOVERY ERROR: {e}")
+        return False
+
+    def _on_first_scan(self):
+        """First strategy evaluation done - report startup timings and start non-critical services"""
+        self.first_scan_completed = True
+        self.startup_timer.mark('first_scan')
+        self.logger.info(f"⏱️ FIRST SCAN {self.startup_timer.elapsed():.2f}s AFTER STARTUP\n"
+                         f"{self.startup_timer.format_report()}")
+        asyncio.create_task(self._run_deferred_startup())
+
+    async def _run_deferred_startup(self):
+        """Start services the trading loop does not need (daily reports)"""
+        try:
+            with self.startup_timer.stage('daily_reporter'):
+                from src.analytics.daily_reporter import DailyReporter
+                self.daily_reporter = DailyReporter(self.telegram_reporter)
+                self.daily_reporter.start_scheduler()
+        except Exception as e:
+            self.logger.error(f"❌ Deferred startup error: {e}")
+
     async def start(self):
         """Start the trading bot"""
         self.is_running = True
+        self.startup_timer = StageTimer()
+        self.first_scan_completed = False
 
         # Log startup source - simplified detection
         startup_source = "Web Interface"
@@ -219,16 +289,38 @@ class BotManager:
             strategies = list(self.strategies.keys())
             self.logger.info(f"📈 ACTIVE STRATEGIES: {', '.join(strategies)}")
 
-            # Get initial balance
-            self.logger.info(f"🔍 FETCHING ACCOUNT BALANCE...")
-            balance_info = self.balance_fetcher.get_usdt_balance() or 0
-            self.logger.info(f"💰 ACCOUNT BALANCE: ${balance_info:,.1f} USDT")
-
             self.logger.info(f"⚡ MONITORING INTERVAL: {global_config.PRICE_UPDATE_INTERVAL}s")
 
-            # Check for existing positions from previous runs FIRST
-            self.logger.info(f"🔍 CHECKING FOR EXISTING POSITIONS...")
-            await self._recover_active_positions()
+            # Keep exchange trading rules current off the order path (first download starts now if none is saved)
+            self.symbol_metadata.start()
+
+            # Connect WebSocket streams first - candle bootstrap proceeds in the background
+            with self.startup_timer.stage('websocket_streams'):
+                self._initialize_websocket_streams()
+
+            # Independent startup steps run concurrently; position recovery must finish before trading
+            self.logger.info(f"🔍 FETCHING ACCOUNT BALANCE...")
+            exchange_check, balance_info, recovered = await asyncio.gather(
+                self._startup_stage('exchange_check', asyncio.to_thread(self._verify_exchange_access)),
+                self._startup_stage('balance', asyncio.to_thread(self.balance_fetcher.get_usdt_balance)),
+                self._startup_stage('position_recovery', self._restore_trade_state()),
+                return_exceptions=True
+            )
+            if isinstance(exchange_check, BaseException):
+                raise RuntimeError(f"Exchange check failed: {exchange_check}") from exchange_check
+            if isinstance(recovered, BaseException):
+                self.logger.error(f"❌ POSITION RECOVERY ERROR: {recovered}")
+                recovered = False
+            if not recovered:
+                with self.startup_timer.stage('position_recovery_retry'):
+                    recovered = await self._retry_position_recovery()
+                if not recovered:
+                    raise RuntimeError("Position recovery failed - not trading with unknown open positions")
+
+            # Only the balance may fall back (it is refreshed by the balance checks)
+            if not isinstance(balance_info, (int, float)):
+                balance_info = 0
+            self.logger.info(f"💰 ACCOUNT BALANCE: ${balance_info:,.1f} USDT")
 
             # Get pairs being watched
             pairs = [config['symbol'] for config in self.strategies.values()]
@@ -254,18 +346,22 @@ class BotManager:
             self.is_running = True
             self.logger.info(f"🔍 BOT STATUS: is_running = {self.is_running}")
 
-            # Start daily reporter scheduler
-            self.daily_reporter.start_scheduler()
+            # Subscribe strategy evaluation to candle closes
+            if self.event_driven:
+                self._start_strategy_scheduler()
 
-            # Initialize WebSocket connections for all strategy symbols
-            self._initialize_websocket_streams()
+            # Push account/position changes instead of polling REST for them
+            if global_config.USER_DATA_STREAM:
+                self.user_data_stream.start()
 
             # Clear any ghost anomalies for symbols where we have legitimate positions
             self._cleanup_misidentified_positions()
 
             # Initial anomaly check AFTER startup notification - SUPPRESS notifications for startup scan
             self.logger.info("🔍 PERFORMING INITIAL ANOMALY CHECK (SUPPRESSED)...")
-            self.anomaly_detector.run_detection(suppress_notifications=True)
+            with self.startup_timer.stage('anomaly_scan'):
+                # Position snapshot refresh and anomaly file I/O stay off the event loop
+                await self._run_blocking(self.anomaly_detector.run_detection, suppress_notifications=True)
 
             # Log startup scan completion status
             self.logger.info(f"🔍 STARTUP SCAN STATUS: startup_protection_complete = {self.anomaly_detector.startup_complete}")
@@ -292,7 +388,7 @@ class BotManager:
 
         try:
             # Stop daily reporter scheduler
-            if hasattr(self, 'daily_reporter'):
+            if self.daily_reporter:
                 try:
                     import schedule
                     schedule.clear()  # Clear all scheduled jobs
@@ -311,6 +407,20 @@ class BotManager:
             except Exception as e:
                 self.logger.warning(f"Could not send Telegram notification: {e}")
 
+            # Stop candle-close scheduling and release strategy workers
+            self.strategy_scheduler.detach()
+            if self.strategy_executor:
+                self.strategy_executor.shutdown(wait=False)
+                self.strategy_executor = None
+
+            self.symbol_metadata.stop()
+
+            # Stop user-data stream (releases the listen key)
+            try:
+                self.user_data_stream.stop()
+            except Exception as e:
+                self.logger.warning(f"Could not stop user-data stream: {e}")
+
             # Stop WebSocket manager
             try:
                 websocket_manager.stop()
@@ -318,6 +428,25 @@ class BotManager:
             except Exception as e:
                 self.logger.warning(f"Could not stop WebSocket manager: {e}")
 
+            # Deliver pending trade events (records and their notifications) before flushing the sinks
+            try:
+                await asyncio.to_thread(trade_event_bus.flush)
+            except Exception as e:
+                self.logger.warning(f"Could not flush trade events: {e}")
+
+            # Give queued notifications (including the shutdown one) a moment to go out
+            try:
+                await asyncio.to_thread(self.telegram_reporter.flush)
+            except Exception as e:
+                self.logger.warning(f"Could not flush Telegram notifications: {e}")
+
+            # Write out trade log changes still waiting in the background writer
+            try:
+                from src.analytics.trade_logger import trade_logger
+                trade_logger.flush()
+            except Exception as e:
+                self.logger.warning(f"Could not flush trade log: {e}")
+
             # Close database connections safely
             if hasattr(self, 'anomaly_detector') and hasattr(self.anomaly_detector, 'db'):
                 try:
@@ -347,41 +476,26 @@ class BotManager:
 
         while self.is_running:
             try:
-                # Display current PnL for all active positions (throttled)
-                await self._display_active_positions_pnl_throttled()
-
-            # Log WebSocket status periodically (every 50 iterations ~= 5 minutes)
-                if hasattr(self, '_websocket_status_counter'):
-                    self._websocket_status_counter += 1
+                if self.event_driven:
+                    # Sleep until a candle closes or a price trigger fires; exit checks / housekeeping on timeout
+                    events = await self.strategy_scheduler.wait_for_events(
+                        min(self._seconds_until_housekeeping(), self._seconds_until_exit_check()))
+                    await self._handle_scheduler_events(events)
+
+                    if self._seconds_until_housekeeping() <= 0:
+                        await self._run_housekeeping(poll_strategies=False)
+                    elif self._seconds_until_exit_check() <= 0:
+                        # Stop loss / take profit keep their 1s cadence between housekeeping passes
+                        await self._check_exit_conditions()
                 else:
-                    self._websocket_status_counter = 1
-
-                if self._websocket_status_counter % 50 == 0:
-                    self._log_websocket_status()
-
-                # Check each strategy
-                for strategy_name, strategy_config in self.strategies.items():
-                    if not strategy_config.get('enabled', True):
-                        continue
-
-                    await self._process_strategy(strategy_name, strategy_config)
-
-                # Check exit conditions for open positions
-                await self._check_exit_conditions()
-
-                # Run anomaly detection continuously for automatic orphan/ghost trade management
-                if hasattr(self, 'anomaly_detector') and self.anomaly_detector:
-                    try:
-                        self.anomaly_detector.run_detection(suppress_notifications=False)
-                    except Exception as e:
-                        self.logger.error(f"❌ Anomaly detection error: {e}")
-                        # Continue running despite anomaly detection errors
+                    await self._run_housekeeping(poll_strategies=True)
 
                 # Reset error counter on successful iteration
                 consecutive_errors = 0
 
                 # Sleep before next iteration
-                await asyncio.sleep(global_config.PRICE_UPDATE_INTERVAL)
+                if not self.event_driven:
+                    await asyncio.sleep(global_config.PRICE_UPDATE_INTERVAL)
 
             except (ConnectionError, TimeoutError) as e:
                 consecutive_errors += 1
@@ -451,6 +565,235 @@ class BotManager:
                     self.telegram_reporter.report_error("Unexpected Error", str(e))
                     await asyncio.sleep(min(30, 5 * consecutive_errors))  # Progressive backoff
 
+    async def _run_housekeeping(self, poll_strategies: bool):
+        """PnL display, strategy polling, exit checks and anomaly detection"""
+        self.last_housekeeping = datetime.now()
+
+        # Display current PnL for all active positions (throttled)
+        await self._display_active_positions_pnl_throttled()
+
+        # Log WebSocket status periodically (every 50 iterations)
+        if hasattr(self, '_websocket_status_counter'):
+            self._websocket_status_counter += 1
+        else:
+            self._websocket_status_counter = 1
+
+        if self._websocket_status_counter % 50 == 0:
+            self._log_websocket_status()
+
+        # Check each strategy (event-driven mode only polls strategies without a live stream)
+        due = []
+        for strategy_name, strategy_config in self.strategies.items():
+            if not strategy_config.get('enabled', True):
+                continue
+
+            if poll_strategies or not self._has_live_stream(strategy_config):
+                due.append((strategy_name, strategy_config, False))
+        await self._evaluate_strategies(due)
+
+        # Check exit conditions for open positions
+        await self._check_exit_conditions()
+
+        if self.event_driven:
+            self._sync_price_triggers()
+
+        # Run anomaly detection continuously for automatic orphan/ghost trade management
+        if hasattr(self, 'anomaly_detector') and self.anomaly_detector:
+            try:
+                await self._run_blocking(self.anomaly_detector.run_detection, suppress_notifications=False)
+            except Exception as e:
+                self.logger.error(f"❌ Anomaly detection error: {e}")
+                # Continue running despite anomaly detection errors
+
+    async def _evaluate_strategies(self, due):
+        """Evaluate (name, config, force) entries - concurrently per symbol with per-strategy timeouts"""
+        if not due:
+            return
+
+        if not self.concurrent_strategies:
+            for strategy_name, strategy_config, force in due:
+                await self._process_strategy(strategy_name, strategy_config, force=force)
+                if not self.first_scan_completed:
+                    self._on_first_scan()
+            return
+
+        results = await asyncio.gather(
+            *(self._process_strategy_isolated(name, config, force) for name, config, force in due),
+            return_exceptions=True
+        )
+        for (strategy_name, _, _), result in zip(due, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"❌ STRATEGY ERROR | {strategy_name.upper()} | {result}")
+
+    async def _process_strategy_isolated(self, strategy_name: str, strategy_config: Dict, force: bool):
+        """One strategy evaluation: serialized per symbol, bounded by STRATEGY_EVAL_TIMEOUT"""
+        symbol = strategy_config.get('symbol', '')
+        lock = self._symbol_locks.setdefault(symbol, asyncio.Lock())
+
+        async with lock:
+            try:
+                await asyncio.wait_for(self._process_strategy(strategy_name, strategy_config, force=force),
+                                       timeout=global_config.STRATEGY_EVAL_TIMEOUT)
+                if not self.first_scan_completed:
+                    self._on_first_scan()
+            except asyncio.TimeoutError:
+                self.logger.warning(f"⏱️ STRATEGY TIMEOUT | {strategy_name.upper()} | {symbol} | "
+                                    f"Skipped after {global_config.STRATEGY_EVAL_TIMEOUT}s - other strategies unaffected")
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking call (REST, pandas) in the strategy worker pool"""
+        if not self.concurrent_strategies:
+            return func(*args, **kwargs)
+        if self.strategy_executor is None:
+            self.strategy_executor = ThreadPoolExecutor(max_workers=global_config.STRATEGY_WORKER_THREADS,
+                                                        thread_name_prefix="strategy-worker")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.strategy_executor, partial(func, *args, **kwargs))
+
+    async def _execute_signal(self, signal, strategy_config: Dict):
+        """Place and record an order; serialized and shielded so a timeout can't cut it in half"""
+        if not self.concurrent_strategies:
+            return self.order_manager.execute_signal(signal, strategy_config)
+
+        if self._execution_lock is None:
+            self._execution_lock = asyncio.Lock()
+
+        async def execute():
+            async with self._execution_lock:
+                return await self._run_blocking(self.order_manager.execute_signal, signal, strategy_config)
+
+        return await asyncio.shield(execute())
+
+    async def _close_position(self, strategy_name: str, exit_reason: str):
+        """Close a position in the worker pool; serialized with order placement and shielded like it"""
+        if not self.concurrent_strategies:
+            return self.order_manager.close_position(strategy_name, exit_reason)
+
+        if self._execution_lock is None:
+            self._execution_lock = asyncio.Lock()
+
+        async def close():
+            async with self._execution_lock:
+                return await self._run_blocking(self.order_manager.close_position, strategy_name, exit_reason)
+
+        return await asyncio.shield(close())
+
+    def _seconds_until_housekeeping(self) -> float:
+        """Time left before the next housekeeping pass in event-driven mode"""
+        if not self.last_housekeeping:
+            return 0
+        elapsed = (datetime.now() - self.last_housekeeping).total_seconds()
+        return max(0.0, global_config.SCHEDULER_HOUSEKEEPING_INTERVAL - elapsed)
+
+    def _seconds_until_exit_check(self) -> float:
+        """Time left before the next stop-loss/take-profit check (only while positions are open)"""
+        if not self.order_manager.active_positions:
+            return float('inf')
+        if not self.last_exit_check:
+            return 0
+        elapsed = (datetime.now() - self.last_exit_check).total_seconds()
+        return max(0.0, global_config.EXIT_CHECK_INTERVAL - elapsed)
+
+    def _start_strategy_scheduler(self):
+        """Register strategies for candle-close evaluation and subscribe to the WebSocket feed"""
+        try:
+            for strategy_name, strategy_config in self.strategies.items():
+                symbol = strategy_config.get('symbol')
+                if symbol:
+                    self.strategy_scheduler.register_strategy(
+                        strategy_name, symbol, strategy_config.get('timeframe', '15m'))
+
+            self.strategy_scheduler.attach(asyncio.get_running_loop())
+            self._sync_price_triggers()
+            self.logger.info("⏱️ EVENT-DRIVEN SCHEDULER ACTIVE - strategies evaluate on candle close")
+
+        except Exception as e:
+            self.logger.error(f"❌ Strategy scheduler startup error: {e}")
+            self.logger.warning("🔄 Falling back to interval polling")
+            self.event_driven = False
+
+    def _has_live_stream(self, strategy_config: Dict) -> bool:
+        """True if candle-close events can be expected for this strategy"""
+        symbol = strategy_config.get('symbol')
+        timeframe = strategy_config.get('timeframe', '15m')
+        return bool(symbol) and websocket_manager.is_connected and websocket_manager.is_data_fresh(symbol, timeframe)
+
+    def _sync_price_triggers(self):
+        """Arm intra-candle triggers: open position SL/TP levels and optional strategy price levels"""
+        try:
+            wanted = set()
+
+            for strategy_name, position in list(self.order_manager.active_positions.items()):
+                above, below = (position.take_profit, position.stop_loss) if position.side == 'BUY' \
+                    else (position.stop_loss, position.take_profit)
+                key = f"exit:{strategy_name}"
+                self.strategy_scheduler.set_price_trigger(key, position.symbol, above=above or None,
+                                                          below=below or None, strategy_name=strategy_name)
+                wanted.add(key)
+
+            for strategy_name, strategy_config in self.strategies.items():
+                above = strategy_config.get('trigger_price_above')
+                below = strategy_config.get('trigger_price_below')
+                if strategy_config.get('enabled', True) and (above or below):
+                    key = f"entry:{strategy_name}"
+                    # One shot per candle: not re-armed by later syncs until the strategy's candle closes
+                    self.strategy_scheduler.set_price_trigger(key, strategy_config['symbol'], above=above,
+                                                              below=below, strategy_name=strategy_name,
+                                                              interval=strategy_config.get('timeframe', '15m'))
+                    wanted.add(key)
+
+            for key in self.strategy_scheduler.get_trigger_keys():
+                if key not in wanted:
+                    self.strategy_scheduler.clear_price_trigger(key)
+
+        except Exception as e:
+            self.logger.error(f"Error syncing price triggers: {e}")
+
+    def _on_user_data_event(self, event_type: str, payload: Dict):
+        """User-data stream callback (socket thread): react to position changes without waiting for a poll"""
+        if event_type != 'ACCOUNT_UPDATE' or not payload.get('symbols'):
+            return
+        self.anomaly_detector.request_detection()
+        if self.event_driven:
+            self.strategy_scheduler.notify_account_update(payload['symbols'])
+
+    async def _handle_scheduler_events(self, events):
+        """Run strategy evaluations and exit checks for candle-close / price-trigger / account events"""
+        check_exits = False
+        check_anomalies = False
+        due = []
+
+        for event in events:
+            if event.kind == 'account_update':
+                check_anomalies = True
+                continue
+
+            if event.kind == 'price_trigger' and event.trigger_key.startswith('exit:'):
+                check_exits = True
+                continue
+
+            strategy_config = self.strategies.get(event.strategy_name)
+            if not strategy_config or not strategy_config.get('enabled', True):
+                continue
+
+            self.logger.debug(f"⏱️ {event.kind.upper()} | {event.strategy_name} | {event.symbol} {event.interval} @ ${event.price:,.4f}")
+            due.append((event.strategy_name, strategy_config, True))
+
+        await self._evaluate_strategies(due)
+
+        if check_exits:
+            await self._check_exit_conditions()
+
+        if due or check_exits:
+            # Positions may have opened or closed - arm/clear their exit triggers now, not at housekeeping
+            self._sync_price_triggers()
+
+        if check_anomalies:
+            try:
+                await self._run_blocking(self.anomaly_detector.run_detection, suppress_notifications=False)
+            except Exception as e:
+                self.logger.error(f"❌ Anomaly detection error: {e}")
+
     async def _display_active_positions_pnl_throttled(self):
         """Display current PnL for all active positions with throttling - FIXED DUPLICATE DISPLAY"""
         try:
@@ -474,7 +817,8 @@ class BotManager:
                 for strategy_name in to_remove:
                     del self.last_position_log_time[strategy_name]
 
-            for strategy_name, position in self.order_manager.active_positions.items():
+            # Snapshot - the loop awaits worker threads, so positions may change underneath it
+            for strategy_name, position in list(self.order_manager.active_positions.items()):
                 # Check if we should log this position (throttle to once per minute)
                 last_log_time = self.last_position_log_time.get(strategy_name)
                 if last_log_time and (current_time - last_log_time).total_seconds() < self.position_log_interval:
@@ -487,8 +831,8 @@ class BotManager:
                 try:
                     symbol = strategy_config['symbol']
 
-                    # Get current price with timeout protection
-                    current_price = self._get_current_price(symbol)
+                    # Get current price (REST) off the event loop
+                    current_price = await self._run_blocking(self._get_current_price, symbol)
                     if not current_price:
                         self.logger.debug(f"🔍 Price fetch failed for {symbol}, skipping display")
                         continue
@@ -518,33 +862,35 @@ class BotManager:
                         # Get current indicators based on strategy type
                         indicator_text = "N/A"
                         try:
-                            # Get fresh market data for indicator calculation
+                            # Incremental indicators (O(1) per closed candle); full recalculation only as fallback
                             timeframe = strategy_config.get('timeframe', '15m')
-                            df = await self.price_fetcher.get_market_data(symbol, timeframe, 100)
-                            if df is not None and not df.empty:
-                                # Calculate indicators
-                                df = self.price_fetcher.calculate_indicators(df)
-
+                            latest = self.price_fetcher.get_latest_indicators(symbol, timeframe)
+                            if latest is None or latest.get('rsi') is None:
+                                df = await self._run_blocking(self.price_fetcher.fetch_market_data, symbol, timeframe,
+                                                              self._get_data_limit(timeframe))
+                                if df is not None and not df.empty:
+                                    df = await self._run_blocking(self.price_fetcher.calculate_indicators_cached,
+                                                                  symbol, timeframe, df)
+                                    latest = df.iloc[-1].to_dict()
+
+                            if latest:
                                 # Display strategy-specific indicators with enhanced error handling
                                 indicator_text = "Indicators loading..."
+                                current_rsi = latest.get('rsi')
+                                has_rsi = current_rsi is not None and not pd.isna(current_rsi)
 
                                 if 'rsi' in strategy_name.lower() and 'engulfing' not in strategy_name.lower():
                                     # RSI Strategy - show current RSI
-                                    if 'rsi' in df.columns and len(df['rsi'].dropna()) > 0:
-                                        current_rsi = df['rsi'].iloc[-1]
-                                        if not pd.isna(current_rsi):
-                                            indicator_text = f"RSI: {current_rsi:.1f}"
-                                        else:
-                                            indicator_text = "RSI: Calculating..."
+                                    if 'rsi' in latest:
+                                        indicator_text = f"RSI: {current_rsi:.1f}" if has_rsi else "RSI: Calculating..."
                                     else:
                                         indicator_text = "RSI: Waiting for data..."
 
                                 elif 'macd' in strategy_name.lower():
                                     # MACD Strategy - show MACD line and signal
-                                    if ('macd' in df.columns and 'macd_signal' in df.columns and 
-                                        len(df['macd'].dropna()) > 0 and len(df['macd_signal'].dropna()) > 0):
-                                        macd_line = df['macd'].iloc[-1]
-                                        macd_signal = df['macd_signal'].iloc[-1]
+                                    macd_line = latest.get('macd')
+                                    macd_signal = latest.get('macd_signal')
+                                    if macd_line is not None and macd_signal is not None:
                                         if not pd.isna(macd_line) and not pd.isna(macd_signal):
                                             indicator_text = f"MACD: {macd_line:.4f}/{macd_signal:.4f}"
                                         else:
@@ -555,61 +901,35 @@ class BotManager:
                                 elif 'engulfing' in strategy_name.lower():
                                     # Engulfing Pattern - show RSI + pattern status
                                     pattern_status = "No Pattern"
-                                    rsi_value = "N/A"
+                                    rsi_value = f"{current_rsi:.1f}" if has_rsi else "N/A"
 
-                                    if 'rsi' in df.columns and len(df['rsi'].dropna()) > 0:
-                                        current_rsi = df['rsi'].iloc[-1]
-                                        if not pd.isna(current_rsi):
-                                            rsi_value = f"{current_rsi:.1f}"
-
-                                    # Check for patterns
-                                    if len(df) >= 2:
-                                        if 'bullish_engulfing' in df.columns and df['bullish_engulfing'].iloc[-1]:
-                                            pattern_status = "Bullish Engulfing"
-                                        elif 'bearish_engulfing' in df.columns and df['bearish_engulfing'].iloc[-1]:
-                                            pattern_status = "Bearish Engulfing"
+                                    if latest.get('bullish_engulfing'):
+                                        pattern_status = "Bullish Engulfing"
+                                    elif latest.get('bearish_engulfing'):
+                                        pattern_status = "Bearish Engulfing"
 
                                     indicator_text = f"RSI: {rsi_value} | Pattern: {pattern_status}"
 
                                 elif 'smart' in strategy_name.lower() and 'money' in strategy_name.lower():
                                     # Smart Money - show custom analysis
                                     indicator_text = "Smart Money Analysis"
-                                    if 'rsi' in df.columns and len(df['rsi'].dropna()) > 0:
-                                        current_rsi = df['rsi'].iloc[-1]
-                                        if not pd.isna(current_rsi):
-                                            indicator_text += f" | RSI: {current_rsi:.1f}"
+                                    if has_rsi:
+                                        indicator_text += f" | RSI: {current_rsi:.1f}"
 
                                 else:
                                     # Other strategies - try to show RSI as fallback
-                                    if 'rsi' in df.columns and len(df['rsi'].dropna()) > 0:
-                                        current_rsi = df['rsi'].iloc[-1]
-                                        if not pd.isna(current_rsi):
-                                            indicator_text = f"RSI: {current_rsi:.1f}"
-                                        else:
-                                            indicator_text = "RSI: Calculating..."
+                                    if 'rsi' in latest:
+                                        indicator_text = f"RSI: {current_rsi:.1f}" if has_rsi else "RSI: Calculating..."
                                     else:
                                         indicator_text = "Indicators: Waiting for data..."
                         except Exception as e:
                             self.logger.debug(f"Could not fetch indicators for {symbol}: {e}")
 
                         # Clean, single position display with strategy-specific indicators
-                        position_display = f"""╔═══════════════════════════════════════════════════╗
-║ 📊 ACTIVE POSITION                                ║
-║ ⏰ {datetime.now().strftime('%H:%M:%S')}                                        ║
-║                                                   ║
-║ 📊 TRADE IN PROGRESS                             ║
-║ 🎯 Strategy: {strategy_name.upper():<15}                    ║
-║ 💱 Symbol: {position.symbol:<20}                      ║
-║ 📊 Side: {position.side:<25}                           ║
-║ 💵 Entry: ${position.entry_price:.1f}                          ║
-║ 📊 Current: ${current_price:.1f}                           ║
-║ 📈 Indicator: {indicator_text:<25}                      ║
-║ ⚡ Config: ${margin_invested:.1f} USDT @ {configured_leverage}x           ║
-║ 💰 PnL: ${pnl:.1f} USDT ({pnl_percent:+.1f}%)              ║
-║                                                   ║
-╚═══════════════════════════════════════════════════╝"""
-
-                        self.logger.info(position_display)
+                        log_event(self.logger, EVENT_POSITION, strategy=strategy_name.upper(), symbol=position.symbol,
+                                  side=position.side, entry_price=position.entry_price, price=current_price,
+                                  margin=margin_invested, leverage=configured_leverage, pnl=pnl,
+                                  pnl_percent=pnl_percent, indicators={'Indicator': indicator_text})
                     else:
                         self.logger.error(f"❌ PnL DISPLAY ERROR | {strategy_name} | Invalid margin configuration for {symbol}")
 
@@ -629,7 +949,7 @@ class BotManager:
         try:
             # This handles the case where positions exist but weren't recovered properly
             if self.binance_client.is_futures:
-                positions = self.binance_client.client.futures_position_information()
+                positions = await self._run_blocking(self.account_snapshot.get_positions) or []
                 for position in positions:
                         symbol = position.get('symbol')
                         position_amt = float(position.get('positionAmt', 0))
@@ -652,7 +972,7 @@ class BotManager:
 
                                 if managing_strategy:
                                     # Get current price
-                                    current_price = self._get_current_price(symbol)
+                                    current_price = await self._run_blocking(self._get_current_price, symbol)
                                     if current_price:
                                         entry_price = float(position.get('entryPrice', 0))
                                         side = 'BUY' if position_amt > 0 else 'SELL'
@@ -673,22 +993,12 @@ class BotManager:
                                         # Check if we should log this position (throttle to once per minute)
                                         last_log_time = self.last_position_log_time.get(f"untracked_{managing_strategy}")
                                         if not last_log_time or (current_time - last_log_time).total_seconds() >= self.position_log_interval:
-                                            self.logger.warning(f"""╔═══════════════════════════════════════════════════╗
-║ ⚠️  UNTRACKED POSITION DETECTED                   ║
-║ ⏰ {datetime.now().strftime('%H:%M:%S')}                                        ║
-║                                                   ║
-║ 📊 TRADE IN PROGRESS (NOT TRACKED)               ║
-║ 🎯 Strategy: {managing_strategy.upper()}                        ║
-║ 💱 Symbol: {symbol}                              ║
-║ 📊 Side: {side}                                 ║
-║ 💵 Entry: ${entry_price:.1f}                          ║
-║ 📊 Current: ${current_price:.1f}                           ║
-║ ⚡ Config: ${margin_invested:.1f} USDT @ {configured_leverage}x           ║
-║ 💰 PnL: ${pnl:.1f} USDT ({pnl_percent:+.1f}%)              ║
-║ ⚠️  WARNING: Position exists but not tracked internally  ║
-║ 📝 SOLUTION: Position recovery needed on next restart    ║
-║                                                   ║
-╚═══════════════════════════════════════════════════╝""")
+                                            log_event(self.logger, EVENT_UNTRACKED_POSITION, logging.WARNING,
+                                                      strategy=managing_strategy.upper(), symbol=symbol, side=side,
+                                                      entry_price=entry_price, price=current_price,
+                                                      margin=margin_invested, leverage=configured_leverage,
+                                                      pnl=pnl, pnl_percent=pnl_percent,
+                                                      note="Position exists but not tracked internally - recovery needed on next restart")
 
                                             # Update last log time
                                             self.last_position_log_time[f"untracked_{managing_strategy}"] = current_time
@@ -697,50 +1007,57 @@ class BotManager:
             self.logger.error(f"❌ ERROR CHECKING UNTRACKED POSITIONS | {e}")
             # Don't crash the bot for untracked position errors
 
-    async def _recover_active_positions(self):
-        """Simplified single-source position recovery with comprehensive debugging"""
+    def _fetch_exchange_positions(self) -> Dict[str, Dict]:
+        """Current non-zero Binance positions by symbol (position recovery step 2)
+
+        Raises if the exchange cannot be read - an empty result would look like "no positions".
+        """
+        binance_positions = {}
+        if self.binance_client.is_futures:
+            try:
+                positions = self.binance_client.client.futures_position_information()
+                for position in positions:
+                    symbol = position.get('symbol')
+                    position_amt = float(position.get('positionAmt', 0))
+                    if abs(position_amt) > 0.001:  # Has actual position
+                        entry_price = float(position.get('entryPrice', 0))
+                        side = 'BUY' if position_amt > 0 else 'SELL'
+                        quantity = abs(position_amt)
+
+                        binance_positions[symbol] = {
+                            'symbol': symbol,
+                            'side': side,
+                            'quantity': quantity,
+                            'entry_price': entry_price,
+                            'position_amt': position_amt
+                        }
+                        self.logger.info(f"🔍 DEBUG: Found Binance position: {symbol} | {side} | Qty: {quantity} | Entry: ${entry_price}")
+            except Exception as e:
+                self.logger.error(f"❌ Error fetching Binance positions: {e}")
+                raise
+        return binance_positions
+
+    async def _recover_active_positions(self) -> bool:
+        """Simplified single-source position recovery with comprehensive debugging
+
+        Returns False if recovery could not complete (trading must not start).
+        """
         self.logger.info("🔍 DEBUG: Position recovery started")
 
         try:
             self.logger.info("🛡️ POSITION RECOVERY: Starting simplified recovery process...")
 
-            # Step 1: Get all open trades from database
-            from src.execution_engine.trade_database import TradeDatabase
-            trade_db = TradeDatabase()
+            # Steps 1 and 2 are independent: load open trades from the database while fetching Binance positions
+            from src.execution_engine.trade_database import get_trade_database
+            open_trades, binance_positions = await asyncio.gather(
+                asyncio.to_thread(lambda: get_trade_database().get_open_trades()),
+                asyncio.to_thread(self._fetch_exchange_positions)
+            )
 
-            open_trades = {}
-            for trade_id, trade_data in trade_db.trades.items():
-                if trade_data.get('trade_status') == 'OPEN':
-                    open_trades[trade_id] = trade_data
-                    self.logger.info(f"🔍 DEBUG: Found open trade in DB: {trade_id} | {trade_data.get('symbol')} | {trade_data.get('side')}")
+            for trade_id, trade_data in open_trades.items():
+                self.logger.info(f"🔍 DEBUG: Found open trade in DB: {trade_id} | {trade_data.get('symbol')} | {trade_data.get('side')}")
 
             self.logger.info(f"🔍 DEBUG: Found {len(open_trades)} open trades in database")
-
-            # Step 2: Get current Binance positions
-            binance_positions = {}
-            if self.binance_client.is_futures:
-                try:
-                    positions = self.binance_client.client.futures_position_information()
-                    for position in positions:
-                        symbol = position.get('symbol')
-                        position_amt = float(position.get('positionAmt', 0))
-                        if abs(position_amt) > 0.001:  # Has actual position
-                            entry_price = float(position.get('entryPrice', 0))
-                            side = 'BUY' if position_amt > 0 else 'SELL'
-                            quantity = abs(position_amt)
-
-                            binance_positions[symbol] = {
-                                'symbol': symbol,
-                                'side': side,
-                                'quantity': quantity,
-                                'entry_price': entry_price,
-                                'position_amt': position_amt
-                            }
-                            self.logger.info(f"🔍 DEBUG: Found Binance position: {symbol} | {side} | Qty: {quantity} | Entry: ${entry_price}")
-                except Exception as e:
-                    self.logger.error(f"❌ Error fetching Binance positions: {e}")
-                    binance_positions = {}
-
             self.logger.info(f"🔍 DEBUG: Found {len(binance_positions)} active positions on Binance")
 
             # Step 3: Match database trades with Binance positions
@@ -822,23 +1139,27 @@ class BotManager:
 
             # Step 5: Log final recovery summary
             self.logger.info(f"🔍 DEBUG: Recovery summary - DB Open: {len(open_trades)}, Binance: {len(binance_positions)}, Recovered: {len(recovered_positions)}")
+            return True
 
         except Exception as e:
             self.logger.error(f"❌ POSITION RECOVERY ERROR: {e}")
             import traceback
             self.logger.error(f"🔍 DEBUG: Recovery traceback: {traceback.format_exc()}")
-            self.logger.info("🔄 Continuing startup without position recovery...")
+            return False
 
-    async def _process_strategy(self, strategy_name: str, strategy_config: Dict):
+    async def _process_strategy(self, strategy_name: str, strategy_config: Dict, force: bool = False):
         """Process a single strategy with improved error handling"""
         try:
-            # Check if it's time to assess this strategy
-            if not self._should_assess_strategy(strategy_name, strategy_config):
+            # Check if it's time to assess this strategy (scheduler events are always due)
+            if not force and not self._should_assess_strategy(strategy_name, strategy_config):
                 return
 
             # Update last assessment time
             self.strategy_last_assessment[strategy_name] = datetime.now()
 
+            if force:
+                latency_tracker.record_since_kline('kline_to_eval', strategy_config['symbol'], strategy_config['timeframe'])
+
             # Check if strategy has blocking anomaly
             if self.anomaly_detector.has_blocking_anomaly(strategy_name):
                 anomaly_status = self.anomaly_detector.get_anomaly_status(strategy_name)
@@ -859,7 +1180,10 @@ class BotManager:
             # CRITICAL: Also check if there's already a position on Binance for this symbol
             try:
                 if self.binance_client.is_futures:
-                    positions = self.binance_client.client.futures_position_information(symbol=symbol)
+                    positions = await self._run_blocking(self.account_snapshot.get_positions, symbol)
+                    if positions is None:
+                        self.logger.error(f"Error checking Binance positions for {symbol}: account snapshot unavailable")
+                        positions = []
                     for position in positions:
                         position_amt = float(position.get('positionAmt', 0))
                         if abs(position_amt) > 0:
@@ -870,7 +1194,7 @@ class BotManager:
                 # Continue execution despite error
 
             # Check balance requirements
-            if not self._check_balance_requirements(strategy_config):
+            if not await self._run_blocking(self._check_balance_requirements, strategy_config):
                 return
 
             # Log market assessment start
@@ -882,25 +1206,23 @@ class BotManager:
             timeframe = strategy_config['timeframe']
 
             # Optimize data limit based on timeframe for better indicator accuracy
-            if timeframe in ['1m', '3m', '5m']:
-                data_limit = 300  # Short timeframes need more recent data
-            elif timeframe in ['15m', '30m', '1h']:
-                data_limit = 200  # Medium timeframes
-            else:
-                data_limit = 150  # Longer timeframes
-
-            df = await self.price_fetcher.get_market_data(
-                symbol=strategy_config['symbol'], 
-                interval=timeframe, 
-                limit=data_limit
-            )
+            data_limit = self._get_data_limit(timeframe)
+
+            with latency_tracker.timer('market_data'):
+                df = await self._run_blocking(
+                    self.price_fetcher.fetch_market_data,
+                    symbol=strategy_config['symbol'],
+                    interval=timeframe,
+                    limit=data_limit
+                )
             if df is None or df.empty:
                 self.logger.warning(f"No data for {strategy_config['symbol']}")
                 return
 
-            # Calculate indicators with error handling
+            # Calculate indicators with error handling (shared per candle across consumers)
             try:
-                df = self.price_fetcher.calculate_indicators(df)
+                with latency_tracker.timer('indicators'):
+                    df = await self._run_blocking(self.price_fetcher.calculate_indicators_cached, strategy_config['symbol'], timeframe, df)
             except Exception as e:
                 self.logger.error(f"Error calculating indicators for {strategy_config['symbol']}: {e}")
                 return
@@ -913,7 +1235,8 @@ class BotManager:
             strategy_config_with_name['name'] = strategy_name
 
             # Evaluate entry conditions
-            signal = self.signal_processor.evaluate_entry_conditions(df, strategy_config_with_name)
+            with latency_tracker.timer('signal'):
+                signal = await self._run_blocking(self.signal_processor.evaluate_entry_conditions, df, strategy_config_with_name)
 
             if signal:
                 # Check signal cooldown to prevent spam
@@ -945,21 +1268,13 @@ class BotManager:
                 self.logger.info(entry_signal_message)
 
                 # Execute the signal with the config that includes the strategy name
-                position = self.order_manager.execute_signal(signal, strategy_config_with_name)
+                position = await self._execute_signal(signal, strategy_config_with_name)
 
                 if position:
+                    if force:
+                        latency_tracker.record_since_kline('kline_to_recorded', symbol, timeframe)
                     self.logger.info(f"✅ POSITION OPENED | {strategy_name.upper()} | {strategy_config['symbol']} | {position.side} | Entry: ${position.entry_price:,.1f} | Qty: {position.quantity:,.1f} | SL: ${position.stop_loss:,.1f} | TP: ${position.take_profit:,.1f}")
-
-                    # Send ONLY position opened notification (no separate entry signal notification)
-                    # Add a small delay to ensure position is fully stored before sending notification
-                    import asyncio
-                    await asyncio.sleep(0.1)
-
-                    from dataclasses import asdict
-                    position_dict = asdict(position)
-                    # Add current leverage info to the position data
-                    position_dict['leverage'] = strategy_config.get('leverage', 5)
-                    self.telegram_reporter.report_position_opened(position_dict)
+                    # Position opened notification is sent by the order manager's trade event subscriber
                 else:
                     self.logger.warning(f"❌ POSITION FAILED | {strategy_name.upper()} | {strategy_config['symbol']} | Could not execute signal")
             else:
@@ -977,14 +1292,10 @@ class BotManager:
                     if not pd.isna(rsi_value):
                         current_rsi = rsi_value
                     else:
-                        # Force recalculation if RSI is NaN
-                        try:
-                            df = self.price_fetcher.calculate_indicators(df)
-                            rsi_value = df['rsi'].iloc[-1]
-                            if not pd.isna(rsi_value):
-                                current_rsi = rsi_value
-                        except Exception as e:
-                            self.logger.debug(f"RSI recalculation failed for {strategy_config['symbol']}: {e}")
+                        # RSI is NaN on this frame - take the incremental engine value instead of recalculating
+                        latest = self.price_fetcher.get_latest_indicators(strategy_config['symbol'], timeframe)
+                        if latest and latest.get('rsi') is not None:
+                            current_rsi = latest['rsi']
 
                 # Enhanced strategy-specific market assessment with prominent price and indicators
                 if 'macd' in strategy_name.lower():
@@ -993,21 +1304,15 @@ class BotManager:
                     macd_signal = df['macd_signal'].iloc[-1] if 'macd_signal' in df.columns else 0.0
                     macd_histogram = df['macd_histogram'].iloc[-1] if 'macd_histogram' in df.columns else 0.0
 
-                    # Enhanced MACD scanning display with clear price and indicators
-                    self.logger.info(f"🔍 SCANNING | {strategy_name.upper()}")
-                    self.logger.info(f"💱 Symbol: {strategy_config['symbol']} | ⏱️ Timeframe: {strategy_config['timeframe']}")
-                    self.logger.info(f"💰 Price: ${current_price:,.4f} | 💵 Margin: ${margin:.1f} @ {leverage}x")
-                    self.logger.info(f"📊 MACD Line: {macd_line:.6f} | Signal: {macd_signal:.6f} | Histogram: {macd_histogram:.6f}")
+                    indicators = {'MACD Line': macd_line, 'Signal': macd_signal, 'Histogram': macd_histogram}
 
                 elif 'rsi' in strategy_name.lower() and 'engulfing' not in strategy_name.lower():
                     # Enhanced RSI scanning display
                     rsi_long_entry = strategy_config.get('rsi_long_entry', 40)
                     rsi_short_entry = strategy_config.get('rsi_short_entry', 60)
 
-                    self.logger.info(f"🔍 SCANNING | {strategy_name.upper()}")
-                    self.logger.info(f"💱 Symbol: {strategy_config['symbol']} | ⏱️ Timeframe: {strategy_config['timeframe']}")
-                    self.logger.info(f"💰 Price: ${current_price:,.4f} | 💵 Margin: ${margin:.1f} @ {leverage}x")
-                    self.logger.info(f"📊 RSI: {current_rsi:.2f} | Long Entry: ≤{rsi_long_entry} | Short Entry: ≥{rsi_short_entry}")
+                    indicators = {'RSI': current_rsi, 'Long Entry': f"≤{rsi_long_entry}",
+                                  'Short Entry': f"≥{rsi_short_entry}"}
 
                 elif 'engulfing' in strategy_name.lower():
                     # Enhanced Engulfing pattern scanning display
@@ -1037,17 +1342,17 @@ class BotManager:
                     except Exception as e:
                         self.logger.debug(f"Pattern detection error: {e}")
 
-                    self.logger.info(f"🔍 SCANNING | {strategy_name.upper()}")
-                    self.logger.info(f"💱 Symbol: {strategy_config['symbol']} | ⏱️ Timeframe: {strategy_config['timeframe']}")
-                    self.logger.info(f"💰 Price: ${current_price:,.4f} | 💵 Margin: ${margin:.1f} @ {leverage}x")
-                    self.logger.info(f"📊 RSI: {current_rsi:.2f} | Pattern: {pattern_status} | Stable: {'✅' if stable_candle else '❌'}")
-                    self.logger.info(f"📈 Momentum: {price_momentum}")
+                    indicators = {'RSI': current_rsi, 'Pattern': pattern_status,
+                                  'Stable': '✅' if stable_candle else '❌', 'Momentum': price_momentum}
 
                 else:
                     # Generic strategy scanning display
-                    self.logger.info(f"🔍 SCANNING | {strategy_name.upper()}")
-                    self.logger.info(f"💱 Symbol: {strategy_config['symbol']} | ⏱️ Timeframe: {strategy_config['timeframe']}")
-                    self.logger.info(f"💰 Price: ${current_price:,.4f} | 💵 Margin: ${margin:.1f} @ {leverage}x")
+                    indicators = {}
+
+                # One structured event per scan - rendered by the log handlers, not here
+                log_event(self.logger, EVENT_SCAN, strategy=strategy_name.upper(), symbol=strategy_config['symbol'],
+                          timeframe=strategy_config['timeframe'], price=current_price, margin=margin,
+                          leverage=leverage, indicators=indicators)
 
         except Exception as e:
             self.logger.error(f"Error processing strategy {strategy_name}: {e}")
@@ -1085,6 +1390,14 @@ class BotManager:
             self.logger.error(f"Error checking balance requirements: {e}")
             return False  # Fail safe
 
+    def _get_data_limit(self, timeframe: str) -> int:
+        """Candles to load per timeframe (shared so consumers hit the same indicator cache entry)"""
+        if timeframe in ['1m', '3m', '5m']:
+            return 300  # Short timeframes need more recent data
+        elif timeframe in ['15m', '30m', '1h']:
+            return 200  # Medium timeframes
+        return 150  # Longer timeframes
+
     def _get_current_price(self, symbol: str) -> Optional[float]:
         """Get current price for a symbol with error handling"""
         try:
@@ -1118,17 +1431,7 @@ class BotManager:
             if websocket_manager.subscribed_streams:
                 websocket_manager.start()
                 self.logger.info(f"🚀 WEBSOCKET MANAGER STARTED with {len(websocket_manager.subscribed_streams)} streams")
-
-                # Wait a moment for initial connection
-                import time
-                time.sleep(2)
-
-                # Log connection status
-                stats = websocket_manager.get_statistics()
-                if stats['is_connected']:
-                    self.logger.info("✅ WEBSOCKET CONNECTION ESTABLISHED")
-                else:
-                    self.logger.warning("⚠️ WEBSOCKET CONNECTION PENDING...")
+                # Connects in the background; strategies without a live stream fall back to REST until then
             else:
                 self.logger.warning("⚠️ No WebSocket streams to initialize")
 
@@ -1153,14 +1456,20 @@ class BotManager:
 
     async def _check_exit_conditions(self):
         """Check exit conditions for all active positions"""
+        self.last_exit_check = datetime.now()
         try:
             positions_to_close = []
 
-            for strategy_name, position in self.order_manager.active_positions.items():
+            # Prices for every open position fetched concurrently in the worker pool
+            positions = list(self.order_manager.active_positions.items())
+            prices = await asyncio.gather(
+                *(self._run_blocking(self._get_current_price, position.symbol) for _, position in positions),
+                return_exceptions=True
+            )
+
+            for (strategy_name, position), current_price in zip(positions, prices):
                 try:
-                    # Get current price
-                    current_price = self._get_current_price(position.symbol)
-                    if not current_price:
+                    if isinstance(current_price, Exception) or not current_price:
                         continue
 
                     # Check stop loss
@@ -1186,7 +1495,7 @@ class BotManager:
             # Close positions that hit exit conditions
             for strategy_name, exit_reason in positions_to_close:
                 try:
-                    success = self.order_manager.close_position(strategy_name, exit_reason)
+                    success = await self._close_position(strategy_name, exit_reason)
                     if success:
                         self.logger.info(f"✅ POSITION CLOSED | {strategy_name} | {exit_reason}")
                     else:
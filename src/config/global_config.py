@@ -23,6 +23,9 @@ class GlobalConfig:
         # Telegram bot credentials
         self.TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
         self.TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
+        self.TELEGRAM_QUEUE_SIZE = int(os.getenv('TELEGRAM_QUEUE_SIZE', '200'))  # notifications waiting to be sent
+        self.TELEGRAM_RATE_PER_MINUTE = float(os.getenv('TELEGRAM_RATE_PER_MINUTE', '20'))  # messages per chat (Telegram allows 20/min in groups)
+        self.TELEGRAM_COALESCE_WINDOW = float(os.getenv('TELEGRAM_COALESCE_WINDOW', '60'))  # seconds repeated alerts are folded into one digest
 
         # Global trading rules
         self.BALANCE_MULTIPLIER = 2.0  # Available balance must be 2x biggest margin
@@ -30,12 +33,45 @@ class GlobalConfig:
 
         # Market data settings
         self.PRICE_UPDATE_INTERVAL = 1  # seconds
+        self.REST_WEIGHT_LIMIT = int(os.getenv('REST_WEIGHT_LIMIT', '2000'))  # request weight per minute (exchange allows 2400)
+        self.REST_ORDER_LIMIT_10S = int(os.getenv('REST_ORDER_LIMIT_10S', '250'))  # orders per 10 seconds (exchange allows 300)
+        self.REST_ORDER_LIMIT_1M = int(os.getenv('REST_ORDER_LIMIT_1M', '1000'))  # orders per minute (exchange allows 1200)
+        self.HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))  # keep-alive connections per host
+        self.HTTP_TIMEOUT = 10  # seconds per REST request
+        self.HTTP_RETRIES = 3  # connection/5xx retries (idempotent requests only for 5xx)
+        self.HTTP_BACKOFF = 0.5  # retry backoff factor (0.5s, 1s, 2s)
         self.BALANCE_CHECK_INTERVAL = 30  # seconds
+        self.SYMBOL_METADATA_REFRESH_INTERVAL = float(os.getenv('SYMBOL_METADATA_REFRESH_INTERVAL', '21600'))  # seconds between exchange info downloads (lot/tick sizes)
+        self.ACCOUNT_SNAPSHOT_MAX_AGE = float(os.getenv('ACCOUNT_SNAPSHOT_MAX_AGE', '5'))  # seconds before positions/balances are refetched
+        self.USER_DATA_STREAM = os.getenv('USER_DATA_STREAM', 'true').lower() == 'true'  # push fills/positions/balances over WebSocket
+        self.LISTEN_KEY_KEEPALIVE_INTERVAL = 1800  # seconds between listen key keepalives (key expires after 60 min)
+        self.USER_DATA_RESYNC_INTERVAL = 300  # seconds between REST resyncs while the user-data stream is live
+        self.TRADE_LOG_FLUSH_INTERVAL = float(os.getenv('TRADE_LOG_FLUSH_INTERVAL', '0.5'))  # seconds trade log changes are coalesced before writing
+        self.TRADE_LOG_COMPACT_INTERVAL = 300  # seconds between rewrites of the trade log snapshot
+        self.TRADE_LOG_COMPACT_EVERY = 500  # journal lines that force an earlier rewrite
+        self.TRADE_EVENT_LANES = int(os.getenv('TRADE_EVENT_LANES', '4'))  # trade event delivery threads (events of one trade stay in order)
+        self.TRADE_EVENT_JOURNAL_COMPACT_EVERY = 1000  # trade event journal lines before it is truncated (once fully delivered)
+        self.OHLCV_ARCHIVE = os.getenv('OHLCV_ARCHIVE', 'true').lower() == 'true'  # keep closed candles on disk; restarts only fetch gaps
+        self.KLINE_CACHE_SIZE = int(os.getenv('KLINE_CACHE_SIZE', '1000'))  # candles kept per symbol/interval
+        self.EVENT_DRIVEN_SCHEDULER = os.getenv('EVENT_DRIVEN_SCHEDULER', 'true').lower() == 'true'  # evaluate on candle close
+        self.SCHEDULER_HOUSEKEEPING_INTERVAL = 5  # seconds between PnL/exit/anomaly passes in event-driven mode
+        self.EXIT_CHECK_INTERVAL = float(os.getenv('EXIT_CHECK_INTERVAL', '1'))  # seconds between stop-loss/take-profit checks while positions are open
+        self.CONCURRENT_STRATEGIES = os.getenv('CONCURRENT_STRATEGIES', 'true').lower() == 'true'  # evaluate symbols in parallel
+        self.STRATEGY_WORKER_THREADS = int(os.getenv('STRATEGY_WORKER_THREADS', '8'))  # pool for blocking REST/pandas work
+        self.STRATEGY_EVAL_TIMEOUT = 30  # seconds before a single strategy evaluation is abandoned
+        self.INDICATOR_CACHE_SIZE = int(os.getenv('INDICATOR_CACHE_SIZE', '256'))  # memoized indicator results (LRU)
+        self.BACKTEST_WORKERS = int(os.getenv('BACKTEST_WORKERS', '0'))  # processes for parameter sweeps (0 = one per CPU)
+        self.EXCHANGE_WS_URL = os.getenv('EXCHANGE_WS_URL', 'wss://fstream.binance.com/ws/')  # kline stream base URL
+        self.EXCHANGE_REPLAY = os.getenv('EXCHANGE_REPLAY', 'false').lower() == 'true'  # trade against the in-process fake exchange (replay harness)
 
         # Timezone settings for chart alignment - Set to Dubai/UAE time
         self.USE_LOCAL_TIMEZONE = os.getenv('USE_LOCAL_TIMEZONE', 'true').lower() == 'true'
         self.TIMEZONE_OFFSET_HOURS = float(os.getenv('TIMEZONE_OFFSET_HOURS', '4'))  # Dubai is UTC+4
 
+        # Logging
+        self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()  # records below this are dropped before formatting (DEBUG to trace)
+        self.LOG_QUEUE = os.getenv('LOG_QUEUE', 'true').lower() == 'true'  # format and write logs on a background thread
+
     def validate_config(self) -> bool:
         """Validate that all required config is present"""
         required_vars = [
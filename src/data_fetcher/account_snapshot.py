@@ -0,0 +1,164 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Any
+from src.config.global_config import global_config
+
+
+class AccountSnapshotService:
+    """One shared view of futures positions and balances, refreshed at most once per staleness bound
+
+    A single futures_account() call returns both positions and assets, so every
+    consumer (strategy checks, PnL display, anomaly detection, balance checks)
+    reads the same snapshot instead of issuing its own REST request. Data older
+    than max_age_seconds is refreshed on read; if the refresh fails, data older
+    than the hard bound is reported as unavailable (None) rather than served.
+    """
+
+    def __init__(self, binance_client, max_age_seconds: Optional[float] = None):
+        self.binance_client = binance_client
+        self.logger = logging.getLogger(__name__)
+        self.max_age_seconds = max_age_seconds if max_age_seconds is not None else global_config.ACCOUNT_SNAPSHOT_MAX_AGE
+        self.hard_max_age_seconds = self.max_age_seconds * 6
+
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()  # single-flight: concurrent readers share one refresh
+
+        self.account_info: Optional[Dict[str, Any]] = None
+        self.positions: Dict[str, Dict[str, Any]] = {}  # symbol -> position (one-way mode)
+        self.updated_at: Optional[float] = None
+        self.source = None  # "rest" or "stream"
+        self.stream_live = False  # user-data stream connected and resynced
+        self._balances_stale = False  # pushed balance deltas lack availableBalance/margins
+
+        self.stats = {'refreshes': 0, 'refresh_failures': 0, 'reads': 0, 'stream_updates': 0}
+
+    def age_seconds(self) -> Optional[float]:
+        """Seconds since the snapshot was last updated"""
+        with self._lock:
+            if self.updated_at is None:
+                return None
+            return time.time() - self.updated_at
+
+    def invalidate(self):
+        """Force the next read to refresh (e.g. after placing or closing an order)"""
+        with self._lock:
+            self.updated_at = None
+
+    def refresh(self, force: bool = False) -> bool:
+        """Fetch account + positions in one REST call if the snapshot is stale"""
+        with self._refresh_lock:
+            age = self.age_seconds()
+            if not force and age is not None and age < self.max_age_seconds:
+                return True  # another reader refreshed while we waited
+
+            try:
+                account_info = self.binance_client.get_account_info()
+                if not account_info:
+                    self.stats['refresh_failures'] += 1
+                    return False
+
+                positions = {}
+                for position in account_info.get('positions', []):
+                    symbol = position.get('symbol')
+                    if symbol:
+                        positions[symbol] = position
+
+                with self._lock:
+                    self.account_info = account_info
+                    self.positions = positions
+                    self.updated_at = time.time()
+                    self.source = "rest"
+                    self._balances_stale = False
+                self.stats['refreshes'] += 1
+                self.logger.debug(f"📸 Account snapshot refreshed | {len(positions)} positions")
+                return True
+
+            except Exception as e:
+                self.stats['refresh_failures'] += 1
+                self.logger.error(f"❌ Account snapshot refresh failed: {e}")
+                return False
+
+    def set_stream_live(self, live: bool):
+        """While the user-data stream is live, pushed updates keep the snapshot current"""
+        with self._lock:
+            self.stream_live = live
+
+    def _ensure_fresh(self, max_age: Optional[float]) -> bool:
+        """Refresh if older than max_age; False if no data within the hard bound is available"""
+        self.stats['reads'] += 1
+        bound = self.max_age_seconds if max_age is None else max_age
+        if self.stream_live:
+            bound = max(bound, global_config.USER_DATA_RESYNC_INTERVAL)
+        age = self.age_seconds()
+        if age is None or age >= bound:
+            if not self.refresh():
+                age = self.age_seconds()
+                if age is None or age >= self.hard_max_age_seconds:
+                    return False
+                self.logger.warning(f"⚠️ Using {age:.1f}s old account snapshot (refresh failed)")
+        return True
+
+    def get_account_info(self, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Raw futures account payload (assets + positions) within the staleness bound"""
+        if self._balances_stale:
+            self.refresh(force=True)
+        if not self._ensure_fresh(max_age):
+            return None
+        with self._lock:
+            return self.account_info
+
+    def get_positions(self, symbol: Optional[str] = None, max_age: Optional[float] = None,
+                      include_zero: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """Positions (non-zero unless include_zero), optionally for one symbol; None if unavailable"""
+        if not self._ensure_fresh(max_age):
+            return None
+        with self._lock:
+            if symbol:
+                candidates = [self.positions[symbol]] if symbol in self.positions else []
+            else:
+                candidates = list(self.positions.values())
+            return [dict(position) for position in candidates
+                    if include_zero or abs(float(position.get('positionAmt', 0))) > 0.000001]
+
+    def get_position_amount(self, symbol: str, max_age: Optional[float] = None) -> Optional[float]:
+        """Signed position amount for a symbol (0.0 if flat); None if unavailable"""
+        positions = self.get_positions(symbol, max_age=max_age)
+        if positions is None:
+            return None
+        return sum(float(position.get('positionAmt', 0)) for position in positions)
+
+    def apply_position_update(self, symbol: str, fields: Dict[str, Any]):
+        """Merge a pushed position update (user-data stream) into the snapshot"""
+        with self._lock:
+            position = self.positions.setdefault(symbol, {'symbol': symbol})
+            position.update(fields)
+            self.updated_at = time.time()
+            self.source = "stream"
+            self.stats['stream_updates'] += 1
+
+    def apply_balance_update(self, asset: str, fields: Dict[str, Any]):
+        """Merge a pushed balance update (user-data stream) into the snapshot"""
+        fields = {key: value for key, value in fields.items() if value is not None}
+        with self._lock:
+            if self.account_info is None:
+                self.account_info = {'assets': [], 'positions': []}
+            assets = self.account_info.setdefault('assets', [])
+            for entry in assets:
+                if entry.get('asset') == asset:
+                    entry.update(fields)
+                    break
+            else:
+                assets.append(dict({'asset': asset, 'availableBalance': 0, 'initialMargin': 0, 'maintMargin': 0}, **fields))
+            self.updated_at = time.time()
+            self.source = "stream"
+            self._balances_stale = True  # next balance read refetches margins/available balance
+            self.stats['stream_updates'] += 1
+
+    def get_statistics(self) -> Dict[str, Any]:
+        stats = self.stats.copy()
+        stats['age_seconds'] = self.age_seconds()
+        stats['source'] = self.source
+        stats['stream_live'] = self.stream_live
+        stats['positions'] = len(self.positions)
+        return stats
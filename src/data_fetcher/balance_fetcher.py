@@ -9,11 +9,15 @@ class BalanceFetcher:
     def __init__(self, binance_client: BinanceClientWrapper):
         self.binance_client = binance_client
         self.logger = logging.getLogger(__name__)
+        self.account_snapshot = None  # optional AccountSnapshotService shared with the bot
 
     def get_account_balance(self) -> Optional[Dict[str, float]]:
         """Get account balances"""
         try:
-            account_info = self.binance_client.get_account_info()
+            if self.account_snapshot and self.binance_client.is_futures:
+                account_info = self.account_snapshot.get_account_info()
+            else:
+                account_info = self.binance_client.get_account_info()
             if not account_info:
                 return None
 
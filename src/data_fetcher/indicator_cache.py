@@ -0,0 +1,108 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from src.config.global_config import global_config
+
+
+class IndicatorCache:
+    """Shared LRU memo for indicator computations, keyed by (symbol, interval, candle, spec)
+
+    The candle part of the key is the last candle's open time plus its close and
+    the frame length: a closed candle is therefore computed once for every
+    consumer, and the still-forming candle once per price change. Cached values
+    are shared between consumers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.logger = logging.getLogger(__name__)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._in_flight: Dict[Tuple, Future] = {}  # key -> computation other threads wait on
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    @staticmethod
+    def candle_key(df) -> Optional[Tuple]:
+        """Candle identity of a kline DataFrame: (last open time, last close, rows)"""
+        if df is None or df.empty:
+            return None
+        last_index = df.index[-1]
+        open_time = int(last_index.value) if hasattr(last_index, 'value') else last_index
+        return (open_time, float(df['close'].iloc[-1]), len(df))
+
+    @staticmethod
+    def klines_key(klines) -> Optional[Tuple]:
+        """Candle identity of raw REST klines: (last open time, last close, rows)"""
+        if not klines:
+            return None
+        return (int(klines[-1][0]), float(klines[-1][4]), len(klines))
+
+    def get_or_compute(self, symbol: str, interval: str, candle: Optional[Tuple],
+                       spec: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for this key or compute, store and return it"""
+        if candle is None:
+            return compute()
+
+        key = (symbol.upper(), interval, candle, spec)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return self._entries[key]
+
+            pending = self._in_flight.get(key)
+            if pending is None:
+                # This thread computes; concurrent misses on the same key wait for its result
+                self.stats['misses'] += 1
+                pending = self._in_flight[key] = Future()
+                owner = True
+            else:
+                self.stats['hits'] += 1
+                owner = False
+
+        if not owner:
+            return pending.result()
+
+        # Computed outside the lock so different symbols/specs run in parallel
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if value is not None:
+                self._entries[key] = value
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.stats['evictions'] += 1
+        pending.set_result(value)
+        return value
+
+    def invalidate(self, symbol: Optional[str] = None, interval: Optional[str] = None):
+        """Drop cached entries (all, per symbol, or per symbol/interval)"""
+        with self._lock:
+            for key in list(self._entries):
+                if symbol and key[0] != symbol.upper():
+                    continue
+                if interval and key[1] != interval:
+                    continue
+                del self._entries[key]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Cache hit/miss statistics"""
+        with self._lock:
+            stats = self.stats.copy()
+            stats['entries'] = len(self._entries)
+            lookups = stats['hits'] + stats['misses']
+            stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+            return stats
+
+
+# Global indicator cache instance
+indicator_cache = IndicatorCache(global_config.INDICATOR_CACHE_SIZE)
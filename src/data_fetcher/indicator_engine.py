@@ -0,0 +1,290 @@
+import logging
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Optional, Any, Tuple
+
+
+@dataclass(frozen=True)
+class IndicatorParams:
+    """Indicator settings; defaults mirror PriceFetcher.calculate_indicators"""
+    rsi_period: int = 14
+    rsi_method: str = "sma"  # "sma" (PriceFetcher rolling mean) or "wilder"
+    macd_fast: int = 12
+    macd_slow: int = 26
+    macd_signal: int = 9
+    sma_periods: Tuple[int, ...] = (20, 50)
+    bb_period: int = 20
+    bb_std: float = 2.0
+
+
+class _EMA:
+    """Exponential moving average matching pandas ewm(span, adjust=False)"""
+
+    def __init__(self, span: int):
+        self.alpha = 2.0 / (span + 1)
+        self.value = None
+
+    def peek(self, x: float) -> float:
+        if self.value is None:
+            return x
+        return self.alpha * x + (1 - self.alpha) * self.value
+
+    def update(self, x: float) -> float:
+        self.value = self.peek(x)
+        return self.value
+
+
+class _RollingWindow:
+    """Fixed window with running sum and sum of squares"""
+
+    RESUM_EVERY = 1000  # periodically re-sum to stop float drift
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._updates = 0
+
+    def _totals_with(self, x: Optional[float]) -> Tuple[float, float, int]:
+        """Sum, sum of squares and count if x were pushed (x=None: current window)"""
+        if x is None:
+            return self.total, self.total_sq, len(self.values)
+        total, total_sq, count = self.total + x, self.total_sq + x * x, len(self.values) + 1
+        if len(self.values) == self.period:
+            oldest = self.values[0]
+            total -= oldest
+            total_sq -= oldest * oldest
+            count -= 1
+        return total, total_sq, count
+
+    def push(self, x: float):
+        self.total, self.total_sq, _ = self._totals_with(x)
+        self.values.append(x)
+        self._updates += 1
+        if self._updates % self.RESUM_EVERY == 0:
+            self.total = math.fsum(self.values)
+            self.total_sq = math.fsum(v * v for v in self.values)
+
+    def mean(self, x: Optional[float] = None) -> Optional[float]:
+        total, _, count = self._totals_with(x)
+        if count < self.period:
+            return None
+        return total / count
+
+    def std(self, x: Optional[float] = None) -> Optional[float]:
+        """Sample standard deviation (ddof=1, as pandas rolling std)"""
+        total, total_sq, count = self._totals_with(x)
+        if count < self.period or count < 2:
+            return None
+        variance = (total_sq - total * total / count) / (count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+
+class _RSI:
+    """RSI over close-to-close changes, rolling-mean or Wilder smoothing"""
+
+    def __init__(self, period: int, method: str):
+        self.period = period
+        self.wilder = method == "wilder"
+        self.gains = _RollingWindow(period)
+        self.losses = _RollingWindow(period)
+        self.avg_gain = None
+        self.avg_loss = None
+        self.prev_close = None
+
+    def _averages(self, close: float, commit: bool) -> Tuple[Optional[float], Optional[float]]:
+        if self.prev_close is None:
+            if commit:
+                self.prev_close = close
+            return None, None
+
+        delta = close - self.prev_close
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+
+        if self.wilder and self.avg_gain is not None:
+            avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+        else:
+            avg_gain, avg_loss = self.gains.mean(gain), self.losses.mean(loss)
+
+        if commit:
+            self.prev_close = close
+            if self.wilder and self.avg_gain is not None:
+                self.avg_gain, self.avg_loss = avg_gain, avg_loss
+            else:
+                self.gains.push(gain)
+                self.losses.push(loss)
+                if self.wilder and avg_gain is not None:
+                    # Wilder smoothing is seeded with the first simple average
+                    self.avg_gain, self.avg_loss = avg_gain, avg_loss
+        return avg_gain, avg_loss
+
+    @staticmethod
+    def _value(avg_gain: Optional[float], avg_loss: Optional[float]) -> Optional[float]:
+        if avg_gain is None or avg_loss is None:
+            return None
+        rs = avg_gain / (avg_loss if avg_loss != 0 else 0.000001)
+        return 100 - (100 / (1 + rs))
+
+    def update(self, close: float) -> Optional[float]:
+        return self._value(*self._averages(close, commit=True))
+
+    def peek(self, close: float) -> Optional[float]:
+        return self._value(*self._averages(close, commit=False))
+
+
+class IndicatorState:
+    """Indicator state for one (symbol, interval, params), advanced once per closed candle"""
+
+    def __init__(self, params: IndicatorParams):
+        self.params = params
+        self.rsi = _RSI(params.rsi_period, params.rsi_method)
+        self.ema_fast = _EMA(params.macd_fast)
+        self.ema_slow = _EMA(params.macd_slow)
+        self.ema_signal = _EMA(params.macd_signal)
+        self.sma_windows = {period: _RollingWindow(period) for period in params.sma_periods}
+        self.bb_window = _RollingWindow(params.bb_period)
+
+        self.last_timestamp = None
+        self.candles = 0
+        self.prev_candle = None  # (open, close) of last closed candle
+        self.closed_values: Dict[str, Any] = {}
+
+    def _compute(self, open_price: float, close: float, commit: bool) -> Dict[str, Any]:
+        """Indicator values if a candle closed at close (state advanced only when commit)"""
+        rsi = self.rsi.update(close) if commit else self.rsi.peek(close)
+
+        fast = self.ema_fast.update(close) if commit else self.ema_fast.peek(close)
+        slow = self.ema_slow.update(close) if commit else self.ema_slow.peek(close)
+        macd = fast - slow
+        signal = self.ema_signal.update(macd) if commit else self.ema_signal.peek(macd)
+
+        values = {
+            'close': close,
+            'rsi': rsi,
+            'macd': macd,
+            'macd_signal': signal,
+            'macd_histogram': macd - signal
+        }
+
+        for period, window in self.sma_windows.items():
+            if commit:
+                window.push(close)
+                values[f'sma_{period}'] = window.mean()
+            else:
+                values[f'sma_{period}'] = window.mean(close)
+
+        if commit:
+            self.bb_window.push(close)
+        bb_middle = self.bb_window.mean(None if commit else close)
+        bb_std = self.bb_window.std(None if commit else close)
+        if bb_middle is not None and bb_std is not None:
+            values['bb_middle'] = bb_middle
+            values['bb_upper'] = bb_middle + bb_std * self.params.bb_std
+            values['bb_lower'] = bb_middle - bb_std * self.params.bb_std
+
+        # Engulfing patterns against the previous closed candle (same rules as PriceFetcher)
+        previous = self.prev_candle
+        if previous is not None:
+            prev_open, prev_close = previous
+            values['bullish_engulfing'] = (prev_close < prev_open and close > open_price and
+                                           open_price < prev_close and close > prev_open)
+            values['bearish_engulfing'] = (prev_close > prev_open and close < open_price and
+                                           open_price > prev_close and close < prev_open)
+        return values
+
+    def update(self, timestamp: int, open_price: float, close: float):
+        """Advance state with a closed candle; older or repeated candles are ignored"""
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return
+        values = self._compute(open_price, close, commit=True)
+        values['timestamp'] = timestamp
+        self.prev_candle = (open_price, close)
+        self.last_timestamp = timestamp
+        self.candles += 1
+        self.closed_values = values
+
+    def snapshot(self, open_candle: Optional[Tuple[int, float, float]] = None) -> Dict[str, Any]:
+        """Latest values; with an open candle they are provisional for that candle"""
+        if open_candle is None:
+            values = dict(self.closed_values)
+            values['is_provisional'] = False
+        else:
+            timestamp, open_price, close = open_candle
+            values = self._compute(open_price, close, commit=False)
+            values['timestamp'] = timestamp
+            values['is_provisional'] = True
+        values['candles'] = self.candles
+        return values
+
+
+class IncrementalIndicatorEngine:
+    """Keeps IndicatorState per (symbol, interval, params), fed from the WebSocket kline store"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._states: Dict[Tuple[str, str, IndicatorParams], IndicatorState] = {}
+        self._lock = threading.RLock()
+
+    def get_indicators(self, symbol: str, interval: str,
+                       params: Optional[IndicatorParams] = None) -> Optional[Dict[str, Any]]:
+        """Latest indicator values, catching up on any candles closed since the last call"""
+        try:
+            from src.data_fetcher.websocket_manager import websocket_manager
+
+            params = params or IndicatorParams()
+            store = websocket_manager.get_kline_store(symbol, interval)
+            if store is None or not len(store):
+                return None
+
+            key = (symbol.upper(), interval, params)
+            with self._lock:
+                state = self._states.get(key)
+
+                # Store no longer overlaps our state (evicted or re-seeded) - start over
+                first_timestamp = store.first_timestamp()
+                if state is None or (state.last_timestamp is not None and
+                                     first_timestamp is not None and
+                                     state.last_timestamp < first_timestamp):
+                    state = IndicatorState(params)
+                    self._states[key] = state
+
+                columns = store.columns_since(state.last_timestamp)
+                timestamps = columns['timestamp']
+                opens = columns['open']
+                closes = columns['close']
+                is_closed = columns['is_closed']
+
+                # Every candle but the newest is closed; the newest only once flagged closed
+                open_candle = None
+                count = len(timestamps)
+                for index in range(count):
+                    if index == count - 1 and not is_closed[index]:
+                        open_candle = (int(timestamps[index]), float(opens[index]), float(closes[index]))
+                        break
+                    state.update(int(timestamps[index]), float(opens[index]), float(closes[index]))
+
+                if state.candles == 0:
+                    return None
+                return state.snapshot(open_candle)
+
+        except Exception as e:
+            self.logger.error(f"Error updating indicators for {symbol} {interval}: {e}")
+            return None
+
+    def reset(self, symbol: Optional[str] = None, interval: Optional[str] = None):
+        """Drop cached state (all, per symbol, or per symbol/interval)"""
+        with self._lock:
+            for key in list(self._states):
+                if symbol and key[0] != symbol.upper():
+                    continue
+                if interval and key[1] != interval:
+                    continue
+                del self._states[key]
+
+
+# Global indicator engine instance
+indicator_engine = IncrementalIndicatorEngine()
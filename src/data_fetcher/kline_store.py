@@ -0,0 +1,185 @@
+import threading
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Any, Iterator
+
+
+class KlineStore:
+    """Columnar candle store for one symbol/interval, one row per candle open time
+
+    Columns live in preallocated NumPy arrays of twice the capacity. New candles
+    are written at the end index and the window start advances once capacity is
+    reached; when the end of the arrays is hit the live window is shifted back to
+    the front. Every window is therefore a contiguous slice, read out with one
+    block copy per column rather than row by row.
+    """
+
+    FLOAT_COLUMNS = ('open', 'high', 'low', 'close', 'volume', 'received_at')
+    INT_COLUMNS = ('timestamp', 'close_time')
+    OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = max(1, int(capacity))
+        self._lock = threading.RLock()
+
+        size = self.capacity * 2
+        self._columns: Dict[str, np.ndarray] = {}
+        for column in self.FLOAT_COLUMNS:
+            self._columns[column] = np.zeros(size, dtype=np.float64)
+        for column in self.INT_COLUMNS:
+            self._columns[column] = np.zeros(size, dtype=np.int64)
+        self._columns['is_closed'] = np.zeros(size, dtype=bool)
+
+        self._start = 0
+        self._end = 0
+
+    def _write_row(self, index: int, kline: Dict[str, Any]):
+        """Write one kline dict into row index of every column"""
+        columns = self._columns
+        columns['timestamp'][index] = kline['timestamp']
+        columns['open'][index] = kline['open']
+        columns['high'][index] = kline['high']
+        columns['low'][index] = kline['low']
+        columns['close'][index] = kline['close']
+        columns['volume'][index] = kline['volume']
+        columns['close_time'][index] = kline.get('close_time', 0)
+        columns['is_closed'][index] = bool(kline.get('is_closed', False))
+        columns['received_at'][index] = kline.get('received_at', 0.0)
+
+    def _read_row(self, index: int) -> Dict[str, Any]:
+        """Build a kline dict from row index"""
+        columns = self._columns
+        return {
+            'timestamp': int(columns['timestamp'][index]),
+            'open': float(columns['open'][index]),
+            'high': float(columns['high'][index]),
+            'low': float(columns['low'][index]),
+            'close': float(columns['close'][index]),
+            'volume': float(columns['volume'][index]),
+            'close_time': int(columns['close_time'][index]),
+            'is_closed': bool(columns['is_closed'][index]),
+            'received_at': float(columns['received_at'][index])
+        }
+
+    def _append_row(self, kline: Dict[str, Any]):
+        """Append a new candle, compacting the window back to the front when full"""
+        if self._end == len(self._columns['timestamp']):
+            keep = self._end - self._start
+            for array in self._columns.values():
+                array[:keep] = array[self._start:self._end]
+            self._start = 0
+            self._end = keep
+
+        self._write_row(self._end, kline)
+        self._end += 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+
+    def upsert(self, kline: Dict[str, Any]) -> bool:
+        """Insert or update a kline; returns True when a new candle was appended"""
+        with self._lock:
+            open_time = kline['timestamp']
+
+            if self._end > self._start:
+                timestamps = self._columns['timestamp']
+                last_open_time = timestamps[self._end - 1]
+
+                # Same candle still forming (or its closing tick) - update in place
+                if open_time == last_open_time:
+                    self._write_row(self._end - 1, kline)
+                    return False
+
+                # Late/replayed update for an older candle - patch it if we still hold it
+                if open_time < last_open_time:
+                    window = timestamps[self._start:self._end]
+                    position = int(np.searchsorted(window, open_time))
+                    if position < len(window) and window[position] == open_time:
+                        self._write_row(self._start + position, kline)
+                    return False
+
+            self._append_row(kline)
+            return True
+
+    def seed(self, klines: List[Dict[str, Any]]):
+        """Load historical candles, keeping any newer live candles already buffered"""
+        if not klines:
+            return
+
+        with self._lock:
+            last_seed_time = klines[-1]['timestamp']
+            newer = [self._read_row(index) for index in range(self._start, self._end)
+                     if self._columns['timestamp'][index] > last_seed_time]
+
+            self._start = 0
+            self._end = 0
+            for kline in klines[-self.capacity:]:
+                self._append_row(kline)
+            for kline in newer:
+                self._append_row(kline)
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Most recent candle (may still be open)"""
+        with self._lock:
+            if self._end == self._start:
+                return None
+            return self._read_row(self._end - 1)
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """Most recent candles up to limit as kline dicts, oldest first"""
+        with self._lock:
+            start = max(self._start, self._end - limit)
+            return [self._read_row(index) for index in range(start, self._end)]
+
+    def arrays(self, limit: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Copies of every column for the most recent candles
+
+        Copied under the lock: views would change underneath the caller when the
+        forming candle is updated in place or the window is compacted.
+        """
+        with self._lock:
+            start = self._start if limit is None else max(self._start, self._end - limit)
+            return {column: array[start:self._end].copy() for column, array in self._columns.items()}
+
+    def columns_since(self, open_time: Optional[int], columns: tuple = ('timestamp', 'open', 'close', 'is_closed')) -> Dict[str, np.ndarray]:
+        """Copies of the given columns for candles opened after open_time (all candles if None)"""
+        with self._lock:
+            start = self._start
+            if open_time is not None:
+                window = self._columns['timestamp'][self._start:self._end]
+                start += int(np.searchsorted(window, open_time, side='right'))
+            return {column: self._columns[column][start:self._end].copy() for column in columns}
+
+    def first_timestamp(self) -> Optional[int]:
+        """Open time of the oldest candle held"""
+        with self._lock:
+            if self._end == self._start:
+                return None
+            return int(self._columns['timestamp'][self._start])
+
+    def to_dataframe(self, limit: Optional[int] = None, timestamp_offset_ms: int = 0) -> Optional[pd.DataFrame]:
+        """OHLCV DataFrame indexed by candle open time, built column-wise from the store"""
+        with self._lock:
+            if self._end == self._start:
+                return None
+
+            start = self._start if limit is None else max(self._start, self._end - limit)
+            columns = self._columns
+
+            # Column slices are copied so the frame stays stable while the store keeps updating
+            data = {column: columns[column][start:self._end].copy() for column in self.OHLCV_COLUMNS}
+            data['close_time'] = columns['close_time'][start:self._end].copy()
+            timestamps = columns['timestamp'][start:self._end] + timestamp_offset_ms
+
+        index = pd.DatetimeIndex(pd.to_datetime(timestamps, unit='ms'), name='timestamp')
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def clear(self):
+        with self._lock:
+            self._start = 0
+            self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.tail(len(self)))
@@ -0,0 +1,235 @@
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from src.config.global_config import global_config
+
+# Candle length per interval (epoch-aligned ones only; '3d', '1w' and '1M' are not archived)
+INTERVAL_MS = {
+    '1m': 60_000, '3m': 180_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '2h': 7_200_000, '4h': 14_400_000, '6h': 21_600_000,
+    '8h': 28_800_000, '12h': 43_200_000, '1d': 86_400_000
+}
+
+# One fixed-width record per closed candle (56 bytes), sorted by open time
+CANDLE_DTYPE = np.dtype([
+    ('timestamp', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+    ('close_time', '<i8')
+])
+
+MAX_KLINES_PER_REQUEST = 1000
+
+
+class OHLCVArchive:
+    """On-disk archive of closed candles: trading_data/ohlcv/<SYMBOL>/<interval>.bin
+
+    Closed candles from the WebSocket feed are appended as they close, so a
+    restart only has to fetch the candles that closed while the bot was down.
+    Files are flat arrays of CANDLE_DTYPE records and are read through
+    np.memmap, so a window is a searchsorted slice rather than a parse.
+    Out-of-order inserts (filling a hole in the middle) rewrite the file
+    atomically; everything else is an append.
+    """
+
+    def __init__(self, archive_dir: str = "trading_data/ohlcv"):
+        self.logger = logging.getLogger(__name__)
+        self.archive_dir = Path(archive_dir)
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.stats = {'appended': 0, 'gap_fills': 0, 'gap_candles': 0, 'rest_candles_saved': 0}
+
+    @staticmethod
+    def supports(interval: str) -> bool:
+        return interval in INTERVAL_MS
+
+    def _path(self, symbol: str, interval: str) -> Path:
+        return self.archive_dir / symbol.upper() / f"{interval}.bin"
+
+    def _lock(self, symbol: str, interval: str) -> threading.Lock:
+        key = (symbol.upper(), interval)
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _memmap(self, symbol: str, interval: str) -> Optional[np.ndarray]:
+        path = self._path(symbol, interval)
+        if not path.exists() or path.stat().st_size < CANDLE_DTYPE.itemsize:
+            return None
+        count = path.stat().st_size // CANDLE_DTYPE.itemsize  # ignore a torn trailing record
+        return np.memmap(path, dtype=CANDLE_DTYPE, mode='r', shape=(count,))
+
+    def count(self, symbol: str, interval: str) -> int:
+        path = self._path(symbol, interval)
+        return path.stat().st_size // CANDLE_DTYPE.itemsize if path.exists() else 0
+
+    def last_timestamp(self, symbol: str, interval: str) -> Optional[int]:
+        candles = self._memmap(symbol, interval)
+        if candles is None:
+            return None
+        return int(candles['timestamp'][-1])
+
+    def read(self, symbol: str, interval: str, limit: Optional[int] = None,
+             start_time: Optional[int] = None, end_time: Optional[int] = None) -> Optional[np.ndarray]:
+        """Memory-mapped candles with start_time <= open time < end_time, newest limit of them"""
+        candles = self._memmap(symbol, interval)
+        if candles is None:
+            return None
+
+        timestamps = candles['timestamp']
+        lo = 0 if start_time is None else int(np.searchsorted(timestamps, start_time, side='left'))
+        hi = len(candles) if end_time is None else int(np.searchsorted(timestamps, end_time, side='left'))
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return candles[lo:hi]
+
+    def append(self, symbol: str, interval: str, kline: Dict[str, Any]) -> bool:
+        """Archive one closed candle (WebSocket kline dict); older or duplicate candles are ignored"""
+        if not self.supports(interval) or not kline.get('is_closed'):
+            return False
+
+        try:
+            with self._lock(symbol, interval):
+                last = self.last_timestamp(symbol, interval)
+                if last is not None and kline['timestamp'] <= last:
+                    return False
+
+                record = np.array([(kline['timestamp'], kline['open'], kline['high'], kline['low'],
+                                    kline['close'], kline['volume'], kline.get('close_time', 0))],
+                                  dtype=CANDLE_DTYPE)
+                self._append_records(self._path(symbol, interval), record)
+                self.stats['appended'] += 1
+                return True
+
+        except Exception as e:
+            self.logger.error(f"Error archiving candle for {symbol} {interval}: {e}")
+            return False
+
+    def _append_records(self, path: Path, records: np.ndarray):
+        """Append whole records, first cutting off a torn trailing record left by an interrupted write"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size = path.stat().st_size if path.exists() else 0
+        whole = size - size % CANDLE_DTYPE.itemsize
+        with open(path, 'r+b' if size else 'wb') as f:
+            if whole != size:
+                f.truncate(whole)
+                self.logger.warning(f"⚠️ OHLCV ARCHIVE: Dropped {size - whole} bytes of a torn record in {path}")
+            f.seek(whole)
+            f.write(records.tobytes())
+
+    def write_klines(self, symbol: str, interval: str, klines: List[List[Any]], now_ms: Optional[int] = None) -> int:
+        """Merge closed REST klines ([open_time, o, h, l, c, v, close_time, ...]) into the archive"""
+        if not self.supports(interval) or not klines:
+            return 0
+
+        now_ms = now_ms or int(time.time() * 1000)
+        rows = np.array([(int(k[0]), float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5]), int(k[6]))
+                         for k in klines if int(k[6]) < now_ms], dtype=CANDLE_DTYPE)
+        if not len(rows):
+            return 0
+
+        try:
+            with self._lock(symbol, interval):
+                path = self._path(symbol, interval)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                existing = self._memmap(symbol, interval)
+
+                if existing is None or rows['timestamp'].min() > existing['timestamp'][-1]:
+                    _, first = np.unique(rows['timestamp'], return_index=True)  # sorted, duplicates dropped
+                    rows = rows[first]
+                    self._append_records(path, rows)
+                    added = len(rows)
+                else:
+                    merged = np.concatenate([np.asarray(existing), rows])
+                    _, first = np.unique(merged['timestamp'], return_index=True)  # existing rows win
+                    merged = merged[first]
+                    added = len(merged) - len(existing)
+                    del existing  # release the map before replacing the file
+
+                    tmp_path = path.with_suffix('.bin.tmp')
+                    merged.tofile(tmp_path)
+                    os.replace(tmp_path, path)
+
+                self.stats['rest_candles_saved'] += added
+                return added
+
+        except Exception as e:
+            self.logger.error(f"Error writing klines to archive for {symbol} {interval}: {e}")
+            return 0
+
+    def missing_ranges(self, symbol: str, interval: str, limit: int, now_ms: Optional[int] = None) -> List[Tuple[int, int]]:
+        """[start, end) open-time ranges of closed candles missing from the newest limit candles"""
+        step = INTERVAL_MS[interval]
+        now_ms = now_ms or int(time.time() * 1000)
+        current_open = now_ms - now_ms % step  # candle still forming
+        window_start = current_open - limit * step
+
+        candles = self.read(symbol, interval, start_time=window_start, end_time=current_open)
+        if candles is None or not len(candles):
+            return [(window_start, current_open)]
+
+        timestamps = np.asarray(candles['timestamp'])
+        ranges = []
+        if timestamps[0] > window_start:
+            ranges.append((window_start, int(timestamps[0])))
+        for gap in np.nonzero(np.diff(timestamps) > step)[0]:
+            ranges.append((int(timestamps[gap]) + step, int(timestamps[gap + 1])))
+        if timestamps[-1] + step < current_open:
+            ranges.append((int(timestamps[-1]) + step, current_open))
+        return ranges
+
+    def load_window(self, symbol: str, interval: str, limit: int,
+                    fetch: Callable[[int, Optional[int], int], Optional[List[List[Any]]]]) -> Optional[List[List[Any]]]:
+        """Newest limit candles as REST-style kline rows, fetching only what the archive lacks
+
+        fetch(start_time, end_time, limit) returns REST klines. The candle still
+        forming is always fetched (it cannot be archived yet). Returns None if a
+        gap could not be filled, so the caller can fall back to a full request.
+        """
+        if not self.supports(interval):
+            return None
+
+        now_ms = int(time.time() * 1000)
+        step = INTERVAL_MS[interval]
+        current_open = now_ms - now_ms % step
+
+        for start, end in self.missing_ranges(symbol, interval, limit, now_ms):
+            while start < end:
+                batch = fetch(start, end - 1, min(MAX_KLINES_PER_REQUEST, (end - start) // step))
+                if batch is None:
+                    return None
+                if not batch:
+                    break  # nothing traded/listed yet in this range
+                self.write_klines(symbol, interval, batch, now_ms)
+                self.stats['gap_candles'] += len(batch)
+                start = int(batch[-1][0]) + step
+            self.stats['gap_fills'] += 1
+
+        live = fetch(current_open, None, 2)
+        if live is None:
+            return None
+
+        candles = self.read(symbol, interval, limit=limit, end_time=current_open)
+        rows = [] if candles is None else [
+            [int(c['timestamp']), float(c['open']), float(c['high']), float(c['low']),
+             float(c['close']), float(c['volume']), int(c['close_time'])]
+            for c in candles
+        ]
+        for kline in live:
+            if int(kline[0]) >= current_open:
+                rows.append(kline)
+        return rows[-limit:]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return self.stats.copy()
+
+
+# Global archive (None when disabled)
+ohlcv_archive = OHLCVArchive() if global_config.OHLCV_ARCHIVE else None
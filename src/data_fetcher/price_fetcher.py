@@ -1,12 +1,14 @@
 import pandas as pd
 import numpy as np
-import ta
 from typing import Dict, List, Optional
 import logging
 from src.binance_client.client import BitgetClientWrapper as BinanceClientWrapper
 from datetime import datetime, timezone, timedelta
 from src.config.global_config import global_config
 from src.data_fetcher.websocket_manager import websocket_manager
+from src.data_fetcher.indicator_engine import indicator_engine, IndicatorParams
+from src.data_fetcher.indicator_cache import indicator_cache
+from src.data_fetcher.ohlcv_archive import ohlcv_archive
 import time
 import asyncio
 
@@ -79,17 +81,19 @@ class PriceFetcher:
 
     async def get_market_data(self, symbol: str, interval: str, limit: int = 100) -> Optional[pd.DataFrame]:
         """Get market data with enhanced historical data bootstrapping"""
+        return self.fetch_market_data(symbol, interval, limit)
+
+    def fetch_market_data(self, symbol: str, interval: str, limit: int = 100) -> Optional[pd.DataFrame]:
+        """Blocking market data fetch (WebSocket cache or REST bootstrap) - safe to run in a worker thread"""
         try:
             # Always ensure minimum data requirements for indicators
             min_required = max(limit, 200)  # MACD needs 26, RSI needs 14, plus buffer for accuracy
 
-            # Try WebSocket data first
-            websocket_data = websocket_manager.get_cached_klines(symbol, interval, min_required)
-
-            if websocket_data and len(websocket_data) >= min_required:
+            # Try WebSocket data first (columnar store, no per-row conversion)
+            if websocket_manager.get_cached_count(symbol, interval) >= min_required:
                 if websocket_manager.is_data_fresh(symbol, interval, max_age_seconds=120):
-                    df = self._convert_websocket_to_dataframe(websocket_data)
-                    if len(df) >= min_required:
+                    df = websocket_manager.get_cached_dataframe(symbol, interval, min_required, self._websocket_timestamp_offset_ms())
+                    if df is not None and len(df) >= min_required:
                         self.logger.debug(f"✅ Using WebSocket data: {symbol} {interval} ({len(df)} candles)")
                         return df
 
@@ -99,28 +103,31 @@ class PriceFetcher:
             # Fetch comprehensive historical data
             enhanced_limit = max(min_required, 500)  # Get plenty of historical data
 
-            if self.binance_client.is_futures:
-                klines = self.binance_client.client.futures_klines(
-                    symbol=symbol,
-                    interval=interval,
-                    limit=enhanced_limit
-                )
-            else:
-                klines = self.binance_client.client.get_klines(
-                    symbol=symbol,
-                    interval=interval,
-                    limit=enhanced_limit
-                )
+            # Local archive first - REST only for candles that closed while we were down
+            klines = None
+            if ohlcv_archive and ohlcv_archive.supports(interval):
+                klines = ohlcv_archive.load_window(
+                    symbol, interval, enhanced_limit,
+                    lambda start, end, limit: self.binance_client.get_klines(
+                        symbol, interval, limit=limit, start_time=start, end_time=end))
+                if klines:
+                    self.logger.info(f"💾 Loaded {symbol} {interval} from local archive ({len(klines)} candles)")
+
+            if not klines:
+                klines = self.binance_client.get_klines(symbol, interval, limit=enhanced_limit)
+                if klines and ohlcv_archive:
+                    ohlcv_archive.write_klines(symbol, interval, klines)
 
             if not klines:
                 self.logger.warning(f"No REST API data received for {symbol} {interval}")
                 return None
 
-            # Convert to DataFrame
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'number_of_trades',
-                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
+            # Seed the WebSocket candle buffer so later calls can use the live cache
+            websocket_manager.seed_klines(symbol, interval, klines)
+
+            # Convert to DataFrame (archive rows carry only the OHLCV and close time fields)
+            df = pd.DataFrame([kline[:7] for kline in klines], columns=[
+                'timestamp', 'open', 'high', 'low', 'close', 'volume', 'close_time'
             ])
 
             # Convert data types
@@ -183,11 +190,11 @@ class PriceFetcher:
                         self.logger.info(f"⏳ Waiting for WebSocket connection... {wait_time}/{max_wait}s")
 
             # Try to get cached data with more flexible freshness requirements
-            cached_data = websocket_manager.get_cached_klines(symbol, interval, limit)
+            cached_df = websocket_manager.get_cached_dataframe(symbol, interval, limit, self._websocket_timestamp_offset_ms())
 
-            if cached_data and len(cached_data) > 0:
-                self.logger.info(f"📡 Using WebSocket data for {symbol} {interval} ({len(cached_data)} klines)")
-                return self._convert_websocket_to_dataframe(cached_data)
+            if cached_df is not None and len(cached_df) > 0:
+                self.logger.info(f"📡 Using WebSocket data for {symbol} {interval} ({len(cached_df)} klines)")
+                return cached_df
 
             # If WebSocket is connected but no data yet, wait for initial data
             if websocket_manager.is_connected:
@@ -201,10 +208,10 @@ class PriceFetcher:
                     time.sleep(2)  # Check every 2 seconds
                     data_wait += 2
 
-                    cached_data = websocket_manager.get_cached_klines(symbol, interval, limit)
-                    if cached_data and len(cached_data) > 0:
+                    cached_df = websocket_manager.get_cached_dataframe(symbol, interval, limit, self._websocket_timestamp_offset_ms())
+                    if cached_df is not None and len(cached_df) > 0:
                         self.logger.info(f"📡 Got initial WebSocket data for {symbol} {interval} after {data_wait}s")
-                        return self._convert_websocket_to_dataframe(cached_data)
+                        return cached_df
 
                     if data_wait % 10 == 0:  # Log every 10 seconds
                         self.logger.info(f"⏳ Waiting for WebSocket data... {data_wait}/{max_data_wait}s")
@@ -304,6 +311,22 @@ class PriceFetcher:
             self.logger.error(f"Error calculating indicators: {e}")
             return df
 
+    def calculate_indicators_cached(self, symbol: str, interval: str, df: pd.DataFrame) -> pd.DataFrame:
+        """calculate_indicators memoized per candle in the shared indicator cache (result is read-only)"""
+        return indicator_cache.get_or_compute(
+            symbol, interval, indicator_cache.candle_key(df), ('price_fetcher',),
+            lambda: self.calculate_indicators(df)
+        )
+
+    def get_latest_indicators(self, symbol: str, interval: str,
+                              params: Optional[IndicatorParams] = None) -> Optional[Dict]:
+        """Latest indicator values from the incremental engine (provisional for the open candle)"""
+        try:
+            return indicator_engine.get_indicators(symbol, interval, params)
+        except Exception as e:
+            self.logger.error(f"Error getting incremental indicators for {symbol} {interval}: {e}")
+            return None
+
     def _calculate_rsi_manual(self, prices, period=14):
         """Manual RSI calculation matching Binance methodology"""
         if len(prices) < period + 1:
@@ -331,50 +354,9 @@ class PriceFetcher:
 
         return rsi
 
-    def _convert_websocket_to_dataframe(self, cached_data: List[Dict], limit: int = None) -> pd.DataFrame:
-        """Convert WebSocket data to DataFrame format"""
-        df_data = []
-        for kline in cached_data:
-            df_data.append([
-                kline['timestamp'], kline['open'], kline['high'], kline['low'],
-                kline['close'], kline['volume'], kline['close_time'],
-                0, 0, 0, 0, 0  # Placeholder values for additional columns
-            ])
-
-        df = pd.DataFrame(df_data, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-
-        # Apply timezone adjustment if configured (preserves all existing logic)
-        if self.use_local_timezone or self.timezone_offset_hours != 0:
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df['timestamp'] = df['timestamp'].apply(lambda x: self._adjust_timestamp_for_timezone(int(x.timestamp() * 1000)))
-        else:
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-
-        # Convert to proper data types with high precision
-        numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-
-        # Sort by timestamp to ensure proper order
-        df = df.sort_values(by='timestamp')
-
-        # Remove any duplicate timestamps
-        df = df.drop_duplicates(subset=['timestamp'], keep='last')
-
-        # Remove any rows with NaN values
-        df = df.dropna()
-
-        if df.empty:
-            self.logger.warning(f"DataFrame is empty after processing")
-            return None
-
-        df.set_index('timestamp', inplace=True)
-
-        # Return only requested amount if limit specified
-        if limit:
-            return df.tail(limit)
-        return df
+    def _websocket_timestamp_offset_ms(self) -> int:
+        """Timezone shift applied to WebSocket candle timestamps (one offset per frame)"""
+        if not self.use_local_timezone and self.timezone_offset_hours == 0:
+            return 0
+        now_ms = int(time.time() * 1000)
+        return self._adjust_timestamp_for_timezone(now_ms) - now_ms
@@ -0,0 +1,176 @@
+import json
+import logging
+import os
+import threading
+import time
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.config.global_config import global_config
+
+
+def _decimals(step: str) -> int:
+    """Decimal places of a filter step ('0.001' -> 3, '1' -> 0, '1e-05' -> 5)"""
+    try:
+        exponent = Decimal(str(step)).normalize().as_tuple().exponent
+    except InvalidOperation:
+        return 0
+    return max(0, -exponent)
+
+
+def index_symbol(symbol_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Trading rules of one exchange info symbol entry, keyed the way order sizing uses them"""
+    filters = {f['filterType']: f for f in symbol_info.get('filters', [])}
+    lot_size = filters.get('LOT_SIZE', {})
+    market_lot_size = filters.get('MARKET_LOT_SIZE', {})
+    price_filter = filters.get('PRICE_FILTER', {})
+    min_notional = filters.get('MIN_NOTIONAL') or filters.get('NOTIONAL') or {}
+
+    step_size = lot_size.get('stepSize', '0.1')
+    tick_size = price_filter.get('tickSize', '0.01')
+
+    return {
+        'min_qty': float(lot_size.get('minQty', 0.1)),
+        'max_qty': float(lot_size.get('maxQty', 0) or 0),
+        'step_size': float(step_size),
+        'precision': _decimals(step_size),
+        'market_min_qty': float(market_lot_size.get('minQty', lot_size.get('minQty', 0.1))),
+        'market_max_qty': float(market_lot_size.get('maxQty', 0) or 0),
+        'tick_size': float(tick_size),
+        'price_precision': _decimals(tick_size),
+        'min_notional': float(min_notional.get('notional', min_notional.get('minNotional', 0)) or 0),
+        'status': symbol_info.get('status', 'TRADING')
+    }
+
+
+class SymbolMetadataService:
+    """Per-symbol trading rules (lot size, tick size, min notional) indexed from one exchange info download
+
+    The index is written to disk so a restart serves lookups immediately;
+    a background thread refreshes it every refresh_interval (and at start
+    if the saved copy is older than that). Lookups never download exchange
+    info on the order path unless there is no index at all yet.
+    """
+
+    COLD_RETRY_BACKOFF = 30  # seconds lookups skip downloading after a failed refresh (callers use fallback rules)
+
+    def __init__(self, binance_client, cache_file: str = "trading_data/symbol_metadata.json",
+                 refresh_interval: Optional[float] = None):
+        self.binance_client = binance_client
+        self.logger = logging.getLogger(__name__)
+        self.cache_file = Path(cache_file)
+        self.refresh_interval = refresh_interval or global_config.SYMBOL_METADATA_REFRESH_INTERVAL
+
+        self.symbols: Dict[str, Dict[str, Any]] = {}
+        self.updated_at: Optional[float] = None
+        self._refresh_lock = threading.Lock()  # single-flight: one download at a time
+        self._retry_at = 0.0  # monotonic time before which a cold lookup does not download again
+        self._stop_event = threading.Event()
+        self.refresh_thread = None
+        self.stats = {'lookups': 0, 'misses': 0, 'refreshes': 0, 'refresh_failures': 0}
+
+        self._load()
+
+    def _load(self):
+        """Warm start from the saved index"""
+        try:
+            if not self.cache_file.exists():
+                return
+            with open(self.cache_file) as f:
+                data = json.load(f)
+            self.symbols = data.get('symbols', {})
+            self.updated_at = data.get('updated_at')
+            self.logger.info(f"📋 SYMBOL METADATA: Loaded {len(self.symbols)} symbols from {self.cache_file}")
+        except Exception as e:
+            self.logger.warning(f"⚠️ SYMBOL METADATA: Could not load {self.cache_file}: {e}")
+
+    def _save(self):
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump({'updated_at': self.updated_at, 'symbols': self.symbols}, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            self.logger.warning(f"⚠️ SYMBOL METADATA: Could not save {self.cache_file}: {e}")
+
+    def age_seconds(self) -> Optional[float]:
+        if self.updated_at is None:
+            return None
+        return time.time() - self.updated_at
+
+    def refresh(self, max_age: Optional[float] = None) -> bool:
+        """Download exchange info and rebuild the index
+
+        With max_age, an index refreshed that recently (e.g. by whoever held the
+        lock while this caller waited) is kept and no download is made.
+        """
+        with self._refresh_lock:
+            age = self.age_seconds()
+            if max_age is not None and self.symbols and age is not None and age < max_age:
+                return True
+            try:
+                client = self.binance_client.client
+                if self.binance_client.is_futures:
+                    exchange_info = client.futures_exchange_info()
+                else:
+                    exchange_info = client.get_exchange_info()
+
+                symbols = {}
+                for symbol_info in exchange_info.get('symbols', []):
+                    if symbol_info.get('symbol'):
+                        symbols[symbol_info['symbol']] = index_symbol(symbol_info)
+                if not symbols:
+                    self._refresh_failed()
+                    return False
+
+                self.symbols = symbols  # swapped whole - readers never see a partial index
+                self.updated_at = time.time()
+                self._retry_at = 0.0
+                self.stats['refreshes'] += 1
+                self._save()
+                self.logger.info(f"📋 SYMBOL METADATA: Indexed {len(symbols)} symbols")
+                return True
+
+            except Exception as e:
+                self._refresh_failed()
+                self.logger.warning(f"⚠️ SYMBOL METADATA: Refresh failed: {e}")
+                return False
+
+    def _refresh_failed(self):
+        """Count a failed download and hold off cold lookups for COLD_RETRY_BACKOFF seconds"""
+        self.stats['refresh_failures'] += 1
+        self._retry_at = time.monotonic() + self.COLD_RETRY_BACKOFF
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Trading rules for symbol, or None if the exchange does not list it"""
+        self.stats['lookups'] += 1
+        if not self.symbols and time.monotonic() >= self._retry_at:
+            # Cold start with no saved index; callers queued behind another download reuse its result
+            self.refresh(max_age=self.refresh_interval)
+
+        info = self.symbols.get(symbol.upper())
+        if info is None:
+            self.stats['misses'] += 1
+        return info
+
+    def start(self):
+        """Refresh in the background every refresh_interval"""
+        if self.refresh_thread and self.refresh_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self.refresh_thread = threading.Thread(target=self._run_refresh, daemon=True, name="symbol-metadata")
+        self.refresh_thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _run_refresh(self):
+        age = self.age_seconds()
+        wait = 0 if age is None else max(0.0, self.refresh_interval - age)
+        while not self._stop_event.wait(wait):
+            wait = self.refresh_interval if self.refresh() else min(300, self.refresh_interval)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {**self.stats, 'symbols': len(self.symbols), 'age_seconds': self.age_seconds()}
@@ -0,0 +1,267 @@
+import json
+import logging
+import ssl
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from websocket import WebSocketApp
+from src.config.global_config import global_config
+
+
+class UserDataStreamManager:
+    """Futures user-data WebSocket: pushes fills, position and balance changes into the account snapshot
+
+    Runs beside WebSocketKlineManager on its own thread. The listen key is kept
+    alive on a timer; on every (re)connect the snapshot is resynced over REST so
+    events missed while disconnected are not lost. While the stream is live the
+    snapshot only falls back to REST every USER_DATA_RESYNC_INTERVAL seconds.
+    """
+
+    MAINNET_URL = "wss://fstream.binance.com/ws/"
+    TESTNET_URL = "wss://stream.binancefuture.com/ws/"
+
+    def __init__(self, binance_client, account_snapshot):
+        self.binance_client = binance_client
+        self.account_snapshot = account_snapshot
+        self.logger = logging.getLogger(__name__)
+
+        self.base_url = self.TESTNET_URL if global_config.BINANCE_TESTNET else self.MAINNET_URL
+        self.listen_key: Optional[str] = None
+        self.ws = None
+        self.ws_thread = None
+        self.keepalive_thread = None
+        self.is_connected = False
+        self.is_running = False
+        self._stop_event = threading.Event()
+
+        self.reconnect_attempts = 0
+        self.max_reconnect_attempts = 20
+
+        # Callbacks: callback(event_type, payload) - called on the socket thread
+        self.update_callbacks: List[Callable] = []
+
+        self.stats = {
+            'messages_received': 0,
+            'account_updates': 0,
+            'order_updates': 0,
+            'resyncs': 0,
+            'keepalives': 0,
+            'reconnections': 0,
+            'last_message_time': None
+        }
+
+    def start(self) -> bool:
+        """Start the user-data stream in a background thread (futures only)"""
+        if self.is_running:
+            self.logger.warning("User-data stream is already running")
+            return True
+
+        if not self.binance_client.is_futures:
+            self.logger.info("📡 User-data stream skipped - only available for futures")
+            return False
+
+        self.is_running = True
+        self._stop_event.clear()
+        self.ws_thread = threading.Thread(target=self._run_stream, daemon=True, name="user-data-stream")
+        self.ws_thread.start()
+        self.keepalive_thread = threading.Thread(target=self._run_keepalive, daemon=True, name="listen-key-keepalive")
+        self.keepalive_thread.start()
+
+        self.logger.info("🚀 User-data stream started")
+        return True
+
+    def stop(self):
+        """Stop the stream and release the listen key"""
+        self.is_running = False
+        self._stop_event.set()
+
+        if self.ws:
+            try:
+                self.ws.close()
+            except Exception as e:
+                self.logger.error(f"Error closing user-data WebSocket: {e}")
+
+        if self.ws_thread and self.ws_thread.is_alive():
+            self.ws_thread.join(timeout=5.0)
+
+        if self.listen_key:
+            self.binance_client.close_listen_key(self.listen_key)
+            self.listen_key = None
+
+        self._set_connected(False)
+        self.logger.info("🛑 User-data stream stopped")
+
+    def _run_stream(self):
+        """Connect with a fresh listen key; reconnect with backoff until stopped"""
+        while self.is_running:
+            try:
+                self.listen_key = self.binance_client.get_listen_key()
+                if not self.listen_key:
+                    raise ConnectionError("could not obtain listen key")
+
+                self.ws = WebSocketApp(
+                    f"{self.base_url}{self.listen_key}",
+                    on_open=self._on_open,
+                    on_message=self._on_message,
+                    on_error=self._on_error,
+                    on_close=self._on_close
+                )
+                self.ws.run_forever(
+                    sslopt={"cert_reqs": ssl.CERT_NONE, "check_hostname": False},
+                    ping_interval=None,
+                    ping_timeout=None
+                )
+
+            except Exception as e:
+                self.logger.error(f"User-data stream connection error: {e}")
+
+            self._set_connected(False)
+            if not self.is_running:
+                break
+
+            self.reconnect_attempts += 1
+            if self.reconnect_attempts >= self.max_reconnect_attempts:
+                self.logger.error("❌ User-data stream: max reconnection attempts reached - falling back to REST polling")
+                self.is_running = False
+                break
+
+            wait_time = min(30, 2 ** self.reconnect_attempts)
+            self.logger.info(f"🔄 User-data stream reconnecting in {wait_time}s (attempt {self.reconnect_attempts})")
+            self._stop_event.wait(wait_time)
+
+    def _run_keepalive(self):
+        """Extend the listen key periodically; force a reconnect if that fails"""
+        while not self._stop_event.wait(global_config.LISTEN_KEY_KEEPALIVE_INTERVAL):
+            if not self.listen_key:
+                continue
+            try:
+                if self.binance_client.keepalive_listen_key(self.listen_key):
+                    self.stats['keepalives'] += 1
+                    self.logger.debug("🔑 Listen key keepalive sent")
+                else:
+                    self.logger.warning("⚠️ Listen key keepalive failed - reconnecting user-data stream")
+                    self._force_reconnect()
+            except Exception as e:
+                # Keep the thread alive - a dead keepalive lets the key expire after 60 minutes
+                self.logger.error(f"❌ Listen key keepalive error: {e} - reconnecting user-data stream")
+                try:
+                    self._force_reconnect()
+                except Exception:
+                    pass
+
+    def _force_reconnect(self):
+        """Close the socket; _run_stream reconnects with a new listen key"""
+        self.listen_key = None
+        if self.ws:
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+
+    def _set_connected(self, connected: bool):
+        self.is_connected = connected
+        self.account_snapshot.set_stream_live(connected)
+
+    def _on_open(self, ws):
+        """Connected: resync the snapshot over REST to cover anything missed while disconnected"""
+        self.reconnect_attempts = 0
+        self.stats['reconnections'] += 1
+        self.logger.info("✅ User-data stream connected")
+
+        if self.account_snapshot.refresh(force=True):
+            self.stats['resyncs'] += 1
+            self._set_connected(True)
+            self._notify('RESYNC', {})
+        else:
+            self.logger.warning("⚠️ User-data stream resync failed - snapshot stays on REST polling")
+            self._force_reconnect()
+
+    def _on_message(self, ws, message):
+        """Route account, order and listen key events"""
+        try:
+            data = json.loads(message)
+            self.stats['messages_received'] += 1
+            self.stats['last_message_time'] = datetime.now()
+
+            event_type = data.get('e')
+            if event_type == 'ACCOUNT_UPDATE':
+                self._process_account_update(data.get('a', {}))
+            elif event_type == 'ORDER_TRADE_UPDATE':
+                self._process_order_update(data.get('o', {}))
+            elif event_type == 'listenKeyExpired':
+                self.logger.warning("⚠️ Listen key expired - reconnecting user-data stream")
+                self._force_reconnect()
+            else:
+                self.logger.debug(f"🔍 Unhandled user-data event: {event_type}")
+
+        except json.JSONDecodeError as e:
+            self.logger.error(f"User-data JSON decode error: {e}")
+        except Exception as e:
+            self.logger.error(f"Error processing user-data message: {e}")
+
+    def _process_account_update(self, account: Dict[str, Any]):
+        """Apply balance and position deltas from an ACCOUNT_UPDATE event"""
+        self.stats['account_updates'] += 1
+
+        for balance in account.get('B', []):
+            self.account_snapshot.apply_balance_update(balance['a'], {
+                'walletBalance': balance.get('wb'),
+                'crossWalletBalance': balance.get('cw')
+            })
+
+        symbols = []
+        for position in account.get('P', []):
+            # Hedge-mode LONG/SHORT legs are not tracked by the bot (one-way mode only)
+            if position.get('ps', 'BOTH') != 'BOTH':
+                continue
+            symbol = position['s']
+            self.account_snapshot.apply_position_update(symbol, {
+                'positionAmt': position.get('pa', '0'),
+                'entryPrice': position.get('ep', '0'),
+                'unrealizedProfit': position.get('up', '0'),
+                'isolatedWallet': position.get('iw', '0'),
+                'positionSide': position.get('ps', 'BOTH')
+            })
+            symbols.append(symbol)
+
+        self.logger.debug(f"📥 ACCOUNT_UPDATE ({account.get('m')}) | Positions: {symbols}")
+        self._notify('ACCOUNT_UPDATE', {'reason': account.get('m'), 'symbols': symbols})
+
+    def _process_order_update(self, order: Dict[str, Any]):
+        """Log fills and forward order status changes to listeners"""
+        self.stats['order_updates'] += 1
+
+        if order.get('x') == 'TRADE':
+            self.logger.info(f"📥 FILL | {order.get('s')} | {order.get('S')} {order.get('l')} @ ${float(order.get('L', 0)):,.4f} | "
+                             f"Status: {order.get('X')}")
+        self._notify('ORDER_TRADE_UPDATE', order)
+
+    def _notify(self, event_type: str, payload: Dict[str, Any]):
+        for callback in list(self.update_callbacks):
+            try:
+                callback(event_type, payload)
+            except Exception as e:
+                self.logger.error(f"Error in user-data callback: {e}")
+
+    def _on_error(self, ws, error):
+        self.logger.error(f"🚫 User-data WebSocket error: {error}")
+
+    def _on_close(self, ws, close_status_code, close_msg):
+        self._set_connected(False)
+        if self.is_running:
+            self.logger.warning(f"User-data WebSocket closed: {close_status_code} - {close_msg}")
+
+    def add_update_callback(self, callback: Callable):
+        """Add callback(event_type, payload) for pushed account/order events"""
+        self.update_callbacks.append(callback)
+
+    def remove_update_callback(self, callback: Callable):
+        if callback in self.update_callbacks:
+            self.update_callbacks.remove(callback)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        stats = self.stats.copy()
+        stats['is_connected'] = self.is_connected
+        stats['is_running'] = self.is_running
+        return stats
@@ -9,11 +9,15 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 from collections import defaultdict, deque
 import ssl
+from src.config.global_config import global_config
+from src.data_fetcher.kline_store import KlineStore
+from src.data_fetcher.ohlcv_archive import ohlcv_archive
+from src.utils.latency import latency_tracker
 
 class WebSocketKlineManager:
     """Persistent WebSocket manager for live kline data caching"""
 
-    def __init__(self):
+    def __init__(self, cache_size: Optional[int] = None):
         self.logger = logging.getLogger(__name__)
 
         # WebSocket configuration
@@ -23,8 +27,9 @@ class WebSocketKlineManager:
         self.is_connected = False
         self.is_running = False
 
-        # Data storage - organized by symbol and interval
-        self.kline_cache = defaultdict(lambda: defaultdict(lambda: deque(maxlen=1000)))
+        # Data storage - organized by symbol and interval, one entry per candle
+        self.cache_size = cache_size or global_config.KLINE_CACHE_SIZE
+        self.kline_cache = defaultdict(lambda: defaultdict(self._new_kline_buffer))
         self.latest_klines = defaultdict(dict)  # symbol -> interval -> latest_kline
         self.last_updates = defaultdict(dict)   # symbol -> interval -> timestamp
 
@@ -47,11 +52,16 @@ class WebSocketKlineManager:
         self.stats = {
             'messages_received': 0,
             'klines_processed': 0,
+            'candles_appended': 0,
             'connection_uptime': 0,
             'last_message_time': None,
             'reconnections': 0
         }
 
+    def _new_kline_buffer(self) -> KlineStore:
+        """Create an empty columnar candle store with the configured capacity"""
+        return KlineStore(self.cache_size)
+
     def add_symbol_interval(self, symbol: str, interval: str):
         """Add a symbol/interval pair for WebSocket streaming"""
         symbol = symbol.upper()
@@ -65,9 +75,9 @@ class WebSocketKlineManager:
 
             # Initialize cache structure
             if symbol not in self.kline_cache:
-                self.kline_cache[symbol] = defaultdict(lambda: deque(maxlen=1000))
+                self.kline_cache[symbol] = defaultdict(self._new_kline_buffer)
             if interval not in self.kline_cache[symbol]:
-                self.kline_cache[symbol][interval] = deque(maxlen=1000)
+                self.kline_cache[symbol][interval] = self._new_kline_buffer()
 
             # If already connected, update subscription
             if self.is_connected and self.ws:
@@ -171,13 +181,13 @@ class WebSocketKlineManager:
             if len(self.subscribed_streams) == 1:
                 # Single stream - direct connection
                 stream = list(self.subscribed_streams)[0]
-                url = f"wss://fstream.binance.com/ws/{stream}"
+                url = f"{global_config.EXCHANGE_WS_URL}{stream}"
             else:
                 # Multiple streams - use proper Binance Futures combined stream format
                 streams_list = list(sorted(self.subscribed_streams))
                 # Binance Futures uses different combined stream format
                 combined_params = "/".join(streams_list)
-                url = f"wss://fstream.binance.com/ws/{combined_params}"
+                url = f"{global_config.EXCHANGE_WS_URL}{combined_params}"
 
             self.logger.info(f"🔗 Connecting to WebSocket: {url}")
             self.logger.info(f"📡 Streams: {list(self.subscribed_streams)}")
@@ -252,6 +262,11 @@ class WebSocketKlineManager:
             self.stats['messages_received'] += 1
             self.stats['last_message_time'] = datetime.now()
 
+            # Exchange event time -> receipt (only meaningful with a synced clock)
+            event_time = data.get('data', data).get('E') if isinstance(data, dict) else None
+            if event_time:
+                latency_tracker.record('ws_transport', time.time() - event_time / 1000)
+
             # Handle different message formats from Binance WebSocket
             if 'stream' in data and 'data' in data:
                 # Combined stream format: {"stream": "btcusdt@kline_1m", "data": {...}}
@@ -439,8 +454,9 @@ class WebSocketKlineManager:
                 'received_at': time.time()
             }
 
-            # Update cache
-            self.kline_cache[symbol][interval].append(processed_kline)
+            # Update cache - open candle is updated in place, new candle appended
+            if self.kline_cache[symbol][interval].upsert(processed_kline):
+                self.stats['candles_appended'] += 1
             self.latest_klines[symbol][interval] = processed_kline
             self.last_updates[symbol][interval] = datetime.now()
 
@@ -448,9 +464,12 @@ class WebSocketKlineManager:
 
             self.logger.debug(f"✅ Kline processed: {symbol} {interval} @ ${processed_kline['close']:.4f} | Total processed: {self.stats['klines_processed']}")
 
-            # Log closed klines (completed candles)
+            # Log and archive closed klines (completed candles)
             if processed_kline['is_closed']:
                 self.logger.info(f"📊 Kline closed: {symbol} {interval} @ ${processed_kline['close']:.4f}")
+                latency_tracker.mark_kline(symbol, interval, processed_kline['received_at'])
+                if ohlcv_archive:
+                    ohlcv_archive.append(symbol, interval, processed_kline)
 
             # Notify callbacks
             for callback in self.update_callbacks:
@@ -491,12 +510,74 @@ class WebSocketKlineManager:
             self.logger.debug(f"No cached data for {symbol} {interval}")
             return None
 
-        klines = list(self.kline_cache[symbol][interval])
-        if not klines:
+        buffer = self.kline_cache[symbol][interval]
+        if not len(buffer):
             return None
 
         # Return most recent klines up to limit
-        return klines[-limit:] if len(klines) > limit else klines
+        return buffer.tail(limit)
+
+    def get_cached_count(self, symbol: str, interval: str) -> int:
+        """Number of candles cached for a symbol/interval"""
+        symbol = symbol.upper()
+        if symbol not in self.kline_cache or interval not in self.kline_cache[symbol]:
+            return 0
+        return len(self.kline_cache[symbol][interval])
+
+    def get_cached_dataframe(self, symbol: str, interval: str, limit: int = 100,
+                             timestamp_offset_ms: int = 0) -> Optional[pd.DataFrame]:
+        """Get cached klines as an OHLCV DataFrame built column-wise from the store"""
+        symbol = symbol.upper()
+
+        if symbol not in self.kline_cache or interval not in self.kline_cache[symbol]:
+            self.logger.debug(f"No cached data for {symbol} {interval}")
+            return None
+
+        return self.kline_cache[symbol][interval].to_dataframe(limit, timestamp_offset_ms)
+
+    def get_kline_store(self, symbol: str, interval: str) -> Optional[KlineStore]:
+        """Get the columnar candle store for a symbol/interval if one exists"""
+        symbol = symbol.upper()
+        if symbol not in self.kline_cache or interval not in self.kline_cache[symbol]:
+            return None
+        return self.kline_cache[symbol][interval]
+
+    def get_kline_arrays(self, symbol: str, interval: str, limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Get ndarray copies of cached kline columns (stable while the feed keeps updating)"""
+        symbol = symbol.upper()
+
+        if symbol not in self.kline_cache or interval not in self.kline_cache[symbol]:
+            return None
+
+        store = self.kline_cache[symbol][interval]
+        if not len(store):
+            return None
+        return store.arrays(limit)
+
+    def seed_klines(self, symbol: str, interval: str, klines: List[List[Any]]):
+        """Seed the candle buffer from REST klines so later reads can skip the bootstrap"""
+        try:
+            symbol = symbol.upper()
+            now_ms = int(time.time() * 1000)
+            received_at = time.time()
+
+            processed = [{
+                'timestamp': int(kline[0]),
+                'open': float(kline[1]),
+                'high': float(kline[2]),
+                'low': float(kline[3]),
+                'close': float(kline[4]),
+                'volume': float(kline[5]),
+                'close_time': int(kline[6]),
+                'is_closed': int(kline[6]) < now_ms,
+                'received_at': received_at
+            } for kline in klines]
+
+            self.kline_cache[symbol][interval].seed(processed)
+            self.logger.debug(f"📥 Seeded {len(processed)} klines for {symbol} {interval}")
+
+        except Exception as e:
+            self.logger.error(f"Error seeding klines for {symbol} {interval}: {e}")
 
     def get_latest_kline(self, symbol: str, interval: str) -> Optional[Dict]:
         """Get the most recent kline for a symbol/interval"""
@@ -529,7 +610,7 @@ class WebSocketKlineManager:
 
         # First check if we have any data at all
         if symbol in self.kline_cache and interval in self.kline_cache[symbol]:
-            cached_data = list(self.kline_cache[symbol][interval])
+            cached_data = self.kline_cache[symbol][interval]
             if len(cached_data) > 0:
                 # If we have recent data, check timestamp
                 if symbol in self.last_updates and interval in self.last_updates[symbol]:
@@ -544,7 +625,7 @@ class WebSocketKlineManager:
                     return age <= max_age_seconds
                 else:
                     # Have data but no timestamp - check if data itself is recent
-                    latest_kline = cached_data[-1]
+                    latest_kline = cached_data.latest()
                     data_age = time.time() - latest_kline.get('received_at', 0)
                     if data_age <= max_age_seconds * 2:  # Double tolerance for received_at
                         self.logger.debug(f"💡 Using received_at timestamp for freshness check: {data_age:.1f}s")
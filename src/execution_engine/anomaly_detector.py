@@ -10,6 +10,7 @@ from pathlib import Path
 
 from src.binance_client.client import BinanceClientWrapper
 from src.execution_engine.order_manager import OrderManager, Position
+from src.execution_engine.trade_events import trade_event_bus, TradeEvent, ANOMALY_DETECTED, ANOMALY_CLEARED
 from src.reporting.telegram_reporter import TelegramReporter
 
 
@@ -200,6 +201,10 @@ class AnomalyDetector:
         self.telegram_reporter = telegram_reporter
         self.logger = logging.getLogger(__name__)
 
+        # Shared account/position snapshot (set by bot manager)
+        self.account_snapshot = None
+        self.detection_requested = False  # set by pushed account updates to skip the interval wait
+
         # Initialize database
         self.db = AnomalyDatabase()
 
@@ -222,6 +227,10 @@ class AnomalyDetector:
         # Position tolerance for rounding differences
         self.position_tolerance = 0.01  # 1% tolerance
 
+        # Notifications are sent by an event bus subscriber, not on the detection pass
+        trade_event_bus.subscribe('anomaly_telegram', self._on_anomaly_event,
+                                  [ANOMALY_DETECTED, ANOMALY_CLEARED], replay=False)
+
     def register_strategy(self, strategy_name: str, symbol: str):
         """Register a strategy for monitoring"""
         self.registered_strategies[strategy_name] = symbol
@@ -278,11 +287,16 @@ class AnomalyDetector:
         """Main detection method - should be called periodically"""
         try:
             # Check if it's time to run detection
+            # A pushed account update runs detection early, but only scheduled scans advance
+            # anomaly lifecycles so orphan clear-down timing stays tied to detection_interval
             time_since_last = datetime.now() - self.last_detection_run
-            if time_since_last.total_seconds() < self.detection_interval:
+            scheduled = time_since_last.total_seconds() >= self.detection_interval
+            if not scheduled and not self.detection_requested:
                 return
+            self.detection_requested = False
 
-            self.last_detection_run = datetime.now()
+            if scheduled:
+                self.last_detection_run = datetime.now()
 
             scan_type = "STARTUP" if self.is_startup_protected() else "NORMAL"
             self.logger.debug(f"🔍 Starting {scan_type} anomaly detection scan")
@@ -303,7 +317,8 @@ class AnomalyDetector:
             self._detect_ghost_trades(bot_positions, binance_positions, suppress_notifications)
 
             # Process anomaly lifecycle
-            self._process_anomaly_lifecycle(binance_positions, suppress_notifications)
+            if scheduled:
+                self._process_anomaly_lifecycle(binance_positions, suppress_notifications)
 
             # Cleanup old anomalies
             self.db.cleanup_old_anomalies()
@@ -318,10 +333,22 @@ class AnomalyDetector:
             import traceback
             self.logger.error(f"Traceback: {traceback.format_exc()}")
 
+    def request_detection(self):
+        """Run on the next run_detection call regardless of detection_interval"""
+        self.detection_requested = True
+
+    def set_account_snapshot(self, account_snapshot):
+        """Read positions from the shared account snapshot instead of a REST call per check"""
+        self.account_snapshot = account_snapshot
+
     def _get_all_binance_positions(self) -> Optional[List[Dict]]:
         """Get all positions from Binance"""
         try:
             if self.binance_client.is_futures:
+                if self.account_snapshot:
+                    # Shared snapshot already drops zero positions; None means unavailable
+                    return self.account_snapshot.get_positions()
+
                 account_info = self.binance_client.client.futures_account()
                 positions = account_info.get('positions', [])
                 # Filter for non-zero positions
@@ -392,7 +419,7 @@ class AnomalyDetector:
 
                 # Send notification if not suppressed
                 if not suppress_notifications:
-                    self._send_orphan_notification(anomaly)
+                    self._publish_anomaly(ANOMALY_DETECTED, anomaly)
                     self.db.update_anomaly(anomaly_id, notified=True)
 
                 self.logger.warning(f"🔍 ORPHAN DETECTED: {strategy_name} | {symbol} | "
@@ -473,7 +500,7 @@ class AnomalyDetector:
 
                 # Send clear notification
                 if not suppress_notifications:
-                    self._send_orphan_clear_notification(anomaly)
+                    self._publish_anomaly(ANOMALY_CLEARED, anomaly)
 
                 self.logger.info(f"🧹 ORPHAN AUTO-CLEARED: {anomaly.strategy_name} | {anomaly.symbol} | "
                                f"Strategy can trade again")
@@ -511,7 +538,7 @@ class AnomalyDetector:
 
             # Send clear notification
             if not suppress_notifications:
-                self._send_ghost_clear_notification(anomaly)
+                self._publish_anomaly(ANOMALY_CLEARED, anomaly)
 
             self.logger.info(f"🧹 GHOST CLEARED: {anomaly.strategy_name} | {anomaly.symbol} | "
                            f"Manual position closed")
@@ -520,6 +547,23 @@ class AnomalyDetector:
             self.logger.debug(f"🔍 GHOST MONITORING: {anomaly.strategy_name} | {anomaly.symbol} | "
                             f"Manual position still active")
 
+    def _publish_anomaly(self, event_type: str, anomaly: TradeAnomaly):
+        """Publish an anomaly event (ordered per strategy/symbol)"""
+        trade_event_bus.publish(event_type, f"{anomaly.strategy_name}:{anomaly.symbol}", anomaly.to_dict())
+
+    def _on_anomaly_event(self, event: TradeEvent):
+        """Send the Telegram notification for an anomaly event"""
+        anomaly = TradeAnomaly.from_dict(dict(event.payload))
+        if anomaly.type == AnomalyType.ORPHAN:
+            if event.event_type == ANOMALY_DETECTED:
+                self._send_orphan_notification(anomaly)
+            else:
+                self._send_orphan_clear_notification(anomaly)
+        elif event.event_type == ANOMALY_DETECTED:
+            self._send_ghost_notification(anomaly)
+        else:
+            self._send_ghost_clear_notification(anomaly)
+
     def _send_orphan_notification(self, anomaly: TradeAnomaly):
         """Send orphan trade notification"""
         try:
@@ -6,6 +6,11 @@ from datetime import datetime
 import json
 from src.binance_client.client import BinanceClientWrapper
 from src.strategy_processor.signal_processor import TradingSignal, SignalType
+from src.execution_engine.position_sizing import fallback_symbol_info, quantity_for_margin
+from src.execution_engine.trade_events import (
+    trade_event_bus, TradeEvent, POSITION_OPENED, PARTIAL_CLOSED, POSITION_CLOSED
+)
+from src.utils.latency import latency_tracker
 
 @dataclass
 class Position:
@@ -46,9 +51,18 @@ class OrderManager:
         # Thread safety for position management
         self._position_lock = threading.RLock()
 
+        # Shared account/position snapshot (set by bot manager)
+        self.account_snapshot = None
+
+        # Indexed exchange trading rules (set by bot manager, created on first use otherwise)
+        self.symbol_metadata = None
+
         # Memory management - limit history size
         self.max_history_size = 1000
 
+        # Bookkeeping (database, trade log, Telegram) runs off the order path
+        self._subscribe_event_sinks()
+
     def execute_signal(self, signal: TradingSignal, strategy_config: Dict) -> Optional[Position]:
         """Execute a trading signal with improved error handling"""
         try:
@@ -139,7 +153,9 @@ class OrderManager:
                 'positionSide': position_side  # LONG/SHORT for hedge mode
             }
 
-            order_result = self.binance_client.create_order(**order_params)
+            with latency_tracker.timer('order_sent'):
+                order_result = self.binance_client.create_order(**order_params)
+            self._invalidate_account_snapshot()
             if not order_result:
                 # Check if this might be a minimum position value issue
                 actual_position_value = quantity * signal.entry_price
@@ -179,7 +195,8 @@ class OrderManager:
             with self._position_lock:
                 self.active_positions[strategy_name] = position
 
-            # Register bot trade with anomaly detector to pause ghost detection
+            # Register bot trade with anomaly detector to pause ghost detection - synchronously,
+            # so no anomaly scan can see the new exchange position before it is registered
             if hasattr(self, 'anomaly_detector') and self.anomaly_detector:
                 self.anomaly_detector.register_bot_trade(position.symbol, strategy_name)
                 self.logger.debug(f"🔍 BOT TRADE REGISTERED: {position.symbol} | Anomaly detection paused for 120 seconds")
@@ -190,8 +207,9 @@ class OrderManager:
             # Generate Trade ID
             position.trade_id = self._generate_trade_id(strategy_name, symbol)
 
-            # Single database recording with actual order confirmation data
-            self._record_confirmed_trade(position, order_result, strategy_config)
+            # Publish the confirmed trade (database, logger and Telegram subscribe)
+            with latency_tracker.timer('trade_recorded'):
+                self._record_confirmed_trade(position, order_result, strategy_config)
 
             # Record the time of this order for ghost detection timing
             self.last_order_time = datetime.now()
@@ -332,24 +350,17 @@ class OrderManager:
                         # Calculate duration
                         duration_minutes = (datetime.now() - position.entry_time).total_seconds() / 60 if position.entry_time else 0
 
-                        # CRITICAL: Update database with manual closure info
-                        try:
-                            from src.execution_engine.trade_database import TradeDatabase
-                            trade_db = TradeDatabase()
-
-                            if position.trade_id:
-                                trade_db.update_trade(position.trade_id, {
-                                    'trade_status': 'CLOSED',
-                                    'exit_price': current_price,
-                                    'exit_reason': 'Manual Closure (Detected)',
-                                    'pnl_usdt': pnl,
-                                    'pnl_percentage': pnl_percentage,
-                                    'duration_minutes': duration_minutes,
-                                    'manually_closed': True
-                                })
-                                self.logger.info(f"✅ Database updated for manual closure: {position.trade_id}")
-                        except Exception as db_error:
-                            self.logger.error(f"❌ Failed to update database for manual closure: {db_error}")
+                        # CRITICAL: Record the manual closure (no Telegram report - the bot did not close it)
+                        if position.trade_id:
+                            self._publish_position_closed(position, {
+                                'trade_status': 'CLOSED',
+                                'exit_price': current_price,
+                                'exit_reason': 'Manual Closure (Detected)',
+                                'pnl_usdt': pnl,
+                                'pnl_percentage': pnl_percentage,
+                                'duration_minutes': duration_minutes,
+                                'manually_closed': True
+                            }, notify=False)
 
                         # Update position status and move to history
                         position.status = "MANUALLY_CLOSED"
@@ -385,6 +396,7 @@ class OrderManager:
 
             try:
                 order_result = self.binance_client.create_order(**order_params)
+                self._invalidate_account_snapshot()
                 if not order_result:
                     self.logger.error("Failed to create closing order")
                     return {}
@@ -413,26 +425,10 @@ class OrderManager:
                     self.logger.error(f"Error creating closing order: {order_error}")
                     return {}
 
-            # Log trade exit for analytics
-            try:
-                if position.trade_id:
-                    from src.analytics.trade_logger import trade_logger
-                    trade_logger.log_trade_exit(
-                        trade_id=position.trade_id,
-                        exit_price=current_price,
-                        exit_reason=reason,
-                        pnl_usdt=pnl,
-                        pnl_percentage=pnl_percentage,
-                        max_drawdown=0  # Could be calculated if tracking is implemented
-                    )
-
-            except Exception as e:
-                self.logger.error(f"❌ Error logging trade exit: {e}")
-
             # Calculate duration before updating anything
             duration_minutes = (datetime.now() - position.entry_time).total_seconds() / 60 if position.entry_time else 0
 
-            # Update database and logger
+            # Record the close in the database and logger, then report it (via the event bus)
             close_data = {
                 'trade_status': 'CLOSED',
                 'exit_price': current_price,
@@ -443,17 +439,7 @@ class OrderManager:
                 'last_updated': datetime.now().isoformat()
             }
 
-            database_success = self._database_record_close(position.trade_id, close_data)
-            logger_success = self._logger_record_close(position.trade_id, current_price, reason, pnl, pnl_percentage)
-
-            if database_success and logger_success:
-                self.logger.info(f"✅ CLOSE RECORDED SUCCESSFULLY | {position.trade_id}")
-            elif database_success:
-                self.logger.warning(f"⚠️ DATABASE CLOSE ONLY | {position.trade_id}")
-            elif logger_success:
-                self.logger.warning(f"⚠️ LOGGER CLOSE ONLY | {position.trade_id}")
-            else:
-                self.logger.error(f"❌ CLOSE RECORDING FAILED | {position.trade_id}")
+            self._publish_position_closed(position, close_data)
 
             # Update position status
             position.status = "CLOSED"
@@ -484,41 +470,6 @@ class OrderManager:
 ╚═══════════════════════════════════════════════════╝"""
             self.logger.info(position_closed_message)
 
-            # Log trade closure
-            try:
-                if position.trade_id:
-                    from src.analytics.trade_logger import trade_logger
-                    trade_logger.log_trade_exit(
-                        trade_id=position.trade_id,
-                        exit_price=current_price,
-                        exit_reason=reason,
-                        pnl_usdt=pnl,
-                        pnl_percentage=pnl_percentage,
-                        max_drawdown=0  # Could be calculated if tracking is implemented
-                    )
-            except Exception as e:
-                self.logger.error(f"❌ Error logging trade exit: {e}")
-
-            # Send Telegram notification for position closure
-            try:
-                if hasattr(self, 'telegram_reporter') and self.telegram_reporter:
-                    position_data = {
-                        'strategy_name': position.strategy_name,
-                        'symbol': symbol,
-                        'side': position.side,
-                        'entry_price': position.entry_price,
-                        'exit_price': current_price,
-                        'quantity': position.quantity
-                    }
-                    self.telegram_reporter.report_position_closed(
-                        position_data=position_data,
-                        exit_reason=reason,
-                        pnl=pnl
-                    )
-                    self.logger.info(f"📱 TELEGRAM: Position closure notification sent for {strategy_name}")
-            except Exception as e:
-                self.logger.error(f"❌ TELEGRAM: Failed to send position closure notification: {e}")
-
             return {
                 'symbol': symbol,
                 'pnl_usdt': total_pnl,
@@ -550,50 +501,19 @@ class OrderManager:
             self.logger.error(f"Error adding position to history: {e}")
 
     def _get_symbol_info(self, symbol: str) -> Dict:
-        """Get symbol trading rules from Binance with caching"""
+        """Get symbol trading rules from the symbol metadata index"""
         try:
-            # Cache symbol info to avoid repeated API calls
-            if not hasattr(self, '_symbol_info_cache'):
-                self._symbol_info_cache = {}
-
-            if symbol in self._symbol_info_cache:
-                return self._symbol_info_cache[symbol]
+            if self.symbol_metadata is None:
+                from src.data_fetcher.symbol_metadata import SymbolMetadataService
+                self.symbol_metadata = SymbolMetadataService(self.binance_client)
 
-            # Fetch exchange info from Binance
-            if self.binance_client.is_futures:
-                exchange_info = self.binance_client.client.futures_exchange_info()
-            else:
-                exchange_info = self.binance_client.client.get_exchange_info()
-
-            # Find symbol info
-            symbol_info = None
-            for s in exchange_info['symbols']:
-                if s['symbol'] == symbol:
-                    symbol_info = s
-                    break
-
-            if symbol_info:
-                # Extract relevant filters
-                filters = {f['filterType']: f for f in symbol_info.get('filters', [])}
-
-                # Get LOT_SIZE filter for quantity precision
-                lot_size = filters.get('LOT_SIZE', {})
-                min_qty = float(lot_size.get('minQty', 0.1))
-                step_size = float(lot_size.get('stepSize', 0.1))
-
-                # Calculate precision from step size
-                precision = len(str(step_size).rstrip('0').split('.')[-1]) if '.' in str(step_size) else 0
-
-                info = {
-                    'min_qty': min_qty,
-                    'step_size': step_size,
-                    'precision': precision
-                }
-
-                self._symbol_info_cache[symbol] = info
-                self.logger.debug(f"📋 SYMBOL INFO | {symbol} | Min: {min_qty} | Step: {step_size} | Precision: {precision}")
+            info = self.symbol_metadata.get(symbol)
+            if info:
+                self.logger.debug(f"📋 SYMBOL INFO | {symbol} | Min: {info['min_qty']} | Step: {info['step_size']} | Precision: {info['precision']}")
                 return info
 
+            self.logger.warning(f"Symbol {symbol} not found in exchange info - using fallback rules")
+
         except Exception as e:
             self.logger.warning(f"Could not fetch symbol info for {symbol}: {e}")
 
@@ -602,17 +522,7 @@ class OrderManager:
 
     def _get_fallback_symbol_info(self, symbol: str) -> Dict:
         """Fallback symbol info if API fails"""
-        symbol_upper = symbol.upper()
-
-        if 'ETH' in symbol_upper:
-            # ETHUSDT minimum position size is 20 USDT, precision is 2 decimals
-            return {'min_qty': 0.01, 'step_size': 0.01, 'precision': 2}
-        elif 'SOL' in symbol_upper:
-            return {'min_qty': 0.01, 'step_size': 0.01, 'precision': 2}
-        elif 'BTC' in symbol_upper:
-            return {'min_qty': 0.001, 'step_size': 0.001, 'precision': 3}
-        else:
-            return {'min_qty': 0.1, 'step_size': 0.1, 'precision': 1}
+        return fallback_symbol_info(symbol)
 
     def _calculate_position_size(self, signal: TradingSignal, strategy_config: Dict) -> float:
         """Calculate position size based on margin and leverage with improved accuracy"""
@@ -631,42 +541,15 @@ class OrderManager:
             step_size = symbol_info['step_size']
             precision = strategy_config.get('decimals', symbol_info['precision'])
 
-            # Method 1: Calculate ideal quantity based on exact margin
-            target_position_value = margin * leverage
-            ideal_quantity = target_position_value / signal.entry_price
-
-            # Method 2: Smart rounding to minimize margin discrepancy
-            # Try both rounding up and down, choose the one closest to target margin
-            quantity_down = (ideal_quantity // step_size) * step_size
-            quantity_up = quantity_down + step_size
-
-            # Calculate actual margins for both options
-            margin_down = (quantity_down * signal.entry_price) / leverage if quantity_down >= min_qty else float('inf')
-            margin_up = (quantity_up * signal.entry_price) / leverage
-
-            # Choose the quantity that gets closest to target margin
-            margin_diff_down = abs(margin_down - margin) if margin_down != float('inf') else float('inf')
-            margin_diff_up = abs(margin_up - margin)
-
-            if margin_diff_down <= margin_diff_up and quantity_down >= min_qty:
-                quantity = quantity_down
-                chosen_direction = "DOWN"
-            else:
-                quantity = quantity_up
-                chosen_direction = "UP"
-
-            # Apply precision rounding
-            quantity = round(quantity, precision)
-
-            # Ensure minimum quantity (final safety check)
-            if quantity < min_qty:
-                quantity = min_qty
-                chosen_direction = "MIN_QTY"
+            # Ideal quantity for the exact margin, rounded to the step size nearest the target margin
+            ideal_quantity = (margin * leverage) / signal.entry_price
+            quantity, actual_margin_used, chosen_direction = quantity_for_margin(
+                signal.entry_price, margin, leverage, min_qty, step_size, precision)
+            if chosen_direction == "MIN_QTY":
                 self.logger.warning(f"⚠️ MARGIN ADJUSTMENT: Quantity increased to minimum {min_qty} - margin will be higher than configured")
 
             # Calculate actual values after rounding
             actual_position_value = quantity * signal.entry_price
-            actual_margin_used = actual_position_value / leverage
 
             # Log the margin difference for transparency
             margin_difference = actual_margin_used - margin
@@ -721,6 +604,19 @@ class OrderManager:
             self.logger.error(f"Error getting position on symbol: {e}")
             return None
 
+    def set_account_snapshot(self, account_snapshot):
+        """Set shared account snapshot so it can be invalidated after orders"""
+        self.account_snapshot = account_snapshot
+
+    def set_symbol_metadata(self, symbol_metadata):
+        """Set shared symbol metadata service used for lot size/precision rules"""
+        self.symbol_metadata = symbol_metadata
+
+    def _invalidate_account_snapshot(self):
+        """Positions/balances changed - make the next snapshot read refetch"""
+        if self.account_snapshot:
+            self.account_snapshot.invalidate()
+
     def set_anomaly_detector(self, anomaly_detector):
         """Set anomaly detector reference for ghost trade prevention"""
         try:
@@ -777,8 +673,8 @@ class OrderManager:
 
             # Check if trade ID exists in database with comprehensive tolerance
             try:
-                from src.execution_engine.trade_database import TradeDatabase
-                trade_db = TradeDatabase()
+                from src.execution_engine.trade_database import get_trade_database
+                trade_db = get_trade_database()
 
                 # First try exact strategy match
                 trade_id = trade_db.find_trade_by_position(strategy_name, symbol, side, quantity, entry_price, tolerance=0.05)
@@ -823,50 +719,70 @@ class OrderManager:
     def _calculate_entry_indicators(self, symbol: str) -> dict:
         """Calculate technical indicators at trade entry"""
         try:
-            # Get recent klines for indicator calculation
-            klines = self.binance_client.client.futures_klines(
-                symbol=symbol,
-                interval='1h',
-                limit=100
-            )
+            from src.data_fetcher.websocket_manager import websocket_manager
+            from src.data_fetcher.indicator_cache import indicator_cache
+
+            # Prefer live WebSocket candles; fetch klines only when they are not cached
+            df = websocket_manager.get_cached_dataframe(symbol, '1h', 100)
+            if df is not None and len(df) >= 50:
+                closes = df['close'].tolist()
+                volumes = df['volume'].tolist()
+                candle = indicator_cache.candle_key(df)
+            else:
+                klines = self.binance_client.get_klines(
+                    symbol=symbol,
+                    interval='1h',
+                    limit=100
+                )
+
+                if not klines or len(klines) < 50:
+                    self.logger.warning(f"Insufficient data for indicators on {symbol}")
+                    return {}
 
-            if not klines or len(klines) < 50:
-                self.logger.warning(f"Insufficient data for indicators on {symbol}")
-                return {}
+                # Extract prices and volumes
+                closes = [float(kline[4]) for kline in klines]
+                volumes = [float(kline[5]) for kline in klines]
+                candle = indicator_cache.klines_key(klines)
 
-            # Extract prices and volumes
-            closes = [float(kline[4]) for kline in klines]
-            volumes = [float(kline[5]) for kline in klines]
+            # Shared indicator cache: computed once per candle for all entries on this symbol
+            indicators = indicator_cache.get_or_compute(
+                symbol, '1h', candle, ('entry_indicators',),
+                lambda: self._compute_entry_indicators(closes, volumes)
+            )
+            indicators = dict(indicators)
 
-            indicators = {}
+            self.logger.info(f"📊 Calculated indicators for {symbol}: RSI={indicators.get('rsi', 'N/A')}, MACD={indicators.get('macd', 'N/A')}")
+            return indicators
 
-            # Calculate RSI
-            if len(closes) >= 14:
-                indicators['rsi'] = self._calculate_rsi(closes)
+        except Exception as e:
+            self.logger.error(f"Error calculating entry indicators for {symbol}: {e}")
+            return {}
 
-            # Calculate MACD
-            if len(closes) >= 26:
-                indicators['macd'] = self._calculate_simple_macd(closes)
+    def _compute_entry_indicators(self, closes: list, volumes: list) -> dict:
+        """Compute the entry indicator set from close prices and volumes"""
+        indicators = {}
 
-            # Calculate SMAs
-            if len(closes) >= 20:
-                indicators['sma_20'] = sum(closes[-20:]) / 20
-            if len(closes) >= 50:
-                indicators['sma_50'] = sum(closes[-50:]) / 50
+        # Calculate RSI
+        if len(closes) >= 14:
+            indicators['rsi'] = self._calculate_rsi(closes)
 
-            # Volume analysis
-            if volumes:
-                indicators['volume'] = sum(volumes[-20:]) / min(20, len(volumes))
+        # Calculate MACD
+        if len(closes) >= 26:
+            indicators['macd'] = self._calculate_simple_macd(closes)
 
-            # Signal strength (basic calculation)
-            indicators['signal_strength'] = self._calculate_signal_strength(indicators)
+        # Calculate SMAs
+        if len(closes) >= 20:
+            indicators['sma_20'] = sum(closes[-20:]) / 20
+        if len(closes) >= 50:
+            indicators['sma_50'] = sum(closes[-50:]) / 50
 
-            self.logger.info(f"📊 Calculated indicators for {symbol}: RSI={indicators.get('rsi', 'N/A')}, MACD={indicators.get('macd', 'N/A')}")
-            return indicators
+        # Volume analysis
+        if volumes:
+            indicators['volume'] = sum(volumes[-20:]) / min(20, len(volumes))
 
-        except Exception as e:
-            self.logger.error(f"Error calculating entry indicators for {symbol}: {e}")
-            return {}
+        # Signal strength (basic calculation)
+        indicators['signal_strength'] = self._calculate_signal_strength(indicators)
+        return indicators
 
     def _analyze_market_conditions(self, symbol: str) -> dict:
         """Analyze current market conditions"""
@@ -1029,40 +945,109 @@ class OrderManager:
                 'last_updated': datetime.now().isoformat()
             }
 
-            # Record in database first
-            self.logger.info(f"🔍 DEBUG: About to call _database_record_open for {position.trade_id}")
-            database_success = self._database_record_open(trade_data)
-            self.logger.info(f"🔍 DEBUG: _database_record_open returned: {database_success}")
-
-            # Record in logger
-            self.logger.info(f"🔍 DEBUG: About to call _logger_record_open for {position.trade_id}")
-            logger_success = self._logger_record_open(trade_data)
-            self.logger.info(f"🔍 DEBUG: _logger_record_open returned: {logger_success}")
-
-            if database_success and logger_success:
-                self.logger.info(f"✅ TRADE RECORDED SUCCESSFULLY | {position.trade_id}")
-            elif database_success:
-                self.logger.warning(f"⚠️ DATABASE ONLY | {position.trade_id} | Logger failed")
-            elif logger_success:
-                self.logger.warning(f"⚠️ LOGGER ONLY | {position.trade_id} | Database failed")
-            else:
-                self.logger.error(f"❌ RECORDING FAILED | {position.trade_id} | Both systems failed")
+            # Journaled before returning; the subscribers record it in the database and logger
+            trade_event_bus.publish(POSITION_OPENED, position.trade_id, trade_data)
+            self.logger.info(f"📬 TRADE PUBLISHED | {position.trade_id}")
 
         except Exception as e:
             self.logger.error(f"❌ Error recording trade: {e}")
             import traceback
             self.logger.error(f"❌ Traceback: {traceback.format_exc()}")
 
+    def _publish_position_closed(self, position: Position, close_data: Dict, notify: bool = True):
+        """Publish a close; the subscribers record it and (if notify) report it"""
+        trade_event_bus.publish(POSITION_CLOSED, position.trade_id or position.strategy_name, {
+            'trade_id': position.trade_id,
+            'strategy_name': position.strategy_name,
+            'symbol': position.symbol,
+            'side': position.side,
+            'entry_price': float(position.entry_price),
+            'quantity': float(position.quantity),
+            'close_data': close_data,
+            'notify': notify
+        })
+
+    def _subscribe_event_sinks(self):
+        """Attach the bookkeeping sinks to the trade event bus"""
+        trade_event_bus.subscribe('trade_database', self._on_trade_event_database, [POSITION_OPENED, POSITION_CLOSED])
+        trade_event_bus.subscribe('trade_logger', self._on_trade_event_logger, [POSITION_OPENED, POSITION_CLOSED])
+        trade_event_bus.subscribe('trade_validation', self._on_trade_event_validation, [POSITION_OPENED])
+        if self.telegram_reporter:
+            # Notifications are not worth repeating after a restart
+            trade_event_bus.subscribe('telegram', self._on_trade_event_telegram,
+                                      [POSITION_OPENED, PARTIAL_CLOSED, POSITION_CLOSED], replay=False)
+
+    def _on_trade_event_database(self, event: TradeEvent):
+        """Persist opens/closes in the trade database (raising makes the bus retry)"""
+        trade_id = event.payload.get('trade_id')
+        if not trade_id:
+            return
+        if event.event_type == POSITION_OPENED:
+            success = self._database_record_open(dict(event.payload))
+        else:
+            success = self._database_record_close(trade_id, dict(event.payload['close_data']))
+        if not success:
+            raise RuntimeError(f"database did not record {event.event_type}")
+
+    def _on_trade_event_logger(self, event: TradeEvent):
+        """Mirror opens/closes into the trade logger"""
+        trade_id = event.payload.get('trade_id')
+        if not trade_id:
+            return
+        if event.event_type == POSITION_OPENED:
+            if not self._logger_record_open(dict(event.payload)):
+                raise RuntimeError(f"trade logger did not record {event.event_type}")
+            return
+
+        close_data = event.payload['close_data']
+        from src.analytics.trade_logger import trade_logger
+        trade_logger.log_trade_exit(
+            trade_id=trade_id,
+            exit_price=close_data['exit_price'],
+            exit_reason=close_data['exit_reason'],
+            pnl_usdt=close_data['pnl_usdt'],
+            pnl_percentage=close_data['pnl_percentage'],
+            max_drawdown=0,  # Could be calculated if tracking is implemented
+            exit_time=datetime.fromtimestamp(event.created_at)  # publish time, also on journal replay
+        )
+
+    def _on_trade_event_validation(self, event: TradeEvent):
+        self._log_trade_for_validation(event.payload)
+
+    def _on_trade_event_telegram(self, event: TradeEvent):
+        """Queue the Telegram report for a trade event"""
+        payload = event.payload
+        if event.event_type == POSITION_OPENED:
+            self.telegram_reporter.report_position_opened(payload)
+        elif event.event_type == PARTIAL_CLOSED:
+            self._send_partial_tp_notification(payload)
+        elif payload.get('notify', True):
+            close_data = payload['close_data']
+            position_data = {
+                'strategy_name': payload['strategy_name'],
+                'symbol': payload['symbol'],
+                'side': payload['side'],
+                'entry_price': payload['entry_price'],
+                'exit_price': close_data['exit_price'],
+                'quantity': payload['quantity']
+            }
+            self.telegram_reporter.report_position_closed(
+                position_data=position_data,
+                exit_reason=close_data['exit_reason'],
+                pnl=close_data['pnl_usdt']
+            )
+            self.logger.info(f"📱 TELEGRAM: Position closure notification queued for {payload['strategy_name']}")
+
     def _database_record_open(self, trade_data: Dict) -> bool:
         """Record trade opening in database with robust error handling"""
         try:
             trade_id = trade_data['trade_id']
             self.logger.info(f"💾 DATABASE RECORD OPEN | {trade_id}")
 
-            from src.execution_engine.trade_database import TradeDatabase
+            from src.execution_engine.trade_database import get_trade_database
 
             # Initialize database
-            trade_db = TradeDatabase()
+            trade_db = get_trade_database()
 
             # Use the proper add_trade method
             success = trade_db.add_trade(trade_id, trade_data)
@@ -1113,8 +1098,8 @@ class OrderManager:
         try:
             self.logger.info(f"💾 DATABASE RECORD CLOSE | {trade_id}")
 
-            from src.execution_engine.trade_database import TradeDatabase
-            trade_db = TradeDatabase()
+            from src.execution_engine.trade_database import get_trade_database
+            trade_db = get_trade_database()
 
             # Use the proper update_trade method
             success = trade_db.update_trade(trade_id, close_data)
@@ -1132,35 +1117,6 @@ class OrderManager:
             self.logger.error(f"❌ Traceback: {traceback.format_exc()}")
             return False
 
-    def _logger_record_close(self, trade_id: str, exit_price: float, exit_reason: str, pnl: float, pnl_percentage: float) -> bool:
-        """Record trade closing in logger"""
-        try:
-            self.logger.info(f"📝 LOGGER RECORD CLOSE | {trade_id}")
-
-            from src.analytics.trade_logger import trade_logger
-
-            # Update existing trade in logger
-            for trade in trade_logger.trades:
-                if trade.trade_id == trade_id:
-                    trade.exit_price = exit_price
-                    trade.exit_reason = exit_reason
-                    trade.pnl = pnl
-                    trade.pnl_percentage = pnl_percentage
-                    trade.status = 'CLOSED'
-                    trade.exit_time = datetime.now()
-
-                    # Save the logger data
-                    trade_logger._save_trades()
-                    self.logger.info(f"✅ LOGGER CLOSE SUCCESS | {trade_id}")
-                    return True
-
-            self.logger.warning(f"⚠️ Trade {trade_id} not found in logger for close update")
-            return False
-
-        except Exception as e:
-            self.logger.error(f"❌ Logger close record error: {e}")
-            return False
-
     def check_partial_take_profit(self, strategy_name: str, current_price: float) -> bool:
         """Check and execute partial take profit if conditions are met"""
         try:
@@ -1230,8 +1186,18 @@ class OrderManager:
                     position.remaining_quantity = position.quantity - close_quantity
                     position.quantity = position.remaining_quantity  # Update current quantity
 
-                    # Send Telegram notification
-                    self._send_partial_tp_notification(position, current_price, partial_profit, partial_profit_percentage)
+                    trade_event_bus.publish(PARTIAL_CLOSED, position.trade_id or strategy_name, {
+                        'trade_id': position.trade_id,
+                        'strategy_name': position.strategy_name,
+                        'symbol': position.symbol,
+                        'side': position.side,
+                        'entry_price': float(position.entry_price),
+                        'exit_price': float(current_price),
+                        'closed_quantity': float(close_quantity),
+                        'remaining_quantity': float(position.remaining_quantity),
+                        'partial_profit': float(partial_profit),
+                        'partial_profit_percentage': float(partial_profit_percentage)
+                    })
 
                     self.logger.info(f"✅ PARTIAL TAKE PROFIT EXECUTED | {strategy_name} | Closed: {close_quantity} | Profit: ${partial_profit:.2f} ({partial_profit_percentage:+.1f}%) | Remaining: {position.remaining_quantity}")
 
@@ -1259,6 +1225,7 @@ class OrderManager:
             }
 
             order_result = self.binance_client.create_order(**order_params)
+            self._invalidate_account_snapshot()
             if order_result:
                 self.logger.info(f"✅ PARTIAL CLOSE ORDER EXECUTED | {position.symbol} | Quantity: {close_quantity} | Price: ${current_price:.4f}")
                 return True
@@ -1270,37 +1237,37 @@ class OrderManager:
             self.logger.error(f"Error executing partial close: {e}")
             return False
 
-    def _send_partial_tp_notification(self, position: Position, current_price: float, partial_profit: float, partial_profit_percentage: float):
+    def _send_partial_tp_notification(self, partial: Dict):
         """Send Telegram notification for partial take profit"""
         try:
             if hasattr(self, 'telegram_reporter') and self.telegram_reporter:
                 # Get current indicator value based on strategy
                 current_indicator = "N/A"
-                strategy_config = position.strategy_config
+                strategy_name = partial['strategy_name']
 
-                if strategy_config and 'rsi' in position.strategy_name.lower():
+                if 'rsi' in strategy_name.lower():
                     # Try to get current RSI value - simplified for now
                     current_indicator = "RSI: N/A"  # Could be enhanced with actual RSI
-                elif strategy_config and 'macd' in position.strategy_name.lower():
+                elif 'macd' in strategy_name.lower():
                     current_indicator = "MACD: N/A"  # Could be enhanced with actual MACD
 
                 message = f"""🎯 **Partial Take Profit Taken**
 
-Strategy: {position.strategy_name.upper()}
-Symbol: {position.symbol}
-Side: {position.side}
-Entry: ${position.entry_price:.4f}
-Current Price: ${current_price:.4f}
+Strategy: {strategy_name.upper()}
+Symbol: {partial['symbol']}
+Side: {partial['side']}
+Entry: ${partial['entry_price']:.4f}
+Current Price: ${partial['exit_price']:.4f}
 {current_indicator}
 
-💰 Partial Take Profit: ${partial_profit:.2f} USDT ({partial_profit_percentage:+.1f}%)
+💰 Partial Take Profit: ${partial['partial_profit']:.2f} USDT ({partial['partial_profit_percentage']:+.1f}%)
 📊 Rest of trade is ongoing
 
-Remaining Position: {position.remaining_quantity} {position.symbol.replace('USDT', '')}"""
+Remaining Position: {partial['remaining_quantity']} {partial['symbol'].replace('USDT', '')}"""
 
                 # Send via Telegram
                 self.telegram_reporter.send_message(message)
-                self.logger.info(f"📱 TELEGRAM: Partial TP notification sent for {position.strategy_name}")
+                self.logger.info(f"📱 TELEGRAM: Partial TP notification sent for {strategy_name}")
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Failed to send partial TP notification: {e}")
@@ -1308,10 +1275,10 @@ Remaining Position: {position.remaining_quantity} {position.symbol.replace('USDT
     def _sync_database_to_logger(self, trade_id: str, trade_data: Dict) -> bool:
         """Sync trade from database to logger (database is source of truth)"""
         try:
-            from src.execution_engine.trade_database import TradeDatabase
+            from src.execution_engine.trade_database import get_trade_database
 
             # Get the trade from database as source of truth
-            trade_db = TradeDatabase()
+            trade_db = get_trade_database()
             db_trade = trade_db.get_trade(trade_id)
 
             if not db_trade:
@@ -1332,22 +1299,22 @@ Remaining Position: {position.remaining_quantity} {position.symbol.replace('USDT
             self.logger.error(f"❌ Error syncing database to logger: {e}")
             return False
 
-    def _log_trade_for_validation(self, position: Position) -> None:
+    def _log_trade_for_validation(self, trade: Dict) -> None:
         """Log trade details for validation purposes with error handling"""
         try:
             trade_data = {
-                'strategy_name': position.strategy_name,
-                'symbol': position.symbol,
-                'side': position.side,
-                'entry_price': position.entry_price,
-                'quantity': position.quantity,
-                'stop_loss': position.stop_loss,
-                'take_profit': position.take_profit,
-                'position_side': position.position_side,
-                'order_id': position.order_id,
-                'entry_time': position.entry_time.isoformat() if position.entry_time else None,
-                'status': position.status,
-                'trade_id': position.trade_id,
+                'strategy_name': trade.get('strategy_name'),
+                'symbol': trade.get('symbol'),
+                'side': trade.get('side'),
+                'entry_price': trade.get('entry_price'),
+                'quantity': trade.get('quantity'),
+                'stop_loss': trade.get('stop_loss'),
+                'take_profit': trade.get('take_profit'),
+                'position_side': trade.get('position_side'),
+                'order_id': trade.get('order_id'),
+                'entry_time': trade.get('timestamp'),
+                'status': trade.get('trade_status'),
+                'trade_id': trade.get('trade_id'),
             }
             self.logger.debug(f"📜 TRADE DATA: {json.dumps(trade_data, indent=2)}")
         except Exception as e:
@@ -0,0 +1,57 @@
+from typing import Dict, Tuple
+
+
+def fallback_symbol_info(symbol: str) -> Dict:
+    """Hardcoded lot size rules used when exchange info is unavailable"""
+    symbol_upper = symbol.upper()
+
+    if 'ETH' in symbol_upper:
+        # ETHUSDT minimum position size is 20 USDT, precision is 2 decimals
+        return {'min_qty': 0.01, 'step_size': 0.01, 'precision': 2}
+    elif 'SOL' in symbol_upper:
+        return {'min_qty': 0.01, 'step_size': 0.01, 'precision': 2}
+    elif 'BTC' in symbol_upper:
+        return {'min_qty': 0.001, 'step_size': 0.001, 'precision': 3}
+    else:
+        return {'min_qty': 0.1, 'step_size': 0.1, 'precision': 1}
+
+
+def quantity_for_margin(entry_price: float, margin: float, leverage: float,
+                        min_qty: float, step_size: float, precision: int) -> Tuple[float, float, str]:
+    """Order quantity whose margin is closest to the target margin
+
+    Tries rounding the ideal quantity down and up to the step size and keeps
+    whichever lands nearer the configured margin (never below min_qty).
+    Returns (quantity, actual_margin_used, rounding_direction).
+    """
+    target_position_value = margin * leverage
+    ideal_quantity = target_position_value / entry_price
+
+    quantity_down = (ideal_quantity // step_size) * step_size
+    quantity_up = quantity_down + step_size
+
+    # Calculate actual margins for both options
+    margin_down = (quantity_down * entry_price) / leverage if quantity_down >= min_qty else float('inf')
+    margin_up = (quantity_up * entry_price) / leverage
+
+    # Choose the quantity that gets closest to target margin
+    margin_diff_down = abs(margin_down - margin) if margin_down != float('inf') else float('inf')
+    margin_diff_up = abs(margin_up - margin)
+
+    if margin_diff_down <= margin_diff_up and quantity_down >= min_qty:
+        quantity = quantity_down
+        direction = "DOWN"
+    else:
+        quantity = quantity_up
+        direction = "UP"
+
+    # Apply precision rounding
+    quantity = round(quantity, precision)
+
+    # Ensure minimum quantity (final safety check)
+    if quantity < min_qty:
+        quantity = min_qty
+        direction = "MIN_QTY"
+
+    actual_margin_used = (quantity * entry_price) / leverage
+    return quantity, actual_margin_used, direction
@@ -63,6 +63,9 @@ class SmartMoneyStrategy:
         self.max_daily_trades = config.get('max_daily_trades', 3)
         self.trend_filter_enabled = config.get('trend_filter_enabled', True)
         
+        # Clock for session/daily limits (a backtest replaces it with candle time)
+        self.clock = lambda: datetime.now(pytz.UTC)
+
         # Internal tracking
         self.daily_trade_count = 0
         self.last_trade_date = None
@@ -360,7 +363,7 @@ class SmartMoneyStrategy:
     def _get_current_session(self) -> str:
         """Get current trading session based on UTC time"""
         try:
-            utc_now = datetime.now(pytz.UTC)
+            utc_now = self.clock()
             hour = utc_now.hour
             
             # Define session times (UTC)
@@ -379,7 +382,7 @@ class SmartMoneyStrategy:
     def _reset_daily_count_if_needed(self):
         """Reset daily trade count if it's a new day"""
         try:
-            today = datetime.now().date()
+            today = self.clock().astimezone().date()
             if self.last_trade_date != today:
                 self.daily_trade_count = 0
                 self.last_trade_date = today
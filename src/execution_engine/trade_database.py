@@ -1,190 +1,250 @@
 import json
 import os
 import logging
+import sqlite3
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple, Callable
 
 class TradeDatabase:
-    """Simplified trade database - mirrors trade logger data only"""
+    """Trade store backed by SQLite (WAL) - mirrors trade logger data
+
+    Every trade is one row: indexed strategy/symbol/side/status/timestamp
+    columns plus the full trade dict as JSON. add_trade/update_trade write a
+    single row in a transaction instead of rewriting the whole history.
+    self.trades stays an in-memory mirror of the table for existing readers;
+    open trades and (strategy, symbol, side) keys are indexed on every write
+    so lookups don't scan the whole history.
+
+    Use get_trade_database() for the process-wide instance: it reloads only
+    when another connection (e.g. a maintenance script) has committed, and
+    listeners are told about every change. Size-changing writes swap in a
+    new self.trades dict, so readers iterating the old one are never hit by
+    a concurrent insert.
+    """
+
+    COLUMNS = ('trade_id', 'strategy_name', 'symbol', 'side', 'trade_status',
+               'timestamp', 'created_at', 'last_updated', 'data')
 
     def __init__(self, db_file: str = "trading_data/trade_database.json"):
         self.logger = logging.getLogger(__name__)
-        self.db_file = db_file
+        self.db_file = db_file  # legacy JSON file, migrated once into the SQLite store
+        self.db_path = os.path.splitext(db_file)[0] + ".db"
         self.trades = {}
+        self._open_trade_ids: Set[str] = set()
+        self._position_index: Dict[Tuple[Any, Any, Any], Set[str]] = {}  # (strategy, symbol, side) -> trade_ids
+        self._lock = threading.RLock()
+        self._listeners: List[Callable[[str, str, Optional[Dict[str, Any]]], None]] = []
+        self._data_version = None
+        self.conn = None
         self._ensure_directory()
+        self._connect()
+        self._migrate_from_json()
         self._load_database()
 
     def _ensure_directory(self):
         """Ensure the trading_data directory exists"""
-        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+    def _connect(self):
+        """Open the SQLite store in WAL mode and create the schema"""
+        self.conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")  # durable at checkpoints; WAL keeps commits atomic
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS trades (
+                    trade_id TEXT PRIMARY KEY,
+                    strategy_name TEXT,
+                    symbol TEXT,
+                    side TEXT,
+                    trade_status TEXT,
+                    timestamp TEXT,
+                    created_at TEXT,
+                    last_updated TEXT,
+                    data TEXT NOT NULL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_status ON trades (trade_status)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_strategy_symbol ON trades (strategy_name, symbol, side)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades (symbol)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades (timestamp)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_created_at ON trades (created_at)")
+
+    def _row_values(self, trade_id: str, trade_data: Dict[str, Any]) -> tuple:
+        """Column values for one trade row"""
+        timestamp = trade_data.get('timestamp') or trade_data.get('created_at')
+        return (
+            trade_id,
+            trade_data.get('strategy_name'),
+            trade_data.get('symbol'),
+            trade_data.get('side'),
+            trade_data.get('trade_status'),
+            str(timestamp) if timestamp is not None else None,
+            trade_data.get('created_at'),
+            trade_data.get('last_updated'),
+            json.dumps(trade_data, default=str, ensure_ascii=False)
+        )
+
+    def _upsert_rows(self, trades: Dict[str, Dict[str, Any]]):
+        """Insert or replace rows (caller holds the lock and the transaction)"""
+        placeholders = ", ".join("?" for _ in self.COLUMNS)
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO trades ({', '.join(self.COLUMNS)}) VALUES ({placeholders})",
+            [self._row_values(trade_id, trade_data) for trade_id, trade_data in trades.items()]
+        )
+
+    @staticmethod
+    def _position_key(trade_data: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+        return (trade_data.get('strategy_name'), trade_data.get('symbol'), trade_data.get('side'))
+
+    def _index_trade(self, trade_id: str, previous: Optional[Dict[str, Any]] = None):
+        """Update secondary indexes for one trade (previous: its data before the write)"""
+        if previous is not None:
+            ids = self._position_index.get(self._position_key(previous))
+            if ids:
+                ids.discard(trade_id)
+
+        trade_data = self.trades.get(trade_id)
+        if trade_data is None:
+            self._open_trade_ids.discard(trade_id)
+            return
+
+        self._position_index.setdefault(self._position_key(trade_data), set()).add(trade_id)
+        if trade_data.get('trade_status') == 'OPEN':
+            self._open_trade_ids.add(trade_id)
+        else:
+            self._open_trade_ids.discard(trade_id)
+
+    def _rebuild_indexes(self):
+        """Rebuild secondary indexes from self.trades (load, bulk sync)"""
+        with self._lock:
+            self._open_trade_ids = set()
+            self._position_index = {}
+            for trade_id in self.trades:
+                self._index_trade(trade_id)
+
+    def _upsert_trade(self, trade_id: str) -> bool:
+        """Write a single trade row in its own transaction"""
+        try:
+            with self._lock, self.conn:
+                self._upsert_rows({trade_id: self.trades[trade_id]})
+            return True
+        except Exception as e:
+            self.logger.error(f"❌ Error writing trade {trade_id} to database: {e}")
+            return False
 
-    def _load_database(self):
-        """Load trades from database file"""
+    def _migrate_from_json(self):
+        """One-shot import of the legacy trade_database.json into an empty SQLite store"""
         try:
-            if os.path.exists(self.db_file):
-                with open(self.db_file, 'r') as f:
+            if not os.path.exists(self.db_file):
+                return
+
+            with self._lock:
+                if self.conn.execute("SELECT 1 FROM trades LIMIT 1").fetchone():
+                    return
+
+                with open(self.db_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    
-                    # Handle different data formats with robust error handling
-                    if isinstance(data, dict):
-                        if 'trades' in data:
-                            trades_data = data['trades']
-                            # Ensure trades_data is a dict with proper validation
-                            if isinstance(trades_data, dict):
-                                # Validate that all keys are strings and values are dicts
-                                valid_trades = {}
-                                for key, value in trades_data.items():
-                                    if isinstance(key, str) and isinstance(value, dict):
-                                        valid_trades[key] = value
-                                    else:
-                                        self.logger.warning(f"📊 Skipping invalid trade entry: key={type(key)}, value={type(value)}")
-                                self.trades = valid_trades
-                                self.logger.info(f"📊 Loaded {len(valid_trades)} valid trades from {len(trades_data)} entries")
-                            elif isinstance(trades_data, list):
-                                # Convert list to dict if needed
-                                self.trades = {}
-                                self.logger.warning("📊 Converting trades list to dict format")
-                            else:
-                                self.logger.warning("📊 Invalid trades format, starting with empty database")
-                                self.trades = {}
-                        else:
-                            # If data is directly the trades dict, validate it thoroughly
-                            if (isinstance(data, dict) and 
-                                all(isinstance(key, str) for key in data.keys()) and
-                                all(isinstance(value, dict) for value in data.values())):
-                                self.trades = data
-                            else:
-                                self.logger.warning("📊 Invalid trade data structure, starting with empty database")
-                                self.trades = {}
-                    elif isinstance(data, list):
-                        # Convert list to dict if needed
-                        self.trades = {}
-                        self.logger.warning("📊 Converting list format to dict format")
+
+                trades_data = data.get('trades', data) if isinstance(data, dict) else {}
+                valid_trades = {}
+                for key, value in trades_data.items():
+                    if isinstance(key, str) and isinstance(value, dict):
+                        valid_trades[key] = value
                     else:
-                        self.logger.warning("📊 Unknown data format, starting with empty database")
-                        self.trades = {}
-                    
-                    # Ensure trades is a dict
-                    if not isinstance(self.trades, dict):
-                        self.logger.warning("📊 Invalid trades format, resetting to empty dict")
-                        self.trades = {}
-                    
-                    self.logger.info(f"📊 Loaded {len(self.trades)} trades from database")
-            else:
-                self.logger.info("📊 Trade database file not found, starting with empty database")
-                self.trades = {}
+                        self.logger.warning(f"📊 Skipping invalid trade entry: key={type(key)}, value={type(value)}")
+
+                with self.conn:
+                    self._upsert_rows(valid_trades)
+
+            migrated_file = f"{self.db_file}.migrated"
+            os.replace(self.db_file, migrated_file)
+            self.logger.info(f"📦 MIGRATED {len(valid_trades)} trades from {self.db_file} to {self.db_path} "
+                             f"(original kept as {migrated_file})")
+
         except Exception as e:
-            self.logger.error(f"❌ Error loading trade database: {e}")
-            import traceback
-            self.logger.error(f"❌ Database loading traceback: {traceback.format_exc()}")
-            self.trades = {}
+            self.logger.error(f"❌ Error migrating JSON trade database: {e}")
 
-    def _save_database(self):
-        """Save trades to database file with enhanced error handling and fallback options"""
+    def _load_database(self):
+        """Load all trades from the SQLite store into memory"""
         try:
-            self.logger.info(f"🔍 SAVING DATABASE | File: {self.db_file} | Trades: {len(self.trades)}")
+            with self._lock:
+                rows = self.conn.execute("SELECT trade_id, data FROM trades").fetchall()
+                self._data_version = self._read_data_version()
 
-            data = {
-                'trades': self.trades,
-                'last_updated': datetime.now().isoformat()
-            }
+            trades = {}
+            for row in rows:
+                try:
+                    trades[row['trade_id']] = json.loads(row['data'])
+                except (TypeError, ValueError) as e:
+                    self.logger.warning(f"📊 Skipping corrupted trade row {row['trade_id']}: {e}")
+            self.trades = trades
+            self._rebuild_indexes()
+            self.logger.info(f"📊 Loaded {len(self.trades)} trades from database")
 
-            # Multiple save strategies for maximum reliability
-            save_success = False
+        except Exception as e:
+            self.logger.error(f"Error loading database: {e}")
+            self.trades = {}
 
-            # Strategy 1: Normal directory with atomic write
-            try:
-                import os
-                db_dir = os.path.dirname(self.db_file)
-
-                # Create directory if needed
-                if db_dir and not os.path.exists(db_dir):
-                    os.makedirs(db_dir, mode=0o755, exist_ok=True)
-                    self.logger.info(f"✅ CREATED DIRECTORY | {db_dir}")
-
-                # Atomic write with temp file
-                temp_file = f"{self.db_file}.tmp"
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, default=str, ensure_ascii=False)
-                    f.flush()
-                    os.fsync(f.fileno())
-
-                # Atomic move
-                os.replace(temp_file, self.db_file)
-
-                # Verify the save
-                if os.path.exists(self.db_file) and os.path.getsize(self.db_file) > 10:
-                    try:
-                        with open(self.db_file, 'r', encoding='utf-8') as f:
-                            verification_data = json.load(f)
-                            saved_trades = verification_data.get('trades', {})
-                            if len(saved_trades) == len(self.trades):
-                                save_success = True
-                                self.logger.info(f"✅ DATABASE SAVE SUCCESS | Strategy 1 | {len(saved_trades)} trades")
-                            else:
-                                self.logger.warning(f"⚠️ Trade count mismatch: saved {len(saved_trades)}, expected {len(self.trades)}")
-                    except Exception as verify_error:
-                        self.logger.warning(f"⚠️ Verification read failed: {verify_error}")
-
-            except Exception as strategy1_error:
-                self.logger.warning(f"⚠️ Strategy 1 failed: {strategy1_error}")
-                # Clean up temp file
-                try:
-                    temp_file = f"{self.db_file}.tmp"
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                except:
-                    pass
-
-            # Strategy 2: Fallback to root directory
-            if not save_success:
-                try:
-                    fallback_file = "trade_database.json"
-                    self.logger.info(f"🔄 TRYING FALLBACK LOCATION | {fallback_file}")
-
-                    with open(fallback_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
-                        f.flush()
-                        os.fsync(f.fileno())
-
-                    # Verify fallback save
-                    if os.path.exists(fallback_file) and os.path.getsize(fallback_file) > 10:
-                        try:
-                            with open(fallback_file, 'r', encoding='utf-8') as f:
-                                verification_data = json.load(f)
-                                saved_trades = verification_data.get('trades', {})
-                                if len(saved_trades) == len(self.trades):
-                                    save_success = True
-                                    self.db_file = fallback_file  # Update file path
-                                    self.logger.info(f"✅ DATABASE SAVE SUCCESS | Strategy 2 (Fallback) | {len(saved_trades)} trades")
-                        except Exception as verify_error:
-                            self.logger.warning(f"⚠️ Fallback verification failed: {verify_error}")
-
-                except Exception as strategy2_error:
-                    self.logger.warning(f"⚠️ Strategy 2 failed: {strategy2_error}")
-
-            # Strategy 3: Simple write without atomic operations
-            if not save_success:
-                try:
-                    simple_file = "trades_backup.json"
-                    self.logger.info(f"🔄 TRYING SIMPLE WRITE | {simple_file}")
+    def _read_data_version(self) -> Optional[int]:
+        """SQLite data_version - changes when another connection commits"""
+        try:
+            return self.conn.execute("PRAGMA data_version").fetchone()[0]
+        except Exception:
+            return None
 
-                    with open(simple_file, 'w') as f:
-                        json.dump(data, f, indent=2, default=str)
+    def refresh_if_changed(self) -> bool:
+        """Reload if the store was modified by another connection/process; True if reloaded"""
+        try:
+            with self._lock:
+                if self.conn is None or self._read_data_version() == self._data_version:
+                    return False
+                self.logger.info("🔄 Trade database changed externally - reloading")
+                self._load_database()
+            self._notify('*', 'reloaded')
+            return True
+        except Exception as e:
+            self.logger.error(f"Error checking trade database version: {e}")
+            return False
 
-                    if os.path.exists(simple_file) and os.path.getsize(simple_file) > 0:
-                        save_success = True
-                        self.logger.info(f"✅ DATABASE SAVE SUCCESS | Strategy 3 (Simple)")
+    def add_listener(self, callback: Callable[[str, str, Optional[Dict[str, Any]]], None]):
+        """Call callback(trade_id, change, trade_data) after every write
 
-                except Exception as strategy3_error:
-                    self.logger.error(f"❌ Strategy 3 failed: {strategy3_error}")
+        change is 'added', 'updated', 'removed' or 'reloaded' (trade_id '*').
+        Callbacks run on the writing thread and must not block.
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
 
-            if save_success:
-                self.logger.info(f"✅ DATABASE SAVE COMPLETED SUCCESSFULLY")
-                return True
-            else:
-                self.logger.error(f"❌ ALL SAVE STRATEGIES FAILED")
-                return False
+    def remove_listener(self, callback: Callable):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, trade_id: str, change: str, trade_data: Optional[Dict[str, Any]] = None):
+        for callback in list(self._listeners):
+            try:
+                callback(trade_id, change, trade_data)
+            except Exception as e:
+                self.logger.error(f"Error in trade database listener: {e}")
+
+    def _save_database(self):
+        """Make the SQLite store match self.trades exactly (bulk sync for tools that edit self.trades)"""
+        try:
+            with self._lock, self.conn:
+                stored_ids = {row['trade_id'] for row in self.conn.execute("SELECT trade_id FROM trades")}
+                removed = stored_ids - set(self.trades)
+                if removed:
+                    self.conn.executemany("DELETE FROM trades WHERE trade_id = ?", [(trade_id,) for trade_id in removed])
+                self._upsert_rows(self.trades)
+                self._rebuild_indexes()
+
+            self.logger.info(f"✅ DATABASE SYNC COMPLETED | {len(self.trades)} trades | {len(removed)} removed")
+            self._notify('*', 'reloaded')
+            return True
 
         except Exception as e:
             self.logger.error(f"❌ Critical error in database save: {e}")
@@ -192,6 +252,13 @@ class TradeDatabase:
             self.logger.error(f"🔍 Save error traceback: {traceback.format_exc()}")
             return False
 
+    def close(self):
+        """Close the SQLite connection"""
+        with self._lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
     def add_trade(self, trade_id: str, trade_data: Dict[str, Any]) -> bool:
         """Add a trade to the database - simplified version"""
         try:
@@ -233,29 +300,18 @@ class TradeDatabase:
 
             self.logger.info(f"🔍 DEBUG: Added timestamps")
 
-            # Store the trade
-            trades_before = len(self.trades)
-            self.trades[trade_id] = trade_data
-            trades_after = len(self.trades)
-
-            self.logger.info(f"🔍 DEBUG: Trades count before: {trades_before}, after: {trades_after}")
-
-            # Verify trade was stored
-            if trade_id in self.trades:
-                self.logger.info(f"🔍 DEBUG: Trade {trade_id} successfully stored in memory")
-            else:
-                self.logger.error(f"🔍 DEBUG: Trade {trade_id} NOT stored in memory")
-                return False
-
-            # Save to file
-            self.logger.info(f"🔍 DEBUG: Calling _save_database()")
-            save_result = self._save_database()
-            self.logger.info(f"🔍 DEBUG: _save_database() returned: {save_result}")
+            # Store the trade (single-row upsert)
+            with self._lock:
+                previous_trades = self.trades
+                previous = previous_trades.get(trade_id)
+                self.trades = {**previous_trades, trade_id: trade_data}  # copy-on-write for concurrent readers
 
-            # Verify save result
-            if not save_result:
-                self.logger.error(f"❌ DATABASE SAVE FAILED for trade {trade_id}")
-                return False
+                if not self._upsert_trade(trade_id):
+                    self.trades = previous_trades
+                    self.logger.error(f"❌ DATABASE SAVE FAILED for trade {trade_id}")
+                    return False
+                self._index_trade(trade_id, previous)
+            self._notify(trade_id, 'updated' if previous is not None else 'added', trade_data)
 
             self.logger.info(f"✅ Trade added to database: {trade_id} | {trade_data['symbol']} | {trade_data['side']}")
             return True
@@ -271,11 +327,20 @@ class TradeDatabase:
         try:
             if trade_id in self.trades:
                 updates['last_updated'] = datetime.now().isoformat()
-                self.trades[trade_id].update(updates)
+                with self._lock:
+                    previous = self.trades[trade_id]
+                    self.trades[trade_id] = {**previous, **updates}  # readers never see a half-applied update
+
+                    # Single-row upsert; keep memory consistent with the store on failure
+                    save_result = self._upsert_trade(trade_id)
+                    if save_result:
+                        self._index_trade(trade_id, previous)
+                    else:
+                        self.trades[trade_id] = previous
 
-                # Save and verify
-                save_result = self._save_database()
                 if save_result:
+                    self._notify(trade_id, 'updated', self.trades[trade_id])
+
                     self.logger.info(f"✅ Trade updated in database: {trade_id}")
 
                     # Automatically sync to logger after successful database update
@@ -309,16 +374,39 @@ class TradeDatabase:
         """Get all trades"""
         return self.trades.copy()
 
+    def get_open_trades(self) -> Dict[str, Dict[str, Any]]:
+        """Open trades by trade_id (indexed - O(open trades))"""
+        with self._lock:
+            return {trade_id: self.trades[trade_id] for trade_id in self._open_trade_ids
+                    if trade_id in self.trades}
+
+    def get_open_trade_count(self) -> int:
+        with self._lock:
+            return len(self._open_trade_ids)
+
+    def count_trades_by_status(self) -> Dict[str, int]:
+        """Trade count per trade_status (answered from the status index, no row decoding)"""
+        try:
+            with self._lock:
+                rows = self.conn.execute(
+                    "SELECT trade_status, COUNT(*) AS count FROM trades GROUP BY trade_status").fetchall()
+            return {row['trade_status'] or 'UNKNOWN': row['count'] for row in rows}
+        except Exception as e:
+            self.logger.error(f"Error counting trades by status: {e}")
+            return {}
+
     def find_trade_by_position(self, strategy_name: str, symbol: str, side: str, 
                               quantity: float, entry_price: float, tolerance: float = 0.01) -> Optional[str]:
         """Find trade by position details with tolerance - prioritize recent trades"""
         try:
-            # Get all matching trades
+            # Only trades with this (strategy, symbol, side) are candidates
+            with self._lock:
+                candidate_ids = list(self._position_index.get((strategy_name, symbol, side), ()))
+
             matching_trades = []
-            for trade_id, trade_data in self.trades.items():
-                if (trade_data.get('strategy_name') == strategy_name and
-                    trade_data.get('symbol') == symbol and
-                    trade_data.get('side') == side and
+            for trade_id in candidate_ids:
+                trade_data = self.trades.get(trade_id)
+                if (trade_data is not None and
                     abs(trade_data.get('quantity', 0) - quantity) <= tolerance and
                     abs(trade_data.get('entry_price', 0) - entry_price) <= entry_price * tolerance):
                     matching_trades.append(trade_id)
@@ -368,18 +456,14 @@ class TradeDatabase:
             self.logger.info(f"🔄 CALLING LOGGER.LOG_TRADE | {trade_id}")
 
             # Check if trade already exists in logger to prevent duplicates
-            existing_trade = None
-            for existing in trade_logger.trades:
-                if existing.trade_id == trade_id:
-                    existing_trade = existing
-                    break
+            existing_trade = trade_logger.get_trade(trade_id)
 
             if existing_trade:
                 self.logger.info(f"✅ Trade {trade_id} already exists in logger - updating from database (database is source of truth)")
                 # Even if exists, update with latest database data since database is source of truth
                 try:
                     # Remove existing and add updated version
-                    trade_logger.trades = [t for t in trade_logger.trades if t.trade_id != trade_id]
+                    trade_logger.remove_trade(trade_id)
                     self.logger.info(f"🔄 Removed existing trade from logger for update")
                 except Exception as e:
                     self.logger.warning(f"Could not remove existing trade: {e}")
@@ -408,26 +492,35 @@ class TradeDatabase:
         try:
             from src.analytics.trade_logger import trade_logger
 
-            logger_trades = {t.trade_id: t for t in trade_logger.trades}
-            sync_count = 0
+            logger_trades = {t.trade_id: t.to_dict() for t in list(trade_logger.trades)}
+            if not logger_trades:
+                self.logger.info("✅ Synced 0 trades from logger to database")
+                return 0
 
-            for trade_id, logger_trade in logger_trades.items():
-                # Convert logger trade to dict
-                trade_dict = logger_trade.to_dict()
+            # Swap, row writes and index updates happen under one lock so a concurrent
+            # add_trade/update_trade can't be lost and readers never see a half-updated trade
+            with self._lock:
+                previous_trades = self.trades
+                trades = dict(previous_trades)  # copy-on-write for concurrent readers
+                now = datetime.now().isoformat()
+
+                for trade_id, trade_dict in logger_trades.items():
+                    if trade_id in trades:
+                        # Update a copy of the existing trade with logger data
+                        trades[trade_id] = {**trades[trade_id], **trade_dict, 'last_updated': now}
+                    else:
+                        # Add missing trade from logger
+                        trades[trade_id] = {**trade_dict, 'created_at': now, 'last_updated': now}
 
-                if trade_id in self.trades:
-                    # Update existing trade with logger data
-                    self.trades[trade_id].update(trade_dict)
-                    self.trades[trade_id]['last_updated'] = datetime.now().isoformat()
-                else:
-                    # Add missing trade from logger
-                    trade_dict['created_at'] = datetime.now().isoformat()
-                    trade_dict['last_updated'] = datetime.now().isoformat()
-                    self.trades[trade_id] = trade_dict
+                with self.conn:
+                    self._upsert_rows({trade_id: trades[trade_id] for trade_id in logger_trades})
 
-                sync_count += 1
+                self.trades = trades
+                for trade_id in logger_trades:
+                    self._index_trade(trade_id, previous_trades.get(trade_id))
+                sync_count = len(logger_trades)
 
-            self._save_database()
+            self._notify('*', 'reloaded')
             self.logger.info(f"✅ Synced {sync_count} trades from logger to database")
             return sync_count
 
@@ -439,7 +532,7 @@ class TradeDatabase:
         """Get open trades that could be recovered - simplified approach"""
         try:
             candidates = []
-            for trade_id, trade_data in self.trades.items():
+            for trade_id, trade_data in self.get_open_trades().items():
                 if trade_data.get('trade_status') == 'OPEN':
                     candidates.append({
                         'trade_id': trade_id,
@@ -538,7 +631,7 @@ class TradeDatabase:
 
                 # Check if we already have a database record for this position
                 position_matched = False
-                for trade_id, trade_data in self.trades.items():
+                for trade_id, trade_data in self.get_open_trades().items():
                     if (trade_data.get('symbol') == symbol and 
                         trade_data.get('trade_status') == 'OPEN'):
 
@@ -593,11 +686,16 @@ class TradeDatabase:
                     except ValueError:
                         continue
 
-            for trade_id in trades_to_remove:
-                del self.trades[trade_id]
-
             if trades_to_remove:
-                self._save_database()
+                with self._lock, self.conn:
+                    self.trades = dict(self.trades)  # copy-on-write for concurrent readers
+                    for trade_id in trades_to_remove:
+                        previous = self.trades.pop(trade_id)
+                        self._index_trade(trade_id, previous)
+                    self.conn.executemany("DELETE FROM trades WHERE trade_id = ?",
+                                          [(trade_id,) for trade_id in trades_to_remove])
+                for trade_id in trades_to_remove:
+                    self._notify(trade_id, 'removed')
                 self.logger.info(f"🧹 Cleaned up {len(trades_to_remove)} old trades")
 
         except Exception as e:
@@ -620,8 +718,8 @@ class TradeDatabase:
                 elif key == 'side':
                     query += " AND side = ?"
                     params.append(value)
-                elif key == 'status':
-                    query += " AND status = ?"
+                elif key in ('status', 'trade_status'):
+                    query += " AND trade_status = ?"
                     params.append(value)
                 elif key == 'partial_strategy_name':
                     # Allow partial matching for strategy names
@@ -630,74 +728,53 @@ class TradeDatabase:
 
             query += " ORDER BY timestamp DESC"
 
-            cursor = self.conn.execute(query, params)
-            results = cursor.fetchall()
+            with self._lock:
+                results = self.conn.execute(query, params).fetchall()
 
-            trades = []
-            for row in results:
-                trades.append(dict(row))
-
-            return trades
+            return [json.loads(row['data']) for row in results]
 
         except Exception as e:
             self.logger.error(f"Error searching trades: {e}")
             return []
+
     def load_existing_trades(self):
         """Load existing open trades from database"""
         try:
-            import sqlite3
-            
-            # Check if database file exists
-            if not os.path.exists(self.db_path):
-                self.logger.info("Database file doesn't exist yet, returning empty trades")
-                return []
-                
-            with sqlite3.connect(self.db_path) as conn:
-                # Set row factory to return Row objects
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-
-                # Check if trades table exists
-                cursor.execute("""
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name='trades'
-                """)
-                
-                if not cursor.fetchone():
-                    self.logger.info("Trades table doesn't exist yet, returning empty trades")
-                    return []
-
-                # Get open trades from database
-                cursor.execute("""
-                    SELECT * FROM trades 
-                    WHERE status = 'OPEN'
+            with self._lock:
+                rows = self.conn.execute("""
+                    SELECT trade_id, data FROM trades
+                    WHERE trade_status = 'OPEN'
                     ORDER BY timestamp DESC
-                """)
+                """).fetchall()
 
-                trades = cursor.fetchall()
-                trade_list = []
-
-                for trade in trades:
-                    try:
-                        # Convert Row object to dict safely
-                        if hasattr(trade, 'keys'):
-                            trade_dict = {key: trade[key] for key in trade.keys()}
-                        else:
-                            # Fallback for old format
-                            trade_dict = dict(trade) if trade else {}
-                            
-                        if trade_dict:  # Only add non-empty trades
-                            trade_list.append(trade_dict)
-                            
-                    except Exception as row_error:
-                        self.logger.warning(f"Skipping corrupted trade row: {row_error}")
-                        continue
+            trade_list = []
+            for row in rows:
+                try:
+                    trade_list.append(json.loads(row['data']))
+                except (TypeError, ValueError) as row_error:
+                    self.logger.warning(f"Skipping corrupted trade row {row['trade_id']}: {row_error}")
 
-                self.logger.info(f"📊 Loaded {len(trade_list)} trades from database")
-                return trade_list
+            self.logger.info(f"📊 Loaded {len(trade_list)} trades from database")
+            return trade_list
 
         except Exception as e:
             self.logger.error(f"Error loading existing trades: {e}")
             import traceback
             self.logger.error(f"Database loading traceback: {traceback.format_exc()}")
-            return []  # Return empty list instead of raising exception
\ No newline at end of file
+            return []  # Return empty list instead of raising exception
+
+
+_shared_database = None
+_shared_database_lock = threading.Lock()
+
+
+def get_trade_database() -> TradeDatabase:
+    """Process-wide TradeDatabase; reloads only if another process changed the store"""
+    global _shared_database
+    if _shared_database is None:
+        with _shared_database_lock:
+            if _shared_database is None:
+                _shared_database = TradeDatabase()
+                return _shared_database
+    _shared_database.refresh_if_changed()
+    return _shared_database
@@ -0,0 +1,240 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.config.global_config import global_config
+
+# Event types
+POSITION_OPENED = 'position_opened'
+PARTIAL_CLOSED = 'partial_closed'
+POSITION_CLOSED = 'position_closed'
+ANOMALY_DETECTED = 'anomaly_detected'
+ANOMALY_CLEARED = 'anomaly_cleared'
+
+HANDLER_RETRIES = 2  # extra attempts before a failing subscriber is skipped for an event
+
+
+@dataclass
+class TradeEvent:
+    """Something that happened to a trade; key orders delivery (the trade_id, or strategy:symbol)"""
+    event_type: str
+    key: str
+    payload: Dict[str, Any]
+    sequence: int = 0
+    created_at: float = field(default_factory=time.time)
+    replayed: bool = False
+
+
+@dataclass
+class Subscriber:
+    name: str
+    handler: Callable[[TradeEvent], Any]
+    event_types: Optional[Tuple[str, ...]] = None  # None = every event
+    replay: bool = True  # redeliver journaled events after a restart (persistence yes, notifications no)
+
+
+class TradeEventBus:
+    """In-process trade event bus with ordered per-trade delivery
+
+    publish() appends the event to a JSONL journal and hands it to one of
+    `lanes` worker threads, picked by hashing the event key, so every event
+    of a trade reaches every subscriber in publish order while different
+    trades proceed in parallel. The publisher's cost is the journal append
+    and an enqueue, however many subscribers are attached.
+
+    Once all subscribers have handled an event an ack is journaled.
+    replay_pending() redelivers events that were published but never acked
+    (e.g. the process died mid-delivery) to the subscribers that opted in,
+    so persistence sinks see every trade at least once.
+    """
+
+    def __init__(self, journal_file: str = "trading_data/trades/trade_events.jsonl", lanes: Optional[int] = None):
+        self.logger = logging.getLogger(__name__)
+        self.journal_file = Path(journal_file)
+        self.lane_count = max(1, lanes or global_config.TRADE_EVENT_LANES)
+
+        self._subscribers: List[Subscriber] = []
+        self._subscribers_lock = threading.Lock()
+        self._journal_lock = threading.Lock()
+        self._journal_lines = 0
+        self._sequence = time.time_ns() // 1000  # keeps sequences unique across restarts sharing a journal
+        self._unacked = set()
+        self._lanes: List[queue.Queue] = []
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+        self.stats = {'published': 0, 'delivered': 0, 'handler_errors': 0, 'replayed': 0}
+        atexit.register(self.flush)
+
+    def subscribe(self, name: str, handler: Callable[[TradeEvent], Any], event_types: Optional[List[str]] = None,
+                  replay: bool = True):
+        """Attach a sink; a subscriber with the same name is replaced"""
+        subscriber = Subscriber(name, handler, tuple(event_types) if event_types else None, replay)
+        with self._subscribers_lock:
+            self._subscribers = [s for s in self._subscribers if s.name != name] + [subscriber]
+        self.logger.debug(f"📬 EVENT BUS: {name} subscribed to {', '.join(event_types or ['all events'])}")
+
+    def unsubscribe(self, name: str):
+        with self._subscribers_lock:
+            self._subscribers = [s for s in self._subscribers if s.name != name]
+
+    def _ensure_started(self):
+        if self._threads:
+            return
+        with self._start_lock:
+            if self._threads:
+                return
+            self._lanes = [queue.Queue() for _ in range(self.lane_count)]
+            threads = []
+            for index, lane in enumerate(self._lanes):
+                thread = threading.Thread(target=self._run_lane, args=(lane,), daemon=True,
+                                          name=f"trade-events-{index}")
+                thread.start()
+                threads.append(thread)
+            self._threads = threads
+
+    def publish(self, event_type: str, key: str, payload: Dict[str, Any]) -> TradeEvent:
+        """Journal the event and queue it for delivery; returns immediately"""
+        with self._journal_lock:
+            self._sequence += 1
+            event = TradeEvent(event_type, key or '', payload, self._sequence)
+            self._unacked.add(event.sequence)
+            self._append_journal({'event': asdict(event)}, sync=True)
+        self.stats['published'] += 1
+        self._dispatch(event)
+        return event
+
+    def _dispatch(self, event: TradeEvent):
+        self._ensure_started()
+        self._lanes[zlib.crc32(event.key.encode()) % self.lane_count].put(event)
+
+    def _run_lane(self, lane: queue.Queue):
+        """Lane worker: deliver each event to every interested subscriber, in order"""
+        while True:
+            event = lane.get()
+            try:
+                with self._subscribers_lock:
+                    subscribers = list(self._subscribers)
+                for subscriber in subscribers:
+                    if subscriber.event_types and event.event_type not in subscriber.event_types:
+                        continue
+                    if event.replayed and not subscriber.replay:
+                        continue
+                    self._deliver(subscriber, event)
+                self._ack(event)
+            finally:
+                lane.task_done()
+
+    def _deliver(self, subscriber: Subscriber, event: TradeEvent):
+        for attempt in range(HANDLER_RETRIES + 1):
+            try:
+                subscriber.handler(event)
+                self.stats['delivered'] += 1
+                return
+            except Exception as e:
+                self.stats['handler_errors'] += 1
+                if attempt == HANDLER_RETRIES:
+                    self.logger.error(f"❌ EVENT BUS: {subscriber.name} failed on {event.event_type} "
+                                      f"{event.key}: {e}")
+                    return
+                time.sleep(0.1 * (attempt + 1))
+
+    def _ack(self, event: TradeEvent):
+        with self._journal_lock:
+            self._unacked.discard(event.sequence)
+            self._append_journal({'ack': event.sequence})
+            # Everything delivered - the journal can start over
+            if not self._unacked and self._journal_lines >= global_config.TRADE_EVENT_JOURNAL_COMPACT_EVERY:
+                self._truncate_journal()
+
+    def _append_journal(self, record: Dict[str, Any], sync: bool = False):
+        """Append one journal line (caller holds _journal_lock)
+
+        Events are synced to disk before publish() returns; acks are not -
+        a lost ack only means one extra redelivery.
+        """
+        try:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_file, 'a') as f:
+                f.write(json.dumps(record, default=str) + '\n')
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._journal_lines += 1
+        except Exception as e:
+            self.logger.error(f"❌ EVENT BUS: Could not journal event: {e}")
+
+    def _truncate_journal(self):
+        try:
+            with open(self.journal_file, 'w'):
+                pass
+            self._journal_lines = 0
+        except Exception as e:
+            self.logger.error(f"❌ EVENT BUS: Could not truncate journal: {e}")
+
+    def replay_pending(self) -> int:
+        """Redeliver journaled events that were never acked (call once subscribers are attached)"""
+        if not self.journal_file.exists():
+            return 0
+
+        try:
+            with self._journal_lock:
+                pending: Dict[int, Dict[str, Any]] = {}
+                with open(self.journal_file) as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # torn last line
+                        if 'event' in record:
+                            pending[record['event']['sequence']] = record['event']
+                        elif 'ack' in record:
+                            pending.pop(record['ack'], None)
+
+                # Start a fresh journal holding only what is still owed
+                self._truncate_journal()
+                events = []
+                for _, data in sorted(pending.items()):
+                    self._sequence += 1
+                    event = TradeEvent(data['event_type'], data['key'], data['payload'], self._sequence,
+                                       data.get('created_at', time.time()), replayed=True)
+                    self._unacked.add(event.sequence)
+                    self._append_journal({'event': asdict(event)}, sync=True)
+                    events.append(event)
+
+            for event in events:
+                self._dispatch(event)
+            if events:
+                self.stats['replayed'] += len(events)
+                self.logger.warning(f"📬 EVENT BUS: Replaying {len(events)} undelivered trade events")
+            return len(events)
+
+        except Exception as e:
+            self.logger.error(f"❌ EVENT BUS: Could not replay journal: {e}")
+            return 0
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until every published event has been delivered"""
+        deadline = time.time() + timeout
+        for lane in list(self._lanes):
+            while lane.unfinished_tasks:
+                if time.time() >= deadline:
+                    return False
+                time.sleep(0.01)
+        return True
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._journal_lock:
+            pending = len(self._unacked)
+        return {**self.stats, 'pending': pending, 'subscribers': [s.name for s in self._subscribers]}
+
+
+# Global trade event bus
+trade_event_bus = TradeEventBus()
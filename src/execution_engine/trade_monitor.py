@@ -522,8 +522,8 @@ class TradeMonitor:
 
             # Update database to mark trade as manually closed
             try:
-                from src.execution_engine.trade_database import TradeDatabase
-                trade_db = TradeDatabase()
+                from src.execution_engine.trade_database import get_trade_database
+                trade_db = get_trade_database()
 
                 # Find the trade in database by position details
                 symbol = orphan_trade.position.symbol
@@ -649,6 +649,11 @@ class TradeMonitor:
         """Get positions from Binance for a specific symbol"""
         try:
             if self.binance_client.is_futures:
+                # Shared snapshot (kept current by the user-data stream) when the bot provides one
+                account_snapshot = getattr(self.order_manager, 'account_snapshot', None)
+                if account_snapshot:
+                    return account_snapshot.get_positions(symbol, include_zero=True) or []
+
                 account_info = self.binance_client.client.futures_account()
                 positions = account_info.get('positions', [])
                 return [pos for pos in positions if pos.get('symbol') == symbol]
@@ -1091,8 +1096,8 @@ class TradeMonitor:
     def _update_database_for_cleared_orphan(self, orphan: OrphanTrade, reason: str) -> bool:
         """Update database record for cleared orphan trade with improved matching"""
         try:
-            from src.execution_engine.trade_database import TradeDatabase
-            trade_db = TradeDatabase()
+            from src.execution_engine.trade_database import get_trade_database
+            trade_db = get_trade_database()
 
             # Find the trade record with multiple matching strategies
             trade_record = None
@@ -0,0 +1,209 @@
+import atexit
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from src.config.global_config import global_config
+
+# Lower value is sent first (and evicted last when the queue is full)
+PRIORITY_CRITICAL = 0  # trades, bot start/stop, balance warnings
+PRIORITY_NORMAL = 1    # anomalies, reports
+PRIORITY_LOW = 2       # error alerts
+
+MAX_SEND_ATTEMPTS = 3
+
+# send(text, parse_mode) -> (delivered, retry_after_seconds)
+SendFunction = Callable[[str, str], Tuple[bool, Optional[float]]]
+
+
+# Message text, or a callable that renders it on the sender thread (e.g. needs a REST lookup)
+MessageText = Union[str, Callable[[], str]]
+
+
+@dataclass
+class Notification:
+    chat_id: str
+    text: MessageText
+    send: SendFunction
+    parse_mode: str = "HTML"
+    priority: int = PRIORITY_NORMAL
+    attempts: int = 0
+
+
+@dataclass
+class CoalesceWindow:
+    """Messages sharing a coalesce key within one window; repeats go out as a single digest"""
+    started: float
+    template: Notification
+    count: int = 0
+    latest: Optional[MessageText] = None
+
+
+class TelegramNotificationQueue:
+    """Bounded outbound queue with a background sender
+
+    Callers only pay an enqueue. The sender thread delivers in priority
+    order, at most rate_per_minute messages per chat (and waits out a 429's
+    retry_after). Messages with a coalesce_key open a window: repeats
+    inside it are counted instead of queued and go out as one digest when
+    it ends. A full queue evicts its lowest-priority newest message for a
+    more important one, otherwise the new message is dropped.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, rate_per_minute: Optional[float] = None,
+                 coalesce_window: Optional[float] = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_size = max_size or global_config.TELEGRAM_QUEUE_SIZE
+        self.min_interval = 60.0 / (rate_per_minute or global_config.TELEGRAM_RATE_PER_MINUTE)
+        self.coalesce_window = coalesce_window or global_config.TELEGRAM_COALESCE_WINDOW
+
+        self._heap: List[Tuple[int, int, Notification]] = []
+        self._sequence = itertools.count()
+        self._windows: Dict[str, CoalesceWindow] = {}
+        self._next_send: Dict[str, float] = {}  # chat_id -> earliest next send (monotonic)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._sender_thread = None
+        self.stats = {'queued': 0, 'sent': 0, 'failed': 0, 'dropped': 0, 'coalesced': 0,
+                      'digests': 0, 'rate_limited': 0}
+        atexit.register(self.flush)
+
+    def enqueue(self, chat_id: str, text: MessageText, send: SendFunction, parse_mode: str = "HTML",
+                priority: int = PRIORITY_NORMAL, coalesce_key: Optional[str] = None) -> bool:
+        """Queue a message; returns False only if it was dropped"""
+        notification = Notification(chat_id, text, send, parse_mode, priority)
+        with self._lock:
+            if coalesce_key:
+                now = time.monotonic()
+                window = self._windows.get(coalesce_key)
+                if window and now - window.started < self.coalesce_window:
+                    window.count += 1
+                    window.latest = text
+                    self.stats['coalesced'] += 1
+                    return True
+                self._windows[coalesce_key] = CoalesceWindow(now, notification)
+
+            if not self._push(notification):
+                return False
+            self._ensure_sender()
+        self._wakeup.set()
+        return True
+
+    def _push(self, notification: Notification) -> bool:
+        """Add to the heap, evicting a less important message if full (caller holds _lock)"""
+        if len(self._heap) >= self.max_size:
+            worst = max(self._heap)  # lowest priority, newest
+            if worst[0] <= notification.priority:
+                self.stats['dropped'] += 1
+                self.logger.warning(f"⚠️ TELEGRAM: Queue full ({self.max_size}) - message dropped")
+                return False
+            self._heap.remove(worst)
+            heapq.heapify(self._heap)
+            self.stats['dropped'] += 1
+            self.logger.warning(f"⚠️ TELEGRAM: Queue full ({self.max_size}) - lower priority message evicted")
+
+        heapq.heappush(self._heap, (notification.priority, next(self._sequence), notification))
+        self.stats['queued'] += 1
+        self._idle.clear()
+        return True
+
+    def _ensure_sender(self):
+        if self._sender_thread is None or not self._sender_thread.is_alive():
+            self._sender_thread = threading.Thread(target=self._run_sender, daemon=True, name="telegram-sender")
+            self._sender_thread.start()
+
+    def _emit_digests(self, force: bool = False) -> Optional[float]:
+        """Queue digests for windows that ended; returns seconds until the next window ends"""
+        now = time.monotonic()
+        next_due = None
+        with self._lock:
+            for key, window in list(self._windows.items()):
+                remaining = window.started + self.coalesce_window - now
+                if remaining > 0 and not force:
+                    next_due = remaining if next_due is None else min(next_due, remaining)
+                    continue
+                if not window.count:
+                    del self._windows[key]
+                    continue
+
+                template, latest = window.template, window.latest
+                count, window_seconds = window.count, self.coalesce_window
+
+                def digest() -> str:
+                    text = latest() if callable(latest) else latest
+                    return (f"🔁 <b>{count} more similar alert{'s' if count > 1 else ''} "
+                            f"in the last {window_seconds:g}s</b> - latest:\n{text}")
+
+                self._push(Notification(template.chat_id, digest, template.send, template.parse_mode, template.priority))
+                self.stats['digests'] += 1
+                # Repeats keep coalescing into the next window
+                self._windows[key] = CoalesceWindow(now, template)
+                next_due = self.coalesce_window if next_due is None else min(next_due, self.coalesce_window)
+        return next_due
+
+    def _run_sender(self):
+        """Sender thread: deliver queued messages in priority order within the per-chat rate"""
+        while True:
+            next_digest = self._emit_digests()
+
+            with self._lock:
+                item = heapq.heappop(self._heap) if self._heap else None
+                if item is None:
+                    self._idle.set()
+                    self._wakeup.clear()
+            if item is None:
+                self._wakeup.wait(timeout=next_digest or self.coalesce_window)
+                continue
+
+            notification = item[2]
+            wait = self._next_send.get(notification.chat_id, 0) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._deliver(notification)
+
+    def _deliver(self, notification: Notification):
+        notification.attempts += 1
+        try:
+            if callable(notification.text):
+                notification.text = notification.text()  # rendered once, kept for retries
+            delivered, retry_after = notification.send(notification.text, notification.parse_mode)
+        except Exception as e:
+            self.logger.error(f"❌ TELEGRAM: Error sending message: {e}")
+            delivered, retry_after = False, None
+        self._next_send[notification.chat_id] = time.monotonic() + max(self.min_interval, retry_after or 0)
+
+        if delivered:
+            self.stats['sent'] += 1
+        elif retry_after is not None and notification.attempts < MAX_SEND_ATTEMPTS:
+            self.stats['rate_limited'] += 1
+            self.logger.warning(f"⏳ TELEGRAM: Rate limited - retrying in {retry_after:.0f}s")
+            with self._lock:
+                heapq.heappush(self._heap, (notification.priority, next(self._sequence), notification))
+        else:
+            self.stats['failed'] += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Send pending digests and wait (up to timeout) for the queue to drain"""
+        self._emit_digests(force=True)
+        with self._lock:
+            if self._heap:
+                self._ensure_sender()
+        self._wakeup.set()
+        return self._idle.wait(timeout)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._heap)
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {**self.stats, 'pending': self.pending()}
+
+
+# Global notification queue (shared by every TelegramReporter)
+telegram_queue = TelegramNotificationQueue()
@@ -1,9 +1,10 @@
 
 import logging
-import requests
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from src.config.global_config import global_config
+from src.reporting.telegram_queue import telegram_queue, PRIORITY_CRITICAL, PRIORITY_NORMAL, PRIORITY_LOW
+from src.utils import http_session
 
 
 class TelegramReporter:
@@ -20,12 +21,21 @@ class TelegramReporter:
         else:
             self.logger.info("✅ TELEGRAM: Reporter initialized successfully")
 
-    def send_message(self, message: str, parse_mode: str = "HTML") -> bool:
-        """Send a message to Telegram"""
+    def send_message(self, message: Union[str, Callable[[], str]], parse_mode: str = "HTML",
+                     priority: int = PRIORITY_NORMAL, coalesce_key: Optional[str] = None) -> bool:
+        """Queue a message (or a callable rendering it) for the background sender
+
+        Returns False if Telegram is not configured or the queue dropped it.
+        """
         if not self.enabled:
             self.logger.debug("TELEGRAM: Skipping message (not configured)")
             return False
 
+        return telegram_queue.enqueue(self.chat_id, message, self._post_message, parse_mode=parse_mode,
+                                      priority=priority, coalesce_key=coalesce_key)
+
+    def _post_message(self, message: str, parse_mode: str = "HTML") -> Tuple[bool, Optional[float]]:
+        """Send a message to Telegram now; returns (sent, retry_after seconds if rate limited)"""
         try:
             url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
             payload = {
@@ -35,18 +45,25 @@ class TelegramReporter:
                 'disable_web_page_preview': True
             }
 
-            response = requests.post(url, json=payload, timeout=10)
+            response = http_session.request('POST', url, session_name='telegram', json=payload)
 
             if response.status_code == 200:
                 self.logger.debug("✅ TELEGRAM: Message sent successfully")
-                return True
+                return True, None
+            elif response.status_code == 429:
+                retry_after = response.json().get('parameters', {}).get('retry_after', 5)
+                return False, float(retry_after)
             else:
                 self.logger.error(f"❌ TELEGRAM: Failed to send message. Status: {response.status_code}, Response: {response.text}")
-                return False
+                return False, None
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Error sending message: {e}")
-            return False
+            return False, None
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait for queued notifications to go out (shutdown)"""
+        return telegram_queue.flush(timeout)
 
     def report_bot_startup(self, pairs: List[str], strategies: List[str], balance: float, open_trades: int = 0) -> bool:
         """Send bot startup notification"""
@@ -72,7 +89,7 @@ class TelegramReporter:
 🔄 <b>Next Update:</b> Real-time alerts enabled
 """
 
-            return self.send_message(message)
+            return self.send_message(message, priority=PRIORITY_CRITICAL)
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Error sending startup notification: {e}")
@@ -92,7 +109,7 @@ class TelegramReporter:
 💡 <b>Note:</b> Restart required to resume trading
 """
 
-            return self.send_message(message)
+            return self.send_message(message, priority=PRIORITY_CRITICAL)
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Error sending shutdown notification: {e}")
@@ -130,7 +147,7 @@ class TelegramReporter:
 ✅ <b>Status:</b> Monitoring for exit conditions
 """
 
-            return self.send_message(message)
+            return self.send_message(message, priority=PRIORITY_CRITICAL)
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Error sending position opened notification: {e}")
@@ -157,27 +174,28 @@ class TelegramReporter:
             status_emoji = "💚" if pnl >= 0 else "❌"
             status_text = "PROFIT" if pnl >= 0 else "LOSS"
 
-            # Get current balance and open trades if not provided
-            if current_balance is None:
-                try:
-                    from src.data_fetcher.balance_fetcher import BalanceFetcher
-                    from src.binance_client.client import BinanceClientWrapper
-                    binance_client = BinanceClientWrapper()
-                    balance_fetcher = BalanceFetcher(binance_client)
-                    current_balance = balance_fetcher.get_usdt_balance()
-                except:
-                    current_balance = 0.0
-
-            if open_trades_count is None:
-                try:
-                    from src.execution_engine.trade_database import TradeDatabase
-                    trade_db = TradeDatabase()
-                    open_trades = trade_db.get_open_trades()
-                    open_trades_count = len(open_trades)
-                except:
-                    open_trades_count = 0
-
-            message = f"""
+            def render() -> str:
+                # Balance and open trade count need REST/DB lookups - done on the sender thread
+                balance, trades_open = current_balance, open_trades_count
+                if balance is None:
+                    try:
+                        from src.data_fetcher.balance_fetcher import BalanceFetcher
+                        from src.binance_client.client import get_shared_client
+                        balance_fetcher = BalanceFetcher(get_shared_client())
+                        balance = balance_fetcher.get_usdt_balance()
+                    except:
+                        balance = 0.0
+
+                if trades_open is None:
+                    try:
+                        from src.execution_engine.trade_database import get_trade_database
+                        trade_db = get_trade_database()
+                        open_trades = trade_db.get_open_trades()
+                        trades_open = len(open_trades)
+                    except:
+                        trades_open = 0
+
+                return f"""
 🔴 <b>POSITION CLOSED</b>
 ⏰ <b>Time:</b> {timestamp}
 
@@ -191,11 +209,11 @@ class TelegramReporter:
 
 {status_emoji} <b>Result:</b> {status_text}
 
-💰 <b>Current Balance:</b> ${current_balance:,.2f} USDT
-📈 <b>Open Trades:</b> {open_trades_count}
+💰 <b>Current Balance:</b> ${balance or 0.0:,.2f} USDT
+📈 <b>Open Trades:</b> {trades_open}
 """
 
-            return self.send_message(message)
+            return self.send_message(render, priority=PRIORITY_CRITICAL)
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Error sending position closed notification: {e}")
@@ -219,7 +237,8 @@ class TelegramReporter:
 🔧 <b>Action:</b> Check logs for more information
 """
 
-            return self.send_message(message)
+            return self.send_message(message, priority=PRIORITY_LOW,
+                                     coalesce_key=f"error:{error_type}:{strategy_name or ''}")
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Error sending error notification: {e}")
@@ -242,7 +261,7 @@ class TelegramReporter:
 💡 <b>Action:</b> Add funds to resume trading
 """
 
-            return self.send_message(message)
+            return self.send_message(message, priority=PRIORITY_CRITICAL, coalesce_key="balance_warning")
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Error sending balance warning: {e}")
@@ -281,7 +300,7 @@ class TelegramReporter:
 💡 <b>Note:</b> Use anomaly manager if manual intervention needed
 """
 
-            return self.send_message(message)
+            return self.send_message(message, coalesce_key=f"anomaly:{anomaly_type.lower()}:{symbol}")
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Error sending anomaly notification: {e}")
@@ -306,7 +325,7 @@ class TelegramReporter:
 💡 <b>Note:</b> Strategy temporarily blocked from new trades
 """
 
-            return self.send_message(message)
+            return self.send_message(message, coalesce_key=f"orphan:{strategy_name}:{symbol}")
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Error sending orphan detection notification: {e}")
@@ -356,7 +375,7 @@ class TelegramReporter:
 💡 <b>Note:</b> Close manually when ready
 """
 
-            return self.send_message(message)
+            return self.send_message(message, coalesce_key=f"ghost:{strategy_name}:{symbol}")
 
         except Exception as e:
             self.logger.error(f"❌ TELEGRAM: Error sending ghost detection notification: {e}")
@@ -392,7 +411,7 @@ class TelegramReporter:
 
         try:
             url = f"https://api.telegram.org/bot{self.bot_token}/getMe"
-            response = requests.get(url, timeout=10)
+            response = http_session.request('GET', url, session_name='telegram')
 
             if response.status_code == 200:
                 bot_info = response.json()
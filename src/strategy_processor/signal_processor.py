@@ -31,9 +31,48 @@ class SignalProcessor:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-
-    def evaluate_entry_conditions(self, df: pd.DataFrame, strategy_config: Dict) -> Optional[TradingSignal]:
-        """Evaluate entry conditions based on strategy"""
+        self._strategy_instances: Dict[Tuple[str, str], Tuple] = {}  # (kind, name) -> (config spec, strategy)
+
+    @staticmethod
+    def _config_spec(kind: str, config: Dict) -> Tuple:
+        """Hashable identity of a strategy config (scalar settings only)"""
+        return (kind,) + tuple(sorted(
+            (key, value) for key, value in config.items()
+            if isinstance(value, (int, float, str, bool, type(None)))
+        ))
+
+    def _get_strategy(self, kind: str, config: Dict, factory):
+        """Reuse one strategy instance per strategy; a changed config replaces it"""
+        key = (kind, config.get('name', kind))
+        spec = self._config_spec(kind, config)
+        cached = self._strategy_instances.get(key)
+        if cached is not None and cached[0] == spec:
+            return cached[1]
+        strategy = factory()
+        self._strategy_instances[key] = (spec, strategy)
+        return strategy
+
+    def clear_strategy_cache(self):
+        """Drop all cached strategy instances"""
+        self._strategy_instances.clear()
+
+    def _cached_strategy_indicators(self, df: pd.DataFrame, config: Dict, spec: Tuple, strategy) -> pd.DataFrame:
+        """Strategy indicators memoized per candle in the shared indicator cache"""
+        from src.data_fetcher.indicator_cache import indicator_cache
+
+        return indicator_cache.get_or_compute(
+            config.get('symbol', ''), config.get('timeframe', ''),
+            indicator_cache.candle_key(df), spec,
+            lambda: strategy.calculate_indicators(df.copy())
+        )
+
+    def evaluate_entry_conditions(self, df: pd.DataFrame, strategy_config: Dict,
+                                  indicators_ready: bool = False) -> Optional[TradingSignal]:
+        """Evaluate entry conditions based on strategy
+
+        indicators_ready: df already carries the strategy's own indicator columns
+        (e.g. computed once over a whole backtest), so they are not recalculated.
+        """
         try:
             if df.empty or len(df) < 50:
                 return None
@@ -45,9 +84,9 @@ class SignalProcessor:
             if 'rsi' in strategy_name.lower() and 'engulfing' not in strategy_name.lower():
                 return self._evaluate_rsi_oversold(df, current_price, strategy_config)
             elif 'macd' in strategy_name.lower():
-                return self._evaluate_macd_divergence(df, current_price, strategy_config)
+                return self._evaluate_macd_divergence(df, current_price, strategy_config, indicators_ready)
             elif 'engulfing' in strategy_name.lower():
-                return self._evaluate_engulfing_pattern(df, current_price, strategy_config)
+                return self._evaluate_engulfing_pattern(df, current_price, strategy_config, indicators_ready)
             elif 'smart' in strategy_name.lower() and 'money' in strategy_name.lower():
                 # Smart Money strategy is handled directly by the strategy class
                 # Signal processor doesn't need to generate signals for it
@@ -149,15 +188,17 @@ class SignalProcessor:
             self.logger.error(f"Error in RSI strategy evaluation: {e}")
             return None
 
-    def _evaluate_macd_divergence(self, df: pd.DataFrame, current_price: float, config: Dict) -> Optional[TradingSignal]:
+    def _evaluate_macd_divergence(self, df: pd.DataFrame, current_price: float, config: Dict,
+                                  indicators_ready: bool = False) -> Optional[TradingSignal]:
         """MACD Divergence strategy evaluation - Uses dedicated strategy class"""
         try:
             from src.execution_engine.strategies.macd_divergence_strategy import MACDDivergenceStrategy
 
-            strategy = MACDDivergenceStrategy(config)
+            strategy = self._get_strategy('macd_divergence', config, lambda: MACDDivergenceStrategy(config))
 
-            # Calculate indicators
-            df_with_indicators = strategy.calculate_indicators(df.copy())
+            # Calculate indicators (once per candle for this MACD spec)
+            spec = ('macd_divergence', strategy.macd_fast, strategy.macd_slow, strategy.macd_signal)
+            df_with_indicators = df if indicators_ready else self._cached_strategy_indicators(df, config, spec, strategy)
 
             # Evaluate signal
             signal = strategy.evaluate_entry_signal(df_with_indicators)
@@ -168,16 +209,18 @@ class SignalProcessor:
             self.logger.error(f"Error in MACD divergence evaluation: {e}")
             return None
 
-    def _evaluate_engulfing_pattern(self, df: pd.DataFrame, current_price: float, config: Dict) -> Optional[TradingSignal]:
+    def _evaluate_engulfing_pattern(self, df: pd.DataFrame, current_price: float, config: Dict,
+                                    indicators_ready: bool = False) -> Optional[TradingSignal]:
         """Engulfing Pattern strategy evaluation"""
         try:
             from src.execution_engine.strategies.engulfing_pattern_strategy import EngulfingPatternStrategy
 
             strategy_name = config.get('name', 'engulfing_pattern')
-            strategy = EngulfingPatternStrategy(strategy_name, config)
+            strategy = self._get_strategy('engulfing_pattern', config, lambda: EngulfingPatternStrategy(strategy_name, config))
 
-            # Calculate indicators
-            df_with_indicators = strategy.calculate_indicators(df.copy())
+            # Calculate indicators (once per candle for this pattern spec)
+            spec = ('engulfing_pattern', strategy.rsi_period, strategy.stable_candle_ratio, strategy.price_lookback_bars)
+            df_with_indicators = df if indicators_ready else self._cached_strategy_indicators(df, config, spec, strategy)
 
             # Evaluate signal
             signal = strategy.evaluate_entry_signal(df_with_indicators)
@@ -227,7 +270,8 @@ class SignalProcessor:
                 try:
                     from src.execution_engine.strategies.engulfing_pattern_strategy import EngulfingPatternStrategy
 
-                    strategy = EngulfingPatternStrategy(strategy_name, strategy_config)
+                    strategy = self._get_strategy('engulfing_pattern', strategy_config,
+                                                  lambda: EngulfingPatternStrategy(strategy_name, strategy_config))
                     exit_reason = strategy.evaluate_exit_signal(df, position)
 
                     if exit_reason:
@@ -241,7 +285,8 @@ class SignalProcessor:
                 try:
                     from src.execution_engine.strategies.macd_divergence_strategy import MACDDivergenceStrategy
 
-                    strategy = MACDDivergenceStrategy(strategy_config)
+                    strategy = self._get_strategy('macd_divergence', strategy_config,
+                                                  lambda: MACDDivergenceStrategy(strategy_config))
                     exit_reason = strategy.evaluate_exit_signal(df, position)
 
                     if exit_reason:
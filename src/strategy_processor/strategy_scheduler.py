@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+
+@dataclass
+class SchedulerEvent:
+    """A reason to run work now: a strategy's candle closed or a price trigger fired"""
+    kind: str  # "candle_close", "price_trigger" or "account_update"
+    symbol: str
+    interval: str = ""
+    strategy_name: str = ""
+    trigger_key: str = ""
+    price: float = 0.0
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class PriceTrigger:
+    """One-shot intra-candle trigger; fires once the price crosses above/below a level
+
+    With an interval the trigger stays spent until that candle closes, even if
+    it is set again in the meantime; without one it can be re-armed at once.
+    """
+    key: str
+    symbol: str
+    above: Optional[float] = None
+    below: Optional[float] = None
+    strategy_name: str = ""
+    interval: str = ""
+
+    def is_hit(self, price: float) -> bool:
+        if self.above is not None and price >= self.above:
+            return True
+        if self.below is not None and price <= self.below:
+            return True
+        return False
+
+
+class StrategyScheduler:
+    """Dispatches strategy evaluations on kline close (and price triggers) from the WebSocket feed"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._lock = threading.RLock()
+
+        self._strategies_by_stream: Dict[Tuple[str, str], Set[str]] = {}
+        self._triggers: Dict[str, PriceTrigger] = {}
+        self._spent: Dict[str, Tuple[str, str]] = {}  # fired per-candle triggers -> (symbol, interval) that releases them
+        self._pending: Set[Tuple[str, str]] = set()  # (kind, name) queued but not yet consumed
+        self._attached = False
+
+        self.stats = {
+            'candle_events': 0,
+            'trigger_events': 0,
+            'account_events': 0,
+            'coalesced_events': 0
+        }
+
+    def register_strategy(self, strategy_name: str, symbol: str, interval: str):
+        """Evaluate strategy_name whenever a symbol/interval kline closes"""
+        with self._lock:
+            key = (symbol.upper(), interval)
+            self._strategies_by_stream.setdefault(key, set()).add(strategy_name)
+
+    def unregister_strategy(self, strategy_name: str):
+        with self._lock:
+            for names in self._strategies_by_stream.values():
+                names.discard(strategy_name)
+
+    def set_price_trigger(self, key: str, symbol: str, above: Optional[float] = None,
+                          below: Optional[float] = None, strategy_name: str = "", interval: str = ""):
+        """Arm (or re-arm) a one-shot trigger for intra-candle price thresholds"""
+        if above is None and below is None:
+            self.clear_price_trigger(key)
+            return
+        with self._lock:
+            if key in self._spent:
+                return  # already fired this candle
+            self._triggers[key] = PriceTrigger(key, symbol.upper(), above, below, strategy_name, interval)
+
+    def clear_price_trigger(self, key: str):
+        with self._lock:
+            self._triggers.pop(key, None)
+            self._spent.pop(key, None)
+
+    def get_trigger_keys(self) -> List[str]:
+        with self._lock:
+            return list(self._triggers)
+
+    def attach(self, loop: asyncio.AbstractEventLoop = None):
+        """Bind to the running event loop and subscribe to WebSocket kline updates"""
+        from src.data_fetcher.websocket_manager import websocket_manager
+
+        self._loop = loop or asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        with self._lock:
+            self._pending.clear()
+        if not self._attached:
+            websocket_manager.add_update_callback(self.on_kline)
+            self._attached = True
+        self.logger.info(f"⏱️ Strategy scheduler attached | Streams: {len(self._strategies_by_stream)}")
+
+    def detach(self):
+        from src.data_fetcher.websocket_manager import websocket_manager
+
+        if self._attached:
+            websocket_manager.remove_update_callback(self.on_kline)
+            self._attached = False
+        self._loop = None
+
+    def on_kline(self, symbol: str, interval: str, kline: Dict):
+        """WebSocket callback (socket thread): enqueue due work onto the event loop"""
+        try:
+            events = []
+            price = kline.get('close', 0.0)
+
+            with self._lock:
+                if kline.get('is_closed'):
+                    for strategy_name in self._strategies_by_stream.get((symbol, interval), ()):
+                        events.append(SchedulerEvent('candle_close', symbol, interval,
+                                                     strategy_name=strategy_name, price=price))
+                    # New candle - per-candle triggers may be armed again
+                    for key in [k for k, stream in self._spent.items() if stream == (symbol, interval)]:
+                        del self._spent[key]
+
+                for key, trigger in list(self._triggers.items()):
+                    if trigger.symbol == symbol and trigger.is_hit(price):
+                        del self._triggers[key]  # one-shot
+                        if trigger.interval:
+                            self._spent[key] = (trigger.symbol, trigger.interval)
+                        events.append(SchedulerEvent('price_trigger', symbol, interval,
+                                                     strategy_name=trigger.strategy_name,
+                                                     trigger_key=key, price=price))
+
+            for event in events:
+                self._enqueue(event)
+
+        except Exception as e:
+            self.logger.error(f"❌ Scheduler callback error for {symbol} {interval}: {e}")
+
+    def notify_account_update(self, symbols: List[str]):
+        """User-data stream callback (socket thread): wake the loop for an account/position change"""
+        self._enqueue(SchedulerEvent('account_update', ','.join(symbols), trigger_key='account'))
+
+    def _enqueue(self, event: SchedulerEvent):
+        """Thread-safe enqueue; duplicates still waiting in the queue are coalesced"""
+        if not self._loop or not self._queue:
+            return
+
+        pending_key = (event.kind, event.trigger_key or event.strategy_name)
+        with self._lock:
+            if pending_key in self._pending:
+                self.stats['coalesced_events'] += 1
+                return
+            self._pending.add(pending_key)
+
+        if event.kind == 'candle_close':
+            self.stats['candle_events'] += 1
+        elif event.kind == 'price_trigger':
+            self.stats['trigger_events'] += 1
+        else:
+            self.stats['account_events'] += 1
+
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
+        except RuntimeError:
+            # Event loop already closed (shutdown in progress)
+            with self._lock:
+                self._pending.discard(pending_key)
+
+    async def wait_for_events(self, timeout: float) -> List[SchedulerEvent]:
+        """Wait up to timeout seconds for the next event, then drain everything queued"""
+        if not self._queue:
+            await asyncio.sleep(timeout)
+            return []
+
+        events = []
+        try:
+            events.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+        except asyncio.TimeoutError:
+            return []
+
+        while not self._queue.empty():
+            events.append(self._queue.get_nowait())
+
+        with self._lock:
+            for event in events:
+                self._pending.discard((event.kind, event.trigger_key or event.strategy_name))
+        return events
+
+    def get_statistics(self) -> Dict:
+        with self._lock:
+            stats = self.stats.copy()
+            stats['registered_streams'] = len(self._strategies_by_stream)
+            stats['armed_triggers'] = len(self._triggers)
+            stats['attached'] = self._attached
+            return stats
@@ -0,0 +1,71 @@
+"""
+Shared HTTP session pool for exchange and Telegram REST calls
+"""
+
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Optional
+from src.config.global_config import global_config
+
+logger = logging.getLogger(__name__)
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _build_adapter(pool_size: int) -> HTTPAdapter:
+    """Keep-alive connection pool with retry/backoff
+
+    Connection failures are retried for every method (nothing reached the
+    server); 5xx responses only for idempotent methods, so orders and
+    Telegram messages are never sent twice. 429s are left to the caller
+    (the exchange rate limiter backs off on them).
+    """
+    retry = Retry(
+        total=global_config.HTTP_RETRIES,
+        connect=global_config.HTTP_RETRIES,
+        read=0,
+        status=global_config.HTTP_RETRIES,
+        backoff_factor=global_config.HTTP_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        raise_on_status=False
+    )
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+
+def mount_pool(session: requests.Session, pool_size: Optional[int] = None) -> requests.Session:
+    """Give an existing session (e.g. the exchange client's) the pooled, retrying adapters"""
+    adapter = _build_adapter(pool_size or global_config.HTTP_POOL_SIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session(name: str = 'default') -> requests.Session:
+    """Process-wide pooled session per consumer (e.g. 'telegram'), created on first use"""
+    session = _sessions.get(name)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        if name not in _sessions:
+            _sessions[name] = mount_pool(requests.Session())
+            logger.debug(f"🔌 HTTP session pool created: {name} (pool size {global_config.HTTP_POOL_SIZE})")
+        return _sessions[name]
+
+
+def request(method: str, url: str, session_name: str = 'default', **kwargs) -> requests.Response:
+    """Send a request on a shared session with the configured default timeout"""
+    kwargs.setdefault('timeout', global_config.HTTP_TIMEOUT)
+    return get_session(session_name).request(method, url, **kwargs)
+
+
+def close_sessions():
+    """Close every pooled session (shutdown)"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,124 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Entry points the hosting platform imports on every restart
+DEFAULT_TARGETS = ('main', 'web_dashboard')
+
+# Heavy optional subsystems that must only load when a feature uses them
+LAZY_MODULES = (
+    'sklearn',
+    'ta',
+    'src.analytics.ml_analyzer',
+    'src.analytics.ml_commands',
+    'src.analytics.ai_advisor',
+    'src.analytics.daily_reporter'
+)
+
+DEFAULT_BUDGET_SECONDS = float(os.getenv('IMPORT_TIME_BUDGET', '3.0'))
+
+# Runs in a fresh interpreter so nothing is already imported
+_PROBE = """
+import importlib, json, logging, sys, time
+
+# Entry points swallow ImportError and fall back to a demo mode - catch that as a failure too
+import_errors = []
+class ImportErrorLog(logging.Handler):
+    def emit(self, record):
+        message = record.getMessage()
+        if ('import error' in message.lower() or 'no module named' in message.lower()
+                or (record.exc_info and isinstance(record.exc_info[1], ImportError))):
+            import_errors.append(message)
+logging.getLogger().addHandler(ImportErrorLog(logging.WARNING))
+
+started = time.perf_counter()
+error = None
+try:
+    module = importlib.import_module(sys.argv[1])
+    if getattr(module, 'IMPORTS_AVAILABLE', True) is False:
+        error = "IMPORTS_AVAILABLE is False (fell back to limited mode)"
+except BaseException as e:
+    error = repr(e)
+elapsed = time.perf_counter() - started
+if error is None and import_errors:
+    error = "import error logged: " + import_errors[0]
+lazy = [name for name in sys.argv[2:] if name in sys.modules]
+print("IMPORT_PROFILE " + json.dumps({'seconds': elapsed, 'eager': lazy, 'error': error}))
+"""
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[float, str]]:
+    """(cumulative seconds, module) per line of -X importtime output"""
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        try:
+            _, cumulative, module = line[len('import time:'):].split('|')
+            timings.append((int(cumulative) / 1e6, module.rstrip()))
+        except ValueError:
+            continue
+    return timings
+
+
+def profile_import(target: str, lazy_modules=LAZY_MODULES) -> Dict:
+    """Cold-import target in a fresh interpreter; returns wall time, slowest imports and eager lazy modules"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.getenv('PYTHONPATH')])))
+    lazy_modules = [name for name in lazy_modules if name != target]  # profiling a lazy module directly is fine
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', _PROBE, target, *lazy_modules],
+                            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+
+    summary = {'seconds': None, 'eager': [], 'error': f"exit code {result.returncode}"}
+    for line in result.stdout.splitlines():
+        if line.startswith('IMPORT_PROFILE '):
+            summary = json.loads(line[len('IMPORT_PROFILE '):])
+
+    summary['target'] = target
+    summary['slowest'] = sorted(_parse_importtime(result.stderr), reverse=True)
+    return summary
+
+
+def check_budget(targets, budget: float, top: int = 10) -> bool:
+    """Print a report per target; False if any import fails, exceeds budget or loads a lazy subsystem"""
+    ok = True
+    for target in targets:
+        summary = profile_import(target)
+        seconds = summary['seconds']
+        passed = not summary['error'] and not summary['eager'] and seconds is not None and seconds <= budget
+        ok = ok and passed
+
+        timing = f"{seconds:.2f}s" if seconds is not None else "n/a"
+        print(f"{'✅' if passed else '❌'} {target}: {timing} (budget {budget:.2f}s)")
+        if summary['error']:
+            print(f"   import failed: {summary['error']}")
+        if summary['eager']:
+            print(f"   loaded eagerly (should be lazy): {', '.join(summary['eager'])}")
+        for cumulative, module in summary['slowest'][:top]:
+            print(f"   {cumulative:8.3f}s  {module}")
+    return ok
+
+
+def main(argv: Optional[List[str]] = None):
+    """python -m src.utils.import_profile [--budget 3.0] [--top 10] [module ...]
+
+    Exits non-zero when a cold import exceeds the budget, fails (including a
+    swallowed ImportError: IMPORTS_AVAILABLE False or an import error logged
+    at warning level), or pulls in one of LAZY_MODULES.
+    """
+    parser = argparse.ArgumentParser(description="Cold import time check for the bot's entry points")
+    parser.add_argument('targets', nargs='*', default=list(DEFAULT_TARGETS), help="modules to import")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_SECONDS, help="seconds allowed per import")
+    parser.add_argument('--top', type=int, default=10, help="slowest imports listed per target")
+    args = parser.parse_args(argv)
+
+    sys.exit(0 if check_budget(args.targets, args.budget, args.top) else 1)
+
+
+if __name__ == "__main__":
+    main()
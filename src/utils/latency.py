@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Pipeline stages in the order a candle close flows through them
+PIPELINE_STAGES = (
+    'ws_transport',        # exchange event time -> kline received
+    'kline_to_eval',       # kline received -> strategy evaluation starts
+    'market_data',         # candle window assembled
+    'indicators',          # indicator calculation
+    'signal',              # entry condition evaluation
+    'order_sent',          # create_order round trip
+    'trade_recorded',      # trade database + trade logger write
+    'kline_to_recorded'    # end to end: kline received -> trade recorded
+)
+
+
+class LatencyTracker:
+    """Per-stage latency samples for the candle -> signal -> order pipeline
+
+    Each stage keeps its most recent max_samples durations (seconds). Candle
+    closes are marked per symbol/interval so later stages can measure time
+    since the kline arrived, e.g. mark_kline(...) on receipt and
+    record_since_kline(...) once the order is recorded.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self.max_samples = max_samples
+        self._samples = defaultdict(lambda: deque(maxlen=self.max_samples))
+        self._kline_marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self._samples[stage].append(max(0.0, seconds))
+
+    @contextmanager
+    def timer(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def mark_kline(self, symbol: str, interval: str, received_at: float):
+        """Remember when the latest closed kline (wall clock) arrived for symbol/interval"""
+        self._kline_marks[f"{symbol.upper()}_{interval}"] = received_at
+
+    def record_since_kline(self, stage: str, symbol: str, interval: str) -> Optional[float]:
+        received_at = self._kline_marks.get(f"{symbol.upper()}_{interval}")
+        if received_at is None:
+            return None
+        elapsed = time.time() - received_at
+        self.record(stage, elapsed)
+        return elapsed
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """count/mean/p50/p95/p99/max per stage, in milliseconds"""
+        with self._lock:
+            samples = {stage: np.fromiter(values, dtype=float) for stage, values in self._samples.items() if values}
+
+        ordered = [s for s in PIPELINE_STAGES if s in samples] + sorted(set(samples) - set(PIPELINE_STAGES))
+        stats = {}
+        for stage in ordered:
+            values = samples[stage] * 1000
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            stats[stage] = {
+                'count': len(values),
+                'mean_ms': round(float(values.mean()), 3),
+                'p50_ms': round(float(p50), 3),
+                'p95_ms': round(float(p95), 3),
+                'p99_ms': round(float(p99), 3),
+                'max_ms': round(float(values.max()), 3)
+            }
+        return stats
+
+    def format_report(self) -> str:
+        stats = self.get_statistics()
+        if not stats:
+            return "No latency samples recorded"
+        lines = [f"{'stage':<20}{'count':>8}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)"]
+        for stage, s in stats.items():
+            lines.append(f"{stage:<20}{s['count']:>8}{s['mean_ms']:>10.2f}{s['p50_ms']:>10.2f}"
+                         f"{s['p95_ms']:>10.2f}{s['p99_ms']:>10.2f}{s['max_ms']:>10.2f}")
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._kline_marks.clear()
+
+
+class StageTimer:
+    """Wall-clock timeline of named (possibly overlapping) stages, e.g. bot startup
+
+    Each stage records when it started relative to the timer's creation and
+    how long it took, so the report shows which stages ran concurrently and
+    which one held up the rest. mark() records an instant milestone.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, Tuple[float, float]] = {}  # name -> (start offset, duration) in seconds
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.stages[name] = (started - self.started, time.perf_counter() - started)
+
+    def mark(self, name: str):
+        with self._lock:
+            self.stages[name] = (time.perf_counter() - self.started, 0.0)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def format_report(self) -> str:
+        with self._lock:
+            stages = sorted(self.stages.items(), key=lambda item: item[1])
+        lines = [f"{'stage':<24}{'start':>10}{'took':>10}  (s)"]
+        for name, (offset, duration) in stages:
+            lines.append(f"{name:<24}{offset:>10.2f}{duration:>10.2f}")
+        return "\n".join(lines)
+
+
+# Global latency tracker
+latency_tracker = LatencyTracker()
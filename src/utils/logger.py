@@ -2,14 +2,100 @@
 Logging utilities for the trading bot
 """
 
+import atexit
+import copy
 import logging
+import queue
+import re
 import sys
 import os
 from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from collections import deque
 import threading
 
+# Structured log events - the caller passes fields, handlers render them
+EVENT_SCAN = 'scan'
+EVENT_POSITION = 'position'
+EVENT_UNTRACKED_POSITION = 'untracked_position'
+
+EVENT_TITLES = {
+    EVENT_SCAN: '🔍 SCANNING',
+    EVENT_POSITION: '📊 TRADE IN PROGRESS',
+    EVENT_UNTRACKED_POSITION: '📊 TRADE IN PROGRESS (NOT TRACKED)',
+}
+
+# (field, label, format) in display order; indicators and note follow
+EVENT_FIELDS = (
+    ('strategy', '🎯 Strategy', '{}'),
+    ('symbol', '💱 Symbol', '{}'),
+    ('timeframe', '⏱️ Timeframe', '{}'),
+    ('side', '📊 Side', '{}'),
+    ('entry_price', '💵 Entry', '${:,.4f}'),
+    ('price', '💰 Price', '${:,.4f}'),
+    ('margin', '💵 Margin', '${:.1f}'),
+    ('leverage', '⚡ Leverage', '{}x'),
+    ('pnl', '💰 PnL', '${:.2f} USDT'),
+    ('pnl_percent', '📈 PnL %', '{:+.1f}%'),
+)
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+class LogEvent:
+    """Log message carrying explicit fields; rendered to text only when a handler asks for it"""
+
+    __slots__ = ('event', 'fields', '_text')
+
+    def __init__(self, event: str, fields: dict):
+        self.event = event
+        self.fields = fields
+        self._text = None
+
+    @property
+    def title(self) -> str:
+        return EVENT_TITLES.get(self.event, self.event.upper())
+
+    def lines(self) -> list:
+        lines = []
+        for name, label, fmt in EVENT_FIELDS:
+            value = self.fields.get(name)
+            if value is None:
+                continue
+            try:
+                lines.append(f"{label}: {fmt.format(value)}")
+            except (TypeError, ValueError):
+                lines.append(f"{label}: {value}")
+        for name, value in (self.fields.get('indicators') or {}).items():
+            lines.append(f"📊 {name}: {_format_value(value)}")
+        if self.fields.get('note'):
+            lines.append(f"⚠️ {self.fields['note']}")
+        return lines
+
+    def __str__(self):
+        # One-line form for file and dashboard handlers, rendered once per record
+        if self._text is None:
+            self._text = " | ".join([self.title] + self.lines())
+        return self._text
+
+
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **fields):
+    """Log a structured event (strategy, symbol, price, indicators, ...)
+
+    Nothing is rendered on the calling thread; if the level is disabled
+    the call returns before a record is even created.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    logger.log(level, LogEvent(event, fields), stacklevel=2,
+               extra={'event': event, 'strategy': fields.get('strategy'), 'symbol': fields.get('symbol')})
+
+
 class ColoredFormatter(logging.Formatter):
     """Colorful formatter with Telegram-style vertical layout"""
 
@@ -57,6 +143,20 @@ class ColoredFormatter(logging.Formatter):
         '\033[1;37m', # Bold White
     ]
 
+    # Strategy name patterns for plain-text messages (structured events carry the strategy)
+    STRATEGY_PATTERNS = [re.compile(pattern) for pattern in (
+        r'🎯\s*(?:Strategy:\s*)?([A-Z_]+)',
+        r'([A-Z_]+)\s*\|',
+        r'SCANNING\s+[A-Z]+\s*\|\s*([A-Z_]+)',
+        r'POSITION\s+(?:OPENED|CLOSED)\s*\|\s*([A-Z_]+)',
+        r'SIGNAL\s+(?:DETECTED|TRIGGERED)\s*\|\s*([A-Z_]+)',
+        r'EXIT\s+TRIGGERED\s*\|\s*([A-Z_]+)',
+        r'STRATEGY\s+BLOCKED\s*\|\s*([A-Z_]+)',
+    )]
+
+    STRATEGY_KEYWORDS = ("MARKET ASSESSMENT", "ENTRY SIGNAL", "POSITION OPENED", "POSITION CLOSED", "SCANNING",
+                         "EXIT TRIGGERED", "STRATEGY BLOCKED")
+
     # Dynamic strategy color assignment
     STRATEGY_COLORS = {}
     ACTIVE_POSITION_COLORS = {}
@@ -147,6 +247,16 @@ class ColoredFormatter(logging.Formatter):
         # Load existing strategy colors on initialization
         self._load_strategy_colors()
 
+    def _detect_strategy(self, message):
+        """Strategy name from a plain-text message, e.g. "POSITION OPENED | STRATEGY_NAME | ..." """
+        if '|' not in message and '🎯' not in message:
+            return None  # every pattern needs one of these
+        for pattern in self.STRATEGY_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                return match.group(1).upper()
+        return None
+
     def format(self, record):
         # Format timestamp in Dubai time (UTC+4)
         from src.config.global_config import global_config
@@ -159,45 +269,34 @@ class ColoredFormatter(logging.Formatter):
             timestamp = utc_time.strftime('%H:%M:%S')
             current_time = utc_time
 
-        # Get message
-        message = record.getMessage()
+        event = record.msg if isinstance(record.msg, LogEvent) else None
+        message = str(event) if event else record.getMessage()
 
-        # Detect strategy and position status from message
+        # Detect strategy and position status
         strategy_color = None
         is_active_position = False
-        detected_strategy = None
-
-        # Extract strategy name from common message patterns
-        import re
-
-        # Pattern 1: "STRATEGY_NAME | SYMBOL" or "Strategy: STRATEGY_NAME"
-        strategy_patterns = [
-            r'🎯\s*(?:Strategy:\s*)?([A-Z_]+)',
-            r'([A-Z_]+)\s*\|',
-            r'SCANNING\s+[A-Z]+\s*\|\s*([A-Z_]+)',
-            r'POSITION\s+(?:OPENED|CLOSED)\s*\|\s*([A-Z_]+)',
-            r'SIGNAL\s+(?:DETECTED|TRIGGERED)\s*\|\s*([A-Z_]+)',
-            r'EXIT\s+TRIGGERED\s*\|\s*([A-Z_]+)',
-            r'STRATEGY\s+BLOCKED\s*\|\s*([A-Z_]+)',
-        ]
-
-        for pattern in strategy_patterns:
-            match = re.search(pattern, message)
-            if match:
-                detected_strategy = match.group(1).upper()
-                break
 
-        # If we detected a strategy, assign color if needed
-        if detected_strategy:
-            # Assign color dynamically if not already assigned
-            strategy_color = self._assign_strategy_color(detected_strategy)
+        if event:
+            # Structured event - no message parsing
+            detected_strategy = str(event.fields.get('strategy') or '').upper() or None
+            if detected_strategy:
+                strategy_color = self._assign_strategy_color(detected_strategy)
+                if event.event == EVENT_POSITION:
+                    strategy_color = self.ACTIVE_POSITION_COLORS.get(detected_strategy, strategy_color)
+        else:
+            detected_strategy = self._detect_strategy(message)
+
+            # If we detected a strategy, assign color if needed
+            if detected_strategy:
+                # Assign color dynamically if not already assigned
+                strategy_color = self._assign_strategy_color(detected_strategy)
 
-            # Check if this is an active position
-            if "TRADE IN PROGRESS" in message or "ACTIVE POSITION" in message:
-                strategy_color = self.ACTIVE_POSITION_COLORS.get(detected_strategy, strategy_color)
-                is_active_position = True
-            elif any(keyword in message for keyword in ["MARKET ASSESSMENT", "ENTRY SIGNAL", "POSITION OPENED", "POSITION CLOSED", "SCANNING", "EXIT TRIGGERED", "STRATEGY BLOCKED"]):
-                strategy_color = self.STRATEGY_COLORS.get(detected_strategy, strategy_color)
+                # Check if this is an active position
+                if "TRADE IN PROGRESS" in message or "ACTIVE POSITION" in message:
+                    strategy_color = self.ACTIVE_POSITION_COLORS.get(detected_strategy, strategy_color)
+                    is_active_position = True
+                elif any(keyword in message for keyword in self.STRATEGY_KEYWORDS):
+                    strategy_color = self.STRATEGY_COLORS.get(detected_strategy, strategy_color)
 
         # Get colors
         if strategy_color:
@@ -332,7 +431,17 @@ class ColoredFormatter(logging.Formatter):
             return lines
 
         # Create Telegram-style vertical message
-        if is_active_position:
+        if event:
+            # Structured event - one line per field
+            if event.event == EVENT_SCAN:
+                border, top, bottom = '│', f"┌{'─' * 49}┐", f"└{'─' * 49}┘"
+            else:
+                border, top, bottom = '║', f"╔{'═' * 51}╗", f"╚{'═' * 51}╝"
+            header = '📊 ACTIVE POSITION' if event.event == EVENT_POSITION else event.title
+            body = [f"{border} {line}" for line in [header, f"⏰ {timestamp}", ""] + event.lines()]
+            formatted_lines = "\n".join(body)
+            formatted_message = f"{separator}{text_color}{top}\n{formatted_lines}\n{border}\n{bottom}{reset}\n"
+        elif is_active_position:
             # Active position - special formatting
             msg_lines = format_structured_message(message)
             formatted_lines = "║\n".join([f"║ {line}" for line in msg_lines])
@@ -434,8 +543,69 @@ class SimpleFileFormatter(logging.Formatter):
         message = record.getMessage()
         return f"[{timestamp}] [{record.levelname}] {message}"
 
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread
+
+    The stdlib prepare() renders every record on the logging thread; here
+    only exception info is rendered up front (a traceback pins its frames),
+    so the caller pays for creating the record and one queue put.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        if record.exc_info:
+            record = copy.copy(record)
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# Background listener that runs the real handlers (None when LOG_QUEUE is off)
+_log_listener = None
+
+
+def _stop_log_listener():
+    """Drain queued records and hand the handlers back to the root logger"""
+    global _log_listener
+    listener, _log_listener = _log_listener, None
+    if listener is None:
+        return
+    listener.stop()
+    root_logger = logging.getLogger()
+    for handler in [h for h in root_logger.handlers if isinstance(h, DeferredQueueHandler)]:
+        root_logger.removeHandler(handler)
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
+
+
+atexit.register(_stop_log_listener)
+
+
+def add_log_handler(handler: logging.Handler):
+    """Attach a handler to the logging pipeline, replacing any handler of the same class"""
+    if _log_listener is not None:
+        handlers = [h for h in _log_listener.handlers if type(h) is not type(handler)]
+        _log_listener.handlers = tuple(handlers + [handler])  # swapped whole - the listener thread never sees a partial tuple
+        return
+
+    root_logger = logging.getLogger()
+    for existing in [h for h in root_logger.handlers if type(h) is type(handler)]:
+        root_logger.removeHandler(existing)
+    root_logger.addHandler(handler)
+
+
 def setup_logger():
-    """Setup logging configuration with Telegram-style vertical output"""
+    """Setup logging configuration with Telegram-style vertical output
+
+    With LOG_QUEUE (default) the root logger only enqueues records; a
+    QueueListener thread formats and writes them, so the trading loop never
+    waits on formatting, console or file I/O. Records below LOG_LEVEL are
+    rejected before a record is created.
+    """
+    from src.config.global_config import global_config
+
+    _stop_log_listener()
 
     # Console handler with Telegram-style blocks
     console_handler = logging.StreamHandler(sys.stdout)
@@ -453,25 +623,28 @@ def setup_logger():
     file_handler_web.setFormatter(SimpleFileFormatter())
     file_handler_web.setLevel(logging.INFO)
 
+    # Web log handler - keeps whatever passes LOG_LEVEL for the dashboard
+    web_log_handler = WebLogHandler()
+    web_log_handler.setLevel(logging.DEBUG)
+
+    handlers = [console_handler, file_handler, file_handler_web, web_log_handler]
+
     # Root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(getattr(logging, global_config.LOG_LEVEL, logging.INFO))
 
     # Clear existing handlers
     root_logger.handlers.clear()
 
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(file_handler_web)
-
-
-    # Add web log handler - capture DEBUG level to mirror development console
-    web_log_handler = WebLogHandler()
-    web_log_handler.setFormatter(ColoredFormatter())
-    web_log_handler.setLevel(logging.DEBUG)  # Changed from INFO to DEBUG to capture all messages
-    root_logger.addHandler(web_log_handler)
-
-
+    if global_config.LOG_QUEUE:
+        global _log_listener
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(DeferredQueueHandler(log_queue))
+        _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _log_listener.start()
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Suppress noisy loggers
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -501,128 +674,134 @@ class WebLogHandler(logging.Handler):
         self.logs = deque(maxlen=max_logs)
         self.lock = threading.RLock()  # Use reentrant lock
 
+    # SKIP these noisy debug messages that clutter the dashboard
+    SKIP_PATTERNS = (
+        'startup scan status',
+        'checking for misidentified',
+        'anomaly check (suppressed)',
+        'bot status: is_running',
+        'web log handler',
+        'startup protection',
+        'debug:',
+        'consecutivehits',
+        'cache hit',
+        'throttled',
+        'log handler initialized'
+    )
+
+    # PRIORITIZE important trading activity messages with enhanced patterns
+    PRIORITY_PATTERNS = (
+        'scanning',
+        'active position',
+        'trade in progress',
+        'position opened',
+        'position closed',
+        'entry signal',
+        'exit signal',
+        'strategy',
+        'rsi:',
+        'macd:',
+        'price:',
+        'pnl',
+        'margin:',
+        'leverage:',
+        'indicator:',
+        'current price:',
+        'symbol:',
+        'timeframe:',
+        'pattern:',
+        'momentum:',
+        'exit at'
+    )
+
+    LIFECYCLE_PATTERNS = ('bot startup', 'bot stopped', 'trading bot')
+    TRADING_INFO_PATTERNS = ('price:', 'rsi:', 'macd:', 'pnl:', 'indicator:', 'exit at')
+    IGNORED_LINES = ('ℹ️  INFO', 'INFO', 'ERROR', 'WARNING', '')
+
+    # Box drawing characters stripped from plain-text messages; bars become spaces
+    BOX_CHARS = str.maketrans({**{char: None for char in '┌┐└┘├┤─╔╗╚╝═'}, '│': ' ', '║': ' '})
+
     def emit(self, record):
         try:
-            with self.lock:
-                if not record or not hasattr(record, 'created'):
-                    return
-
-                # Get the original message for processing
-                original_msg = record.getMessage()
-                timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S')
-
-                # SMART FILTERING: Capture important trading messages while reducing debug noise
-                if original_msg and original_msg.strip():
-                    msg_lower = original_msg.lower()
-                    
-                    # SKIP these noisy debug messages that clutter the dashboard
-                    skip_patterns = [
-                        'startup scan status',
-                        'checking for misidentified', 
-                        'anomaly check (suppressed)',
-                        'bot status: is_running',
-                        'web log handler',
-                        'startup protection',
-                        'debug:',
-                        'consecutivehits',
-                        'cache hit',
-                        'throttled',
-                        'log handler initialized'
-                    ]
-                    
-                    if any(pattern in msg_lower for pattern in skip_patterns):
-                        return  # Skip these messages entirely
-                    
-                    # PRIORITIZE important trading activity messages with enhanced patterns
-                    priority_patterns = [
-                        'scanning',
-                        'active position', 
-                        'trade in progress',
-                        'position opened',
-                        'position closed',
-                        'entry signal',
-                        'exit signal',
-                        'strategy',
-                        'rsi:',
-                        'macd:',
-                        'price:',
-                        'pnl',
-                        'margin:',
-                        'leverage:',
-                        'indicator:',
-                        'current price:',
-                        'symbol:',
-                        'timeframe:',
-                        'pattern:',
-                        'momentum:',
-                        'exit at'
-                    ]
-                    
-                    is_priority_msg = any(pattern in msg_lower for pattern in priority_patterns)
-                    is_error_warning = record.levelname in ['ERROR', 'WARNING'] or any(char in original_msg for char in ['❌', '⚠️'])
-                    is_lifecycle = any(pattern in msg_lower for pattern in ['bot startup', 'bot stopped', 'trading bot'])
-                    
-                    # Only process important messages or errors/warnings
-                    if not (is_priority_msg or is_error_warning or is_lifecycle):
-                        return  # Skip less important messages
-                    
-                    # Preserve the original message format as much as possible
-                    clean_msg = str(original_msg).strip()
-                    
-                    # Enhanced cleaning for trading information display
-                    box_chars_to_remove = ['┌', '┐', '└', '┘', '├', '┤', '─', '╔', '╗', '╚', '╝', '═']
-                    for char in box_chars_to_remove:
-                        clean_msg = clean_msg.replace(char, '')
-                    
-                    # Replace vertical bars with spaces but preserve structure
-                    clean_msg = clean_msg.replace('│', ' ')
-                    clean_msg = clean_msg.replace('║', ' ')
-                    
-                    # Clean up excessive whitespace but preserve intentional spacing
-                    lines = clean_msg.split('\n')
-                    cleaned_lines = []
-                    for line in lines:
-                        stripped_line = line.strip()
-                        if stripped_line and stripped_line not in ['ℹ️  INFO', 'INFO', 'ERROR', 'WARNING', '']:
-                            # Enhance trading info display by highlighting key data
-                            if any(pattern in stripped_line.lower() for pattern in ['scanning', 'active position', 'price:', 'rsi:', 'macd:']):
-                                # Keep important trading lines intact
-                                cleaned_lines.append(stripped_line)
-                            elif stripped_line and len(stripped_line) > 3:
-                                cleaned_lines.append(stripped_line)
-                    
-                    if cleaned_lines:
-                        # Enhanced formatting for trading information
-                        if len(cleaned_lines) == 1:
-                            formatted_log = f'[{timestamp}] {cleaned_lines[0]}'
-                        else:
-                            # Multi-line message - group related trading info
-                            main_line = cleaned_lines[0]
-                            
-                            # Group trading indicators together
-                            trading_info = []
-                            other_info = []
-                            
-                            for line in cleaned_lines[1:]:
-                                if any(pattern in line.lower() for pattern in ['price:', 'rsi:', 'macd:', 'pnl:', 'indicator:', 'exit at']):
-                                    trading_info.append(line)
-                                else:
-                                    other_info.append(line)
-                            
-                            # Prioritize trading info display
-                            if trading_info:
-                                formatted_log = f'[{timestamp}] {main_line} | {" | ".join(trading_info)}'
-                                if other_info:
-                                    formatted_log += f' | {" | ".join(other_info)}'
-                            else:
-                                additional_info = ' | '.join(cleaned_lines[1:])
-                                formatted_log = f'[{timestamp}] {main_line} | {additional_info}'
-                        
-                        self.logs.append(formatted_log)
+            if not record or not hasattr(record, 'created'):
+                return
+
+            timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S')
+
+            if isinstance(record.msg, LogEvent):
+                # Structured events are always trading activity - one line from the fields
+                formatted_log = f'[{timestamp}] {record.msg}'
+            else:
+                formatted_log = self._format_plain(record, timestamp)
+
+            if formatted_log:
+                with self.lock:
+                    self.logs.append(formatted_log)
         except Exception:
             # DO NOT log here! Just pass
             pass
 
+    def _format_plain(self, record, timestamp):
+        """Dashboard line for a plain-text message, or None if it is noise"""
+        # Get the original message for processing
+        original_msg = record.getMessage()
+
+        # SMART FILTERING: Capture important trading messages while reducing debug noise
+        if not original_msg or not original_msg.strip():
+            return None
+        msg_lower = original_msg.lower()
+
+        if any(pattern in msg_lower for pattern in self.SKIP_PATTERNS):
+            return None  # Skip these messages entirely
+
+        is_priority_msg = any(pattern in msg_lower for pattern in self.PRIORITY_PATTERNS)
+        is_error_warning = record.levelname in ['ERROR', 'WARNING'] or '❌' in original_msg or '⚠️' in original_msg
+        is_lifecycle = any(pattern in msg_lower for pattern in self.LIFECYCLE_PATTERNS)
+
+        # Only process important messages or errors/warnings
+        if not (is_priority_msg or is_error_warning or is_lifecycle):
+            return None  # Skip less important messages
+
+        # Enhanced cleaning for trading information display
+        clean_msg = str(original_msg).strip().translate(self.BOX_CHARS)
+
+        # Clean up excessive whitespace but preserve intentional spacing
+        cleaned_lines = []
+        for line in clean_msg.split('\n'):
+            stripped_line = line.strip()
+            if stripped_line not in self.IGNORED_LINES and len(stripped_line) > 3:
+                cleaned_lines.append(stripped_line)
+
+        if not cleaned_lines:
+            return None
+
+        # Enhanced formatting for trading information
+        if len(cleaned_lines) == 1:
+            return f'[{timestamp}] {cleaned_lines[0]}'
+
+        # Multi-line message - group related trading info
+        main_line = cleaned_lines[0]
+
+        # Group trading indicators together
+        trading_info = []
+        other_info = []
+
+        for line in cleaned_lines[1:]:
+            if any(pattern in line.lower() for pattern in self.TRADING_INFO_PATTERNS):
+                trading_info.append(line)
+            else:
+                other_info.append(line)
+
+        # Prioritize trading info display
+        if trading_info:
+            formatted_log = f'[{timestamp}] {main_line} | {" | ".join(trading_info)}'
+            if other_info:
+                formatted_log += f' | {" | ".join(other_info)}'
+            return formatted_log
+
+        additional_info = ' | '.join(cleaned_lines[1:])
+        return f'[{timestamp}] {main_line} | {additional_info}'
+
     def get_recent_logs(self, count=50):
         try:
             with self.lock:
@@ -0,0 +1,104 @@
+
+import logging
+import os
+import sys
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_fetcher.indicator_engine import IncrementalIndicatorEngine
+from src.data_fetcher.kline_store import KlineStore
+from src.data_fetcher.websocket_manager import websocket_manager
+
+STEP = 60_000
+COLUMNS = ('rsi', 'macd', 'macd_signal', 'macd_histogram', 'sma_20', 'sma_50', 'bb_upper', 'bb_middle', 'bb_lower')
+
+
+def _klines(count, seed=7):
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 1, count))
+    opens = np.concatenate([[100.0], closes[:-1]]) + rng.normal(0, 0.3, count)
+    return [{'timestamp': i * STEP, 'open': float(opens[i]), 'high': float(max(opens[i], closes[i]) + 0.5),
+             'low': float(min(opens[i], closes[i]) - 0.5), 'close': float(closes[i]), 'volume': 1.0,
+             'close_time': i * STEP + STEP - 1, 'is_closed': True} for i in range(count)]
+
+
+def _reference(klines):
+    """Same formulas as PriceFetcher.calculate_indicators, with pandas"""
+    close = pd.Series([k['close'] for k in klines])
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    rsi = 100 - (100 / (1 + gain / loss.replace(0, 0.000001)))
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+    sma20, std20 = close.rolling(window=20).mean(), close.rolling(window=20).std()
+    return {'rsi': rsi.iloc[-1], 'macd': macd.iloc[-1], 'macd_signal': signal.iloc[-1],
+            'macd_histogram': (macd - signal).iloc[-1], 'sma_20': sma20.iloc[-1],
+            'sma_50': close.rolling(window=50).mean().iloc[-1], 'bb_upper': (sma20 + std20 * 2).iloc[-1],
+            'bb_middle': sma20.iloc[-1], 'bb_lower': (sma20 - std20 * 2).iloc[-1]}
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = KlineStore(capacity=500)
+    monkeypatch.setattr(websocket_manager, 'get_kline_store', lambda symbol, interval: store)
+    return store
+
+
+def test_incremental_values_match_batch_formulas(store):
+    klines = _klines(300)
+    engine = IncrementalIndicatorEngine()
+
+    # Fed in chunks, the way closed candles arrive between calls
+    for start in range(0, 300, 37):
+        for kline in klines[start:start + 37]:
+            store.upsert(kline)
+        values = engine.get_indicators('BTCUSDT', '1m')
+        expected = _reference(klines[:start + 37])
+        for column in COLUMNS:
+            if pd.isna(expected[column]):
+                assert values.get(column) is None, column  # still warming up
+            else:
+                assert values[column] == pytest.approx(expected[column], rel=1e-9, abs=1e-9), column
+
+    assert values['candles'] == 300
+    assert values['is_provisional'] is False
+
+
+def test_open_candle_is_provisional_and_does_not_advance_state(store):
+    klines = _klines(120)
+    for kline in klines[:-1]:
+        store.upsert(kline)
+    store.upsert({**klines[-1], 'is_closed': False})
+    engine = IncrementalIndicatorEngine()
+
+    provisional = engine.get_indicators('BTCUSDT', '1m')
+    assert provisional['is_provisional'] is True
+    assert provisional['candles'] == 119
+    assert provisional['rsi'] == pytest.approx(_reference(klines)['rsi'], rel=1e-9)
+
+    # Candle closes at a different price - only the closed value counts
+    store.upsert({**klines[-1], 'close': klines[-1]['close'] + 3})
+    closed = engine.get_indicators('BTCUSDT', '1m')
+    assert closed['is_provisional'] is False
+    assert closed['candles'] == 120
+    moved = klines[:-1] + [{**klines[-1], 'close': klines[-1]['close'] + 3}]
+    assert closed['sma_20'] == pytest.approx(_reference(moved)['sma_20'], rel=1e-9)
+
+
+def test_matches_price_fetcher_calculate_indicators(store):
+    price_fetcher = pytest.importorskip("src.data_fetcher.price_fetcher")
+    klines = _klines(250, seed=11)
+    for kline in klines:
+        store.upsert(kline)
+
+    frame = pd.DataFrame(klines)[['open', 'high', 'low', 'close', 'volume']]
+    batch = price_fetcher.PriceFetcher.calculate_indicators(SimpleNamespace(logger=logging.getLogger()), frame)
+    values = IncrementalIndicatorEngine().get_indicators('BTCUSDT', '1m')
+    for column in COLUMNS:
+        assert values[column] == pytest.approx(batch[column].iloc[-1], rel=1e-9, abs=1e-9), column
+    assert values['bullish_engulfing'] == bool(batch['bullish_engulfing'].iloc[-1])
@@ -0,0 +1,70 @@
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.data_fetcher.kline_store import KlineStore
+
+STEP = 60_000
+
+
+def _kline(index, close=None, closed=True):
+    close = 100.0 + index if close is None else close
+    return {'timestamp': index * STEP, 'open': close - 1, 'high': close + 1, 'low': close - 2,
+            'close': close, 'volume': 10.0 + index, 'close_time': index * STEP + STEP - 1, 'is_closed': closed}
+
+
+def test_upsert_updates_forming_candle_in_place():
+    store = KlineStore(capacity=5)
+    assert store.upsert(_kline(0))
+    assert store.upsert(_kline(1, close=50.0, closed=False))
+    assert not store.upsert(_kline(1, close=55.0, closed=True))  # closing tick of the same candle
+    assert len(store) == 2
+    assert store.latest()['close'] == 55.0
+    assert store.latest()['is_closed'] is True
+
+
+def test_upsert_patches_late_update_for_held_candle():
+    store = KlineStore(capacity=5)
+    for index in range(4):
+        store.upsert(_kline(index))
+    assert not store.upsert(_kline(1, close=42.0))
+    assert [kline['close'] for kline in store.tail(4)] == [100.0, 42.0, 102.0, 103.0]
+
+    # A candle older than the window is dropped, not inserted
+    assert not store.upsert(_kline(-3))
+    assert len(store) == 4
+
+
+def test_window_wraps_and_stays_contiguous():
+    store = KlineStore(capacity=3)
+    for index in range(20):  # several compactions of the 2x capacity arrays
+        store.upsert(_kline(index))
+
+    assert len(store) == 3
+    assert store.first_timestamp() == 17 * STEP
+    arrays = store.arrays()
+    assert list(arrays['timestamp']) == [17 * STEP, 18 * STEP, 19 * STEP]
+    assert list(arrays['close']) == [117.0, 118.0, 119.0]
+    assert list(store.to_dataframe(limit=2)['close']) == [118.0, 119.0]
+    assert list(store.columns_since(17 * STEP)['timestamp']) == [18 * STEP, 19 * STEP]
+
+
+def test_arrays_are_copies():
+    store = KlineStore(capacity=3)
+    for index in range(3):
+        store.upsert(_kline(index))
+    arrays = store.arrays()
+
+    store.upsert(_kline(2, close=1.0))
+    for index in range(3, 8):
+        store.upsert(_kline(index))
+    assert list(arrays['close']) == [100.0, 101.0, 102.0]
+
+
+def test_seed_keeps_newer_live_candles():
+    store = KlineStore(capacity=10)
+    store.upsert(_kline(5, closed=False))
+    store.seed([_kline(index) for index in range(5)])
+    assert [kline['timestamp'] for kline in store] == [index * STEP for index in range(6)]
+    assert store.latest()['is_closed'] is False
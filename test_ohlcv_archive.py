@@ -0,0 +1,80 @@
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.data_fetcher.ohlcv_archive import OHLCVArchive, CANDLE_DTYPE, INTERVAL_MS
+
+STEP = INTERVAL_MS['1m']
+BASE = 1_700_000_040_000 - 1_700_000_040_000 % STEP
+
+
+def _kline(index, closed=True):
+    timestamp = BASE + index * STEP
+    return {'timestamp': timestamp, 'open': 100.0 + index, 'high': 101.0 + index, 'low': 99.0 + index,
+            'close': 100.5 + index, 'volume': 10.0, 'close_time': timestamp + STEP - 1, 'is_closed': closed}
+
+
+def _rest_kline(index):
+    kline = _kline(index)
+    return [kline['timestamp'], str(kline['open']), str(kline['high']), str(kline['low']),
+            str(kline['close']), str(kline['volume']), kline['close_time']]
+
+
+def test_append_ignores_open_duplicate_and_older_candles(tmp_path):
+    archive = OHLCVArchive(str(tmp_path))
+    assert archive.append('BTCUSDT', '1m', _kline(0))
+    assert archive.append('BTCUSDT', '1m', _kline(1))
+    assert not archive.append('BTCUSDT', '1m', _kline(2, closed=False))
+    assert not archive.append('BTCUSDT', '1m', _kline(1))
+    assert not archive.append('BTCUSDT', '1m', _kline(0))
+    assert not archive.append('BTCUSDT', '1w', _kline(3))
+    assert archive.count('BTCUSDT', '1m') == 2
+
+
+def test_append_after_torn_record_keeps_file_aligned(tmp_path):
+    archive = OHLCVArchive(str(tmp_path))
+    assert archive.append('BTCUSDT', '1m', _kline(0))
+    assert archive.append('BTCUSDT', '1m', _kline(1))
+
+    # Simulate a crash halfway through writing the third record
+    path = tmp_path / "BTCUSDT" / "1m.bin"
+    with open(path, 'ab') as f:
+        f.write(b'\x01' * (CANDLE_DTYPE.itemsize // 2))
+    assert archive.count('BTCUSDT', '1m') == 2
+    assert archive.last_timestamp('BTCUSDT', '1m') == BASE + STEP
+
+    assert archive.append('BTCUSDT', '1m', _kline(2))
+    assert path.stat().st_size == 3 * CANDLE_DTYPE.itemsize
+    candles = archive.read('BTCUSDT', '1m')
+    assert list(candles['timestamp']) == [BASE, BASE + STEP, BASE + 2 * STEP]
+    assert float(candles['close'][-1]) == 102.5
+
+
+def test_write_klines_after_torn_record(tmp_path):
+    archive = OHLCVArchive(str(tmp_path))
+    archive.append('BTCUSDT', '1m', _kline(0))
+    path = tmp_path / "BTCUSDT" / "1m.bin"
+    with open(path, 'ab') as f:
+        f.write(b'\x01' * 10)
+
+    now_ms = BASE + 10 * STEP
+    assert archive.write_klines('BTCUSDT', '1m', [_rest_kline(1), _rest_kline(2)], now_ms) == 2
+    assert path.stat().st_size == 3 * CANDLE_DTYPE.itemsize
+    assert list(archive.read('BTCUSDT', '1m')['timestamp']) == [BASE, BASE + STEP, BASE + 2 * STEP]
+
+
+def test_write_klines_fills_holes_and_skips_forming_candle(tmp_path):
+    archive = OHLCVArchive(str(tmp_path))
+    for index in (0, 1, 4, 5):
+        archive.append('BTCUSDT', '1m', _kline(index))
+
+    now_ms = BASE + 6 * STEP + 1  # candle 6 is still forming
+    assert archive.missing_ranges('BTCUSDT', '1m', 6, now_ms) == [(BASE + 2 * STEP, BASE + 4 * STEP)]
+
+    added = archive.write_klines('BTCUSDT', '1m', [_rest_kline(i) for i in (1, 2, 3, 6)], now_ms)
+    assert added == 2
+    candles = archive.read('BTCUSDT', '1m')
+    assert list(candles['timestamp']) == [BASE + i * STEP for i in range(6)]
+    assert archive.missing_ranges('BTCUSDT', '1m', 6, now_ms) == []
+    assert not (tmp_path / "BTCUSDT" / "1m.bin.tmp").exists()
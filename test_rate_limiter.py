@@ -0,0 +1,63 @@
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from src.binance_client.rate_limiter import WeightedRateLimiter
+
+
+def _response(status_code=200, **headers):
+    return SimpleNamespace(status_code=status_code, headers=headers)
+
+
+def test_weights_follow_endpoint_and_params():
+    limiter = WeightedRateLimiter()
+    assert limiter.weight_for('klines', limit=50) == 1
+    assert limiter.weight_for('klines', limit=1000) == 5
+    assert limiter.weight_for('klines', limit=1500) == 10
+    assert limiter.weight_for('open_orders') == 40
+    assert limiter.weight_for('open_orders', symbol='BTCUSDT') == 1
+    assert limiter.weight_for('account') == 5
+    assert limiter.weight_for('unknown_endpoint') == 1
+
+
+def test_used_weight_header_lowers_local_budget():
+    limiter = WeightedRateLimiter(weight_per_minute=100)
+    limiter.acquire('account')
+    assert limiter.get_statistics()['available_weight'] == pytest.approx(95, abs=0.5)
+
+    # Another process spent most of the shared IP budget
+    limiter.record_response(_response(**{'X-MBX-USED-WEIGHT-1M': '90'}))
+    stats = limiter.get_statistics()
+    assert stats['server_used_weight'] == 90
+    assert stats['available_weight'] == pytest.approx(10, abs=0.5)
+
+    # A lower server count never hands back tokens we already spent
+    limiter.record_response(_response(**{'X-MBX-USED-WEIGHT-1M': '1'}))
+    assert limiter.get_statistics()['available_weight'] == pytest.approx(10, abs=0.5)
+
+
+def test_request_waits_for_refill_after_header_sync():
+    limiter = WeightedRateLimiter(weight_per_minute=600)  # refills 10 weight per second
+    limiter.record_response(_response(**{'X-MBX-USED-WEIGHT-1M': '600'}))
+
+    started = time.monotonic()
+    waited = limiter.acquire('account')  # weight 5 -> about half a second
+    assert 0.3 <= time.monotonic() - started < 2.0
+    assert waited > 0
+    assert limiter.get_statistics()['throttled'] == 1
+
+
+def test_order_count_headers_and_retry_after():
+    limiter = WeightedRateLimiter(orders_per_10s=10)
+    limiter.record_response(_response(**{'X-MBX-ORDER-COUNT-10S': '10'}))
+    assert limiter.order_buckets['10s'].tokens == pytest.approx(0, abs=0.1)
+
+    limiter.record_response(_response(status_code=429, **{'Retry-After': '30'}))
+    stats = limiter.get_statistics()
+    assert stats['backoffs'] == 1
+    assert 29 < stats['paused_seconds'] <= 30
@@ -0,0 +1,80 @@
+
+import asyncio
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.strategy_processor.strategy_scheduler import StrategyScheduler
+
+
+def _tick(close, closed=False):
+    return {'close': close, 'is_closed': closed}
+
+
+def _run(scenario):
+    async def main():
+        scheduler = StrategyScheduler()
+        scheduler.attach(asyncio.get_running_loop())
+        try:
+            return await scenario(scheduler)
+        finally:
+            scheduler.detach()
+    return asyncio.run(main())
+
+
+def test_entry_trigger_fires_once_per_candle():
+    async def scenario(scheduler):
+        fired = []
+        scheduler.set_price_trigger('entry:rsi', 'BTCUSDT', above=105.0, strategy_name='rsi', interval='15m')
+
+        scheduler.on_kline('BTCUSDT', '15m', _tick(106.0))
+        fired += await scheduler.wait_for_events(0.5)
+
+        # Re-armed by the next housekeeping pass, still inside the same candle
+        scheduler.set_price_trigger('entry:rsi', 'BTCUSDT', above=105.0, strategy_name='rsi', interval='15m')
+        scheduler.on_kline('BTCUSDT', '15m', _tick(107.0))
+        fired += await scheduler.wait_for_events(0.1)
+        assert scheduler.get_trigger_keys() == []
+
+        # The candle closes: the trigger may be armed and fire again
+        scheduler.on_kline('BTCUSDT', '15m', _tick(104.0, closed=True))
+        await scheduler.wait_for_events(0.1)
+        scheduler.set_price_trigger('entry:rsi', 'BTCUSDT', above=105.0, strategy_name='rsi', interval='15m')
+        scheduler.on_kline('BTCUSDT', '15m', _tick(105.5))
+        fired += await scheduler.wait_for_events(0.5)
+        return fired
+
+    fired = _run(scenario)
+    assert [(event.kind, event.trigger_key, event.price) for event in fired] == [
+        ('price_trigger', 'entry:rsi', 106.0),
+        ('price_trigger', 'entry:rsi', 105.5),
+    ]
+
+
+def test_exit_trigger_without_interval_rearms_at_once():
+    async def scenario(scheduler):
+        fired = []
+        for price in (94.0, 93.0):
+            scheduler.set_price_trigger('exit:rsi', 'BTCUSDT', below=95.0, strategy_name='rsi')
+            scheduler.on_kline('BTCUSDT', '15m', _tick(price))
+            fired += await scheduler.wait_for_events(0.5)
+        return fired
+
+    assert [event.price for event in _run(scenario)] == [94.0, 93.0]
+
+
+def test_candle_close_events_are_coalesced_until_consumed():
+    async def scenario(scheduler):
+        scheduler.register_strategy('rsi', 'BTCUSDT', '15m')
+        scheduler.register_strategy('macd', 'ETHUSDT', '5m')
+        for _ in range(3):
+            scheduler.on_kline('BTCUSDT', '15m', _tick(100.0, closed=True))
+        scheduler.on_kline('ETHUSDT', '5m', _tick(10.0, closed=True))
+        scheduler.on_kline('ETHUSDT', '15m', _tick(10.0, closed=True))  # no strategy on this stream
+        await asyncio.sleep(0)
+        events = await scheduler.wait_for_events(0.5)
+        return events, scheduler.get_statistics()
+
+    events, stats = _run(scenario)
+    assert sorted(event.strategy_name for event in events) == ['macd', 'rsi']
+    assert stats['coalesced_events'] == 2
@@ -0,0 +1,87 @@
+
+import os
+import sys
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.data_fetcher.symbol_metadata import SymbolMetadataService, index_symbol
+
+EXCHANGE_INFO = {'symbols': [{
+    'symbol': 'BTCUSDT',
+    'status': 'TRADING',
+    'filters': [
+        {'filterType': 'LOT_SIZE', 'minQty': '0.001', 'maxQty': '1000', 'stepSize': '0.001'},
+        {'filterType': 'PRICE_FILTER', 'tickSize': '0.10'},
+        {'filterType': 'MIN_NOTIONAL', 'notional': '100'}
+    ]
+}]}
+
+
+class FakeExchange:
+    """Exchange client stand-in that counts downloads"""
+
+    def __init__(self, fail=False, delay=0.0):
+        self.fail = fail
+        self.delay = delay
+        self.downloads = 0
+        self.is_futures = True
+        self.client = self
+
+    def futures_exchange_info(self):
+        self.downloads += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("exchange unreachable")
+        return EXCHANGE_INFO
+
+
+def test_index_symbol_reads_filters():
+    info = index_symbol(EXCHANGE_INFO['symbols'][0])
+    assert info['min_qty'] == 0.001
+    assert info['precision'] == 3
+    assert info['tick_size'] == 0.1
+    assert info['price_precision'] == 1
+    assert info['min_notional'] == 100.0
+
+
+def test_failed_cold_refresh_backs_off(tmp_path):
+    exchange = FakeExchange(fail=True)
+    service = SymbolMetadataService(exchange, str(tmp_path / "symbol_metadata.json"), refresh_interval=3600)
+
+    for _ in range(5):
+        assert service.get('BTCUSDT') is None
+    assert exchange.downloads == 1
+    assert service.get_statistics()['refresh_failures'] == 1
+
+    # Once the backoff has passed a lookup tries again
+    exchange.fail = False
+    service._retry_at = time.monotonic() - 1
+    assert service.get('BTCUSDT')['precision'] == 3
+    assert exchange.downloads == 2
+
+
+def test_concurrent_cold_lookups_share_one_download(tmp_path):
+    exchange = FakeExchange(delay=0.2)
+    service = SymbolMetadataService(exchange, str(tmp_path / "symbol_metadata.json"), refresh_interval=3600)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.get('btcusdt'))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert exchange.downloads == 1
+    assert all(result is not None and result['min_qty'] == 0.001 for result in results)
+
+
+def test_saved_index_serves_lookups_after_restart(tmp_path):
+    cache_file = str(tmp_path / "symbol_metadata.json")
+    assert SymbolMetadataService(FakeExchange(), cache_file).refresh()
+
+    exchange = FakeExchange(fail=True)
+    restarted = SymbolMetadataService(exchange, cache_file)
+    assert restarted.get('BTCUSDT')['tick_size'] == 0.1
+    assert restarted.get('ETHUSDT') is None
+    assert exchange.downloads == 0
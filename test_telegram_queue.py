@@ -0,0 +1,97 @@
+
+import os
+import sys
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.reporting.telegram_queue import (TelegramNotificationQueue, PRIORITY_CRITICAL,
+                                          PRIORITY_NORMAL, PRIORITY_LOW)
+
+
+class RecordingSender:
+    """send() stand-in; holds the first message until released"""
+
+    def __init__(self, hold_first=False, rate_limit_first=False):
+        self.sent = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.hold_first = hold_first
+        self.rate_limit_first = rate_limit_first
+        self.calls = 0
+
+    def __call__(self, text, parse_mode):
+        self.calls += 1
+        if self.calls == 1:
+            self.started.set()
+            if self.hold_first:
+                self.release.wait(5)
+            if self.rate_limit_first:
+                return False, 0.05
+        self.sent.append(text)
+        return True, None
+
+
+def _queue(**kwargs):
+    kwargs.setdefault('rate_per_minute', 60000)
+    kwargs.setdefault('coalesce_window', 0.3)
+    return TelegramNotificationQueue(**kwargs)
+
+
+def test_higher_priority_messages_are_sent_first():
+    queue = _queue()
+    send = RecordingSender(hold_first=True)
+    queue.enqueue('chat', 'first', send)
+    assert send.started.wait(2)
+
+    queue.enqueue('chat', 'error alert', send, priority=PRIORITY_LOW)
+    queue.enqueue('chat', 'anomaly', send, priority=PRIORITY_NORMAL)
+    queue.enqueue('chat', 'trade opened', send, priority=PRIORITY_CRITICAL)
+    queue.enqueue('chat', 'trade closed', send, priority=PRIORITY_CRITICAL)
+    send.release.set()
+
+    assert queue.flush(timeout=5)
+    assert send.sent == ['first', 'trade opened', 'trade closed', 'anomaly', 'error alert']
+
+
+def test_full_queue_evicts_less_important_message():
+    queue = _queue(max_size=2)
+    send = RecordingSender(hold_first=True)
+    queue.enqueue('chat', 'in flight', send)
+    assert send.started.wait(2)
+
+    assert queue.enqueue('chat', 'low 1', send, priority=PRIORITY_LOW)
+    assert queue.enqueue('chat', 'low 2', send, priority=PRIORITY_LOW)
+    assert queue.enqueue('chat', 'critical', send, priority=PRIORITY_CRITICAL)  # evicts 'low 2'
+    assert not queue.enqueue('chat', 'low 3', send, priority=PRIORITY_LOW)  # nothing less important left
+    send.release.set()
+
+    assert queue.flush(timeout=5)
+    assert send.sent == ['in flight', 'critical', 'low 1']
+    assert queue.get_statistics()['dropped'] == 2
+
+
+def test_repeats_within_window_go_out_as_one_digest():
+    queue = _queue()
+    send = RecordingSender()
+    for index in range(5):
+        queue.enqueue('chat', f'ghost position #{index}', send, coalesce_key='anomaly:BTCUSDT')
+    queue.enqueue('chat', 'other alert', send, coalesce_key='anomaly:ETHUSDT')
+
+    assert queue.flush(timeout=5)
+    assert send.sent[:2] == ['ghost position #0', 'other alert']
+    assert len(send.sent) == 3
+    assert '4 more similar alerts' in send.sent[2]
+    assert send.sent[2].endswith('ghost position #4')
+    stats = queue.get_statistics()
+    assert stats['coalesced'] == 4
+    assert stats['digests'] == 1
+
+
+def test_rate_limited_message_is_retried():
+    queue = _queue()
+    send = RecordingSender(rate_limit_first=True)
+    queue.enqueue('chat', 'trade opened', send, priority=PRIORITY_CRITICAL)
+
+    assert queue.flush(timeout=5)
+    assert send.sent == ['trade opened']
+    assert queue.get_statistics()['rate_limited'] == 1
@@ -0,0 +1,107 @@
+
+import json
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.execution_engine.trade_database import TradeDatabase
+
+
+def _trade(symbol, status="OPEN"):
+    return {
+        'strategy_name': 'rsi_oversold',
+        'symbol': symbol,
+        'side': 'BUY',
+        'quantity': 1.5,
+        'entry_price': 100.0,
+        'trade_status': status,
+        'timestamp': '2024-01-01T00:00:00'
+    }
+
+
+def test_migrates_legacy_json_once(tmp_path):
+    db_file = tmp_path / "trade_database.json"
+    legacy = {'trades': {
+        'rsi_oversold_BTCUSDT_1': _trade('BTCUSDT'),
+        'rsi_oversold_ETHUSDT_1': _trade('ETHUSDT', status="CLOSED"),
+        'broken': 'not a trade'
+    }}
+    db_file.write_text(json.dumps(legacy))
+
+    db = TradeDatabase(str(db_file))
+    assert set(db.trades) == {'rsi_oversold_BTCUSDT_1', 'rsi_oversold_ETHUSDT_1'}
+    assert set(db.get_open_trades()) == {'rsi_oversold_BTCUSDT_1'}
+    assert not db_file.exists()
+    assert (tmp_path / "trade_database.json.migrated").exists()
+    db.close()
+
+    # A later legacy file must not be imported over a populated store
+    db_file.write_text(json.dumps({'trades': {'rsi_oversold_SOLUSDT_1': _trade('SOLUSDT')}}))
+    reopened = TradeDatabase(str(db_file))
+    assert set(reopened.trades) == {'rsi_oversold_BTCUSDT_1', 'rsi_oversold_ETHUSDT_1'}
+    assert reopened.find_trade_by_position('rsi_oversold', 'BTCUSDT', 'BUY', 1.5, 100.0) == 'rsi_oversold_BTCUSDT_1'
+    reopened.close()
+
+
+def test_refresh_picks_up_writes_from_another_connection(tmp_path):
+    db_file = str(tmp_path / "trade_database.json")
+    reader = TradeDatabase(db_file)
+    writer = TradeDatabase(db_file)
+    changes = []
+    reader.add_listener(lambda trade_id, change, data: changes.append((trade_id, change)))
+
+    assert reader.refresh_if_changed() is False
+
+    assert writer.add_trade('rsi_oversold_BTCUSDT_1', _trade('BTCUSDT'))
+    assert 'rsi_oversold_BTCUSDT_1' not in reader.trades
+
+    assert reader.refresh_if_changed() is True
+    assert 'rsi_oversold_BTCUSDT_1' in reader.trades
+    assert reader.get_open_trade_count() == 1
+    assert changes == [('*', 'reloaded')]
+
+    # Nothing new since the reload
+    assert reader.refresh_if_changed() is False
+    reader.close()
+    writer.close()
+
+
+def test_status_counts_follow_updates(tmp_path):
+    db = TradeDatabase(str(tmp_path / "trade_database.json"))
+    db.add_trade('rsi_oversold_BTCUSDT_1', _trade('BTCUSDT'))
+    db.add_trade('rsi_oversold_ETHUSDT_1', _trade('ETHUSDT'))
+    db.update_trade('rsi_oversold_ETHUSDT_1', {'trade_status': 'CLOSED'})
+
+    assert db.count_trades_by_status() == {'OPEN': 1, 'CLOSED': 1}
+    assert set(db.get_open_trades()) == {'rsi_oversold_BTCUSDT_1'}
+    db.close()
+
+
+def test_sync_from_logger_keeps_concurrent_writes(tmp_path, monkeypatch):
+    import threading
+    from types import SimpleNamespace
+    from src.analytics import trade_logger as trade_logger_module
+
+    db = TradeDatabase(str(tmp_path / "trade_database.json"))
+    db.add_trade('rsi_oversold_BTCUSDT_1', _trade('BTCUSDT'))
+    before = db.trades['rsi_oversold_BTCUSDT_1']
+
+    logger_trades = [SimpleNamespace(trade_id=f'rsi_oversold_ETHUSDT_{i}',
+                                     to_dict=lambda i=i: {**_trade('ETHUSDT'), 'trade_id': f'rsi_oversold_ETHUSDT_{i}'})
+                     for i in range(200)]
+    logger_trades.append(SimpleNamespace(trade_id='rsi_oversold_BTCUSDT_1',
+                                         to_dict=lambda: {**_trade('BTCUSDT', status="CLOSED")}))
+    monkeypatch.setattr(trade_logger_module.trade_logger, 'trades', logger_trades)
+
+    writer = threading.Thread(target=lambda: [db.add_trade(f'macd_SOLUSDT_{i}', _trade('SOLUSDT')) for i in range(50)])
+    writer.start()
+    assert db.sync_from_logger() == 201
+    writer.join()
+
+    assert all(f'macd_SOLUSDT_{i}' in db.trades for i in range(50))
+    assert len(db.trades) == 251
+    assert before['trade_status'] == 'OPEN'  # earlier snapshot untouched
+    assert db.trades['rsi_oversold_BTCUSDT_1']['trade_status'] == 'CLOSED'
+    assert 'rsi_oversold_BTCUSDT_1' not in db.get_open_trades()
+    assert db.get_open_trade_count() == 250
+    db.close()
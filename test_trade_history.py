@@ -0,0 +1,98 @@
+
+import os
+import sys
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.analytics.trade_history import TradeHistoryStore
+
+
+def _closed_trade(trade_id, pnl, timestamp='2024-03-05T10:00:00'):
+    return {
+        'trade_id': trade_id,
+        'timestamp': timestamp,
+        'strategy_name': 'rsi_oversold',
+        'symbol': 'BTCUSDT',
+        'side': 'BUY',
+        'entry_price': 100.0,
+        'exit_price': 101.0,
+        'quantity': 1.0,
+        'leverage': 5,
+        'pnl_usdt': pnl,
+        'duration_minutes': 30,
+        'trade_status': 'CLOSED'
+    }
+
+
+def test_compaction_keeps_last_row_per_trade(tmp_path):
+    store = TradeHistoryStore(str(tmp_path / "history"), compact_after_parts=3)
+    store.append([_closed_trade('t1', 1.0)])
+    store.append([_closed_trade('t2', 2.0)])
+    store.append([_closed_trade('t1', 1.5)])  # exit corrected after close
+    month_dir = tmp_path / "history" / "month=2024-03"
+    assert len(list(month_dir.glob("*.parquet"))) == 3
+
+    store.append([_closed_trade('t3', 3.0)])  # fourth part triggers compaction
+    assert len(list(month_dir.glob("*.parquet"))) == 1
+    assert not list(month_dir.glob("*.tmp"))
+
+    frame = store.read(columns=['trade_id', 'pnl_usdt'])
+    assert dict(zip(frame['trade_id'], frame['pnl_usdt'])) == {'t1': 1.5, 't2': 2.0, 't3': 3.0}
+
+
+def test_read_prunes_by_month(tmp_path):
+    store = TradeHistoryStore(str(tmp_path / "history"))
+    store.append([_closed_trade('feb', 1.0, '2024-02-10T00:00:00'),
+                  _closed_trade('mar', 2.0, '2024-03-10T00:00:00')])
+
+    frame = store.read(columns=['trade_id'], start=datetime(2024, 3, 1))
+    assert list(frame['trade_id']) == ['mar']
+
+
+def test_backfill_runs_once_and_skips_known_trades(tmp_path):
+    store = TradeHistoryStore(str(tmp_path / "history"))
+    store.append([_closed_trade('t2', 2.0)])  # writer got there first
+    assert not store.is_backfilled()
+
+    assert store.backfill([_closed_trade('t1', 1.0), _closed_trade('t2', 9.9)]) == 1
+    assert store.is_backfilled()
+    frame = store.read(columns=['trade_id', 'pnl_usdt'])
+    assert dict(zip(frame['trade_id'], frame['pnl_usdt'])) == {'t1': 1.0, 't2': 2.0}
+
+    assert store.backfill([_closed_trade('t4', 4.0)]) == 0
+
+
+def test_daily_summary_reads_closed_trades_from_history(tmp_path, monkeypatch):
+    from src.analytics import trade_logger as trade_logger_module
+    from src.analytics.trade_logger import TradeLogger, TradeRecord
+    from src.execution_engine import trade_database as trade_database_module
+    from src.execution_engine.trade_database import TradeDatabase
+
+    monkeypatch.chdir(tmp_path)
+    store = TradeHistoryStore(str(tmp_path / "history"))
+    monkeypatch.setattr(trade_logger_module, 'trade_history', store)
+    database = TradeDatabase(str(tmp_path / "trade_database.json"))
+    monkeypatch.setattr(trade_database_module, '_shared_database', database)
+
+    store.append([_closed_trade('t1', 5.0, '2024-03-05T10:00:00'),
+                  _closed_trade('t2', -2.0, '2024-03-05T12:00:00'),
+                  _closed_trade('t3', 7.0, '2024-03-06T09:00:00')])
+    store.backfill([])
+
+    open_trade = _closed_trade('t4', None, '2024-03-05T15:00:00')
+    open_trade.update(trade_status='OPEN', margin_used=20.0, position_value_usdt=100.0, exit_price=None)
+    database.add_trade('t4', dict(open_trade))
+    logger = TradeLogger()
+    logger._append_trade(TradeRecord(**{**open_trade, 'timestamp': datetime(2024, 3, 5, 15)}))
+
+    summary = logger.get_daily_summary(datetime(2024, 3, 5))
+    assert summary['total_trades'] == 3
+    assert summary['closed_trades'] == 2
+    assert summary['open_trades'] == 1
+    assert summary['total_pnl'] == 3.0
+    assert [trade['trade_id'] for trade in summary['trades']] == ['t1', 't2', 't4']
+    database.close()
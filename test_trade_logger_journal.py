@@ -0,0 +1,96 @@
+
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from src.analytics import trade_logger as trade_logger_module
+from src.analytics.trade_logger import TradeLogger, TradeRecord
+from src.analytics.trade_history import TradeHistoryStore
+from src.config.global_config import global_config
+
+
+def _record(trade_id, status="OPEN", pnl=None):
+    return TradeRecord(trade_id=trade_id, timestamp=datetime(2024, 3, 5, 10), strategy_name='rsi_oversold',
+                       symbol='BTCUSDT', side='BUY', entry_price=100.0, quantity=1.0, margin_used=20.0,
+                       leverage=5, position_value_usdt=100.0, pnl_usdt=pnl, trade_status=status)
+
+
+@pytest.fixture
+def trade_dir(tmp_path, monkeypatch):
+    """Run the logger in tmp_path; the background writer never gets to flush on its own"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(global_config, 'TRADE_LOG_FLUSH_INTERVAL', 3600)
+    monkeypatch.setattr(global_config, 'TRADE_LOG_COMPACT_INTERVAL', 3600)
+    monkeypatch.setattr(global_config, 'TRADE_LOG_COMPACT_EVERY', 1000)
+    monkeypatch.setattr(trade_logger_module, 'trade_history', TradeHistoryStore(str(tmp_path / "history")))
+    return tmp_path / "trading_data" / "trades"
+
+
+def _save(logger, record):
+    logger._append_trade(record)
+    logger.queue_save(record.trade_id)
+    logger._write_pending()
+
+
+def test_journal_is_replayed_over_snapshot(trade_dir):
+    logger = TradeLogger()
+    _save(logger, _record('t1'))
+    _save(logger, _record('t2'))
+    logger.flush()  # snapshot holds t1 and t2 (both open)
+
+    trade = logger.get_trade('t1')
+    trade.trade_status, trade.pnl_usdt, trade.exit_price = "CLOSED", 4.5, 104.5
+    logger.queue_save('t1')
+    logger._write_pending()
+    logger.remove_trade('t2')
+    logger._write_pending()
+    with open(trade_dir / "all_trades.jsonl", 'a') as f:
+        f.write('{"trade_id": "t3", "timest')  # torn by a crash mid-append
+
+    snapshot = json.loads((trade_dir / "all_trades.json").read_text())
+    assert [t['trade_status'] for t in snapshot] == ['OPEN', 'OPEN']
+
+    restarted = TradeLogger()
+    assert [t.trade_id for t in restarted.trades] == ['t1']
+    assert restarted.get_trade('t1').trade_status == "CLOSED"
+    assert restarted.get_trade('t1').pnl_usdt == 4.5
+    restarted.flush()
+    logger.flush()
+
+
+def test_updates_coalesce_and_compaction_truncates_journal(trade_dir, monkeypatch):
+    monkeypatch.setattr(global_config, 'TRADE_LOG_COMPACT_EVERY', 3)
+    logger = TradeLogger()
+
+    logger._append_trade(_record('t1'))
+    for _ in range(5):
+        logger.queue_save('t1')  # entry, DB sync, update... within one flush window
+    logger._write_pending()
+    assert logger.write_stats['coalesced'] == 4
+    assert len((trade_dir / "all_trades.jsonl").read_text().splitlines()) == 1
+
+    _save(logger, _record('t2'))
+    closed = logger.get_trade('t1')
+    closed.trade_status, closed.pnl_usdt = "CLOSED", -1.0
+    logger.queue_save('t1')
+    logger._write_pending()  # third journal line -> compaction
+
+    assert logger.write_stats['compactions'] == 1
+    assert (trade_dir / "all_trades.jsonl").read_text() == ''
+    snapshot = {t['trade_id']: t for t in json.loads((trade_dir / "all_trades.json").read_text())}
+    assert snapshot['t1']['trade_status'] == 'CLOSED'
+    with open(trade_dir / "all_trades.csv", newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['trade_id'] for row in rows] == ['t1', 't2']  # superseded CSV rows dropped
+
+    # The closed trade also went to the Parquet history when pyarrow is installed
+    if trade_logger_module.trade_history.is_available():
+        history = trade_logger_module.trade_history.read(columns=['trade_id', 'pnl_usdt'])
+        assert list(history['trade_id']) == ['t1']
+
+    assert [t.trade_id for t in TradeLogger().trades] == ['t1', 't2']
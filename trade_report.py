@@ -9,7 +9,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.execution_engine.trade_database import TradeDatabase
+from src.execution_engine.trade_database import get_trade_database
 from src.analytics.trade_logger import trade_logger
 from datetime import datetime
 import json
@@ -20,26 +20,19 @@ def analyze_all_trades():
     print("📊 COMPREHENSIVE TRADE ANALYSIS")
     print("=" * 50)
 
-    # Load data from both sources
-    trade_db = TradeDatabase()
+    # Load data from both sources (SQLite store; the legacy JSON is migrated on first open)
+    trade_db = get_trade_database()
 
     print(f"\n📈 TRADE DATABASE OVERVIEW")
     print("-" * 30)
-    print(f"Total trades in database: {len(trade_db.trades)}")
+    status_counts = trade_db.count_trades_by_status()
+    print(f"Total trades in database: {sum(status_counts.values())}")
 
-    # Analyze database trades
-    db_open = []
-    db_closed = []
-
-    for trade_id, trade_data in trade_db.trades.items():
-        status = trade_data.get('trade_status', 'UNKNOWN')
-        if status == 'OPEN':
-            db_open.append((trade_id, trade_data))
-        elif status == 'CLOSED':
-            db_closed.append((trade_id, trade_data))
+    # Open trades come from the open-trade index, closed ones are counted from the status index
+    db_open = trade_db.get_open_trades()
 
     print(f"🔓 Open trades: {len(db_open)}")
-    print(f"✅ Closed trades: {len(db_closed)}")
+    print(f"✅ Closed trades: {status_counts.get('CLOSED', 0)}")
 
     # Analyze logger trades
     print(f"\n📊 TRADE LOGGER OVERVIEW")
@@ -167,8 +160,10 @@ def show_file_sizes():
 
     files_to_check = [
         "trading_data/trades/all_trades.json",
-        "trading_data/trades/all_trades.csv", 
-        "trading_data/trade_database.json"
+        "trading_data/trades/all_trades.csv",
+        "trading_data/trades/all_trades.jsonl",
+        "trading_data/trade_database.db",
+        "trading_data/trade_database.db-wal"
     ]
 
     for file_path in files_to_check:
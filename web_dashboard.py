@@ -240,11 +240,10 @@ def get_shared_bot_manager():
 try:
     from src.config.trading_config import trading_config_manager
     from src.config.global_config import global_config
-    from src.binance_client.client import BinanceClientWrapper
+    from src.binance_client.client import BinanceClientWrapper, get_shared_client
     from src.data_fetcher.price_fetcher import PriceFetcher
     from src.data_fetcher.balance_fetcher import BalanceFetcher
-    from src.bot_manager import BotManager
-    from src.utils.logger import setup_logger
+    from src.utils.logger import setup_logger  # BotManager is imported where a bot is created
 
     # Setup proper logging
     setup_logger()
@@ -254,7 +253,7 @@ try:
     shared_bot_manager = get_shared_bot_manager()
 
     # Initialize clients for web interface
-    binance_client = BinanceClientWrapper()
+    binance_client = get_shared_client()
     price_fetcher = PriceFetcher(binance_client)
     balance_fetcher = BalanceFetcher(binance_client)
 
@@ -647,14 +646,11 @@ def get_bot_status():
             # Get active positions count from database (primary source)
             try:
                 if IMPORTS_AVAILABLE:
-                    from src.execution_engine.trade_database import TradeDatabase
-                    trade_db = TradeDatabase()
+                    from src.execution_engine.trade_database import get_trade_database
+                    trade_db = get_trade_database()
                     
-                    # Count open trades in database
-                    open_count = 0
-                    for trade_id, trade_data in trade_db.trades.items():
-                        if trade_data.get('trade_status') == 'OPEN':
-                            open_count += 1
+                    # Count open trades in database (status index)
+                    open_count = trade_db.get_open_trade_count()
                     
                     default_response['active_positions'] = open_count
                     logger.debug(f"🔍 DEBUG [{request_id}]: Active positions from database: {open_count}")
@@ -1401,7 +1397,10 @@ def get_balance():
 
             # Get real balance from Binance with timeout protection
             try:
-                usdt_balance = balance_fetcher.get_usdt_balance()
+                # Prefer the running bot's fetcher - it reads the shared, stream-fed account snapshot
+                current_bot = get_shared_bot_manager()
+                live_fetcher = getattr(current_bot, 'balance_fetcher', None) or balance_fetcher
+                usdt_balance = live_fetcher.get_usdt_balance()
                 if usdt_balance is None:
                     usdt_balance = 0.0
 
@@ -1416,7 +1415,7 @@ def get_balance():
                     'debug_info': {
                         'request_id': request_id,
                         'endpoint': 'balance',
-                        'source': 'binance_api'
+                        'source': 'account_snapshot' if live_fetcher is not balance_fetcher else 'binance_api'
                     }
                 }
                 logger.debug(f"✅ DEBUG [{request_id}]: Live balance retrieved: {usdt_balance}")
@@ -1529,14 +1528,11 @@ def get_positions():
         # PRIMARY SOURCE: Read from trade database
         if IMPORTS_AVAILABLE:
             try:
-                from src.execution_engine.trade_database import TradeDatabase
-                trade_db = TradeDatabase()
+                from src.execution_engine.trade_database import get_trade_database
+                trade_db = get_trade_database()
                 
-                # Get all open trades from database
-                open_trades = []
-                for trade_id, trade_data in trade_db.trades.items():
-                    if trade_data.get('trade_status') == 'OPEN':
-                        open_trades.append((trade_id, trade_data))
+                # Get all open trades from database (status index)
+                open_trades = list(trade_db.get_open_trades().items())
                 
                 logger.info(f"🔍 DEBUG: Found {len(open_trades)} open trades in database")
                 
@@ -1668,36 +1664,51 @@ def get_rsi(symbol):
         if not symbol or len(symbol) < 6:
             return jsonify({'success': False, 'error': 'Invalid symbol'})
 
-        # Try to get klines with proper error handling
-        try:
-            klines = binance_client.get_klines(symbol=symbol, interval='15m', limit=100)
+        # Prefer the bot's live WebSocket candles; REST klines only when they are not cached
+        from src.data_fetcher.websocket_manager import websocket_manager
+        from src.data_fetcher.indicator_cache import indicator_cache
 
-            if not klines or len(klines) < 15:
-                # Fallback: Try different timeframe
-                klines = binance_client.get_klines(symbol=symbol, interval='5m', limit=100)
+        closes = []
+        candle = None
+        interval = '15m'
+        df = websocket_manager.get_cached_dataframe(symbol, interval, 100)
+        if df is not None and len(df) >= 15:
+            closes = df['close'].tolist()
+            candle = indicator_cache.candle_key(df)
+        else:
+            # Try to get klines with proper error handling
+            try:
+                klines = binance_client.get_klines(symbol=symbol, interval=interval, limit=100)
 
-            if not klines or len(klines) < 15:
-                return jsonify({'success': False, 'error': f'Insufficient market data for {symbol}'})
+                if not klines or len(klines) < 15:
+                    # Fallback: Try different timeframe
+                    interval = '5m'
+                    klines = binance_client.get_klines(symbol=symbol, interval=interval, limit=100)
 
-        except Exception as e:
-            logger.error(f"Error fetching klines for {symbol}: {e}")
-            return jsonify({'success': False, 'error': f'Failed to fetch market data for {symbol}'})
+                if not klines or len(klines) < 15:
+                    return jsonify({'success': False, 'error': f'Insufficient market data for {symbol}'})
 
-        # Convert to closes
-        closes = []
-        for kline in klines:
-            try:
-                close_price = float(kline[4])
-                closes.append(close_price)
-            except (ValueError, IndexError):
-                continue
+            except Exception as e:
+                logger.error(f"Error fetching klines for {symbol}: {e}")
+                return jsonify({'success': False, 'error': f'Failed to fetch market data for {symbol}'})
+
+            # Convert to closes
+            for kline in klines:
+                try:
+                    close_price = float(kline[4])
+                    closes.append(close_price)
+                except (ValueError, IndexError):
+                    continue
+            candle = indicator_cache.klines_key(klines)
 
         if len(closes) < 14:
             return jsonify({'success': False, 'error': f'Not enough valid price data for RSI calculation for {symbol}'})
 
         # Calculate RSI using the same method as the bot
         try:
-            rsi = calculate_rsi(closes, period=14)
+            # Shared indicator cache: computed once per candle however often the dashboard polls
+            rsi = indicator_cache.get_or_compute(symbol, interval, candle, ('dashboard_rsi', 14),
+                                                 lambda: calculate_rsi(closes, period=14))
 
             # Validate RSI value
             if rsi < 0 or rsi > 100:
@@ -2006,6 +2017,12 @@ def ml_reports():
         logger.error(f"Error loading ML reports page: {e}")
         return f"Error loading ML reports: {e}"
 
+# Columns shown on the trades database page
+TRADES_PAGE_COLUMNS = [
+    'trade_id', 'strategy_name', 'symbol', 'side', 'entry_price', 'exit_price', 'quantity', 'leverage',
+    'margin_used', 'trade_status', 'timestamp', 'exit_reason', 'pnl_usdt', 'pnl_percentage', 'duration_minutes'
+]
+
 @app.route('/trades_database')
 def trades_database():
     """Trades Database page"""
@@ -2014,12 +2031,25 @@ def trades_database():
             return render_template('trades_database.html', trades=[], error="Database not available in demo mode")
 
         # Get all trades from the database
-        from src.execution_engine.trade_database import TradeDatabase
-        trade_db = TradeDatabase()
+        from src.execution_engine.trade_database import get_trade_database
+        trade_db = get_trade_database()
+
+        # Closed trades: only the displayed columns, read from the Parquet history.
+        # Open trades: the open-trade index. Without pyarrow, walk every record as before.
+        from src.analytics.trade_logger import trade_logger
+        closed_history = trade_logger.read_closed_history(TRADES_PAGE_COLUMNS)
+        if closed_history is not None:
+            trades_list = closed_history.to_dict('records')
+            for trade in trades_list:
+                if trade['timestamp'] is not None:
+                    trade['timestamp'] = trade['timestamp'].isoformat()
+            source_trades = trade_db.get_open_trades().items()
+        else:
+            trades_list = []
+            source_trades = trade_db.trades.items()
 
         # Convert trades to list format for template
-        trades_list = []
-        for trade_id, trade_data in trade_db.trades.items():
+        for trade_id, trade_data in source_trades:
             trade_info = {
                 'trade_id': trade_id,
                 'strategy_name': trade_data.get('strategy_name', 'N/A'),